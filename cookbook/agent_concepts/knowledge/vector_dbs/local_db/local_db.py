@@ -0,0 +1,22 @@
+# install numpy - `pip install numpy`
+
+from agno.agent import Agent
+from agno.knowledge.pdf_url import PDFUrlKnowledgeBase
+from agno.vectordb.index import HNSW
+from agno.vectordb.local import LocalVectorDb
+
+# Embeddings are stored in memory-mapped files, and metadata in SQLite, under tmp/localdb/recipes.
+# Remove vector_index to search exactly.
+vector_db = LocalVectorDb(collection="recipes", path="tmp/localdb", vector_index=HNSW(ef_search=40))
+
+# Create knowledge base
+knowledge_base = PDFUrlKnowledgeBase(
+    urls=["https://agno-public.s3.amazonaws.com/recipes/ThaiRecipes.pdf"],
+    vector_db=vector_db,
+)
+
+knowledge_base.load(recreate=False)  # Comment out after first run
+
+# Create and use the agent
+agent = Agent(knowledge=knowledge_base, show_tool_calls=True)
+agent.print_response("Show me how to make Tom Kha Gai", markdown=True)
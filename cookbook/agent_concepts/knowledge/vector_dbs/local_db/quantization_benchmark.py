@@ -0,0 +1,91 @@
+"""Recall, latency and size of quantized LocalVectorDb search, compared to full precision exact search.
+
+Run `pip install numpy agno` to install dependencies, then:
+
+python cookbook/agent_concepts/knowledge/vector_dbs/local_db/quantization_benchmark.py --num-vectors 100000
+
+Each quantization scans the compressed vectors for `k * rescore_factor` candidates,
+which are re-ranked with the float32 vectors, like LocalVectorDb(quantization=...).
+Binary quantization keeps 1 bit per dimension and needs a larger rescore_factor for the same recall.
+"""
+
+import argparse
+from time import perf_counter
+from typing import Callable, List, Tuple
+
+import numpy as np
+from agno.vectordb.distance import Distance
+from agno.vectordb.local.index import get_quantized_scores, get_scores, quantize, top_k
+from agno.vectordb.quantization import Quantization
+
+
+def generate_vectors(
+    num_vectors: int, num_queries: int, dimensions: int, seed: int = 0
+) -> Tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(max(num_vectors // 1000, 10), dimensions))
+    vectors = centers[rng.integers(0, len(centers), num_vectors)] + 0.5 * rng.normal(size=(num_vectors, dimensions))
+    queries = centers[rng.integers(0, len(centers), num_queries)] + 0.5 * rng.normal(size=(num_queries, dimensions))
+    return vectors.astype(np.float32), queries.astype(np.float32)
+
+
+def measure(search: Callable[[np.ndarray], np.ndarray], queries: np.ndarray) -> Tuple[List[np.ndarray], np.ndarray]:
+    results, latencies = [], []
+    for query in queries:
+        start = perf_counter()
+        results.append(search(query))
+        latencies.append((perf_counter() - start) * 1000)
+    return results, np.array(latencies)
+
+
+def report(name: str, latencies: np.ndarray, recall: float, size: int) -> None:
+    print(
+        f"{name:<28} p50 {np.percentile(latencies, 50):8.2f}ms  p95 {np.percentile(latencies, 95):8.2f}ms"
+        f"  recall@k {recall:.3f}  size {size / 2**20:8.1f}MB"
+    )
+
+
+def run_benchmark(args: argparse.Namespace) -> None:
+    distance = Distance(args.distance)
+    vectors, queries = generate_vectors(args.num_vectors, args.num_queries, args.dimensions)
+    norms = np.linalg.norm(vectors, axis=1)
+
+    def exact_search(query: np.ndarray) -> np.ndarray:
+        return top_k(get_scores(vectors, norms, query, float(np.linalg.norm(query)), distance), args.k)
+
+    print(f"{args.num_vectors} vectors, {args.dimensions} dimensions, {args.num_queries} queries, k={args.k}")
+    expected, latencies = measure(exact_search, queries)
+    report("float32", latencies, 1.0, vectors.nbytes)
+
+    for quantization in Quantization:
+        codes, scales = quantize(vectors, quantization)
+
+        def quantized_search(query: np.ndarray) -> np.ndarray:
+            query_norm = float(np.linalg.norm(query))
+            scores = get_quantized_scores(codes, scales, norms, query, query_norm, distance, quantization)
+            candidates = np.sort(top_k(scores, args.k * rescore_factor))
+            exact_scores = get_scores(vectors[candidates], norms[candidates], query, query_norm, distance)
+            return candidates[top_k(exact_scores, args.k)]
+
+        print()
+        for rescore_factor in [1, 4, 16]:
+            results, latencies = measure(quantized_search, queries)
+            recall = np.mean(
+                [len(set(result.tolist()) & set(exact.tolist())) / args.k for result, exact in zip(results, expected)]
+            )
+            report(
+                f"{quantization.value} rescore_factor={rescore_factor}",
+                latencies,
+                float(recall),
+                codes.nbytes + (scales.nbytes if quantization == Quantization.int8 else 0),
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--num-vectors", type=int, default=10000)
+    parser.add_argument("--num-queries", type=int, default=100)
+    parser.add_argument("--dimensions", type=int, default=384)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--distance", choices=[d.value for d in Distance], default=Distance.cosine.value)
+    run_benchmark(parser.parse_args())
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from collections import ChainMap, defaultdict, deque
 from dataclasses import asdict, dataclass
 from os import getenv
@@ -28,6 +29,7 @@ from uuid import uuid4
 from pydantic import BaseModel
 
 from agno.agent.metrics import SessionMetrics
+from agno.agent.retrieval import ParallelRetrieval
 from agno.exceptions import ModelProviderError, StopAgentRun
 from agno.knowledge.agent import AgentKnowledge
 from agno.media import Audio, AudioArtifact, AudioResponse, File, Image, ImageArtifact, Video, VideoArtifact
@@ -36,9 +38,11 @@ from agno.memory.v2.memory import Memory, SessionSummary
 from agno.memory.v2.schema import UserMemory
 from agno.models.base import Model
 from agno.models.message import Citations, Message, MessageMetrics, MessageReferences
+from agno.models.rate_limit import get_retry_delay
 from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
 from agno.reasoning.step import NextAction, ReasoningStep, ReasoningSteps
 from agno.run.base import RunResponseExtraData, RunStatus
+from agno.run.encoder import acoalesce_content_events, coalesce_content_events
 from agno.run.messages import RunMessages
 from agno.run.response import (
     RunEvent,
@@ -166,6 +170,10 @@ class Agent:
     #     ...
     retriever: Optional[Callable[..., Optional[List[Union[Dict, str]]]]] = None
     references_format: Literal["json", "yaml"] = "json"
+    # If True, retrieve references and user memories in background threads while the run messages are built
+    parallel_retrieval: bool = False
+    # Deadline (in seconds) for parallel retrieval. If exceeded, the run proceeds without the results.
+    retrieval_timeout: Optional[float] = None
 
     # --- Agent Storage ---
     storage: Optional[Storage] = None
@@ -372,6 +380,8 @@ class Agent:
         add_references: bool = False,
         retriever: Optional[Callable[..., Optional[List[Union[Dict, str]]]]] = None,
         references_format: Literal["json", "yaml"] = "json",
+        parallel_retrieval: bool = False,
+        retrieval_timeout: Optional[float] = None,
         storage: Optional[Storage] = None,
         extra_data: Optional[Dict[str, Any]] = None,
         tools: Optional[List[Union[Toolkit, Callable, Function, Dict]]] = None,
@@ -467,6 +477,8 @@ class Agent:
         self.add_references = add_references
         self.retriever = retriever
         self.references_format = references_format
+        self.parallel_retrieval = parallel_retrieval
+        self.retrieval_timeout = retrieval_timeout
 
         self.storage = storage
         self.extra_data = extra_data
@@ -1136,12 +1148,7 @@ class Agent:
                     raise e
                 last_exception = e
                 if attempt < num_attempts - 1:  # Don't sleep on the last attempt
-                    if self.exponential_backoff:
-                        delay = 2**attempt * self.delay_between_retries
-                    else:
-                        delay = self.delay_between_retries
-                    import time
-
+                    delay = get_retry_delay(attempt, self.delay_between_retries, self.exponential_backoff, e)
                     time.sleep(delay)
             except KeyboardInterrupt:
                 self.run_response = self.create_run_response(
@@ -1466,6 +1473,13 @@ class Agent:
                 elif messages is not None:
                     self.run_input = [m.to_dict() if isinstance(m, Message) else m for m in messages]
 
+                # Retrieve references and user memories concurrently, without blocking the event loop
+                retrieval: Optional[ParallelRetrieval] = None
+                if self.parallel_retrieval:
+                    retrieval = await self.aget_parallel_retrieval(
+                        message=message, user_id=user_id, knowledge_filters=effective_filters, **kwargs
+                    )
+
                 # Prepare run messages
                 run_messages: RunMessages = self.get_run_messages(
                     message=message,
@@ -1477,6 +1491,7 @@ class Agent:
                     files=files,
                     messages=messages,
                     knowledge_filters=effective_filters,
+                    retrieval=retrieval,
                     **kwargs,
                 )
                 if len(run_messages.messages) == 0:
@@ -1512,13 +1527,8 @@ class Agent:
                     raise e
                 last_exception = e
                 if attempt < num_attempts - 1:  # Don't sleep on the last attempt
-                    if self.exponential_backoff:
-                        delay = 2**attempt * self.delay_between_retries
-                    else:
-                        delay = self.delay_between_retries
-                    import time
-
-                    time.sleep(delay)
+                    delay = get_retry_delay(attempt, self.delay_between_retries, self.exponential_backoff, e)
+                    await asyncio.sleep(delay)
             except KeyboardInterrupt:
                 self.run_response = self.create_run_response(
                     run_state=RunStatus.cancelled, content="Operation cancelled by user", run_response=run_response
@@ -1768,12 +1778,7 @@ class Agent:
                     raise e
                 last_exception = e
                 if attempt < num_attempts - 1:  # Don't sleep on the last attempt
-                    if self.exponential_backoff:
-                        delay = 2**attempt * self.delay_between_retries
-                    else:
-                        delay = self.delay_between_retries
-                    import time
-
+                    delay = get_retry_delay(attempt, self.delay_between_retries, self.exponential_backoff, e)
                     time.sleep(delay)
             except KeyboardInterrupt:
                 if stream:
@@ -2165,13 +2170,8 @@ class Agent:
                     raise e
                 last_exception = e
                 if attempt < num_attempts - 1:  # Don't sleep on the last attempt
-                    if self.exponential_backoff:
-                        delay = 2**attempt * self.delay_between_retries
-                    else:
-                        delay = self.delay_between_retries
-                    import time
-
-                    time.sleep(delay)
+                    delay = get_retry_delay(attempt, self.delay_between_retries, self.exponential_backoff, e)
+                    await asyncio.sleep(delay)
             except KeyboardInterrupt:
                 if stream:
                     return async_generator_wrapper(
@@ -2780,6 +2780,7 @@ class Agent:
         run_response.messages = messages_for_run_response
         # Update the RunResponse metrics
         run_response.metrics = self.aggregate_metrics_from_messages(messages_for_run_response)
+        self._add_retrieval_metrics(run_response.metrics, run_messages)
 
     def _add_run_to_memory(
         self,
@@ -3043,6 +3044,7 @@ class Agent:
         run_response.messages = messages_for_run_response
         # Update the RunResponse metrics
         run_response.metrics = self.aggregate_metrics_from_messages(messages_for_run_response)
+        self._add_retrieval_metrics(run_response.metrics, run_messages)
 
         # Update the run_response audio if streaming
         if model_response.audio is not None:
@@ -3112,6 +3114,7 @@ class Agent:
         run_response.messages = messages_for_run_response
         # Update the RunResponse metrics
         run_response.metrics = self.aggregate_metrics_from_messages(messages_for_run_response)
+        self._add_retrieval_metrics(run_response.metrics, run_messages)
 
         # Update the run_response audio if streaming
         if model_response.audio is not None:
@@ -4328,9 +4331,13 @@ class Agent:
             log_warning(f"Template substitution failed: {e}")
             return message
 
-    def get_system_message(self, session_id: str, user_id: Optional[str] = None) -> Optional[Message]:
+    def get_system_message(
+        self, session_id: str, user_id: Optional[str] = None, user_memories: Optional[List[UserMemory]] = None
+    ) -> Optional[Message]:
         """Return the system message for the Agent.
 
+        If user_memories is provided, it is used instead of reading the user memories from memory.
+
         1. If the system_message is provided, use that.
         2. If create_default_system_message is False, return None.
         3. Build and return the default system message for the Agent.
@@ -4556,7 +4563,8 @@ class Agent:
             elif isinstance(self.memory, Memory) and self.add_memory_references:
                 if not user_id:
                     user_id = "default"
-                user_memories = self.memory.get_user_memories(user_id=user_id)  # type: ignore
+                if user_memories is None:
+                    user_memories = self.memory.get_user_memories(user_id=user_id)  # type: ignore
                 if user_memories and len(user_memories) > 0:
                     system_message_content += (
                         "You have access to memories from previous interactions with the user that you can use:\n\n"
@@ -4649,6 +4657,8 @@ class Agent:
         videos: Optional[Sequence[Video]] = None,
         files: Optional[Sequence[File]] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
+        references: Optional[MessageReferences] = None,
+        retrieve_references: bool = True,
         **kwargs: Any,
     ) -> Optional[Message]:
         """Return the user message for the Agent.
@@ -4656,11 +4666,13 @@ class Agent:
         1. If the user_message is provided, use that.
         2. If create_default_user_message is False or if the message is a list, return the message as is.
         3. Build the default user message for the Agent
+
+        References from the knowledge base can be passed in if they were already retrieved,
+        with retrieve_references=False to skip searching the knowledge base.
         """
         # Get references from the knowledge base to use in the user message
-        references = None
         self.run_response = cast(RunResponse, self.run_response)
-        if self.add_references and message:
+        if references is None and retrieve_references and self.add_references and message:
             message_str: str
             if isinstance(message, str):
                 message_str = message
@@ -4670,26 +4682,20 @@ class Agent:
                 raise Exception("message must be a string or a callable when add_references is True")
 
             try:
-                retrieval_timer = Timer()
-                retrieval_timer.start()
-                docs_from_knowledge = self.get_relevant_docs_from_knowledge(
-                    query=message_str, filters=knowledge_filters, **kwargs
+                references = self.get_references_from_knowledge(
+                    query=message_str, knowledge_filters=knowledge_filters, **kwargs
                 )
-                if docs_from_knowledge is not None:
-                    references = MessageReferences(
-                        query=message_str, references=docs_from_knowledge, time=round(retrieval_timer.elapsed, 4)
-                    )
-                    # Add the references to the run_response
-                    if self.run_response.extra_data is None:
-                        self.run_response.extra_data = RunResponseExtraData()
-                    if self.run_response.extra_data.references is None:
-                        self.run_response.extra_data.references = []
-                    self.run_response.extra_data.references.append(references)
-                retrieval_timer.stop()
-                log_debug(f"Time to get references: {retrieval_timer.elapsed:.4f}s")
             except Exception as e:
                 log_warning(f"Failed to get references: {e}")
 
+        if references is not None:
+            # Add the references to the run_response
+            if self.run_response.extra_data is None:
+                self.run_response.extra_data = RunResponseExtraData()
+            if self.run_response.extra_data.references is None:
+                self.run_response.extra_data.references = []
+            self.run_response.extra_data.references.append(references)
+
         # 1. If the user_message is provided, use that.
         if self.user_message is not None:
             if isinstance(self.user_message, Message):
@@ -4813,6 +4819,7 @@ class Agent:
         files: Optional[Sequence[File]] = None,
         messages: Optional[Sequence[Union[Dict, Message]]] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
+        retrieval: Optional[ParallelRetrieval] = None,
         **kwargs: Any,
     ) -> RunMessages:
         """This function returns a RunMessages object with the following attributes:
@@ -4843,8 +4850,25 @@ class Agent:
         run_messages = RunMessages()
         self.run_response = cast(RunResponse, self.run_response)
 
+        # Retrieve references and user memories in the background, while the messages are built
+        if retrieval is None and self.parallel_retrieval:
+            retrieval = ParallelRetrieval(timeout=self.retrieval_timeout)
+            if self._should_retrieve_references(message):
+                retrieval.submit(
+                    "references",
+                    self.get_references_from_knowledge,
+                    query=message,
+                    knowledge_filters=knowledge_filters,
+                    **kwargs,
+                )
+            if self._should_retrieve_memories():
+                retrieval.submit("memories", self.memory.get_user_memories, user_id=user_id or "default")  # type: ignore
+
         # 1. Add system message to run_messages
-        system_message = self.get_system_message(session_id=session_id, user_id=user_id)
+        user_memories: Optional[List[UserMemory]] = None
+        if retrieval is not None and retrieval.has("memories"):
+            user_memories = retrieval.result("memories", default=[])
+        system_message = self.get_system_message(session_id=session_id, user_id=user_id, user_memories=user_memories)
         if system_message is not None:
             run_messages.system_message = system_message
             run_messages.messages.append(system_message)
@@ -4913,6 +4937,10 @@ class Agent:
         user_message: Optional[Message] = None
         # 4.1 Build user message if message is None, str or list
         if message is None or isinstance(message, str) or isinstance(message, list):
+            references: Optional[MessageReferences] = None
+            references_retrieved = retrieval is not None and retrieval.has("references")
+            if references_retrieved:
+                references = retrieval.result("references")  # type: ignore
             user_message = self.get_user_message(
                 message=message,
                 audio=audio,
@@ -4920,6 +4948,8 @@ class Agent:
                 videos=videos,
                 files=files,
                 knowledge_filters=knowledge_filters,
+                references=references,
+                retrieve_references=not references_retrieved,
                 **kwargs,
             )
         # 4.2 If message is provided as a Message, use it directly
@@ -4961,8 +4991,50 @@ class Agent:
                     except Exception as e:
                         log_warning(f"Failed to validate message: {e}")
 
+        if retrieval is not None:
+            retrieval.shutdown()
+            run_messages.knowledge_retrieval_time = retrieval.times.get("references")
+            run_messages.memory_retrieval_time = retrieval.times.get("memories")
+        elif self.run_response.extra_data is not None and self.run_response.extra_data.references:
+            run_messages.knowledge_retrieval_time = self.run_response.extra_data.references[-1].time
+
         return run_messages
 
+    async def aget_parallel_retrieval(
+        self,
+        message: Optional[Union[str, List, Dict, Message, BaseModel]] = None,
+        user_id: Optional[str] = None,
+        knowledge_filters: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> ParallelRetrieval:
+        """Retrieve references and user memories concurrently for an async run, to pass to get_run_messages."""
+        retrieval = ParallelRetrieval(timeout=self.retrieval_timeout)
+        retrievals: Dict[str, Any] = {}
+        if self._should_retrieve_references(message):
+            retrievals["references"] = self.aget_references_from_knowledge(
+                query=message,  # type: ignore
+                knowledge_filters=knowledge_filters,
+                **kwargs,
+            )
+        if self._should_retrieve_memories():
+            retrievals["memories"] = asyncio.to_thread(
+                self.memory.get_user_memories,  # type: ignore
+                user_id=user_id or "default",
+            )
+        await retrieval.agather(retrievals)
+        return retrieval
+
+    def _should_retrieve_references(self, message: Optional[Union[str, List, Dict, Message, BaseModel]]) -> bool:
+        return self.add_references and isinstance(message, str) and bool(message)
+
+    def _should_retrieve_memories(self) -> bool:
+        return (
+            isinstance(self.memory, Memory)
+            and self.add_memory_references
+            and self.system_message is None
+            and self.create_default_system_message
+        )
+
     def get_continue_run_messages(
         self,
         messages: List[Message],
@@ -5266,6 +5338,34 @@ class Agent:
             return transfer_instructions
         return ""
 
+    def get_references_from_knowledge(
+        self, query: str, knowledge_filters: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> Optional[MessageReferences]:
+        """Get the references from the knowledge base to add to the user message."""
+        retrieval_timer = Timer()
+        retrieval_timer.start()
+        docs_from_knowledge = self.get_relevant_docs_from_knowledge(query=query, filters=knowledge_filters, **kwargs)
+        retrieval_timer.stop()
+        log_debug(f"Time to get references: {retrieval_timer.elapsed:.4f}s")
+        if docs_from_knowledge is None:
+            return None
+        return MessageReferences(query=query, references=docs_from_knowledge, time=round(retrieval_timer.elapsed, 4))
+
+    async def aget_references_from_knowledge(
+        self, query: str, knowledge_filters: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> Optional[MessageReferences]:
+        """Get the references from the knowledge base to add to the user message asynchronously."""
+        retrieval_timer = Timer()
+        retrieval_timer.start()
+        docs_from_knowledge = await self.aget_relevant_docs_from_knowledge(
+            query=query, filters=knowledge_filters, **kwargs
+        )
+        retrieval_timer.stop()
+        log_debug(f"Time to get references: {retrieval_timer.elapsed:.4f}s")
+        if docs_from_knowledge is None:
+            return None
+        return MessageReferences(query=query, references=docs_from_knowledge, time=round(retrieval_timer.elapsed, 4))
+
     def get_relevant_docs_from_knowledge(
         self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None, **kwargs
     ) -> Optional[List[Union[Dict[str, Any], str]]]:
@@ -5537,6 +5637,13 @@ class Agent:
             aggregated_metrics = dict(aggregated_metrics)
         return aggregated_metrics
 
+    def _add_retrieval_metrics(self, metrics: Dict[str, Any], run_messages: RunMessages) -> None:
+        """Add the time spent retrieving references and user memories to the run metrics."""
+        if run_messages.knowledge_retrieval_time is not None:
+            metrics["knowledge_retrieval_time"] = [run_messages.knowledge_retrieval_time]
+        if run_messages.memory_retrieval_time is not None:
+            metrics["memory_retrieval_time"] = [run_messages.memory_retrieval_time]
+
     def calculate_metrics(self, messages: List[Message]) -> SessionMetrics:
         session_metrics = SessionMetrics()
         assistant_message_role = self.model.assistant_message_role if self.model is not None else "assistant"
@@ -6853,6 +6960,7 @@ class Agent:
         # Add tags to include in markdown content
         tags_to_include_in_markdown: Set[str] = {"think", "thinking"},
         knowledge_filters: Optional[Dict[str, Any]] = None,
+        stream_coalesce_ms: Optional[int] = None,
         **kwargs: Any,
     ) -> None:
         import json
@@ -6901,7 +7009,7 @@ class Agent:
                 if render:
                     live_log.update(Group(*panels))
 
-                for resp in self.run(
+                stream_resp = self.run(
                     message=message,
                     messages=messages,
                     session_id=session_id,
@@ -6915,7 +7023,12 @@ class Agent:
                     stream_intermediate_steps=stream_intermediate_steps,
                     knowledge_filters=knowledge_filters,
                     **kwargs,
-                ):
+                )
+                if stream_coalesce_ms:
+                    # Merge content tokens to limit the number of re-renders
+                    stream_resp = coalesce_content_events(stream_resp, stream_coalesce_ms)
+
+                for resp in stream_resp:
                     if isinstance(resp, tuple(get_args(RunResponseEvent))):
                         if resp.is_paused:
                             resp = cast(RunResponsePausedEvent, resp)
@@ -7302,6 +7415,7 @@ class Agent:
         # Add tags to include in markdown content
         tags_to_include_in_markdown: Set[str] = {"think", "thinking"},
         knowledge_filters: Optional[Dict[str, Any]] = None,
+        stream_coalesce_ms: Optional[int] = None,
         **kwargs: Any,
     ) -> None:
         import json
@@ -7365,6 +7479,9 @@ class Agent:
                     knowledge_filters=knowledge_filters,
                     **kwargs,
                 )
+                if stream_coalesce_ms:
+                    # Merge content tokens to limit the number of re-renders
+                    result = acoalesce_content_events(result, stream_coalesce_ms)
 
                 async for resp in result:
                     if isinstance(resp, tuple(get_args(RunResponseEvent))):
@@ -0,0 +1,98 @@
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from agno.utils.log import log_debug, log_warning
+
+
+class ParallelRetrieval:
+    """Runs retrieval for an Agent run (e.g. knowledge base references and user memories) in background threads,
+    while the rest of the run messages are built.
+
+    All retrievals share a single deadline, counted from when the first one is started.
+    A retrieval that misses the deadline is ignored and the run proceeds without its result.
+    In async runs, `agather` runs the retrievals as tasks on the event loop instead.
+    """
+
+    def __init__(self, timeout: Optional[float] = None, max_workers: int = 2):
+        self.timeout: Optional[float] = timeout
+        self.max_workers: int = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: Dict[str, Future] = {}
+        # Results of the retrievals run by agather
+        self._results: Dict[str, Any] = {}
+        self._deadline: Optional[float] = None
+        # Time spent (in seconds) on each retrieval. Only set for retrievals that completed in time.
+        self.times: Dict[str, float] = {}
+
+    def submit(self, name: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """Start a retrieval in the background."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="agno-retrieval")
+            if self.timeout is not None:
+                self._deadline = perf_counter() + self.timeout
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            start = perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.times[name] = round(perf_counter() - start, 4)
+
+        self._futures[name] = self._executor.submit(timed, *args, **kwargs)
+
+    async def agather(self, retrievals: Dict[str, Awaitable[Any]]) -> None:
+        """Run the retrievals concurrently until the deadline. Their results are then available from `result`."""
+
+        async def timed(name: str, task: "asyncio.Future[Any]") -> None:
+            start = perf_counter()
+            try:
+                self._results[name] = await asyncio.wait_for(task, timeout=self.timeout)
+                self.times[name] = round(perf_counter() - start, 4)
+                log_debug(f"Time to retrieve {name}: {self.times[name]:.4f}s")
+            except asyncio.TimeoutError:
+                log_warning(f"Retrieving {name} exceeded the deadline of {self.timeout}s, continuing without it")
+            except Exception as e:
+                log_warning(f"Failed to retrieve {name}: {e}")
+
+        # Start every retrieval before waiting for any of them
+        tasks = {name: asyncio.ensure_future(retrieval) for name, retrieval in retrievals.items()}
+        for name in tasks:
+            # Retrievals that fail or miss the deadline have no result
+            self._results.setdefault(name, None)
+        await asyncio.gather(*[timed(name, task) for name, task in tasks.items()])
+
+    def has(self, name: str) -> bool:
+        return name in self._futures or name in self._results
+
+    def result(self, name: str, default: Any = None) -> Any:
+        """Wait for a retrieval until the deadline and return its result, or `default` if it failed or timed out."""
+        if name in self._results:
+            result = self._results.pop(name)
+            return default if result is None else result
+        future = self._futures.pop(name, None)
+        if future is None:
+            return default
+        wait = None if self._deadline is None else max(0.0, self._deadline - perf_counter())
+        try:
+            result = future.result(timeout=wait)
+            log_debug(f"Time to retrieve {name}: {self.times.get(name, 0):.4f}s")
+            return result
+        except FutureTimeoutError:
+            log_warning(f"Retrieving {name} exceeded the deadline of {self.timeout}s, continuing without it")
+        except Exception as e:
+            log_warning(f"Failed to retrieve {name}: {e}")
+        self.times.pop(name, None)
+        return default
+
+    def shutdown(self) -> None:
+        """Release the executor without waiting for retrievals that missed the deadline."""
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        self._results.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -11,7 +11,7 @@ class AGUIApp(BaseAPIApp):
     type = "agui"
 
     def get_router(self) -> APIRouter:
-        return get_sync_agui_router(agent=self.agent, team=self.team)
+        return get_sync_agui_router(agent=self.agent, team=self.team, event_encoder=self.event_encoder)
 
     def get_async_router(self) -> APIRouter:
-        return get_async_agui_router(agent=self.agent, team=self.team)
+        return get_async_agui_router(agent=self.agent, team=self.team, event_encoder=self.event_encoder)
@@ -17,12 +17,16 @@ from fastapi.responses import StreamingResponse
 
 from agno.agent.agent import Agent
 from agno.app.agui.utils import async_stream_agno_response_as_agui_events, convert_agui_messages_to_agno_messages
+from agno.run.encoder import EventEncoder as RunEventEncoder
+from agno.run.encoder import acoalesce_content_events
 from agno.team.team import Team
 
 logger = logging.getLogger(__name__)
 
 
-async def run_agent(agent: Agent, run_input: RunAgentInput) -> AsyncIterator[BaseEvent]:
+async def run_agent(
+    agent: Agent, run_input: RunAgentInput, event_encoder: Optional[RunEventEncoder] = None
+) -> AsyncIterator[BaseEvent]:
     """Run the contextual Agent, mapping AG-UI input messages to Agno format, and streaming the response in AG-UI format."""
     run_id = run_input.run_id or str(uuid.uuid4())
 
@@ -38,6 +42,8 @@ async def run_agent(agent: Agent, run_input: RunAgentInput) -> AsyncIterator[Bas
             stream=True,
             stream_intermediate_steps=True,
         )
+        if event_encoder is not None and event_encoder.coalesce_ms:
+            response_stream = acoalesce_content_events(response_stream, event_encoder.coalesce_ms)
 
         # Stream the response content in AG-UI format
         async for event in async_stream_agno_response_as_agui_events(
@@ -51,7 +57,9 @@ async def run_agent(agent: Agent, run_input: RunAgentInput) -> AsyncIterator[Bas
         yield RunErrorEvent(type=EventType.RUN_ERROR, message=str(e))
 
 
-async def run_team(team: Team, input: RunAgentInput) -> AsyncIterator[BaseEvent]:
+async def run_team(
+    team: Team, input: RunAgentInput, event_encoder: Optional[RunEventEncoder] = None
+) -> AsyncIterator[BaseEvent]:
     """Run the contextual Team, mapping AG-UI input messages to Agno format, and streaming the response in AG-UI format."""
     run_id = input.run_id or str(uuid.uuid4())
     try:
@@ -66,6 +74,8 @@ async def run_team(team: Team, input: RunAgentInput) -> AsyncIterator[BaseEvent]
             stream=True,
             stream_intermediate_steps=True,
         )
+        if event_encoder is not None and event_encoder.coalesce_ms:
+            response_stream = acoalesce_content_events(response_stream, event_encoder.coalesce_ms)
 
         # Stream the response content in AG-UI format
         async for event in async_stream_agno_response_as_agui_events(
@@ -78,7 +88,9 @@ async def run_team(team: Team, input: RunAgentInput) -> AsyncIterator[BaseEvent]
         yield RunErrorEvent(type=EventType.RUN_ERROR, message=str(e))
 
 
-def get_async_agui_router(agent: Optional[Agent] = None, team: Optional[Team] = None) -> APIRouter:
+def get_async_agui_router(
+    agent: Optional[Agent] = None, team: Optional[Team] = None, event_encoder: Optional[RunEventEncoder] = None
+) -> APIRouter:
     """Return an AG-UI compatible FastAPI router."""
     if (agent is None and team is None) or (agent is not None and team is not None):
         raise ValueError("One of 'agent' or 'team' must be provided.")
@@ -89,11 +101,11 @@ def get_async_agui_router(agent: Optional[Agent] = None, team: Optional[Team] =
     async def _run(run_input: RunAgentInput):
         async def event_generator():
             if agent:
-                async for event in run_agent(agent, run_input):
+                async for event in run_agent(agent, run_input, event_encoder=event_encoder):
                     encoded_event = encoder.encode(event)
                     yield encoded_event
             elif team:
-                async for event in run_team(team, run_input):
+                async for event in run_team(team, run_input, event_encoder=event_encoder):
                     encoded_event = encoder.encode(event)
                     yield encoded_event
 
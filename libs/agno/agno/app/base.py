@@ -12,6 +12,7 @@ from starlette.middleware.cors import CORSMiddleware
 from agno.agent.agent import Agent
 from agno.api.app import AppCreate, create_app
 from agno.app.settings import APIAppSettings
+from agno.run.encoder import EventEncoder
 from agno.team.team import Team
 from agno.utils.log import log_debug, log_info
 
@@ -31,6 +32,7 @@ class BaseAPIApp(ABC):
         name: Optional[str] = None,
         description: Optional[str] = None,
         version: Optional[str] = None,
+        event_encoder: Optional[EventEncoder] = None,
     ):
         if not agent and not team:
             raise ValueError("Either agent or team must be provided.")
@@ -43,6 +45,8 @@ class BaseAPIApp(ABC):
         self.settings: APIAppSettings = settings or APIAppSettings()
         self.api_app: Optional[FastAPI] = api_app
         self.router: Optional[APIRouter] = router
+        # Encoder used for streaming run events
+        self.event_encoder: Optional[EventEncoder] = event_encoder
         self.monitoring = monitoring
         self.app_id: Optional[str] = app_id
         self.name: Optional[str] = name
@@ -11,6 +11,7 @@ from agno.app.fastapi.async_router import get_async_router
 from agno.app.fastapi.sync_router import get_sync_router
 from agno.app.settings import APIAppSettings
 from agno.app.utils import generate_id
+from agno.run.encoder import EventEncoder
 from agno.team.team import Team
 from agno.utils.log import log_info
 from agno.workflow.workflow import Workflow
@@ -34,6 +35,7 @@ class FastAPIApp(BaseAPIApp):
         description: Optional[str] = None,
         version: Optional[str] = None,
         monitoring: bool = True,
+        event_encoder: Optional[EventEncoder] = None,
     ):
         if not agents and not teams and not workflows:
             raise ValueError("Either agents, teams or workflows must be provided.")
@@ -45,6 +47,8 @@ class FastAPIApp(BaseAPIApp):
         self.settings: APIAppSettings = settings or APIAppSettings()
         self.api_app: Optional[FastAPI] = api_app
         self.router: Optional[APIRouter] = router
+        # Encoder used for streaming run events
+        self.event_encoder: Optional[EventEncoder] = event_encoder
 
         self.app_id: Optional[str] = app_id
         self.name: Optional[str] = name
@@ -83,10 +87,14 @@ class FastAPIApp(BaseAPIApp):
                     workflow.workflow_id = generate_id(workflow.name)
 
     def get_router(self) -> APIRouter:
-        return get_sync_router(agents=self.agents, teams=self.teams, workflows=self.workflows)
+        return get_sync_router(
+            agents=self.agents, teams=self.teams, workflows=self.workflows, event_encoder=self.event_encoder
+        )
 
     def get_async_router(self) -> APIRouter:
-        return get_async_router(agents=self.agents, teams=self.teams, workflows=self.workflows)
+        return get_async_router(
+            agents=self.agents, teams=self.teams, workflows=self.workflows, event_encoder=self.event_encoder
+        )
 
     def serve(
         self,
@@ -11,9 +11,9 @@ from agno.agent.agent import Agent, RunResponse
 from agno.app.playground.utils import process_audio, process_document, process_image, process_video
 from agno.media import Audio, Image, Video
 from agno.media import File as FileMedia
+from agno.run.encoder import EventEncoder
 from agno.run.response import RunResponseErrorEvent
 from agno.run.team import RunResponseErrorEvent as TeamRunResponseErrorEvent
-from agno.run.team import TeamRunResponseEvent
 from agno.run.v2.workflow import WorkflowErrorEvent
 from agno.team.team import Team
 from agno.utils.log import logger
@@ -29,7 +29,9 @@ async def agent_chat_response_streamer(
     images: Optional[List[Image]] = None,
     audio: Optional[List[Audio]] = None,
     videos: Optional[List[Video]] = None,
+    event_encoder: Optional[EventEncoder] = None,
 ) -> AsyncGenerator:
+    event_encoder = event_encoder or EventEncoder()
     try:
         run_response = await agent.arun(
             message,
@@ -41,14 +43,13 @@ async def agent_chat_response_streamer(
             stream=True,
             stream_intermediate_steps=True,
         )
-        async for run_response_chunk in run_response:
-            run_response_chunk = cast(RunResponse, run_response_chunk)
-            yield run_response_chunk.to_json()
+        async for encoded_chunk in event_encoder.aencode_stream(run_response):
+            yield encoded_chunk
     except Exception as e:
         error_response = RunResponseErrorEvent(
             content=str(e),
         )
-        yield error_response.to_json()
+        yield event_encoder.encode(error_response)
         return
 
 
@@ -61,7 +62,9 @@ async def team_chat_response_streamer(
     audio: Optional[List[Audio]] = None,
     videos: Optional[List[Video]] = None,
     files: Optional[List[FileMedia]] = None,
+    event_encoder: Optional[EventEncoder] = None,
 ) -> AsyncGenerator:
+    event_encoder = event_encoder or EventEncoder()
     try:
         run_response = await team.arun(
             message,
@@ -74,14 +77,13 @@ async def team_chat_response_streamer(
             stream=True,
             stream_intermediate_steps=True,
         )
-        async for run_response_chunk in run_response:
-            run_response_chunk = cast(TeamRunResponseEvent, run_response_chunk)
-            yield run_response_chunk.to_json()
+        async for encoded_chunk in event_encoder.aencode_stream(run_response):
+            yield encoded_chunk
     except Exception as e:
         error_response = TeamRunResponseErrorEvent(
             content=str(e),
         )
-        yield error_response.to_json()
+        yield event_encoder.encode(error_response)
         return
 
 
@@ -90,7 +92,9 @@ async def workflow_response_streamer(
     body: Union[Dict[str, Any], str],
     session_id: Optional[str] = None,
     user_id: Optional[str] = None,
+    event_encoder: Optional[EventEncoder] = None,
 ) -> AsyncGenerator:
+    event_encoder = event_encoder or EventEncoder()
     try:
         if isinstance(body, dict):
             run_response = await workflow.arun(  # type: ignore
@@ -108,8 +112,8 @@ async def workflow_response_streamer(
                 stream=True,
                 stream_intermediate_steps=True,
             )
-        async for run_response_chunk in run_response:
-            yield run_response_chunk.to_json()
+        async for encoded_chunk in event_encoder.aencode_stream(run_response):
+            yield encoded_chunk
     except Exception as e:
         import traceback
 
@@ -117,12 +121,15 @@ async def workflow_response_streamer(
         error_response = WorkflowErrorEvent(
             error=str(e),
         )
-        yield error_response.to_json()
+        yield event_encoder.encode(error_response)
         return
 
 
 def get_async_router(
-    agents: Optional[List[Agent]] = None, teams: Optional[List[Team]] = None, workflows: Optional[List[Workflow]] = None
+    agents: Optional[List[Agent]] = None,
+    teams: Optional[List[Team]] = None,
+    workflows: Optional[List[Workflow]] = None,
+    event_encoder: Optional[EventEncoder] = None,
 ) -> APIRouter:
     router = APIRouter()
 
@@ -371,6 +378,7 @@ def get_async_router(
                         images=base64_images if base64_images else None,
                         audio=base64_audios if base64_audios else None,
                         videos=base64_videos if base64_videos else None,
+                        event_encoder=event_encoder,
                     ),
                     media_type="text/event-stream",
                 )
@@ -385,6 +393,7 @@ def get_async_router(
                         audio=base64_audios if base64_audios else None,
                         videos=base64_videos if base64_videos else None,
                         files=document_files if document_files else None,
+                        event_encoder=event_encoder,
                     ),
                     media_type="text/event-stream",
                 )
@@ -406,7 +415,13 @@ def get_async_router(
                         )
                 else:
                     return StreamingResponse(
-                        workflow_response_streamer(workflow, workflow_input, session_id=session_id, user_id=user_id),  # type: ignore
+                        workflow_response_streamer(
+                            workflow,
+                            workflow_input,
+                            session_id=session_id,
+                            user_id=user_id,
+                            event_encoder=event_encoder,
+                        ),  # type: ignore
                         media_type="text/event-stream",
                     )
         else:
@@ -12,9 +12,8 @@ from agno.app.playground.utils import process_audio, process_document, process_i
 from agno.media import Audio, Image, Video
 from agno.media import File as FileMedia
 from agno.run.base import RunStatus
-from agno.run.response import RunResponseEvent
+from agno.run.encoder import EventEncoder
 from agno.run.team import RunResponseErrorEvent as TeamRunResponseErrorEvent
-from agno.run.team import TeamRunResponseEvent
 from agno.run.v2.workflow import WorkflowErrorEvent
 from agno.team.team import Team
 from agno.utils.log import logger
@@ -30,7 +29,9 @@ def agent_chat_response_streamer(
     images: Optional[List[Image]] = None,
     audio: Optional[List[Audio]] = None,
     videos: Optional[List[Video]] = None,
+    event_encoder: Optional[EventEncoder] = None,
 ) -> Generator:
+    event_encoder = event_encoder or EventEncoder()
     try:
         run_response = agent.run(
             message,
@@ -42,12 +43,11 @@ def agent_chat_response_streamer(
             stream=True,
             stream_intermediate_steps=True,
         )
-        for run_response_chunk in run_response:
-            run_response_chunk = cast(RunResponseEvent, run_response_chunk)
-            yield run_response_chunk.to_json()
+        for encoded_chunk in event_encoder.encode_stream(run_response):
+            yield encoded_chunk
     except Exception as e:
         error_response = RunResponse(content=str(e), status=RunStatus.error)
-        yield error_response.to_json()
+        yield event_encoder.encode(error_response)
         return
 
 
@@ -60,7 +60,9 @@ def team_chat_response_streamer(
     audio: Optional[List[Audio]] = None,
     videos: Optional[List[Video]] = None,
     files: Optional[List[FileMedia]] = None,
+    event_encoder: Optional[EventEncoder] = None,
 ) -> Generator:
+    event_encoder = event_encoder or EventEncoder()
     try:
         run_response = team.run(
             message,
@@ -73,14 +75,13 @@ def team_chat_response_streamer(
             stream=True,
             stream_intermediate_steps=True,
         )
-        for run_response_chunk in run_response:
-            run_response_chunk = cast(TeamRunResponseEvent, run_response_chunk)
-            yield run_response_chunk.to_json()
+        for encoded_chunk in event_encoder.encode_stream(run_response):
+            yield encoded_chunk
     except Exception as e:
         error_response = TeamRunResponseErrorEvent(
             content=str(e),
         )
-        yield error_response.to_json()
+        yield event_encoder.encode(error_response)
         return
 
 
@@ -89,7 +90,9 @@ def workflow_response_streamer(
     body: Union[Dict[str, Any], str],
     session_id: Optional[str] = None,
     user_id: Optional[str] = None,
+    event_encoder: Optional[EventEncoder] = None,
 ) -> Generator:
+    event_encoder = event_encoder or EventEncoder()
     try:
         if isinstance(body, dict):
             run_response = workflow.run(
@@ -107,8 +110,8 @@ def workflow_response_streamer(
                 stream=True,
                 stream_intermediate_steps=True,
             )
-        for run_response_chunk in run_response:
-            yield run_response_chunk.to_json()
+        for encoded_chunk in event_encoder.encode_stream(run_response):
+            yield encoded_chunk
     except Exception as e:
         import traceback
 
@@ -116,12 +119,15 @@ def workflow_response_streamer(
         error_response = WorkflowErrorEvent(
             error=str(e),
         )
-        yield error_response.to_json()
+        yield event_encoder.encode(error_response)
         return
 
 
 def get_sync_router(
-    agents: Optional[List[Agent]] = None, teams: Optional[List[Team]] = None, workflows: Optional[List[Workflow]] = None
+    agents: Optional[List[Agent]] = None,
+    teams: Optional[List[Team]] = None,
+    workflows: Optional[List[Workflow]] = None,
+    event_encoder: Optional[EventEncoder] = None,
 ) -> APIRouter:
     router = APIRouter()
 
@@ -366,6 +372,7 @@ def get_sync_router(
                         images=base64_images if base64_images else None,
                         audio=base64_audios if base64_audios else None,
                         videos=base64_videos if base64_videos else None,
+                        event_encoder=event_encoder,
                     ),
                     media_type="text/event-stream",
                 )
@@ -380,6 +387,7 @@ def get_sync_router(
                         audio=base64_audios if base64_audios else None,
                         videos=base64_videos if base64_videos else None,
                         files=document_files if document_files else None,
+                        event_encoder=event_encoder,
                     ),
                     media_type="text/event-stream",
                 )
@@ -400,7 +408,13 @@ def get_sync_router(
                         )
                 else:
                     return StreamingResponse(
-                        workflow_response_streamer(workflow, workflow_input, session_id=session_id, user_id=user_id),
+                        workflow_response_streamer(
+                            workflow,
+                            workflow_input,
+                            session_id=session_id,
+                            user_id=user_id,
+                            event_encoder=event_encoder,
+                        ),
                         media_type="text/event-stream",
                     )
         else:
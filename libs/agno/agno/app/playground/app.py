@@ -19,6 +19,7 @@ from agno.app.utils import generate_id
 from agno.cli.console import console
 from agno.cli.settings import agno_cli_settings
 from agno.playground.settings import PlaygroundSettings
+from agno.run.encoder import EventEncoder
 from agno.team.team import Team
 from agno.utils.log import log_debug, logger
 from agno.workflow.workflow import Workflow
@@ -37,6 +38,7 @@ class Playground:
         name: Optional[str] = None,
         description: Optional[str] = None,
         monitoring: bool = True,
+        event_encoder: Optional[EventEncoder] = None,
     ):
         if not agents and not workflows and not teams:
             raise ValueError("Either agents, teams or workflows must be provided.")
@@ -48,6 +50,8 @@ class Playground:
         self.settings: PlaygroundSettings = settings or PlaygroundSettings()
         self.api_app: Optional[FastAPI] = api_app
         self.router: Optional[APIRouter] = router
+        # Encoder used for streaming run events
+        self.event_encoder: Optional[EventEncoder] = event_encoder
 
         self.endpoints_created: Optional[PlaygroundEndpointCreate] = None
 
@@ -105,10 +109,14 @@ class Playground:
             self.monitoring = monitor_env.lower() == "true"
 
     def get_router(self) -> APIRouter:
-        return get_sync_playground_router(self.agents, self.workflows, self.teams, self.app_id)
+        return get_sync_playground_router(
+            self.agents, self.workflows, self.teams, self.app_id, event_encoder=self.event_encoder
+        )
 
     def get_async_router(self) -> APIRouter:
-        return get_async_playground_router(self.agents, self.workflows, self.teams, self.app_id)
+        return get_async_playground_router(
+            self.agents, self.workflows, self.teams, self.app_id, event_encoder=self.event_encoder
+        )
 
     def get_app(self, use_async: bool = True, prefix: str = "/v1", lifespan: Optional[Callable] = None) -> FastAPI:
         if not self.api_app:
@@ -36,7 +36,8 @@ from agno.media import Audio, Image, Video
 from agno.media import File as FileMedia
 from agno.memory.agent import AgentMemory
 from agno.memory.v2 import Memory
-from agno.run.response import RunResponseErrorEvent, RunResponseEvent
+from agno.run.encoder import EventEncoder
+from agno.run.response import RunResponseErrorEvent
 from agno.run.team import RunResponseErrorEvent as TeamRunResponseErrorEvent
 from agno.run.v2.workflow import WorkflowErrorEvent
 from agno.storage.session.agent import AgentSession
@@ -57,7 +58,9 @@ async def chat_response_streamer(
     audio: Optional[List[Audio]] = None,
     videos: Optional[List[Video]] = None,
     files: Optional[List[FileMedia]] = None,
+    event_encoder: Optional[EventEncoder] = None,
 ) -> AsyncGenerator:
+    event_encoder = event_encoder or EventEncoder()
     try:
         run_response = await agent.arun(
             message,
@@ -70,8 +73,8 @@ async def chat_response_streamer(
             stream=True,
             stream_intermediate_steps=True,
         )
-        async for run_response_chunk in run_response:
-            yield run_response_chunk.to_json()
+        async for encoded_chunk in event_encoder.aencode_stream(run_response):
+            yield encoded_chunk
     except Exception as e:
         import traceback
 
@@ -79,7 +82,7 @@ async def chat_response_streamer(
         error_response = RunResponseErrorEvent(
             content=str(e),
         )
-        yield error_response.to_json()
+        yield event_encoder.encode(error_response)
         return
 
 
@@ -89,7 +92,9 @@ async def agent_acontinue_run_streamer(
     updated_tools: Optional[List] = None,
     session_id: Optional[str] = None,
     user_id: Optional[str] = None,
+    event_encoder: Optional[EventEncoder] = None,
 ) -> AsyncGenerator:
+    event_encoder = event_encoder or EventEncoder()
     try:
         continue_response = await agent.acontinue_run(
             run_id=run_id,
@@ -99,9 +104,8 @@ async def agent_acontinue_run_streamer(
             stream=True,
             stream_intermediate_steps=True,
         )
-        async for run_response_chunk in continue_response:
-            run_response_chunk = cast(RunResponseEvent, run_response_chunk)
-            yield run_response_chunk.to_json()
+        async for encoded_chunk in event_encoder.aencode_stream(continue_response):
+            yield encoded_chunk
     except Exception as e:
         import traceback
 
@@ -109,7 +113,7 @@ async def agent_acontinue_run_streamer(
         error_response = RunResponseErrorEvent(
             content=str(e),
         )
-        yield error_response.to_json()
+        yield event_encoder.encode(error_response)
         return
 
 
@@ -122,7 +126,9 @@ async def team_chat_response_streamer(
     audio: Optional[List[Audio]] = None,
     videos: Optional[List[Video]] = None,
     files: Optional[List[FileMedia]] = None,
+    event_encoder: Optional[EventEncoder] = None,
 ) -> AsyncGenerator:
+    event_encoder = event_encoder or EventEncoder()
     try:
         run_response = await team.arun(
             message,
@@ -135,8 +141,8 @@ async def team_chat_response_streamer(
             stream=True,
             stream_intermediate_steps=True,
         )
-        async for run_response_chunk in run_response:
-            yield run_response_chunk.to_json()
+        async for encoded_chunk in event_encoder.aencode_stream(run_response):
+            yield encoded_chunk
     except Exception as e:
         import traceback
 
@@ -144,14 +150,16 @@ async def team_chat_response_streamer(
         error_response = TeamRunResponseErrorEvent(
             content=str(e),
         )
-        yield error_response.to_json()
+        yield event_encoder.encode(error_response)
         return
 
 
 async def workflow_response_streamer(
     workflow: WorkflowV2,
     body: WorkflowRunRequest,
+    event_encoder: Optional[EventEncoder] = None,
 ) -> AsyncGenerator:
+    event_encoder = event_encoder or EventEncoder()
     try:
         run_response = await workflow.arun(
             **body.input,
@@ -160,8 +168,8 @@ async def workflow_response_streamer(
             stream=True,
             stream_intermediate_steps=True,
         )
-        async for run_response_chunk in run_response:
-            yield run_response_chunk.to_json()
+        async for encoded_chunk in event_encoder.aencode_stream(run_response):
+            yield encoded_chunk
     except Exception as e:
         import traceback
 
@@ -169,7 +177,7 @@ async def workflow_response_streamer(
         error_response = WorkflowErrorEvent(
             error=str(e),
         )
-        yield error_response.to_json()
+        yield event_encoder.encode(error_response)
         return
 
 
@@ -178,8 +186,10 @@ def get_async_playground_router(
     workflows: Optional[List[Workflow]] = None,
     teams: Optional[List[Team]] = None,
     active_app_id: Optional[str] = None,
+    event_encoder: Optional[EventEncoder] = None,
 ) -> APIRouter:
     playground_router = APIRouter(prefix="/playground", tags=["Playground"])
+    event_encoder = event_encoder or EventEncoder()
 
     if agents is None and workflows is None and teams is None:
         raise ValueError("Either agents, teams or workflows must be provided.")
@@ -426,6 +436,7 @@ def get_async_playground_router(
                     audio=base64_audios if base64_audios else None,
                     videos=base64_videos if base64_videos else None,
                     files=input_files if input_files else None,
+                    event_encoder=event_encoder,
                 ),
                 media_type="text/event-stream",
             )
@@ -492,6 +503,7 @@ def get_async_playground_router(
                     updated_tools=updated_tools,
                     session_id=session_id,
                     user_id=user_id,
+                    event_encoder=event_encoder,
                 ),
                 media_type="text/event-stream",
             )
@@ -688,7 +700,7 @@ def get_async_playground_router(
                 else:
                     # Return as a streaming response
                     return StreamingResponse(
-                        (result.to_json() for result in new_workflow_instance.run(**body.input)),
+                        event_encoder.encode_stream(new_workflow_instance.run(**body.input)),
                         media_type="text/event-stream",
                         headers={
                             "Access-Control-Allow-Origin": "*",
@@ -705,7 +717,7 @@ def get_async_playground_router(
                 if body.stream:
                     # Return as a streaming response
                     return StreamingResponse(
-                        workflow_response_streamer(workflow, body),
+                        workflow_response_streamer(workflow, body, event_encoder=event_encoder),
                         media_type="text/event-stream",
                         headers={
                             "Access-Control-Allow-Origin": "*",
@@ -906,6 +918,7 @@ def get_async_playground_router(
                     audio=base64_audios if base64_audios else None,
                     videos=base64_videos if base64_videos else None,
                     files=document_files if document_files else None,
+                    event_encoder=event_encoder,
                 ),
                 media_type="text/event-stream",
             )
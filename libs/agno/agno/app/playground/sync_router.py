@@ -36,7 +36,8 @@ from agno.media import Audio, Image, Video
 from agno.media import File as FileMedia
 from agno.memory.agent import AgentMemory
 from agno.memory.v2 import Memory
-from agno.run.response import RunResponseErrorEvent, RunResponseEvent
+from agno.run.encoder import EventEncoder
+from agno.run.response import RunResponseErrorEvent
 from agno.run.team import RunResponseErrorEvent as TeamRunResponseErrorEvent
 from agno.run.v2.workflow import WorkflowErrorEvent
 from agno.storage.session.agent import AgentSession
@@ -57,7 +58,9 @@ def chat_response_streamer(
     audio: Optional[List[Audio]] = None,
     videos: Optional[List[Video]] = None,
     files: Optional[List[FileMedia]] = None,
+    event_encoder: Optional[EventEncoder] = None,
 ) -> Generator:
+    event_encoder = event_encoder or EventEncoder()
     try:
         run_response = agent.run(
             message,
@@ -70,9 +73,8 @@ def chat_response_streamer(
             stream=True,
             stream_intermediate_steps=True,
         )
-        for run_response_chunk in run_response:
-            run_response_chunk = cast(RunResponseEvent, run_response_chunk)
-            yield run_response_chunk.to_json()
+        for encoded_chunk in event_encoder.encode_stream(run_response):
+            yield encoded_chunk
     except Exception as e:
         import traceback
 
@@ -80,7 +82,7 @@ def chat_response_streamer(
         error_response = RunResponseErrorEvent(
             content=str(e),
         )
-        yield error_response.to_json()
+        yield event_encoder.encode(error_response)
         return
 
 
@@ -90,7 +92,9 @@ def agent_continue_run_streamer(
     updated_tools: Optional[List] = None,
     session_id: Optional[str] = None,
     user_id: Optional[str] = None,
+    event_encoder: Optional[EventEncoder] = None,
 ) -> Generator:
+    event_encoder = event_encoder or EventEncoder()
     try:
         continue_response = agent.continue_run(
             run_id=run_id,
@@ -100,9 +104,8 @@ def agent_continue_run_streamer(
             stream=True,
             stream_intermediate_steps=True,
         )
-        for run_response_chunk in continue_response:
-            run_response_chunk = cast(RunResponseEvent, run_response_chunk)
-            yield run_response_chunk.to_json()
+        for encoded_chunk in event_encoder.encode_stream(continue_response):
+            yield encoded_chunk
     except Exception as e:
         import traceback
 
@@ -110,7 +113,7 @@ def agent_continue_run_streamer(
         error_response = RunResponseErrorEvent(
             content=str(e),
         )
-        yield error_response.to_json()
+        yield event_encoder.encode(error_response)
         return
 
 
@@ -123,7 +126,9 @@ def team_chat_response_streamer(
     audio: Optional[List[Audio]] = None,
     videos: Optional[List[Video]] = None,
     files: Optional[List[FileMedia]] = None,
+    event_encoder: Optional[EventEncoder] = None,
 ) -> Generator:
+    event_encoder = event_encoder or EventEncoder()
     try:
         run_response = team.run(
             message,
@@ -136,8 +141,8 @@ def team_chat_response_streamer(
             stream=True,
             stream_intermediate_steps=True,
         )
-        for run_response_chunk in run_response:
-            yield run_response_chunk.to_json()
+        for encoded_chunk in event_encoder.encode_stream(run_response):
+            yield encoded_chunk
     except Exception as e:
         import traceback
 
@@ -145,14 +150,16 @@ def team_chat_response_streamer(
         error_response = TeamRunResponseErrorEvent(
             content=str(e),
         )
-        yield error_response.to_json()
+        yield event_encoder.encode(error_response)
         return
 
 
 def workflow_response_streamer(
     workflow: WorkflowV2,
     body: WorkflowRunRequest,
+    event_encoder: Optional[EventEncoder] = None,
 ) -> Generator:
+    event_encoder = event_encoder or EventEncoder()
     try:
         run_response = workflow.run(
             **body.input,
@@ -161,8 +168,8 @@ def workflow_response_streamer(
             stream=True,
             stream_intermediate_steps=True,
         )
-        for run_response_chunk in run_response:
-            yield run_response_chunk.to_json()
+        for encoded_chunk in event_encoder.encode_stream(run_response):
+            yield encoded_chunk
     except Exception as e:
         import traceback
 
@@ -170,7 +177,7 @@ def workflow_response_streamer(
         error_response = WorkflowErrorEvent(
             error=str(e),
         )
-        yield error_response.to_json()
+        yield event_encoder.encode(error_response)
         return
 
 
@@ -179,8 +186,10 @@ def get_sync_playground_router(
     workflows: Optional[List[Workflow]] = None,
     teams: Optional[List[Team]] = None,
     active_app_id: Optional[str] = None,
+    event_encoder: Optional[EventEncoder] = None,
 ) -> APIRouter:
     playground_router = APIRouter(prefix="/playground", tags=["Playground"])
+    event_encoder = event_encoder or EventEncoder()
     if agents is None and workflows is None and teams is None:
         raise ValueError("Either agents, teams or workflows must be provided.")
 
@@ -426,6 +435,7 @@ def get_sync_playground_router(
                     audio=base64_audios if base64_audios else None,
                     videos=base64_videos if base64_videos else None,
                     files=input_files if input_files else None,
+                    event_encoder=event_encoder,
                 ),
                 media_type="text/event-stream",
             )
@@ -492,6 +502,7 @@ def get_sync_playground_router(
                     updated_tools=updated_tools,
                     session_id=session_id,
                     user_id=user_id,
+                    event_encoder=event_encoder,
                 ),
                 media_type="text/event-stream",
             )
@@ -682,7 +693,7 @@ def get_sync_playground_router(
                 else:
                     # Return as a streaming response
                     return StreamingResponse(
-                        (result.to_json() for result in new_workflow_instance.run(**body.input)),
+                        event_encoder.encode_stream(new_workflow_instance.run(**body.input)),
                         media_type="text/event-stream",
                         headers={
                             "Access-Control-Allow-Origin": "*",
@@ -699,7 +710,7 @@ def get_sync_playground_router(
                 if body.stream:
                     # Return as a streaming response
                     return StreamingResponse(
-                        workflow_response_streamer(workflow, body),
+                        workflow_response_streamer(workflow, body, event_encoder=event_encoder),
                         media_type="text/event-stream",
                         headers={
                             "Access-Control-Allow-Origin": "*",
@@ -901,6 +912,7 @@ def get_sync_playground_router(
                     audio=base64_audios if base64_audios else None,
                     videos=base64_videos if base64_videos else None,
                     files=document_files if document_files else None,
+                    event_encoder=event_encoder,
                 ),
                 media_type="text/event-stream",
             )
@@ -1,5 +1,6 @@
-from agno.document.base import Document
+from agno.document.base import Document, async_embed_documents
 
 __all__ = [
     "Document",
+    "async_embed_documents",
 ]
@@ -1,7 +1,9 @@
+import asyncio
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 from agno.embedder import Embedder
+from agno.utils.log import log_error
 
 
 @dataclass
@@ -26,6 +28,15 @@ class Document:
 
         self.embedding, self.usage = _embedder.get_embedding_and_usage(self.content)
 
+    async def async_embed(self, embedder: Optional[Embedder] = None) -> None:
+        """Embed the document using the provided embedder, without blocking the event loop"""
+
+        _embedder = embedder or self.embedder
+        if _embedder is None:
+            raise ValueError("No embedder provided")
+
+        self.embedding, self.usage = await _embedder.aget_embedding_and_usage(self.content)
+
     def to_dict(self) -> Dict[str, Any]:
         """Returns a dictionary representation of the document"""
         fields = {"name", "meta_data", "content"}
@@ -46,3 +57,20 @@ class Document:
         import json
 
         return cls(**json.loads(document))
+
+
+async def async_embed_documents(documents: List[Document], embedder: Embedder) -> None:
+    """Embed the documents concurrently, bounded by the embedder's `max_concurrency`.
+
+    A document that fails to embed is logged and left without an embedding.
+    """
+    semaphore = asyncio.Semaphore(max(embedder.max_concurrency, 1))
+
+    async def _embed(document: Document) -> None:
+        async with semaphore:
+            try:
+                await document.async_embed(embedder)
+            except Exception as e:
+                log_error(f"Error embedding document '{document.name}': {e}")
+
+    await asyncio.gather(*[_embed(document) for document in documents])
@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
@@ -7,9 +8,38 @@ class Embedder:
     """Base class for managing embedders"""
 
     dimensions: Optional[int] = 1536
+    # Maximum number of embedding requests in flight during an async batch
+    max_concurrency: int = 8
 
     def get_embedding(self, text: str) -> List[float]:
         raise NotImplementedError
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         raise NotImplementedError
+
+    async def aget_embedding(self, text: str) -> List[float]:
+        """Embedders with an async client override this, the default runs the sync call in a worker thread."""
+        return await asyncio.to_thread(self.get_embedding, text)
+
+    async def aget_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return await asyncio.to_thread(self.get_embedding_and_usage, text)
+
+    async def aget_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed the texts concurrently, with at most `max_concurrency` requests in flight."""
+        semaphore = asyncio.Semaphore(max(self.max_concurrency, 1))
+
+        async def _embed(text: str) -> List[float]:
+            async with semaphore:
+                return await self.aget_embedding(text)
+
+        return list(await asyncio.gather(*[_embed(text) for text in texts]))
+
+    async def aget_embeddings_batch_and_usage(self, texts: List[str]) -> List[Tuple[List[float], Optional[Dict]]]:
+        """Embed the texts concurrently, with at most `max_concurrency` requests in flight."""
+        semaphore = asyncio.Semaphore(max(self.max_concurrency, 1))
+
+        async def _embed(text: str) -> Tuple[List[float], Optional[Dict]]:
+            async with semaphore:
+                return await self.aget_embedding_and_usage(text)
+
+        return list(await asyncio.gather(*[_embed(text) for text in texts]))
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from os import getenv
 from typing import Any, Dict, List, Optional, Tuple
 
+import httpx
 from typing_extensions import Literal
 
 from agno.embedder.base import Embedder
@@ -25,6 +26,8 @@ class JinaEmbedder(Embedder):
     headers: Optional[Dict[str, str]] = None
     request_params: Optional[Dict[str, Any]] = None
     timeout: Optional[float] = None
+    # Reuse this client for async requests instead of opening one per request
+    async_http_client: Optional[httpx.AsyncClient] = None
 
     def _get_headers(self) -> Dict[str, str]:
         if not self.api_key:
@@ -37,7 +40,7 @@ class JinaEmbedder(Embedder):
             headers.update(self.headers)
         return headers
 
-    def _response(self, text: str) -> Dict[str, Any]:
+    def _get_request_data(self, text: str) -> Dict[str, Any]:
         data = {
             "model": self.id,
             "late_chunking": self.late_chunking,
@@ -49,11 +52,24 @@ class JinaEmbedder(Embedder):
             data["user"] = self.user
         if self.request_params:
             data.update(self.request_params)
+        return data
 
+    def _response(self, text: str) -> Dict[str, Any]:
+        data = self._get_request_data(text)
         response = requests.post(self.base_url, headers=self._get_headers(), json=data, timeout=self.timeout)
         response.raise_for_status()
         return response.json()
 
+    async def _aresponse(self, text: str) -> Dict[str, Any]:
+        data = self._get_request_data(text)
+        if self.async_http_client is not None:
+            response = await self.async_http_client.post(self.base_url, headers=self._get_headers(), json=data)
+        else:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                response = await client.post(self.base_url, headers=self._get_headers(), json=data)
+        response.raise_for_status()
+        return response.json()
+
     def get_embedding(self, text: str) -> List[float]:
         try:
             result = self._response(text)
@@ -71,3 +87,21 @@ class JinaEmbedder(Embedder):
         except Exception as e:
             logger.warning(f"Failed to get embedding and usage: {e}")
             return [], None
+
+    async def aget_embedding(self, text: str) -> List[float]:
+        try:
+            result = await self._aresponse(text)
+            return result["data"][0]["embedding"]
+        except Exception as e:
+            logger.warning(f"Failed to get embedding: {e}")
+            return []
+
+    async def aget_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        try:
+            result = await self._aresponse(text)
+            embedding = result["data"][0]["embedding"]
+            usage = result.get("usage")
+            return embedding, usage
+        except Exception as e:
+            logger.warning(f"Failed to get embedding and usage: {e}")
+            return [], None
@@ -47,14 +47,23 @@ class MistralEmbedder(Embedder):
 
         return self.mistral_client
 
-    def _response(self, text: str) -> EmbeddingResponse:
+    def _get_request_params(self, text: str) -> Dict[str, Any]:
         _request_params: Dict[str, Any] = {
             "inputs": text,
             "model": self.id,
         }
         if self.request_params:
             _request_params.update(self.request_params)
-        response = self.client.embeddings.create(**_request_params)
+        return _request_params
+
+    def _response(self, text: str) -> EmbeddingResponse:
+        response = self.client.embeddings.create(**self._get_request_params(text))
+        if response is None:
+            raise ValueError("Failed to get embedding response")
+        return response
+
+    async def _aresponse(self, text: str) -> EmbeddingResponse:
+        response = await self.client.embeddings.create_async(**self._get_request_params(text))
         if response is None:
             raise ValueError("Failed to get embedding response")
         return response
@@ -80,3 +89,25 @@ class MistralEmbedder(Embedder):
         except Exception as e:
             logger.warning(f"Error getting embedding and usage: {e}")
             return [], {}
+
+    async def aget_embedding(self, text: str) -> List[float]:
+        try:
+            response: EmbeddingResponse = await self._aresponse(text=text)
+            if response.data and response.data[0].embedding:
+                return response.data[0].embedding
+            return []
+        except Exception as e:
+            logger.warning(f"Error getting embedding: {e}")
+            return []
+
+    async def aget_embedding_and_usage(self, text: str) -> Tuple[List[float], Dict[str, Any]]:
+        try:
+            response: EmbeddingResponse = await self._aresponse(text=text)
+            embedding: List[float] = (
+                response.data[0].embedding if (response.data and response.data[0].embedding) else []
+            )
+            usage: Dict[str, Any] = response.usage.model_dump() if response.usage else {}
+            return embedding, usage
+        except Exception as e:
+            logger.warning(f"Error getting embedding and usage: {e}")
+            return [], {}
@@ -8,8 +8,10 @@ from agno.document import Document
 from agno.document.chunking.fixed import FixedSizeChunking
 from agno.document.chunking.strategy import ChunkingStrategy
 from agno.document.reader.base import Reader
+from agno.knowledge.cache import SearchCache
 from agno.utils.log import log_debug, log_info, logger
 from agno.vectordb import VectorDb
+from agno.vectordb.filters import parse_filters
 
 
 class AgentKnowledge(BaseModel):
@@ -23,6 +25,8 @@ class AgentKnowledge(BaseModel):
     num_documents: int = 5
     # Number of documents to optimize the vector db on
     optimize_on: Optional[int] = 1000
+    # Cache of search results, invalidated whenever documents are written to the vector db
+    search_cache: Optional[SearchCache] = None
 
     chunking_strategy: ChunkingStrategy = Field(default_factory=FixedSizeChunking)
 
@@ -51,23 +55,45 @@ class AgentKnowledge(BaseModel):
         raise NotImplementedError
 
     def search(
-        self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        num_documents: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
-        """Returns relevant documents matching a query"""
+        """Returns relevant documents matching a query.
+        Embeddings are only returned when include_embeddings is True, otherwise the vector db does not read them.
+        """
         try:
             if self.vector_db is None:
                 logger.warning("No vector db provided")
                 return []
 
             _num_documents = num_documents or self.num_documents
+            cache_key, documents = self._get_cached_search(query, _num_documents, filters, include_embeddings)
+            if documents is not None:
+                return documents
+
             log_debug(f"Getting {_num_documents} relevant documents for query: {query}")
-            return self.vector_db.search(query=query, limit=_num_documents, filters=filters)
+            if include_embeddings:
+                documents = self.vector_db.search(
+                    query=query, limit=_num_documents, filters=filters, include_embeddings=True
+                )
+            else:
+                documents = self.vector_db.search(query=query, limit=_num_documents, filters=filters)
+            if cache_key is not None:
+                self.search_cache.set(cache_key, documents)  # type: ignore
+            return documents
         except Exception as e:
             logger.error(f"Error searching for documents: {e}")
             return []
 
     async def async_search(
-        self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        num_documents: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """Returns relevant documents matching a query"""
         try:
@@ -76,16 +102,48 @@ class AgentKnowledge(BaseModel):
                 return []
 
             _num_documents = num_documents or self.num_documents
+            cache_key, documents = self._get_cached_search(query, _num_documents, filters, include_embeddings)
+            if documents is not None:
+                return documents
+
             log_debug(f"Getting {_num_documents} relevant documents for query: {query}")
             try:
-                return await self.vector_db.async_search(query=query, limit=_num_documents, filters=filters)
+                if include_embeddings:
+                    documents = await self.vector_db.async_search(
+                        query=query, limit=_num_documents, filters=filters, include_embeddings=True
+                    )
+                else:
+                    documents = await self.vector_db.async_search(query=query, limit=_num_documents, filters=filters)
+                if cache_key is not None:
+                    self.search_cache.set(cache_key, documents)  # type: ignore
+                return documents
             except NotImplementedError:
                 logger.info("Vector db does not support async search")
-                return self.search(query=query, num_documents=_num_documents, filters=filters)
+                return self.search(
+                    query=query, num_documents=_num_documents, filters=filters, include_embeddings=include_embeddings
+                )
         except Exception as e:
             logger.error(f"Error searching for documents: {e}")
             return []
 
+    def _get_cached_search(
+        self,
+        query: str,
+        num_documents: int,
+        filters: Optional[Dict[str, Any]],
+        include_embeddings: bool,
+    ) -> Tuple[Optional[str], Optional[List[Document]]]:
+        """Returns the search cache key and the cached documents, if any."""
+        if self.search_cache is None:
+            return None, None
+        cache_key = self.search_cache.get_key(query, num_documents, filters, include_embeddings)
+        return cache_key, self.search_cache.get(cache_key)
+
+    def invalidate_search_cache(self) -> None:
+        """Drop cached search results, called whenever documents are written to or removed from the vector db."""
+        if self.search_cache is not None:
+            self.search_cache.invalidate()
+
     def load(
         self,
         recreate: bool = False,
@@ -106,6 +164,7 @@ class AgentKnowledge(BaseModel):
         if recreate:
             log_info("Dropping collection")
             self.vector_db.drop()
+            self.invalidate_search_cache()
 
         if not self.vector_db.exists():
             log_info("Creating collection")
@@ -137,6 +196,7 @@ class AgentKnowledge(BaseModel):
                         self.vector_db.insert(documents=[doc], filters=doc.meta_data)
 
             num_documents += len(documents_to_load)
+            self.invalidate_search_cache()
             log_info(f"Added {len(documents_to_load)} documents to knowledge base")
 
     async def aload(
@@ -160,6 +220,7 @@ class AgentKnowledge(BaseModel):
         if recreate:
             log_info("Dropping collection")
             await self.vector_db.async_drop()
+            self.invalidate_search_cache()
 
         if not await self.vector_db.async_exists():
             log_info("Creating collection")
@@ -191,6 +252,7 @@ class AgentKnowledge(BaseModel):
                         await self.vector_db.async_insert(documents=[doc], filters=doc.meta_data)
 
             num_documents += len(documents_to_load)
+            self.invalidate_search_cache()
             log_info(f"Added {len(documents_to_load)} documents to knowledge base")
 
     def load_documents(
@@ -220,6 +282,7 @@ class AgentKnowledge(BaseModel):
         # Upsert documents if upsert is True
         if upsert and self.vector_db.upsert_available():
             self.vector_db.upsert(documents=documents, filters=filters)
+            self.invalidate_search_cache()
             log_info(f"Loaded {len(documents)} documents to knowledge base")
         else:
             # Filter out documents which already exist in the vector db
@@ -232,6 +295,7 @@ class AgentKnowledge(BaseModel):
             # Insert documents
             if len(documents_to_load) > 0:
                 self.vector_db.insert(documents=documents_to_load, filters=filters)
+                self.invalidate_search_cache()
                 log_info(f"Loaded {len(documents_to_load)} documents to knowledge base")
             else:
                 log_info("No new documents to load")
@@ -270,6 +334,7 @@ class AgentKnowledge(BaseModel):
             except NotImplementedError:
                 logger.warning("Vector db does not support async upsert")
                 self.vector_db.upsert(documents=documents, filters=filters)
+            self.invalidate_search_cache()
             log_info(f"Loaded {len(documents)} documents to knowledge base")
         else:
             # Filter out documents which already exist in the vector db
@@ -298,6 +363,7 @@ class AgentKnowledge(BaseModel):
                 except NotImplementedError:
                     logger.warning("Vector db does not support async insert")
                     self.vector_db.insert(documents=documents_to_load, filters=filters)
+                self.invalidate_search_cache()
                 log_info(f"Loaded {len(documents_to_load)} documents to knowledge base")
             else:
                 log_info("No new documents to load")
@@ -400,7 +466,9 @@ class AgentKnowledge(BaseModel):
             logger.warning("No vector db available")
             return True
 
-        return self.vector_db.delete()
+        deleted = self.vector_db.delete()
+        self.invalidate_search_cache()
+        return deleted
 
     def filter_existing_documents(self, documents: List[Document]) -> List[Document]:
         """Filter out documents that already exist in the vector database.
@@ -504,9 +572,23 @@ class AgentKnowledge(BaseModel):
             return {}, invalid_keys
 
         for key, value in filters.items():
-            # Handle both normal keys and prefixed keys like meta_data.key
-            base_key = key.split(".")[-1] if "." in key else key
-            if base_key in self.valid_metadata_filters or key in self.valid_metadata_filters:
+            # Logical operators are kept when all the keys they filter on are valid
+            if key in ("$and", "$or"):
+                try:
+                    nested_keys = parse_filters({key: value}).get_keys()  # type: ignore
+                except ValueError as e:
+                    invalid_keys.append(key)
+                    log_debug(f"Invalid filter {key}: {e}")
+                    continue
+                nested_invalid_keys = [
+                    nested_key for nested_key in nested_keys if not self._is_valid_filter_key(nested_key)
+                ]
+                if nested_invalid_keys:
+                    invalid_keys.extend(nested_invalid_keys)
+                    log_debug(f"Invalid filter keys in {key}: {nested_invalid_keys} - not present in knowledge base")
+                else:
+                    valid_filters[key] = value
+            elif self._is_valid_filter_key(key):
                 valid_filters[key] = value
             else:
                 invalid_keys.append(key)
@@ -514,6 +596,13 @@ class AgentKnowledge(BaseModel):
 
         return valid_filters, invalid_keys
 
+    def _is_valid_filter_key(self, key: str) -> bool:
+        # Handle both normal keys and prefixed keys like meta_data.key
+        base_key = key.split(".")[-1] if "." in key else key
+        return self.valid_metadata_filters is not None and (
+            base_key in self.valid_metadata_filters or key in self.valid_metadata_filters
+        )
+
     def initialize_valid_filters(self) -> None:
         """Refresh the valid metadata filters by scanning the documents in the knowledge base.
         This will be required majorly for the case when load/aload is commented out but we still need a way to call document_lists for updating the valid metadata filters.
@@ -564,6 +653,7 @@ class AgentKnowledge(BaseModel):
         if recreate:
             # log_info(f"Recreating collection.")
             self.vector_db.drop()
+            self.invalidate_search_cache()
 
         # Create collection if it doesn't exist
         if not self.vector_db.exists():
@@ -612,6 +702,7 @@ class AgentKnowledge(BaseModel):
         if recreate:
             log_info("Recreating collection.")
             await self.vector_db.async_drop()
+            self.invalidate_search_cache()
 
         # Create collection if it doesn't exist
         if not await self.vector_db.async_exists():
@@ -659,6 +750,7 @@ class AgentKnowledge(BaseModel):
             else:
                 log_info("No new documents to insert after filtering.")
 
+        self.invalidate_search_cache()
         log_info(f"Finished loading documents from {source_info}.")
 
     async def aprocess_documents(
@@ -700,4 +792,5 @@ class AgentKnowledge(BaseModel):
             else:
                 log_info("No new documents to insert after filtering.")
 
+        self.invalidate_search_cache()
         log_info(f"Finished loading documents from {source_info}.")
@@ -0,0 +1,107 @@
+import json
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import dataclass, field
+from hashlib import sha256
+from threading import Lock
+from time import time
+from typing import Any, Dict, List, Optional
+
+from agno.document import Document
+from agno.utils.log import log_debug
+
+
+@dataclass
+class SearchCacheEntry:
+    """Cached results of a knowledge base search"""
+
+    documents: List[Document]
+    created_at: float = field(default_factory=time)
+
+    def is_expired(self, ttl: Optional[int]) -> bool:
+        return ttl is not None and (time() - self.created_at) > ttl
+
+
+class SearchCache:
+    """Caches knowledge base search results in process memory, evicting the least recently used first.
+
+    Results are keyed by the normalized query, filters, number of documents and the collection version.
+    The version is bumped whenever the knowledge base writes to its vector db, so cached results are never stale.
+    """
+
+    def __init__(self, ttl: Optional[int] = 300, max_size: Optional[int] = 1000):
+        """
+        Args:
+            ttl: Number of seconds cached results are valid for. None means no expiry.
+            max_size: Maximum number of cached searches. The least recently used are evicted first.
+        """
+        self.ttl: Optional[int] = ttl
+        self.max_size: Optional[int] = max_size
+
+        self.version: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+
+        self._entries: "OrderedDict[str, SearchCacheEntry]" = OrderedDict()
+        self._lock = Lock()
+
+    def get_key(
+        self,
+        query: str,
+        num_documents: int,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> str:
+        """Build the cache key for a search against the current collection version."""
+        data = {
+            "query": " ".join(query.lower().split()),
+            "num_documents": num_documents,
+            "filters": filters,
+            "include_embeddings": include_embeddings,
+            "version": self.version,
+        }
+        return sha256(json.dumps(data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[List[Document]]:
+        """Return a copy of the cached documents for the key, if any."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.is_expired(self.ttl):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            documents = entry.documents
+        log_debug(f"Search cache hit: {key[:12]}")
+        return deepcopy(documents)
+
+    def set(self, key: str, documents: List[Document]) -> None:
+        entry = SearchCacheEntry(documents=deepcopy(documents))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if self.max_size is not None:
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop all cached results after the collection changed.
+        Searches that started before the change store their results under the old version, so they are never read.
+        """
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __deepcopy__(self, memo):
+        # The cache is shared between copies of a knowledge base
+        return self
@@ -1,13 +1,56 @@
-from typing import AsyncIterator, Iterator, List
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
 from agno.document import Document
 from agno.knowledge.agent import AgentKnowledge
-from agno.utils.log import log_debug
+from agno.reranker.base import Reranker
+from agno.utils.log import log_debug, log_info, logger
+from agno.utils.string import safe_content_hash
+
+
+def reciprocal_rank_fusion(result_lists: List[Tuple[List[Document], float]], rrf_k: int = 60) -> List[Document]:
+    """Fuse ranked result lists into one list, scoring each document as the sum of weight / (rrf_k + rank).
+
+    Documents with the same content are merged, so a document found by several sources ranks higher.
+
+    Args:
+        result_lists (List[Tuple[List[Document], float]]): Ranked documents of each source, with the source weight.
+        rrf_k (int): Constant added to every rank, higher values flatten the contribution of the top ranks.
+
+    Returns:
+        List[Document]: The documents ordered by fused score.
+    """
+    scores: Dict[str, float] = {}
+    documents: Dict[str, Document] = {}
+    for results, weight in result_lists:
+        seen = set()
+        for rank, document in enumerate(results, start=1):
+            key = safe_content_hash(document.content)
+            if key in seen:
+                continue
+            seen.add(key)
+            scores[key] = scores.get(key, 0.0) + weight / (rrf_k + rank)
+            documents.setdefault(key, document)
+    return [documents[key] for key in sorted(scores, key=lambda key: scores[key], reverse=True)]
 
 
 class CombinedKnowledgeBase(AgentKnowledge):
     sources: List[AgentKnowledge] = []
 
+    # Search every source concurrently and fuse the results, instead of searching only the vector_db
+    federated_search: bool = False
+    # Weight of each source in the fusion, in the order of sources. Defaults to 1 for every source
+    source_weights: Optional[List[float]] = None
+    # Constant of the reciprocal rank fusion
+    rrf_k: int = 60
+    # Seconds to wait for each source, slower sources are left out of the results
+    source_timeout: Optional[float] = None
+    # Reranker applied to the fused results
+    reranker: Optional[Reranker] = None
+
     @property
     def document_lists(self) -> Iterator[List[Document]]:
         """Iterate over knowledge bases and yield lists of documents.
@@ -34,3 +77,123 @@ class CombinedKnowledgeBase(AgentKnowledge):
             log_debug(f"Loading documents from {kb.__class__.__name__}")
             async for document in kb.async_document_lists:  # type: ignore
                 yield document
+
+    def _get_search_sources(self) -> List[Tuple[AgentKnowledge, float]]:
+        """Return the sources with a vector db, paired with their fusion weight."""
+        weights = self.source_weights or [1.0] * len(self.sources)
+        if len(weights) != len(self.sources):
+            raise ValueError(f"Expected {len(self.sources)} source weights, got {len(weights)}")
+        return [(source, weight) for source, weight in zip(self.sources, weights) if source.vector_db is not None]
+
+    def _fuse(self, result_lists: List[Tuple[List[Document], float]]) -> List[Document]:
+        documents = reciprocal_rank_fusion(result_lists, rrf_k=self.rrf_k)
+        log_debug(f"Fused {sum(len(results) for results, _ in result_lists)} results into {len(documents)} documents")
+        return documents
+
+    def _finish_search(self, cache_key: Optional[str], documents: List[Document], complete: bool) -> List[Document]:
+        """Cache the documents of a search that got the results of every source, and return them."""
+        if cache_key is not None and complete:
+            self.search_cache.set(cache_key, documents)  # type: ignore
+        log_info(f"Found {len(documents)} documents")
+        return documents
+
+    def search(
+        self,
+        query: str,
+        num_documents: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
+        """Returns relevant documents matching a query.
+        With federated_search, all sources are searched in parallel threads and their results are fused. Sources that
+        fail or time out are left out of the results.
+        """
+        if not self.federated_search:
+            return super().search(
+                query=query, num_documents=num_documents, filters=filters, include_embeddings=include_embeddings
+            )
+
+        sources = self._get_search_sources()
+        if not sources:
+            logger.warning("No sources with a vector db to search")
+            return []
+
+        _num_documents = num_documents or self.num_documents
+        cache_key, cached_documents = self._get_cached_search(query, _num_documents, filters, include_embeddings)
+        if cached_documents is not None:
+            return cached_documents
+
+        log_debug(f"Searching {len(sources)} sources for {_num_documents} documents matching query: {query}")
+        result_lists: List[Tuple[List[Document], float]] = []
+        executor = ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix="knowledge-search")
+        try:
+            futures = [
+                (executor.submit(source.search, query, _num_documents, filters, include_embeddings), source, weight)
+                for source, weight in sources
+            ]
+            deadline = time.monotonic() + self.source_timeout if self.source_timeout is not None else None
+            for future, source, weight in futures:
+                timeout = max(deadline - time.monotonic(), 0) if deadline is not None else None
+                try:
+                    result_lists.append((future.result(timeout=timeout), weight))
+                except FuturesTimeoutError:
+                    logger.warning(f"Search on {source.__class__.__name__} timed out after {self.source_timeout}s")
+                except Exception as e:
+                    logger.warning(f"Search on {source.__class__.__name__} failed: {e}")
+        finally:
+            # Do not wait for sources that timed out
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        documents = self._fuse(result_lists)
+        if self.reranker is not None:
+            documents = self.reranker.rerank(query=query, documents=documents)
+        return self._finish_search(cache_key, documents[:_num_documents], complete=len(result_lists) == len(sources))
+
+    async def async_search(
+        self,
+        query: str,
+        num_documents: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
+        """Returns relevant documents matching a query.
+        With federated_search, all sources are searched concurrently and their results are fused. Sources that fail or
+        time out are left out of the results.
+        """
+        if not self.federated_search:
+            return await super().async_search(
+                query=query, num_documents=num_documents, filters=filters, include_embeddings=include_embeddings
+            )
+
+        sources = self._get_search_sources()
+        if not sources:
+            logger.warning("No sources with a vector db to search")
+            return []
+
+        _num_documents = num_documents or self.num_documents
+        cache_key, cached_documents = self._get_cached_search(query, _num_documents, filters, include_embeddings)
+        if cached_documents is not None:
+            return cached_documents
+
+        log_debug(f"Searching {len(sources)} sources for {_num_documents} documents matching query: {query}")
+
+        async def _search_source(source: AgentKnowledge, weight: float) -> Optional[Tuple[List[Document], float]]:
+            try:
+                results = await asyncio.wait_for(
+                    source.async_search(query, _num_documents, filters, include_embeddings),
+                    timeout=self.source_timeout,
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"Search on {source.__class__.__name__} timed out after {self.source_timeout}s")
+                return None
+            except Exception as e:
+                logger.warning(f"Search on {source.__class__.__name__} failed: {e}")
+                return None
+            return results, weight
+
+        results = await asyncio.gather(*[_search_source(source, weight) for source, weight in sources])
+        result_lists = [result for result in results if result is not None]
+        documents = self._fuse(result_lists)
+        if self.reranker is not None:
+            documents = await self.reranker.arerank(query=query, documents=documents)
+        return self._finish_search(cache_key, documents[:_num_documents], complete=len(result_lists) == len(sources))
@@ -110,6 +110,7 @@ class DocumentKnowledgeBase(AgentKnowledge):
         # Recreate collection if requested
         if recreate:
             self.vector_db.drop()
+            self.invalidate_search_cache()
 
         # Create collection if it doesn't exist
         if not self.vector_db.exists():
@@ -141,6 +142,7 @@ class DocumentKnowledgeBase(AgentKnowledge):
         # Recreate collection if requested
         if recreate:
             await self.vector_db.async_drop()
+            self.invalidate_search_cache()
 
         # Create collection if it doesn't exist
         if not await self.vector_db.async_exists():
@@ -163,7 +163,11 @@ class LightRagKnowledgeBase(AgentKnowledge):
         await self._insert_text(text)
 
     async def async_search(
-        self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        num_documents: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """Override the async_search method from AgentKnowledge to query the LightRAG server."""
         import httpx
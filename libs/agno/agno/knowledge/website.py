@@ -69,6 +69,7 @@ class WebsiteKnowledgeBase(AgentKnowledge):
         if recreate:
             log_debug("Dropping collection")
             self.vector_db.drop()
+            self.invalidate_search_cache()
 
         log_debug("Creating collection")
         self.vector_db.create()
@@ -98,6 +99,7 @@ class WebsiteKnowledgeBase(AgentKnowledge):
                 else:
                     self.vector_db.insert(documents=document_list, filters=filters)
                 num_documents += len(document_list)
+                self.invalidate_search_cache()
                 log_info(f"Loaded {num_documents} documents to knowledge base")
 
         if self.optimize_on is not None and num_documents > self.optimize_on:
@@ -127,6 +129,7 @@ class WebsiteKnowledgeBase(AgentKnowledge):
         if recreate:
             log_debug("Dropping collection asynchronously")
             await vector_db.async_drop()
+            self.invalidate_search_cache()
 
         log_debug("Creating collection asynchronously")
         await vector_db.async_create()
@@ -169,6 +172,7 @@ class WebsiteKnowledgeBase(AgentKnowledge):
                 else:
                     await vector_db.async_insert(documents=document_list, filters=filters)
                 num_documents += len(document_list)
+                self.invalidate_search_cache()
                 log_info(f"Loaded {num_documents} documents to knowledge base asynchronously")
 
         if self.optimize_on is not None and num_documents > self.optimize_on:
@@ -13,6 +13,7 @@ from agno.memory.v2.db.schema import MemoryRow
 from agno.memory.v2.manager import MemoryManager
 from agno.memory.v2.schema import SessionSummary, UserMemory
 from agno.memory.v2.summarizer import SessionSummarizer
+from agno.memory.v2.team_context import get_member_interactions_str
 from agno.models.base import Model
 from agno.models.message import Message
 from agno.run.base import RunStatus
@@ -1030,24 +1031,10 @@ class Memory:
     def get_team_member_interactions_str(self, session_id: str) -> str:
         if not self.team_context:
             return ""
-        team_member_interactions_str = ""
         session_team_context = self.team_context.get(session_id, None)
         if session_team_context and session_team_context.member_interactions:
-            team_member_interactions_str += "<member interactions>\n"
-
-            for interaction in session_team_context.member_interactions:
-                response_dict = interaction.response.to_dict()
-                response_content = (
-                    response_dict.get("content")
-                    or ",".join([tool.get("content", "") for tool in response_dict.get("tools", [])])
-                    or ""
-                )
-                team_member_interactions_str += f"Member: {interaction.member_name}\n"
-                team_member_interactions_str += f"Task: {interaction.task}\n"
-                team_member_interactions_str += f"Response: {response_content}\n"
-                team_member_interactions_str += "\n"
-            team_member_interactions_str += "</member interactions>\n"
-        return team_member_interactions_str
+            return get_member_interactions_str(session_team_context.member_interactions)
+        return ""
 
     def get_team_context_images(self, session_id: str) -> List[ImageArtifact]:
         if not self.team_context:
@@ -0,0 +1,244 @@
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from dataclasses import dataclass, field
+from textwrap import dedent
+from threading import Lock
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.utils.log import log_debug, log_warning
+
+# Characters of each response kept in a summary built without a model
+SNIPPET_LENGTH = 200
+
+
+def estimate_text_tokens(text: Optional[str]) -> int:
+    """Roughly estimate the number of tokens in a text (about 4 characters per token)."""
+    return len(text) // 4 + 1 if text else 0
+
+
+def get_member_interaction_str(interaction: Any) -> str:
+    """Format an interaction of a team member, as shared with the other members."""
+    response_dict = interaction.response.to_dict()
+    response_content = (
+        response_dict.get("content")
+        or ",".join([tool.get("content", "") for tool in response_dict.get("tools", [])])
+        or ""
+    )
+    return f"Member: {interaction.member_name}\nTask: {interaction.task}\nResponse: {response_content}\n\n"
+
+
+def get_member_interactions_str(interactions: Sequence[Any]) -> str:
+    """Format the interactions of the team members, as shared with the other members."""
+    if not interactions:
+        return ""
+    return (
+        "<member interactions>\n"
+        + "".join(get_member_interaction_str(interaction) for interaction in interactions)
+        + "</member interactions>\n"
+    )
+
+
+@dataclass
+class _InteractionsSummary:
+    # Summary of the first `num_interactions` interactions of a session
+    text: str = ""
+    num_interactions: int = 0
+    # Whether a background update of the summary is running
+    updating: bool = False
+
+
+@dataclass
+class TeamContextManager:
+    """Bounds the member interactions sent with each task of a team member.
+
+    The most recent interactions are sent in full and older interactions as a summary, which is extended as
+    interactions leave the window. With a model, the summary is written by the model in a background thread, and
+    interactions it does not cover yet are sent in full meanwhile. The interactions are cut to `max_tokens`.
+    """
+
+    # Number of most recent interactions sent in full
+    window_size: int = 3
+    # Maximum number of tokens of the member interactions sent with a member task, None to not limit them
+    max_tokens: Optional[int] = 2000
+    # Model used to summarize older interactions. Without a model, the summary keeps the start of each response.
+    model: Optional[Model] = None
+    # Update the summary in a background thread instead of before the member task is sent
+    background: bool = True
+
+    # Summary of the older interactions of each session
+    _summaries: Dict[str, _InteractionsSummary] = field(init=False, default_factory=dict, repr=False, compare=False)
+    _lock: Lock = field(init=False, default_factory=Lock, repr=False, compare=False)
+    # Runs the background summary updates, shut down when no update is running
+    _executor: Optional[ThreadPoolExecutor] = field(init=False, default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.model is not None and isinstance(self.model, str):
+            raise ValueError("Model must be a Model object, not a string")
+
+    def get_member_interactions_str(self, session_id: str, interactions: Sequence[Any]) -> Tuple[str, int]:
+        """Get the member interactions to send with a member task, and the number of tokens saved.
+
+        Args:
+            session_id: ID of the session the interactions belong to.
+            interactions: All member interactions of the session, oldest first.
+
+        Returns:
+            The member interactions string and the estimated number of tokens saved compared to sending all
+            interactions in full.
+        """
+        if not interactions:
+            return "", 0
+
+        num_older = max(len(interactions) - self.window_size, 0)
+        with self._lock:
+            summary = self._summaries.get(session_id)
+            if summary is None or summary.num_interactions > len(interactions):
+                # A new session, or the interactions of the session were cleared
+                summary = _InteractionsSummary()
+                self._summaries[session_id] = summary
+            needs_update = num_older > summary.num_interactions and not summary.updating
+            if needs_update:
+                summary.updating = True
+
+        if needs_update:
+            if self.model is not None and self.background:
+                with self._lock:
+                    if self._executor is None:
+                        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="team-context")
+                    self._executor.submit(
+                        self._update_summary_in_background, session_id, list(interactions[:num_older])
+                    )
+            else:
+                self._update_summary(session_id, list(interactions[:num_older]))
+
+        with self._lock:
+            summary_text, num_summarized = summary.text, summary.num_interactions
+
+        # Interactions the summary does not cover yet are sent in full
+        member_interactions_str = self._build_member_interactions_str(summary_text, interactions[num_summarized:])
+        tokens_saved = estimate_text_tokens(get_member_interactions_str(interactions)) - estimate_text_tokens(
+            member_interactions_str
+        )
+        return member_interactions_str, max(tokens_saved, 0)
+
+    def get_team_context_str(self, team_context_str: str) -> Tuple[str, int]:
+        """Cut the team context to `max_tokens`, and get the number of tokens saved.
+
+        The start and the end of the team context are kept, so the tags around it and its latest updates remain.
+        """
+        if self.max_tokens is None or estimate_text_tokens(team_context_str) <= self.max_tokens:
+            return team_context_str, 0
+
+        separator = "\n...\n"
+        max_length = max(self.max_tokens * 4 - 1 - len(separator), 0)
+        head_length = max_length // 2
+        tail_length = max_length - head_length
+        compacted_str = (
+            team_context_str[:head_length]
+            + separator
+            + (team_context_str[len(team_context_str) - tail_length :] if tail_length else "")
+        )
+        tokens_saved = estimate_text_tokens(team_context_str) - estimate_text_tokens(compacted_str)
+        return compacted_str, max(tokens_saved, 0)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the thread updating the summaries, waiting for the running update by default."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _update_summary_in_background(self, session_id: str, interactions: List[Any]) -> None:
+        try:
+            self._update_summary(session_id, interactions)
+        finally:
+            with self._lock:
+                # Summaries marked as updating have an update queued, which keeps the executor running
+                if self._executor is not None and not any(summary.updating for summary in self._summaries.values()):
+                    self._executor.shutdown(wait=False)
+                    self._executor = None
+
+    def _update_summary(self, session_id: str, interactions: List[Any]) -> None:
+        """Extend the summary of the session to cover the given interactions."""
+        with self._lock:
+            summary = self._summaries[session_id]
+            previous_text, num_summarized = summary.text, summary.num_interactions
+
+        new_interactions = interactions[num_summarized:]
+        text = None
+        if self.model is not None:
+            text = self._summarize(previous_text, new_interactions)
+        if text is None:
+            text = previous_text + "".join(self._get_snippet(interaction) for interaction in new_interactions)
+
+        with self._lock:
+            if self._summaries.get(session_id) is summary:
+                summary.text = text
+                summary.num_interactions = len(interactions)
+            summary.updating = False
+        log_debug(f"Summarized {len(interactions)} member interactions of session {session_id}")
+
+    def _summarize(self, previous_text: str, interactions: List[Any]) -> Optional[str]:
+        """Extend the summary with the interactions using the model."""
+        system_message = dedent("""\
+        You maintain a summary of the work of a team of agents, shared with the team members.
+        Update the summary with the new member interactions. Keep the facts, decisions and results
+        the members need to continue the work, and leave out everything else. Be concise and do not make anything up.
+        Only respond with the updated summary.""")
+        user_message = f"<summary>\n{previous_text}\n</summary>\n\n{get_member_interactions_str(interactions)}"
+        try:
+            response = deepcopy(self.model).response(  # type: ignore[union-attr]
+                messages=[Message(role="system", content=system_message), Message(role="user", content=user_message)]
+            )
+        except Exception as e:
+            log_warning(f"Failed to summarize member interactions: {e}")
+            return None
+        if not isinstance(response.content, str) or not response.content.strip():
+            return None
+        return response.content.strip() + "\n"
+
+    def _get_snippet(self, interaction: Any) -> str:
+        interaction_str = get_member_interaction_str(interaction).strip()
+        if len(interaction_str) > SNIPPET_LENGTH:
+            interaction_str = interaction_str[:SNIPPET_LENGTH] + "..."
+        return interaction_str.replace("\n", " ") + "\n"
+
+    def _build_member_interactions_str(self, summary_text: str, interactions: Sequence[Any]) -> str:
+        """Combine the summary and the interactions it does not cover, keeping the most recent within the budget."""
+        header, footer = "<member interactions>\n", "</member interactions>\n"
+        interaction_strs = [get_member_interaction_str(interaction) for interaction in interactions]
+        if self.max_tokens is None:
+            summary_str = f"<summary>\n{summary_text}</summary>\n\n" if summary_text else ""
+            return header + summary_str + "".join(interaction_strs) + footer
+
+        # Stay below max_tokens as counted by estimate_text_tokens
+        remaining = self.max_tokens * 4 - 1 - len(header) - len(footer)
+        kept: List[str] = []
+        for interaction_str in reversed(interaction_strs):
+            if len(interaction_str) > remaining:
+                if not kept:
+                    # Cut the most recent interaction rather than leaving it out
+                    kept.append(interaction_str[: max(remaining, 0)])
+                    remaining = 0
+                break
+            kept.insert(0, interaction_str)
+            remaining -= len(interaction_str)
+
+        omitted_str = ""
+        if len(kept) < len(interaction_strs):
+            omitted_str = f"({len(interaction_strs) - len(kept)} earlier interactions left out)\n\n"
+            if len(omitted_str) > remaining:
+                omitted_str = ""
+            remaining -= len(omitted_str)
+
+        summary_str = ""
+        if summary_text and remaining > len("<summary>\n...</summary>\n\n"):
+            # Keep the end of the summary, which covers the most recent of the older interactions
+            max_summary_length = remaining - len("<summary>\n...</summary>\n\n")
+            if len(summary_text) > max_summary_length:
+                summary_text = "..." + summary_text[len(summary_text) - max_summary_length :]
+            summary_str = f"<summary>\n{summary_text}</summary>\n\n"
+
+        return header + summary_str + omitted_str + "".join(kept) + footer
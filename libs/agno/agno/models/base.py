@@ -1,13 +1,18 @@
 import asyncio
 import collections.abc
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from functools import partial
 from types import AsyncGeneratorType, GeneratorType
 from typing import (
     Any,
     AsyncGenerator,
+    AsyncIterable,
     AsyncIterator,
+    Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
     Literal,
@@ -21,14 +26,17 @@ from uuid import uuid4
 
 from pydantic import BaseModel
 
-from agno.exceptions import AgentRunException
+from agno.exceptions import AgentRunException, ModelProviderError
 from agno.media import AudioResponse, ImageArtifact
+from agno.models.cache.base import CacheQuery
 from agno.models.message import Citations, Message, MessageMetrics
+from agno.models.rate_limit import RateLimiter, estimate_tokens, get_rate_limiter, get_retry_after
 from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
 from agno.run.response import RunResponseContentEvent, RunResponseEvent
 from agno.run.team import RunResponseContentEvent as TeamRunResponseContentEvent
 from agno.run.team import TeamRunResponseEvent
 from agno.tools.function import Function, FunctionCall, FunctionExecutionResult, UserInputField
+from agno.utils.fanout import afan_out, agroup_exclusive_items, fan_out, group_exclusive_items
 from agno.utils.log import log_debug, log_error, log_warning
 from agno.utils.timer import Timer
 from agno.utils.tools import get_function_call_for_tool_call, get_function_call_for_tool_execution
@@ -187,6 +195,23 @@ def _add_usage_metrics_to_assistant_message(assistant_message: Message, response
     )
 
 
+def _get_cache_replay(response: ModelResponse) -> ModelResponse:
+    """A cached response without its token usage, which was counted when the response was generated."""
+    return replace(response, response_usage=None)
+
+
+def _mark_cache_hit(assistant_message: Message) -> None:
+    assistant_message.metrics.additional_metrics = {
+        **(assistant_message.metrics.additional_metrics or {}),
+        "response_cache_hit": True,
+    }
+
+
+def _is_shown_result(item: Any) -> bool:
+    """Whether the item is part of the result of a function call shown to the user."""
+    return isinstance(item, ModelResponse) and item.event == ModelResponseEvent.assistant_response.value
+
+
 def _handle_agent_exception(a_exc: AgentRunException, additional_messages: Optional[List[Message]] = None) -> None:
     """Handle AgentRunException and collect additional messages."""
     if additional_messages is None:
@@ -230,6 +255,12 @@ class Model(ABC):
     name: Optional[str] = None
     # Provider for this Model. This is not sent to the Model API.
     provider: Optional[str] = None
+    # Cache for model responses (an agno.models.cache.ResponseCache).
+    # Only used when temperature is 0, unless the cache is forced.
+    response_cache: Optional[Any] = None
+    # Client-side rate limits. Shared by all models in the process with the same provider, id and api key.
+    requests_per_minute: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
 
     # -*- Do not set the following attributes directly -*-
     # -*- Set them on the Agent instead -*-
@@ -548,18 +579,33 @@ class Model(ABC):
         Returns:
             Tuple[Message, bool]: (assistant_message, should_continue)
         """
+        cache_query = self._get_response_cache_query(
+            messages=messages, response_format=response_format, tools=tools, tool_choice=tool_choice
+        )
+        cached_response = self.response_cache.get(cache_query) if cache_query is not None else None
+
         # Generate response
         assistant_message.metrics.start_timer()
-        response = self.invoke(
-            messages=messages,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-        )
-        assistant_message.metrics.stop_timer()
+        if cached_response is not None:
+            provider_response: ModelResponse = _get_cache_replay(cached_response)
+            assistant_message.metrics.stop_timer()
+        else:
+            rate_limiter = self._get_rate_limiter()
+            estimated_tokens = self._estimate_tokens(messages)
+            rate_limiter.acquire(estimated_tokens)
+            with self._handle_rate_limit_errors(rate_limiter):
+                response = self.invoke(
+                    messages=messages,
+                    response_format=response_format,
+                    tools=tools,
+                    tool_choice=tool_choice or self._tool_choice,
+                )
+            assistant_message.metrics.stop_timer()
 
-        # Parse provider response
-        provider_response: ModelResponse = self.parse_provider_response(response, response_format=response_format)
+            # Parse provider response
+            provider_response = self.parse_provider_response(response, response_format=response_format)
+            if cache_query is not None:
+                self.response_cache.set(cache_query, provider_response)
 
         # Add parsed data to model response
         if provider_response.parsed is not None:
@@ -567,6 +613,10 @@ class Model(ABC):
 
         # Populate the assistant message
         self._populate_assistant_message(assistant_message=assistant_message, provider_response=provider_response)
+        if cached_response is None:
+            self._record_token_usage(rate_limiter, estimated_tokens, assistant_message)
+        else:
+            _mark_cache_hit(assistant_message)
 
         # Update model response with assistant message content and audio
         if assistant_message.content is not None:
@@ -604,18 +654,33 @@ class Model(ABC):
         Returns:
             Tuple[Message, bool]: (assistant_message, should_continue)
         """
+        cache_query = self._get_response_cache_query(
+            messages=messages, response_format=response_format, tools=tools, tool_choice=tool_choice
+        )
+        cached_response = await self.response_cache.aget(cache_query) if cache_query is not None else None
+
         # Generate response
         assistant_message.metrics.start_timer()
-        response = await self.ainvoke(
-            messages=messages,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-        )
-        assistant_message.metrics.stop_timer()
+        if cached_response is not None:
+            provider_response: ModelResponse = _get_cache_replay(cached_response)
+            assistant_message.metrics.stop_timer()
+        else:
+            rate_limiter = self._get_rate_limiter()
+            estimated_tokens = self._estimate_tokens(messages)
+            await rate_limiter.aacquire(estimated_tokens)
+            with self._handle_rate_limit_errors(rate_limiter):
+                response = await self.ainvoke(
+                    messages=messages,
+                    response_format=response_format,
+                    tools=tools,
+                    tool_choice=tool_choice or self._tool_choice,
+                )
+            assistant_message.metrics.stop_timer()
 
-        # Parse provider response
-        provider_response: ModelResponse = self.parse_provider_response(response, response_format=response_format)
+            # Parse provider response
+            provider_response = self.parse_provider_response(response, response_format=response_format)
+            if cache_query is not None:
+                await self.response_cache.aset(cache_query, provider_response)
 
         # Add parsed data to model response
         if provider_response.parsed is not None:
@@ -623,6 +688,10 @@ class Model(ABC):
 
         # Populate the assistant message
         self._populate_assistant_message(assistant_message=assistant_message, provider_response=provider_response)
+        if cached_response is None:
+            self._record_token_usage(rate_limiter, estimated_tokens, assistant_message)
+        else:
+            _mark_cache_hit(assistant_message)
 
         # Update model response with assistant message content and audio
         if assistant_message.content is not None:
@@ -645,6 +714,61 @@ class Model(ABC):
                 model_response.extra = {}
             model_response.extra.update(provider_response.extra)
 
+    def _get_response_cache_query(
+        self,
+        messages: List[Message],
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        stream: bool = False,
+    ) -> Optional[CacheQuery]:
+        """Get the response cache query for this invocation, or None if the response should not be cached."""
+        if self.response_cache is None:
+            return None
+        return self.response_cache.get_query(
+            model=self,
+            messages=messages,
+            response_format=response_format,
+            tools=tools,
+            tool_choice=tool_choice or self._tool_choice,
+            stream=stream,
+        )
+
+    def _get_rate_limiter(self) -> RateLimiter:
+        """Get the rate limiter shared by all models with this provider, id and api key."""
+        return get_rate_limiter(
+            provider=self.get_provider(),
+            model_id=self.id,
+            api_key=getattr(self, "api_key", None),
+            requests_per_minute=self.requests_per_minute,
+            tokens_per_minute=self.tokens_per_minute,
+        )
+
+    def _estimate_tokens(self, messages: List[Message]) -> int:
+        # Token usage is only tracked if a tokens per minute limit is set
+        if self.tokens_per_minute is None:
+            return 0
+        return estimate_tokens(messages)
+
+    def _record_token_usage(self, rate_limiter: RateLimiter, estimated_tokens: int, assistant_message: Message) -> None:
+        if self.tokens_per_minute is None:
+            return
+        actual_tokens = assistant_message.metrics.input_tokens + assistant_message.metrics.output_tokens
+        rate_limiter.record_usage(estimated_tokens, actual_tokens)
+
+    @contextmanager
+    def _handle_rate_limit_errors(self, rate_limiter: RateLimiter):
+        """Hold back all requests sharing the rate limiter for as long as the provider asks, on a rate limit error."""
+        try:
+            yield
+        except ModelProviderError as e:
+            if e.status_code == 429:
+                retry_after = get_retry_after(e)
+                if retry_after is not None:
+                    log_warning(f"Rate limited by {self.get_provider()}, holding back requests for {retry_after}s")
+                    rate_limiter.block(retry_after)
+            raise
+
     def _populate_assistant_message(
         self,
         assistant_message: Message,
@@ -720,17 +844,44 @@ class Model(ABC):
         """
         Process a streaming response from the model.
         """
+        cache_query = self._get_response_cache_query(
+            messages=messages, response_format=response_format, tools=tools, tool_choice=tool_choice, stream=True
+        )
+        cached_deltas = self.response_cache.get(cache_query) if cache_query is not None else None
+
         assistant_message.metrics.start_timer()
-        for response_delta in self.invoke_stream(
-            messages=messages,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-        ):
-            model_response_delta = self.parse_provider_response_delta(response_delta)
-            yield from self._populate_stream_data_and_assistant_message(
-                stream_data=stream_data, assistant_message=assistant_message, model_response_delta=model_response_delta
-            )
+        if cached_deltas is not None:
+            # Replay the cached stream
+            for model_response_delta in cached_deltas:
+                yield from self._populate_stream_data_and_assistant_message(
+                    stream_data=stream_data,
+                    assistant_message=assistant_message,
+                    model_response_delta=_get_cache_replay(model_response_delta),
+                )
+            _mark_cache_hit(assistant_message)
+        else:
+            rate_limiter = self._get_rate_limiter()
+            estimated_tokens = self._estimate_tokens(messages)
+            rate_limiter.acquire(estimated_tokens)
+            model_response_deltas: List[ModelResponse] = []
+            with self._handle_rate_limit_errors(rate_limiter):
+                for response_delta in self.invoke_stream(
+                    messages=messages,
+                    response_format=response_format,
+                    tools=tools,
+                    tool_choice=tool_choice or self._tool_choice,
+                ):
+                    model_response_delta = self.parse_provider_response_delta(response_delta)
+                    if cache_query is not None:
+                        model_response_deltas.append(model_response_delta)
+                    yield from self._populate_stream_data_and_assistant_message(
+                        stream_data=stream_data,
+                        assistant_message=assistant_message,
+                        model_response_delta=model_response_delta,
+                    )
+            self._record_token_usage(rate_limiter, estimated_tokens, assistant_message)
+            if cache_query is not None:
+                self.response_cache.set(cache_query, model_response_deltas)
         assistant_message.metrics.stop_timer()
 
     def response_stream(
@@ -867,18 +1018,46 @@ class Model(ABC):
         """
         Process a streaming response from the model.
         """
+        cache_query = self._get_response_cache_query(
+            messages=messages, response_format=response_format, tools=tools, tool_choice=tool_choice, stream=True
+        )
+        cached_deltas = await self.response_cache.aget(cache_query) if cache_query is not None else None
+
         assistant_message.metrics.start_timer()
-        async for response_delta in self.ainvoke_stream(
-            messages=messages,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-        ):  # type: ignore
-            model_response_delta = self.parse_provider_response_delta(response_delta)
-            for model_response in self._populate_stream_data_and_assistant_message(
-                stream_data=stream_data, assistant_message=assistant_message, model_response_delta=model_response_delta
-            ):
-                yield model_response
+        if cached_deltas is not None:
+            # Replay the cached stream
+            for model_response_delta in cached_deltas:
+                for model_response in self._populate_stream_data_and_assistant_message(
+                    stream_data=stream_data,
+                    assistant_message=assistant_message,
+                    model_response_delta=_get_cache_replay(model_response_delta),
+                ):
+                    yield model_response
+            _mark_cache_hit(assistant_message)
+        else:
+            rate_limiter = self._get_rate_limiter()
+            estimated_tokens = self._estimate_tokens(messages)
+            await rate_limiter.aacquire(estimated_tokens)
+            model_response_deltas: List[ModelResponse] = []
+            with self._handle_rate_limit_errors(rate_limiter):
+                async for response_delta in self.ainvoke_stream(
+                    messages=messages,
+                    response_format=response_format,
+                    tools=tools,
+                    tool_choice=tool_choice or self._tool_choice,
+                ):  # type: ignore
+                    model_response_delta = self.parse_provider_response_delta(response_delta)
+                    if cache_query is not None:
+                        model_response_deltas.append(model_response_delta)
+                    for model_response in self._populate_stream_data_and_assistant_message(
+                        stream_data=stream_data,
+                        assistant_message=assistant_message,
+                        model_response_delta=model_response_delta,
+                    ):
+                        yield model_response
+            self._record_token_usage(rate_limiter, estimated_tokens, assistant_message)
+            if cache_query is not None:
+                await self.response_cache.aset(cache_query, model_response_deltas)
         assistant_message.metrics.stop_timer()
 
     async def aresponse_stream(
@@ -1270,6 +1449,8 @@ class Model(ABC):
         if additional_messages is None:
             additional_messages = []
 
+        # Parallel function calls are run together, before the next function call that is not parallel
+        parallel_function_calls: List[FunctionCall] = []
         for fc in function_calls:
             if function_call_limit is not None:
                 current_function_call_count += 1
@@ -1353,14 +1534,69 @@ class Model(ABC):
                 # We don't execute the function calls here
                 continue
 
+            if fc.function.parallel:
+                parallel_function_calls.append(fc)
+                continue
+
+            yield from self.run_parallel_function_calls(
+                parallel_function_calls, function_call_results, additional_messages
+            )
+            parallel_function_calls = []
             yield from self.run_function_call(
                 function_call=fc, function_call_results=function_call_results, additional_messages=additional_messages
             )
 
+        yield from self.run_parallel_function_calls(parallel_function_calls, function_call_results, additional_messages)
+
         # Add any additional messages at the end
         if additional_messages:
             function_call_results.extend(additional_messages)
 
+    def run_parallel_function_calls(
+        self,
+        function_calls: List[FunctionCall],
+        function_call_results: List[Message],
+        additional_messages: List[Message],
+    ) -> Iterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
+        """Run function calls in threads and yield their events as they are produced.
+
+        Events of agents and teams run by the functions are interleaved, and are told apart by their agent, team and
+        run IDs. The shown results of one function call are yielded at a time. The results are added in call order.
+        """
+        if len(function_calls) <= 1:
+            for fc in function_calls:
+                yield from self.run_function_call(
+                    function_call=fc,
+                    function_call_results=function_call_results,
+                    additional_messages=additional_messages,
+                )
+            return
+
+        results: List[List[Message]] = [[] for _ in function_calls]
+        messages: List[List[Message]] = [[] for _ in function_calls]
+        tasks: List[Callable[[], Iterable[Any]]] = [
+            partial(self.run_function_call, fc, results[index], messages[index])
+            for index, fc in enumerate(function_calls)
+        ]
+        # The first error is raised once all function calls have ended, so none keeps running after it
+        error: Optional[BaseException] = None
+        fan_out_events = fan_out(tasks)
+        try:
+            for event in group_exclusive_items(fan_out_events, exclusive=_is_shown_result):
+                if event.done:
+                    if error is None:
+                        error = event.error
+                    continue
+                yield event.item
+        finally:
+            fan_out_events.close()  # type: ignore[attr-defined]
+        if error is not None:
+            raise error
+
+        for index in range(len(function_calls)):
+            function_call_results.extend(results[index])
+            additional_messages.extend(messages[index])
+
     async def arun_function_call(
         self,
         function_call: FunctionCall,
@@ -1536,106 +1772,171 @@ class Model(ABC):
             *(self.arun_function_call(fc) for fc in function_calls_to_run), return_exceptions=True
         )
 
-        # Process results
-        for result in results:
+        # Process results, the results of consecutive parallel function calls together
+        index = 0
+        while index < len(results):
+            result = results[index]
             # If result is an exception, skip processing it
             if isinstance(result, BaseException):
                 log_error(f"Error during function call: {result}")
                 raise result
 
-            # Unpack result
-            function_call_success, function_call_timer, fc = result
-
-            # Handle AgentRunException
-            if isinstance(function_call_success, AgentRunException):
-                a_exc = function_call_success
-                # Update additional messages from function call
-                _handle_agent_exception(a_exc, additional_messages)
-                # Set function call success to False if an exception occurred
-                function_call_success = False
-
-            # Process function call output
-            function_call_output: str = ""
-            if isinstance(fc.result, (GeneratorType, collections.abc.Iterator)):
-                for item in fc.result:
-                    # This function yields agent/team run events
-                    if isinstance(item, tuple(get_args(RunResponseEvent))) or isinstance(
-                        item, tuple(get_args(TeamRunResponseEvent))
-                    ):
-                        # We only capture content events
-                        if isinstance(item, RunResponseContentEvent) or isinstance(item, TeamRunResponseContentEvent):
-                            if item.content is not None and isinstance(item.content, BaseModel):
-                                function_call_output += item.content.model_dump_json()
-                            else:
-                                # Capture output
-                                function_call_output += item.content or ""
-
-                            if fc.function.show_result:
-                                yield ModelResponse(content=item.content)
-                                continue
-
-                        # Yield the event itself to bubble it up
-                        yield item
-                    else:
-                        function_call_output += str(item)
-                        if fc.function.show_result:
-                            yield ModelResponse(content=str(item))
-            elif isinstance(fc.result, (AsyncGeneratorType, collections.abc.AsyncIterator)):
-                async for item in fc.result:
-                    # This function yields agent/team run events
-                    if isinstance(item, tuple(get_args(RunResponseEvent))) or isinstance(
-                        item, tuple(get_args(TeamRunResponseEvent))
-                    ):
-                        # We only capture content events
-                        if isinstance(item, RunResponseContentEvent) or isinstance(item, TeamRunResponseContentEvent):
-                            if item.content is not None and isinstance(item.content, BaseModel):
-                                function_call_output += item.content.model_dump_json()
-                            else:
-                                # Capture output
-                                function_call_output += item.content or ""
-
-                            if fc.function.show_result:
-                                yield ModelResponse(content=item.content)
-                                continue
-
-                        # Yield the event itself to bubble it up
-                        yield item
-                    else:
-                        function_call_output += str(item)
-                        if fc.function.show_result:
-                            yield ModelResponse(content=str(item))
-            else:
-                function_call_output = str(fc.result)
-                if fc.function.show_result:
-                    yield ModelResponse(content=function_call_output)
-
-            # Create and yield function call result
-            function_call_result = self.create_function_call_result(
-                fc, success=function_call_success, output=function_call_output, timer=function_call_timer
-            )
-            yield ModelResponse(
-                content=f"{fc.get_call_str()} completed in {function_call_timer.elapsed:.4f}s.",
-                tool_executions=[
-                    ToolExecution(
-                        tool_call_id=function_call_result.tool_call_id,
-                        tool_name=function_call_result.tool_name,
-                        tool_args=function_call_result.tool_args,
-                        tool_call_error=function_call_result.tool_call_error,
-                        result=str(function_call_result.content),
-                        stop_after_tool_call=function_call_result.stop_after_tool_call,
-                        metrics=function_call_result.metrics,
-                    )
-                ],
-                event=ModelResponseEvent.tool_call_completed.value,
-            )
+            group = [result]
+            while result[2].function.parallel and index + len(group) < len(results):
+                next_result = results[index + len(group)]
+                if isinstance(next_result, BaseException) or not next_result[2].function.parallel:
+                    break
+                group.append(next_result)
+            index += len(group)
 
-            # Add function call result to function call results
-            function_call_results.append(function_call_result)
+            async for event in self.aprocess_parallel_function_call_results(
+                group, function_call_results, additional_messages
+            ):
+                yield event
 
         # Add any additional messages at the end
         if additional_messages:
             function_call_results.extend(additional_messages)
 
+    async def aprocess_parallel_function_call_results(
+        self,
+        results: List[Tuple[Union[bool, AgentRunException], Timer, FunctionCall]],
+        function_call_results: List[Message],
+        additional_messages: List[Message],
+    ) -> AsyncIterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
+        """Consume the results of function calls concurrently and yield their events as they are produced.
+
+        Async version of run_parallel_function_calls, for function calls whose functions already ran.
+        """
+        if len(results) <= 1:
+            for result in results:
+                async for event in self.aprocess_function_call_result(
+                    result, function_call_results, additional_messages
+                ):
+                    yield event
+            return
+
+        call_results: List[List[Message]] = [[] for _ in results]
+        messages: List[List[Message]] = [[] for _ in results]
+        tasks: List[Callable[[], AsyncIterable[Any]]] = [
+            partial(self.aprocess_function_call_result, result, call_results[index], messages[index])
+            for index, result in enumerate(results)
+        ]
+        # The first error is raised once all function calls have ended, so none keeps running after it
+        error: Optional[BaseException] = None
+        fan_out_events = afan_out(tasks)
+        try:
+            async for event in agroup_exclusive_items(fan_out_events, exclusive=_is_shown_result):
+                if event.done:
+                    if error is None:
+                        error = event.error
+                    continue
+                yield event.item
+        finally:
+            await fan_out_events.aclose()  # type: ignore[attr-defined]
+        if error is not None:
+            raise error
+
+        for index in range(len(results)):
+            function_call_results.extend(call_results[index])
+            additional_messages.extend(messages[index])
+
+    async def aprocess_function_call_result(
+        self,
+        result: Tuple[Union[bool, AgentRunException], Timer, FunctionCall],
+        function_call_results: List[Message],
+        additional_messages: List[Message],
+    ) -> AsyncIterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
+        """Consume the result of a function call, yielding its events, and add the function call result."""
+        # Unpack result
+        function_call_success, function_call_timer, fc = result
+
+        # Handle AgentRunException
+        if isinstance(function_call_success, AgentRunException):
+            a_exc = function_call_success
+            # Update additional messages from function call
+            _handle_agent_exception(a_exc, additional_messages)
+            # Set function call success to False if an exception occurred
+            function_call_success = False
+
+        # Process function call output
+        function_call_output: str = ""
+        if isinstance(fc.result, (GeneratorType, collections.abc.Iterator)):
+            for item in fc.result:
+                # This function yields agent/team run events
+                if isinstance(item, tuple(get_args(RunResponseEvent))) or isinstance(
+                    item, tuple(get_args(TeamRunResponseEvent))
+                ):
+                    # We only capture content events
+                    if isinstance(item, RunResponseContentEvent) or isinstance(item, TeamRunResponseContentEvent):
+                        if item.content is not None and isinstance(item.content, BaseModel):
+                            function_call_output += item.content.model_dump_json()
+                        else:
+                            # Capture output
+                            function_call_output += item.content or ""
+
+                        if fc.function.show_result:
+                            yield ModelResponse(content=item.content)
+                            continue
+
+                    # Yield the event itself to bubble it up
+                    yield item
+                else:
+                    function_call_output += str(item)
+                    if fc.function.show_result:
+                        yield ModelResponse(content=str(item))
+        elif isinstance(fc.result, (AsyncGeneratorType, collections.abc.AsyncIterator)):
+            async for item in fc.result:
+                # This function yields agent/team run events
+                if isinstance(item, tuple(get_args(RunResponseEvent))) or isinstance(
+                    item, tuple(get_args(TeamRunResponseEvent))
+                ):
+                    # We only capture content events
+                    if isinstance(item, RunResponseContentEvent) or isinstance(item, TeamRunResponseContentEvent):
+                        if item.content is not None and isinstance(item.content, BaseModel):
+                            function_call_output += item.content.model_dump_json()
+                        else:
+                            # Capture output
+                            function_call_output += item.content or ""
+
+                        if fc.function.show_result:
+                            yield ModelResponse(content=item.content)
+                            continue
+
+                    # Yield the event itself to bubble it up
+                    yield item
+                else:
+                    function_call_output += str(item)
+                    if fc.function.show_result:
+                        yield ModelResponse(content=str(item))
+        else:
+            function_call_output = str(fc.result)
+            if fc.function.show_result:
+                yield ModelResponse(content=function_call_output)
+
+        # Create and yield function call result
+        function_call_result = self.create_function_call_result(
+            fc, success=function_call_success, output=function_call_output, timer=function_call_timer
+        )
+        yield ModelResponse(
+            content=f"{fc.get_call_str()} completed in {function_call_timer.elapsed:.4f}s.",
+            tool_executions=[
+                ToolExecution(
+                    tool_call_id=function_call_result.tool_call_id,
+                    tool_name=function_call_result.tool_name,
+                    tool_args=function_call_result.tool_args,
+                    tool_call_error=function_call_result.tool_call_error,
+                    result=str(function_call_result.content),
+                    stop_after_tool_call=function_call_result.stop_after_tool_call,
+                    metrics=function_call_result.metrics,
+                )
+            ],
+            event=ModelResponseEvent.tool_call_completed.value,
+        )
+
+        # Add function call result to function call results
+        function_call_results.append(function_call_result)
+
     def _prepare_function_calls(
         self,
         assistant_message: Message,
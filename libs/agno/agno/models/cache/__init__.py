@@ -0,0 +1,2 @@
+from agno.models.cache.base import CacheEntry, CacheQuery, ResponseCache
+from agno.models.cache.in_memory import InMemoryResponseCache
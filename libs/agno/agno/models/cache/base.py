@@ -0,0 +1,257 @@
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from hashlib import sha256
+from math import sqrt
+from time import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union
+
+from pydantic import BaseModel
+
+from agno.embedder.base import Embedder
+from agno.models.message import Message
+from agno.utils.log import log_debug, log_warning
+
+if TYPE_CHECKING:
+    from agno.models.base import Model
+
+
+@dataclass
+class CacheQuery:
+    """A lookup into the response cache for a single model invocation"""
+
+    # Hash of everything sent to the model
+    key: str
+    # Hash of everything except the last user message. Semantic matches are only made within the same scope.
+    scope: str
+    # Content of the last user message, used for the semantic tier
+    prompt: Optional[str] = None
+    # Embedding of the prompt, computed lazily
+    embedding: Optional[List[float]] = None
+
+
+@dataclass
+class CacheEntry:
+    """A cached model response"""
+
+    key: str
+    scope: str
+    # A ModelResponse for non-streaming calls or a list of ModelResponse deltas for streaming calls
+    value: Any
+    embedding: Optional[List[float]] = None
+    created_at: float = field(default_factory=time)
+
+    def is_expired(self, ttl: Optional[int]) -> bool:
+        return ttl is not None and (time() - self.created_at) > ttl
+
+
+def _cosine_similarity(a: List[float], b: List[float]) -> float:
+    if len(a) != len(b):
+        return 0.0
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = sqrt(sum(x * x for x in a))
+    norm_b = sqrt(sum(y * y for y in b))
+    if norm_a == 0 or norm_b == 0:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+def _message_to_cache_dict(message: Message) -> Dict[str, Any]:
+    """Returns the parts of a message that are sent to the model."""
+    message_dict: Dict[str, Any] = {
+        "role": message.role,
+        "content": message.content,
+        "name": message.name,
+        "tool_call_id": message.tool_call_id,
+        "tool_calls": message.tool_calls,
+    }
+    if message.images:
+        message_dict["images"] = [img.to_dict() for img in message.images]
+    if message.audio:
+        message_dict["audio"] = [aud.to_dict() for aud in message.audio]
+    if message.videos:
+        message_dict["videos"] = [vid.to_dict() for vid in message.videos]
+    if message.files:
+        message_dict["files"] = [str(f.url or f.filepath or f.content) for f in message.files]
+    return {k: v for k, v in message_dict.items() if v is not None}
+
+
+def _hash(data: Any) -> str:
+    return sha256(json.dumps(data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class ResponseCache(ABC):
+    """Base class for caching model responses.
+
+    Responses are keyed by a hash of the provider, model id, messages, tools, response format and temperature.
+    If an embedder is provided, a miss on the exact key falls back to the most similar cached prompt
+    with the same conversation history and model settings.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[int] = None,
+        max_size: Optional[int] = 1000,
+        embedder: Optional[Embedder] = None,
+        similarity_threshold: float = 0.95,
+        force: bool = False,
+    ):
+        """
+        Args:
+            ttl: Number of seconds a cached response is valid for. None means no expiry.
+            max_size: Maximum number of cached responses. The least recently used are evicted first.
+            embedder: Embedder used for the semantic tier. If None, only exact matches are returned.
+            similarity_threshold: Minimum cosine similarity for a semantic match.
+            force: Cache responses even if the model is sampling with a temperature above 0.
+        """
+        self.ttl: Optional[int] = ttl
+        self.max_size: Optional[int] = max_size
+        self.embedder: Optional[Embedder] = embedder
+        self.similarity_threshold: float = similarity_threshold
+        self.force: bool = force
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @abstractmethod
+    def read(self, key: str) -> Optional[CacheEntry]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def write(self, entry: CacheEntry) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def search(self, scope: str, embedding: List[float]) -> Optional[CacheEntry]:
+        """Return the entry in the scope with the most similar embedding above the similarity threshold."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def get_query(
+        self,
+        model: "Model",
+        messages: List[Message],
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        stream: bool = False,
+    ) -> Optional[CacheQuery]:
+        """Build the cache query for a model invocation. Returns None if the response should not be cached."""
+        temperature = getattr(model, "temperature", None)
+        if not self.force and (temperature is None or temperature > 0):
+            return None
+
+        if isinstance(response_format, type) and issubclass(response_format, BaseModel):
+            response_format_data: Any = response_format.model_json_schema()
+        else:
+            response_format_data = response_format
+
+        settings = {
+            "provider": model.get_provider(),
+            "id": model.id,
+            "tools": tools,
+            "tool_choice": tool_choice,
+            "response_format": response_format_data,
+            "temperature": temperature,
+            "stream": stream,
+        }
+        message_dicts = [_message_to_cache_dict(m) for m in messages]
+
+        prompt: Optional[str] = None
+        history = message_dicts
+        if len(messages) > 0 and messages[-1].role == "user":
+            prompt = messages[-1].get_content_string()
+            history = message_dicts[:-1]
+
+        return CacheQuery(
+            key=_hash({"settings": settings, "messages": message_dicts}),
+            scope=_hash({"settings": settings, "messages": history}),
+            prompt=prompt,
+        )
+
+    def _get_embedding(self, query: CacheQuery) -> Optional[List[float]]:
+        if self.embedder is None or not query.prompt:
+            return None
+        if query.embedding is None:
+            try:
+                query.embedding = self.embedder.get_embedding(query.prompt)
+            except Exception as e:
+                log_warning(f"Error embedding prompt for response cache: {e}")
+                return None
+        return query.embedding
+
+    async def _aget_embedding(self, query: CacheQuery) -> Optional[List[float]]:
+        if self.embedder is None or not query.prompt:
+            return None
+        if query.embedding is None:
+            try:
+                query.embedding = await self.embedder.aget_embedding(query.prompt)
+            except Exception as e:
+                log_warning(f"Error embedding prompt for response cache: {e}")
+                return None
+        return query.embedding
+
+    def _read_unexpired(self, key: str) -> Optional[CacheEntry]:
+        entry = self.read(key)
+        if entry is not None and entry.is_expired(self.ttl):
+            self.delete(entry.key)
+            return None
+        return entry
+
+    def _search_unexpired(self, scope: str, embedding: Optional[List[float]]) -> Optional[CacheEntry]:
+        if embedding is None:
+            return None
+        entry = self.search(scope, embedding)
+        if entry is not None and entry.is_expired(self.ttl):
+            self.delete(entry.key)
+            return None
+        if entry is not None:
+            log_debug("Response cache semantic hit")
+        return entry
+
+    def _record_lookup(self, entry: Optional[CacheEntry]) -> Optional[Any]:
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        log_debug(f"Response cache hit: {entry.key[:12]}")
+        return entry.value
+
+    def get(self, query: CacheQuery) -> Optional[Any]:
+        """Return the cached response for the query, if any."""
+        entry = self._read_unexpired(query.key)
+        if entry is None:
+            entry = self._search_unexpired(query.scope, self._get_embedding(query))
+        return self._record_lookup(entry)
+
+    async def aget(self, query: CacheQuery) -> Optional[Any]:
+        """Return the cached response for the query, if any, embedding the prompt without blocking the event loop."""
+        entry = self._read_unexpired(query.key)
+        if entry is None:
+            entry = self._search_unexpired(query.scope, await self._aget_embedding(query))
+        return self._record_lookup(entry)
+
+    def set(self, query: CacheQuery, value: Any) -> None:
+        """Cache a response for the query."""
+        self._write(query, value, self._get_embedding(query))
+
+    async def aset(self, query: CacheQuery, value: Any) -> None:
+        """Cache a response for the query, embedding the prompt without blocking the event loop."""
+        self._write(query, value, await self._aget_embedding(query))
+
+    def _write(self, query: CacheQuery, value: Any, embedding: Optional[List[float]]) -> None:
+        try:
+            self.write(CacheEntry(key=query.key, scope=query.scope, value=value, embedding=embedding))
+        except Exception as e:
+            log_warning(f"Error writing to response cache: {e}")
+
+    def __deepcopy__(self, memo):
+        # The cache is shared between copies of a model
+        return self
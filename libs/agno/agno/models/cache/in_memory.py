@@ -0,0 +1,58 @@
+from collections import OrderedDict
+from copy import deepcopy
+from threading import Lock
+from typing import List, Optional
+
+from agno.models.cache.base import CacheEntry, ResponseCache, _cosine_similarity
+
+
+class InMemoryResponseCache(ResponseCache):
+    """Response cache that keeps responses in process memory, evicting the least recently used first."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = Lock()
+
+    def read(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return deepcopy(entry)
+
+    def write(self, entry: CacheEntry) -> None:
+        entry = deepcopy(entry)
+        with self._lock:
+            self._entries[entry.key] = entry
+            self._entries.move_to_end(entry.key)
+            if self.max_size is not None:
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+
+    def search(self, scope: str, embedding: List[float]) -> Optional[CacheEntry]:
+        best_entry: Optional[CacheEntry] = None
+        best_score = self.similarity_threshold
+        with self._lock:
+            for entry in self._entries.values():
+                if entry.scope != scope or entry.embedding is None:
+                    continue
+                score = _cosine_similarity(embedding, entry.embedding)
+                if score >= best_score:
+                    best_entry, best_score = entry, score
+            if best_entry is None:
+                return None
+            self._entries.move_to_end(best_entry.key)
+            return deepcopy(best_entry)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,153 @@
+import json
+import pickle
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import List, Optional
+
+try:
+    from sqlalchemy import Column, Engine, Float, LargeBinary, MetaData, String, Table, create_engine, delete, select
+    from sqlalchemy.dialects import sqlite
+    from sqlalchemy.orm import scoped_session, sessionmaker
+    from sqlalchemy.pool import StaticPool
+except ImportError:
+    raise ImportError("`sqlalchemy` not installed. Please install it with `pip install sqlalchemy`")
+
+from agno.models.cache.base import CacheEntry, ResponseCache, _cosine_similarity
+from agno.utils.log import log_debug
+
+
+class SqliteResponseCache(ResponseCache):
+    def __init__(
+        self,
+        table_name: str = "model_response_cache",
+        db_url: Optional[str] = None,
+        db_file: Optional[str] = None,
+        db_engine: Optional[Engine] = None,
+        **kwargs,
+    ):
+        """
+        Response cache backed by a SQLite table, so cached responses survive process restarts.
+
+        The following order is used to determine the database connection:
+            1. Use the db_engine if provided
+            2. Use the db_url
+            3. Use the db_file
+            4. Create a new in-memory database
+
+        Args:
+            table_name: The name of the table to store cached responses.
+            db_url: The database URL to connect to.
+            db_file: The database file to connect to.
+            db_engine: The database engine to use.
+            **kwargs: Cache settings passed to ResponseCache (ttl, max_size, embedder, ...).
+        """
+        super().__init__(**kwargs)
+        _engine: Optional[Engine] = db_engine
+        if _engine is None and db_url is not None:
+            _engine = create_engine(db_url)
+        elif _engine is None and db_file is not None:
+            db_path = Path(db_file).resolve()
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            _engine = create_engine(f"sqlite:///{db_path}")
+        elif _engine is None:
+            # Share the in-memory database between threads, each connection would otherwise get its own database
+            _engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+
+        self.table_name: str = table_name
+        self.db_url: Optional[str] = db_url
+        self.db_file: Optional[str] = db_file
+        self.db_engine: Engine = _engine
+        self.metadata: MetaData = MetaData()
+        self.Session = scoped_session(sessionmaker(bind=self.db_engine))
+        # The in-memory database shares a single connection between threads
+        self._lock = Lock()
+        self.table: Table = self.get_table()
+        self.create()
+
+    def get_table(self) -> Table:
+        return Table(
+            self.table_name,
+            self.metadata,
+            Column("key", String, primary_key=True),
+            Column("scope", String, index=True),
+            Column("value", LargeBinary),
+            Column("embedding", String),
+            Column("created_at", Float),
+            Column("accessed_at", Float, index=True),
+            extend_existing=True,
+        )
+
+    def create(self) -> None:
+        log_debug(f"Creating table: {self.table_name}")
+        self.table.create(self.db_engine, checkfirst=True)
+
+    def _row_to_entry(self, row) -> CacheEntry:
+        return CacheEntry(
+            key=row.key,
+            scope=row.scope,
+            value=pickle.loads(row.value),
+            embedding=json.loads(row.embedding) if row.embedding else None,
+            created_at=row.created_at,
+        )
+
+    def _touch(self, session, key: str) -> None:
+        session.execute(self.table.update().where(self.table.c.key == key).values(accessed_at=time()))
+        session.commit()
+
+    def read(self, key: str) -> Optional[CacheEntry]:
+        with self._lock, self.Session() as session:
+            row = session.execute(select(self.table).where(self.table.c.key == key)).first()
+            if row is None:
+                return None
+            self._touch(session, key)
+            return self._row_to_entry(row)
+
+    def write(self, entry: CacheEntry) -> None:
+        now = time()
+        values = {
+            "key": entry.key,
+            "scope": entry.scope,
+            "value": pickle.dumps(entry.value),
+            "embedding": json.dumps(entry.embedding) if entry.embedding is not None else None,
+            "created_at": entry.created_at,
+            "accessed_at": now,
+        }
+        stmt = sqlite.insert(self.table).values(**values)
+        stmt = stmt.on_conflict_do_update(index_elements=["key"], set_=values)
+        with self._lock, self.Session() as session:
+            session.execute(stmt)
+            if self.max_size is not None:
+                # Evict the least recently used entries beyond max_size
+                stale_keys = (
+                    select(self.table.c.key).order_by(self.table.c.accessed_at.desc()).offset(self.max_size)
+                ).scalar_subquery()
+                session.execute(delete(self.table).where(self.table.c.key.in_(stale_keys)))
+            session.commit()
+
+    def search(self, scope: str, embedding: List[float]) -> Optional[CacheEntry]:
+        with self._lock, self.Session() as session:
+            rows = session.execute(
+                select(self.table.c.key, self.table.c.embedding).where(
+                    self.table.c.scope == scope, self.table.c.embedding.isnot(None)
+                )
+            ).fetchall()
+            best_key: Optional[str] = None
+            best_score = self.similarity_threshold
+            for row in rows:
+                score = _cosine_similarity(embedding, json.loads(row.embedding))
+                if score >= best_score:
+                    best_key, best_score = row.key, score
+        if best_key is None:
+            return None
+        return self.read(best_key)
+
+    def delete(self, key: str) -> None:
+        with self._lock, self.Session() as session:
+            session.execute(delete(self.table).where(self.table.c.key == key))
+            session.commit()
+
+    def clear(self) -> None:
+        with self._lock, self.Session() as session:
+            session.execute(delete(self.table))
+            session.commit()
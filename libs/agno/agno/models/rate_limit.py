@@ -0,0 +1,205 @@
+"""Client-side rate limiting and retry delays for model providers.
+
+Rate limiters are shared by every model in the process with the same provider, model id and api key, so agents
+running in parallel draw from the same quota.
+"""
+
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
+from hashlib import sha256
+from random import uniform
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+from agno.models.message import Message
+from agno.utils.log import log_debug
+
+# Fraction of the delay added as random jitter, so that concurrent callers do not retry in lockstep
+RETRY_JITTER = 0.25
+# Upper bound on a computed retry delay (in seconds)
+MAX_RETRY_DELAY = 60.0
+
+
+class TokenBucket:
+    """A token bucket that refills `capacity` tokens every minute.
+
+    Reservations may take the bucket below zero. Each caller is then told how long to wait for its share,
+    which spaces out concurrent callers instead of waking them all at once.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity: float = float(capacity)
+        self.rate: float = capacity / 60.0
+        self.tokens: float = float(capacity)
+        self.updated_at: float = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take `amount` tokens and return the number of seconds to wait before using them."""
+        self._refill(now)
+        self.tokens -= amount
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    def refund(self, amount: float) -> None:
+        """Return tokens to the bucket (a negative amount takes more)."""
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class RateLimiter:
+    """Limits requests and tokens per minute for a single (provider, model, api key)."""
+
+    def __init__(self, requests_per_minute: Optional[int] = None, tokens_per_minute: Optional[int] = None):
+        self._lock = Lock()
+        self.requests: Optional[TokenBucket] = None
+        self.tokens: Optional[TokenBucket] = None
+        # Monotonic time until which all requests are held back, set from a provider's Retry-After
+        self.blocked_until: float = 0.0
+        self.configure(requests_per_minute=requests_per_minute, tokens_per_minute=tokens_per_minute)
+
+    def configure(self, requests_per_minute: Optional[int] = None, tokens_per_minute: Optional[int] = None) -> None:
+        with self._lock:
+            if requests_per_minute is not None and (
+                self.requests is None or self.requests.capacity != requests_per_minute
+            ):
+                self.requests = TokenBucket(requests_per_minute)
+            if tokens_per_minute is not None and (self.tokens is None or self.tokens.capacity != tokens_per_minute):
+                self.tokens = TokenBucket(tokens_per_minute)
+
+    def _reserve(self, tokens: int) -> float:
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self.blocked_until - now)
+            if self.requests is not None:
+                wait = max(wait, self.requests.reserve(1, now))
+            if self.tokens is not None and tokens > 0:
+                wait = max(wait, self.tokens.reserve(tokens, now))
+            return wait
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Block until a request using `tokens` tokens is allowed."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            log_debug(f"Rate limited, waiting {wait:.2f}s")
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int = 0) -> None:
+        """Wait until a request using `tokens` tokens is allowed, without blocking the event loop."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            log_debug(f"Rate limited, waiting {wait:.2f}s")
+            await asyncio.sleep(wait)
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Correct the token bucket once the actual token usage of a request is known."""
+        if self.tokens is None or actual_tokens <= 0:
+            return
+        with self._lock:
+            self.tokens.refund(estimated_tokens - actual_tokens)
+
+    def block(self, seconds: float) -> None:
+        """Hold back all requests for `seconds` seconds."""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+_rate_limiters: Dict[Tuple[str, str, str], RateLimiter] = {}
+_rate_limiters_lock = Lock()
+
+
+def get_rate_limiter(
+    provider: str,
+    model_id: str,
+    api_key: Optional[str] = None,
+    requests_per_minute: Optional[int] = None,
+    tokens_per_minute: Optional[int] = None,
+) -> RateLimiter:
+    """Return the rate limiter shared by all models with this provider, model id and api key."""
+    key_hash = sha256(api_key.encode("utf-8")).hexdigest() if api_key else ""
+    limiter_key = (provider, model_id, key_hash)
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(limiter_key)
+        if limiter is None:
+            limiter = RateLimiter(requests_per_minute=requests_per_minute, tokens_per_minute=tokens_per_minute)
+            _rate_limiters[limiter_key] = limiter
+            return limiter
+    limiter.configure(requests_per_minute=requests_per_minute, tokens_per_minute=tokens_per_minute)
+    return limiter
+
+
+def estimate_tokens(messages: List[Message]) -> int:
+    """Roughly estimate the number of tokens in a list of messages (about 4 characters per token)."""
+    num_chars = 0
+    for message in messages:
+        content = message.get_content_string()
+        num_chars += len(content) if content else 0
+        if message.tool_calls:
+            num_chars += len(str(message.tool_calls))
+    return num_chars // 4 + 1
+
+
+def _parse_retry_after(headers) -> Optional[float]:
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms is not None:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+    retry_after = headers.get("retry-after")
+    if retry_after is None:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def get_retry_after(exc: BaseException) -> Optional[float]:
+    """Return the number of seconds the provider asked us to wait, from the Retry-After header of the error."""
+    seen = set()
+    current: Optional[BaseException] = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        retry_after = getattr(current, "retry_after", None)
+        if isinstance(retry_after, (int, float)):
+            return float(retry_after)
+        headers = getattr(getattr(current, "response", None), "headers", None)
+        if headers is not None:
+            try:
+                retry_after = _parse_retry_after(headers)
+            except Exception:
+                retry_after = None
+            if retry_after is not None:
+                return retry_after
+        current = current.__cause__ or current.__context__
+    return None
+
+
+def get_retry_delay(
+    attempt: int,
+    delay_between_retries: float = 1,
+    exponential_backoff: bool = False,
+    exc: Optional[BaseException] = None,
+) -> float:
+    """Return the number of seconds to wait before retry number `attempt` (starting at 0).
+
+    The provider's Retry-After is used if the error has one, otherwise the configured (exponential) backoff.
+    Jitter is added in both cases.
+    """
+    retry_after = get_retry_after(exc) if exc is not None else None
+    if retry_after is not None:
+        delay = retry_after
+    elif exponential_backoff:
+        delay = min(2**attempt * delay_between_retries, MAX_RETRY_DELAY)
+    else:
+        delay = delay_between_retries
+    return delay + uniform(0, delay * RETRY_JITTER)
@@ -1,3 +1,4 @@
+import asyncio
 from typing import List
 
 from pydantic import BaseModel, ConfigDict
@@ -12,3 +13,7 @@ class Reranker(BaseModel):
 
     def rerank(self, query: str, documents: List[Document]) -> List[Document]:
         raise NotImplementedError
+
+    async def arerank(self, query: str, documents: List[Document]) -> List[Document]:
+        """Rerank documents in a worker thread, so the event loop is not blocked while the documents are scored."""
+        return await asyncio.to_thread(self.rerank, query, documents)
@@ -1,26 +1,63 @@
-from typing import Any, Dict, List, Optional
+import json
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
 
 from agno.document import Document
 from agno.reranker.base import Reranker
-from agno.utils.log import logger
+from agno.utils.log import log_debug, logger
 
 try:
     from sentence_transformers import CrossEncoder
 except ImportError:
     raise ImportError("`sentence-transformers` not installed, please run `pip install sentence-transformers`")
 
+# Loaded models are shared by all rerankers in the process, keyed by model name and model kwargs
+_cross_encoders: Dict[Tuple[str, str], CrossEncoder] = {}
+_cross_encoders_lock = Lock()
+
+
+def get_cross_encoder(model: str, model_kwargs: Optional[Dict[str, Any]] = None) -> CrossEncoder:
+    """Return the CrossEncoder for a model, loading it only the first time it is requested in the process."""
+    key = (model, json.dumps(model_kwargs or {}, sort_keys=True, default=str))
+    cross_encoder = _cross_encoders.get(key)
+    if cross_encoder is not None:
+        return cross_encoder
+    with _cross_encoders_lock:
+        cross_encoder = _cross_encoders.get(key)
+        if cross_encoder is None:
+            log_debug(f"Loading cross-encoder model: {model}")
+            cross_encoder = CrossEncoder(model_name_or_path=model, model_kwargs=model_kwargs)
+            _cross_encoders[key] = cross_encoder
+    return cross_encoder
+
+
+def clear_cross_encoder_cache() -> None:
+    """Release all cached cross-encoder models."""
+    with _cross_encoders_lock:
+        _cross_encoders.clear()
+
 
 class SentenceTransformerReranker(Reranker):
     model: str = "BAAI/bge-reranker-v2-m3"
     model_kwargs: Optional[Dict[str, Any]] = None
     top_n: Optional[int] = None
+    # Number of (query, document) pairs scored in one forward pass
+    batch_size: int = 32
+    # Documents scoring below this threshold are dropped from the results
+    score_threshold: Optional[float] = None
+    # Use this cross-encoder instead of the shared model cache
+    sentence_transformer_client: Optional[CrossEncoder] = None
+
+    @property
+    def client(self) -> CrossEncoder:
+        if self.sentence_transformer_client:
+            return self.sentence_transformer_client
+        return get_cross_encoder(self.model, self.model_kwargs)
 
     def _rerank(self, query: str, documents: List[Document]) -> List[Document]:
         if not documents:
             return []
 
-        sentence_transformer_client = CrossEncoder(model_name_or_path=self.model, model_kwargs=self.model_kwargs)
-
         top_n = self.top_n
         if top_n and not (0 < top_n):
             logger.warning(f"top_n should be a positive integer, got {self.top_n}, setting top_n to None")
@@ -30,7 +67,7 @@ class SentenceTransformerReranker(Reranker):
 
         sentence_pairs = [[query, doc.content] for doc in documents]
 
-        scores = sentence_transformer_client.predict(sentence_pairs).tolist()
+        scores = self.client.predict(sentence_pairs, batch_size=self.batch_size, show_progress_bar=False).tolist()
         for index, score in enumerate(scores):
             doc = documents[index]
             doc.reranking_score = score
@@ -41,6 +78,13 @@ class SentenceTransformerReranker(Reranker):
             reverse=True,
         )
 
+        if self.score_threshold is not None:
+            # Documents are sorted by score, so stop at the first one below the threshold
+            for index, doc in enumerate(compressed_docs):
+                if doc.reranking_score is None or doc.reranking_score < self.score_threshold:
+                    compressed_docs = compressed_docs[:index]
+                    break
+
         if top_n:
             compressed_docs = compressed_docs[:top_n]
 
@@ -0,0 +1,175 @@
+"""Fast JSON encoding of run events for streaming responses (e.g. SSE)."""
+
+import json
+from dataclasses import fields, is_dataclass, replace
+from functools import lru_cache
+from time import perf_counter
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
+
+from agno.run.response import RunResponseContentEvent
+from agno.run.team import RunResponseContentEvent as TeamRunResponseContentEvent
+from agno.utils.log import log_error
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+_PRIMITIVE_TYPES = (str, int, float, bool)
+_CONTENT_EVENT_TYPES = (RunResponseContentEvent, TeamRunResponseContentEvent)
+# Fields that are always sent for content events when encoding deltas
+_DELTA_KEYS = ("event", "content", "thinking")
+
+
+@lru_cache(maxsize=None)
+def get_event_fields(event_type: type) -> Tuple[str, ...]:
+    """Return the field names of an event dataclass. Computed once per event type."""
+    return tuple(f.name for f in fields(event_type))
+
+
+def event_to_dict(event: Any) -> Dict[str, Any]:
+    """Convert an event to a dictionary.
+
+    Events whose fields are all primitives (e.g. a content event for a single token) are converted using the
+    precomputed field list, without the deep copy done by `dataclasses.asdict`. Other events use `event.to_dict()`.
+    """
+    if not is_dataclass(event):
+        return event.to_dict()
+    _dict: Dict[str, Any] = {}
+    for name in get_event_fields(type(event)):
+        value = getattr(event, name)
+        if value is None:
+            continue
+        if not isinstance(value, _PRIMITIVE_TYPES):
+            return event.to_dict()
+        _dict[name] = value
+    return _dict
+
+
+def dumps(data: Dict[str, Any]) -> str:
+    """Serialize a dictionary to compact JSON, using orjson if it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str).decode("utf-8")
+    return json.dumps(data, separators=(",", ":"), default=str)
+
+
+def _is_coalescable(event: Any) -> bool:
+    return (
+        isinstance(event, _CONTENT_EVENT_TYPES)
+        and isinstance(event.content, str)
+        and event.citations is None
+        and event.response_audio is None
+        and event.image is None
+        and event.extra_data is None
+    )
+
+
+def _merge_content_events(events: list) -> Any:
+    if len(events) == 1:
+        return events[0]
+    thinking = "".join(e.thinking for e in events if e.thinking)
+    return replace(events[0], content="".join(e.content for e in events), thinking=thinking or None)
+
+
+def _can_merge(buffer: list, event: Any) -> bool:
+    first = buffer[0]
+    return type(first) is type(event) and first.run_id == event.run_id and first.session_id == event.session_id
+
+
+def coalesce_content_events(events: Iterator[Any], interval_ms: int) -> Iterator[Any]:
+    """Merge consecutive content events into a single event every `interval_ms` milliseconds.
+
+    All other events are passed through unchanged, and buffered content is flushed before them.
+    """
+    buffer: list = []
+    frame_start = 0.0
+    for event in events:
+        if _is_coalescable(event):
+            if buffer and not _can_merge(buffer, event):
+                yield _merge_content_events(buffer)
+                buffer = []
+            if not buffer:
+                frame_start = perf_counter()
+            buffer.append(event)
+            if (perf_counter() - frame_start) * 1000 >= interval_ms:
+                yield _merge_content_events(buffer)
+                buffer = []
+            continue
+        if buffer:
+            yield _merge_content_events(buffer)
+            buffer = []
+        yield event
+    if buffer:
+        yield _merge_content_events(buffer)
+
+
+async def acoalesce_content_events(events: AsyncIterator[Any], interval_ms: int) -> AsyncIterator[Any]:
+    """Async version of `coalesce_content_events`."""
+    buffer: list = []
+    frame_start = 0.0
+    async for event in events:
+        if _is_coalescable(event):
+            if buffer and not _can_merge(buffer, event):
+                yield _merge_content_events(buffer)
+                buffer = []
+            if not buffer:
+                frame_start = perf_counter()
+            buffer.append(event)
+            if (perf_counter() - frame_start) * 1000 >= interval_ms:
+                yield _merge_content_events(buffer)
+                buffer = []
+            continue
+        if buffer:
+            yield _merge_content_events(buffer)
+            buffer = []
+        yield event
+    if buffer:
+        yield _merge_content_events(buffer)
+
+
+class EventEncoder:
+    """Encodes streams of run events as compact JSON.
+
+    Args:
+        delta: Only send the fields of a content event that changed since the previous content event.
+            `event`, `content` and `thinking` are always sent.
+        coalesce_ms: Merge content events into one frame every `coalesce_ms` milliseconds.
+    """
+
+    def __init__(self, delta: bool = False, coalesce_ms: Optional[int] = None):
+        self.delta = delta
+        self.coalesce_ms = coalesce_ms
+
+    def encode(self, event: Any) -> str:
+        """Encode a single event."""
+        try:
+            return dumps(event_to_dict(event))
+        except Exception:
+            log_error("Failed to convert response event to json", exc_info=True)
+            raise
+
+    def _encode_delta(self, event: Any, previous: Dict[str, Any]) -> str:
+        _dict = event_to_dict(event)
+        if not isinstance(event, _CONTENT_EVENT_TYPES):
+            previous.clear()
+            return dumps(_dict)
+        delta = {k: v for k, v in _dict.items() if k in _DELTA_KEYS or previous.get(k) != v}
+        previous.clear()
+        previous.update(_dict)
+        return dumps(delta)
+
+    def encode_stream(self, events: Iterator[Any]) -> Iterator[str]:
+        """Encode a stream of events."""
+        if self.coalesce_ms:
+            events = coalesce_content_events(events, self.coalesce_ms)
+        previous: Dict[str, Any] = {}
+        for event in events:
+            yield self._encode_delta(event, previous) if self.delta else self.encode(event)
+
+    async def aencode_stream(self, events: AsyncIterator[Any]) -> AsyncIterator[str]:
+        """Encode an async stream of events."""
+        if self.coalesce_ms:
+            events = acoalesce_content_events(events, self.coalesce_ms)
+        previous: Dict[str, Any] = {}
+        async for event in events:
+            yield self._encode_delta(event, previous) if self.delta else self.encode(event)
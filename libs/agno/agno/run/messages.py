@@ -13,12 +13,16 @@ class RunMessages:
         system_message: The system message for this run
         user_message: The user message for this run
         extra_messages: Extra messages added after the system and user messages
+        knowledge_retrieval_time: Time (in seconds) spent retrieving references from the knowledge base
+        memory_retrieval_time: Time (in seconds) spent retrieving user memories in parallel
     """
 
     messages: List[Message] = field(default_factory=list)
     system_message: Optional[Message] = None
     user_message: Optional[Message] = None
     extra_messages: Optional[List[Message]] = None
+    knowledge_retrieval_time: Optional[float] = None
+    memory_retrieval_time: Optional[float] = None
 
     def get_input_messages(self) -> List[Message]:
         """Get the input messages for the model."""
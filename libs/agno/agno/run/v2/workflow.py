@@ -10,6 +10,7 @@ from agno.run.base import RunStatus
 from agno.utils.log import log_error
 
 if TYPE_CHECKING:
+    from agno.workflow.v2.checkpoint import StepCheckpoint
     from agno.workflow.v2.types import StepOutput, WorkflowMetrics
 
 
@@ -33,6 +34,10 @@ class WorkflowRunEvent(str, Enum):
     parallel_execution_started = "ParallelExecutionStarted"
     parallel_execution_completed = "ParallelExecutionCompleted"
 
+    map_execution_started = "MapExecutionStarted"
+    map_batch_completed = "MapBatchCompleted"
+    map_execution_completed = "MapExecutionCompleted"
+
     condition_execution_started = "ConditionExecutionStarted"
     condition_execution_completed = "ConditionExecutionCompleted"
 
@@ -261,6 +266,46 @@ class ParallelExecutionCompletedEvent(BaseWorkflowRunResponseEvent):
     step_results: List["StepOutput"] = field(default_factory=list)  # noqa: F821
 
 
+@dataclass
+class MapExecutionStartedEvent(BaseWorkflowRunResponseEvent):
+    """Event sent when map step execution starts"""
+
+    event: str = WorkflowRunEvent.map_execution_started.value
+    step_name: Optional[str] = None
+    step_index: Optional[Union[int, tuple]] = None
+    item_count: Optional[int] = None
+    batch_count: Optional[int] = None
+
+
+@dataclass
+class MapBatchCompletedEvent(BaseWorkflowRunResponseEvent):
+    """Event sent when the step of a map step completes for a batch of items"""
+
+    event: str = WorkflowRunEvent.map_batch_completed.value
+    step_name: Optional[str] = None
+    step_index: Optional[Union[int, tuple]] = None
+    batch_index: Optional[int] = None
+    batch_count: Optional[int] = None
+    items: Optional[List[Any]] = None
+
+    # Results of the step for this batch
+    step_results: List["StepOutput"] = field(default_factory=list)  # noqa: F821
+
+
+@dataclass
+class MapExecutionCompletedEvent(BaseWorkflowRunResponseEvent):
+    """Event sent when map step execution completes"""
+
+    event: str = WorkflowRunEvent.map_execution_completed.value
+    step_name: Optional[str] = None
+    step_index: Optional[Union[int, tuple]] = None
+    item_count: Optional[int] = None
+    batch_count: Optional[int] = None
+
+    # Results of the step for all batches, in item order
+    step_results: List["StepOutput"] = field(default_factory=list)  # noqa: F821
+
+
 @dataclass
 class ConditionExecutionStartedEvent(BaseWorkflowRunResponseEvent):
     """Event sent when condition step execution starts"""
@@ -390,6 +435,9 @@ WorkflowRunResponseEvent = Union[
     LoopExecutionCompletedEvent,
     ParallelExecutionStartedEvent,
     ParallelExecutionCompletedEvent,
+    MapExecutionStartedEvent,
+    MapBatchCompletedEvent,
+    MapExecutionCompletedEvent,
     ConditionExecutionStartedEvent,
     ConditionExecutionCompletedEvent,
     RouterExecutionStartedEvent,
@@ -430,6 +478,10 @@ class WorkflowRunResponse:
     # Workflow metrics aggregated from all steps
     workflow_metrics: Optional["WorkflowMetrics"] = None
 
+    # The input of the run and the outputs of its completed steps, stored to resume the run
+    workflow_input: Optional[Dict[str, Any]] = None
+    step_checkpoints: Optional[List["StepCheckpoint"]] = None
+
     extra_data: Optional[Dict[str, Any]] = None
     created_at: int = field(default_factory=lambda: int(time()))
 
@@ -454,6 +506,7 @@ class WorkflowRunResponse:
                 "step_responses",
                 "events",
                 "workflow_metrics",
+                "step_checkpoints",
             ]
         }
 
@@ -489,6 +542,9 @@ class WorkflowRunResponse:
         if self.workflow_metrics is not None:
             _dict["workflow_metrics"] = self.workflow_metrics.to_dict()
 
+        if self.step_checkpoints is not None:
+            _dict["step_checkpoints"] = [checkpoint.to_dict() for checkpoint in self.step_checkpoints]
+
         if self.content and isinstance(self.content, BaseModel):
             _dict["content"] = self.content.model_dump(exclude_none=True)
 
@@ -522,6 +578,12 @@ class WorkflowRunResponse:
                 # Reconstruct StepOutput from dict
                 parsed_step_responses.append(StepOutput.from_dict(step_output_dict))
 
+        step_checkpoints = data.pop("step_checkpoints", None)
+        if step_checkpoints is not None:
+            from agno.workflow.v2.checkpoint import StepCheckpoint
+
+            step_checkpoints = [StepCheckpoint.from_dict(checkpoint) for checkpoint in step_checkpoints]
+
         extra_data = data.pop("extra_data", None)
 
         images = data.pop("images", [])
@@ -547,6 +609,7 @@ class WorkflowRunResponse:
             response_audio=response_audio,
             events=events,
             workflow_metrics=workflow_metrics,
+            step_checkpoints=step_checkpoints,
             **data,
         )
 
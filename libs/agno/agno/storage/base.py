@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import List, Literal, Optional
+from typing import TYPE_CHECKING, List, Literal, Optional
 
 from agno.storage.session import Session
 
+if TYPE_CHECKING:
+    from agno.run.v2.workflow import WorkflowRunResponse
+
 
 class Storage(ABC):
     def __init__(self, mode: Optional[Literal["agent", "team", "workflow", "workflow_v2"]] = "agent"):
@@ -58,3 +61,17 @@ class Storage(ABC):
     @abstractmethod
     def upgrade_schema(self) -> None:
         raise NotImplementedError
+
+    def upsert_workflow_run(self, session_id: str, run: "WorkflowRunResponse") -> bool:
+        """Insert or update a single run of a workflow_v2 session.
+
+        Returns False if the storage keeps the runs with the session, which must then be upserted instead.
+        """
+        return False
+
+    def update_workflow_run_status(self, session_id: str, run_id: str, status: str) -> bool:
+        """Update the status of a stored run of a workflow_v2 session, without writing the rest of the run.
+
+        Returns False if the storage keeps the runs with the session, or the run is not stored yet.
+        """
+        return False
@@ -1,6 +1,6 @@
 import time
 from pathlib import Path
-from typing import List, Literal, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Set
 
 from agno.storage.base import Storage
 from agno.storage.session import Session
@@ -18,11 +18,14 @@ try:
     from sqlalchemy.orm import sessionmaker
     from sqlalchemy.schema import Column, MetaData, Table
     from sqlalchemy.sql import text
-    from sqlalchemy.sql.expression import select
+    from sqlalchemy.sql.expression import select, update
     from sqlalchemy.types import String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
 
+if TYPE_CHECKING:
+    from agno.run.v2.workflow import WorkflowRunResponse
+
 
 class SqliteStorage(Storage):
     def __init__(
@@ -34,6 +37,7 @@ class SqliteStorage(Storage):
         schema_version: int = 1,
         auto_upgrade_schema: bool = False,
         mode: Optional[Literal["agent", "team", "workflow", "workflow_v2"]] = "agent",
+        runs_table_name: Optional[str] = None,
     ):
         """
         This class provides agent storage using a sqlite database.
@@ -49,6 +53,8 @@ class SqliteStorage(Storage):
             db_url: The database URL to connect to.
             db_file: The database file to connect to.
             db_engine: The SQLAlchemy database engine to use.
+            runs_table_name: In workflow_v2 mode, the name of a table to store each run in its own row, instead of
+                all runs in the runs column of the session. Runs already in the runs column are still read.
         """
         super().__init__(mode)
         _engine: Optional[Engine] = db_engine
@@ -83,6 +89,11 @@ class SqliteStorage(Storage):
         self.SqlSession: sessionmaker[SqlSession] = sessionmaker(bind=self.db_engine)
         # Database table for storage
         self.table: Table = self.get_table()
+        # Database table for workflow runs
+        self.runs_table_name: Optional[str] = runs_table_name
+        self.runs_table: Optional[Table] = self.get_runs_table()
+        # Sessions with a run that could not be stored in the runs table, their runs are stored with the session
+        self._sessions_with_unstored_runs: Set[str] = set()
 
     @property
     def mode(self) -> Optional[Literal["agent", "team", "workflow", "workflow_v2"]]:
@@ -95,6 +106,7 @@ class SqliteStorage(Storage):
         super(SqliteStorage, type(self)).mode.fset(self, value)  # type: ignore
         if value is not None:
             self.table = self.get_table()
+            self.runs_table = self.get_runs_table()
 
     def get_table_v1(self) -> Table:
         """
@@ -167,6 +179,35 @@ class SqliteStorage(Storage):
         else:
             raise ValueError(f"Unsupported schema version: {self.schema_version}")
 
+    def get_runs_table(self) -> Optional[Table]:
+        """
+        Define the table storing each run of a workflow_v2 session in its own row, if runs_table_name is set.
+
+        The status of a run has its own column, so status updates do not rewrite the run.
+
+        Returns:
+            Optional[Table]: SQLAlchemy Table object, or None if runs are stored with the session.
+        """
+        if self.mode != "workflow_v2" or self.runs_table_name is None:
+            return None
+        # Defining the table again would add its indexes twice
+        if self.runs_table_name in self.metadata.tables:
+            return self.metadata.tables[self.runs_table_name]
+
+        return Table(
+            self.runs_table_name,
+            self.metadata,
+            # Keeps the order the runs were stored in
+            Column("id", sqlite.INTEGER, primary_key=True, autoincrement=True),
+            Column("run_id", String, unique=True, index=True),
+            Column("session_id", String, index=True),
+            Column("status", String),
+            Column("run_data", sqlite.JSON),
+            Column("created_at", sqlite.INTEGER, default=lambda: int(time.time())),
+            Column("updated_at", sqlite.INTEGER, onupdate=lambda: int(time.time())),
+            extend_existing=True,
+        )
+
     def table_exists(self) -> bool:
         """
         Check if the table exists in the database.
@@ -191,6 +232,11 @@ class SqliteStorage(Storage):
         Create the table if it doesn't exist.
         """
         self.table = self.get_table()
+        self.runs_table = self.get_runs_table()
+        if self.runs_table is not None:
+            log_debug(f"Creating table if it does not exist: {self.runs_table.name}")
+            self.runs_table.create(self.db_engine, checkfirst=True)
+
         if not self.table_exists():
             log_debug(f"Creating table: {self.table.name}")
             try:
@@ -250,7 +296,9 @@ class SqliteStorage(Storage):
                 elif self.mode == "workflow":
                     return WorkflowSession.from_dict(result._mapping) if result is not None else None  # type: ignore
                 elif self.mode == "workflow_v2":
-                    return WorkflowSessionV2.from_dict(result._mapping) if result is not None else None  # type: ignore
+                    if result is None:
+                        return None
+                    return self._to_workflow_session(result, self._get_workflow_runs(sess, [session_id]))
         except Exception as e:
             if "no such table" in str(e):
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -334,7 +382,8 @@ class SqliteStorage(Storage):
                     elif self.mode == "workflow":
                         return [WorkflowSession.from_dict(row._mapping) for row in rows]  # type: ignore
                     elif self.mode == "workflow_v2":
-                        return [WorkflowSessionV2.from_dict(row._mapping) for row in rows]  # type: ignore
+                        runs = self._get_workflow_runs(sess, [row.session_id for row in rows])
+                        return [self._to_workflow_session(row, runs) for row in rows]  # type: ignore
                 else:
                     return []
         except Exception as e:
@@ -391,7 +440,8 @@ class SqliteStorage(Storage):
                     elif self.mode == "workflow":
                         return [WorkflowSession.from_dict(row._mapping) for row in rows]  # type: ignore
                     elif self.mode == "workflow_v2":
-                        return [WorkflowSessionV2.from_dict(row._mapping) for row in rows]  # type: ignore
+                        runs = self._get_workflow_runs(sess, [row.session_id for row in rows])
+                        return [self._to_workflow_session(row, runs) for row in rows]  # type: ignore
                 return []
         except Exception as e:
             if "no such table" in str(e):
@@ -401,6 +451,46 @@ class SqliteStorage(Storage):
                 log_debug(f"Exception reading from table: {e}")
         return []
 
+    def _get_workflow_runs(self, sess: SqlSession, session_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get the runs stored in the runs table for each session, in the order they were stored.
+        """
+        runs: Dict[str, List[Dict[str, Any]]] = {}
+        if self.runs_table is None or len(session_ids) == 0:
+            return runs
+
+        stmt = (
+            select(self.runs_table).where(self.runs_table.c.session_id.in_(session_ids)).order_by(self.runs_table.c.id)
+        )
+        try:
+            rows = sess.execute(stmt).fetchall()
+        except Exception as e:
+            if "no such table" in str(e):
+                log_debug(f"Table does not exist: {self.runs_table.name}")
+                return runs
+            raise
+
+        for row in rows:
+            run_data = dict(row.run_data or {})
+            # The status column is updated on its own
+            run_data["status"] = row.status
+            runs.setdefault(row.session_id, []).append(run_data)
+        return runs
+
+    def _to_workflow_session(self, row: Any, runs: Dict[str, List[Dict[str, Any]]]) -> Optional[WorkflowSessionV2]:
+        """
+        Create a WorkflowSessionV2 from its row and the runs stored in the runs table.
+        """
+        data = dict(row._mapping)
+        stored_runs = runs.get(data["session_id"])
+        if stored_runs:
+            # Runs stored before the runs table was used stay in the runs column
+            stored_run_ids = {run.get("run_id") for run in stored_runs}
+            data["runs"] = [
+                run for run in data.get("runs") or [] if run.get("run_id") not in stored_run_ids
+            ] + stored_runs
+        return WorkflowSessionV2.from_dict(data)
+
     def upgrade_schema(self) -> None:
         """
         Upgrade the schema of the storage table.
@@ -528,34 +618,26 @@ class SqliteStorage(Storage):
                         ),
                     )
                 elif self.mode == "workflow_v2":
-                    # Convert session to dict to ensure proper serialization
-                    session_dict = session.to_dict()
-
-                    # Create an insert statement for WorkflowSessionV2
-                    stmt = sqlite.insert(self.table).values(
-                        session_id=session.session_id,
+                    session_values = dict(
                         workflow_id=session.workflow_id,  # type: ignore
                         workflow_name=session.workflow_name,  # type: ignore
                         user_id=session.user_id,
-                        runs=session_dict.get("runs"),
                         workflow_data=session.workflow_data,  # type: ignore
                         session_data=session.session_data,
                         extra_data=session.extra_data,
                     )
+                    # With a runs table, runs are stored with upsert_workflow_run
+                    if self.runs_table is None or session.session_id in self._sessions_with_unstored_runs:
+                        # Convert session to dict to ensure proper serialization
+                        session_values["runs"] = session.to_dict().get("runs")
+
+                    # Create an insert statement for WorkflowSessionV2
+                    stmt = sqlite.insert(self.table).values(session_id=session.session_id, **session_values)
 
                     # Define the upsert if the session_id already exists
                     stmt = stmt.on_conflict_do_update(
                         index_elements=["session_id"],
-                        set_=dict(
-                            workflow_id=session.workflow_id,  # type: ignore
-                            workflow_name=session.workflow_name,  # type: ignore
-                            user_id=session.user_id,
-                            runs=session_dict.get("runs"),
-                            workflow_data=session.workflow_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),
+                        set_=dict(**session_values, updated_at=int(time.time())),
                     )
 
                 sess.execute(stmt)
@@ -571,8 +653,74 @@ class SqliteStorage(Storage):
                     "A table upgrade might be required, please review these docs for more information: https://agno.link/upgrade-schema"
                 )
                 return None
+        self._sessions_with_unstored_runs.discard(session.session_id)
         return self.read(session_id=session.session_id)
 
+    def upsert_workflow_run(self, session_id: str, run: "WorkflowRunResponse", create_and_retry: bool = True) -> bool:
+        """
+        Insert or update a run of a workflow_v2 session in the runs table.
+
+        Args:
+            session_id (str): ID of the session of the run.
+            run (WorkflowRunResponse): The run to upsert.
+            create_and_retry (bool): Retry upsert if table does not exist.
+
+        Returns:
+            bool: False if runs_table_name is not set or the run could not be stored, and runs must be stored with
+                the session.
+        """
+        if self.runs_table is None:
+            return False
+
+        run_data = run.to_dict()
+        values = dict(session_id=session_id, status=run_data.get("status"), run_data=run_data)
+        try:
+            with self.SqlSession() as sess, sess.begin():
+                stmt = sqlite.insert(self.runs_table).values(run_id=run.run_id, **values)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["run_id"],
+                    set_=dict(**values, updated_at=int(time.time())),
+                )
+                sess.execute(stmt)
+        except Exception as e:
+            if create_and_retry and "no such table" in str(e):
+                log_debug(f"Table does not exist: {self.runs_table.name}")
+                log_debug("Creating table and retrying upsert")
+                self.create()
+                return self.upsert_workflow_run(session_id, run, create_and_retry=False)
+            log_warning(f"Exception upserting into table: {e}")
+            self._sessions_with_unstored_runs.add(session_id)
+            return False
+        return True
+
+    def update_workflow_run_status(self, session_id: str, run_id: str, status: str) -> bool:
+        """
+        Update the status of a run of a workflow_v2 session in the runs table.
+
+        Args:
+            session_id (str): ID of the session of the run.
+            run_id (str): ID of the run to update.
+            status (str): The new status of the run.
+
+        Returns:
+            bool: True if the run was updated, False if runs_table_name is not set or the run is not stored yet.
+        """
+        if self.runs_table is None:
+            return False
+
+        try:
+            with self.SqlSession() as sess, sess.begin():
+                stmt = (
+                    update(self.runs_table)
+                    .where(self.runs_table.c.run_id == run_id)
+                    .where(self.runs_table.c.session_id == session_id)
+                    .values(status=status, updated_at=int(time.time()))
+                )
+                return sess.execute(stmt).rowcount > 0
+        except Exception as e:
+            log_debug(f"Exception updating run status: {e}")
+        return False
+
     def delete_session(self, session_id: Optional[str] = None):
         """
         Delete a workflow session from the database.
@@ -592,6 +740,8 @@ class SqliteStorage(Storage):
                 # Delete the session with the given session_id
                 delete_stmt = self.table.delete().where(self.table.c.session_id == session_id)
                 result = sess.execute(delete_stmt)
+                if self.runs_table is not None:
+                    sess.execute(self.runs_table.delete().where(self.runs_table.c.session_id == session_id))
                 if result.rowcount == 0:
                     log_debug(f"No session found with session_id: {session_id}")
                 else:
@@ -607,9 +757,12 @@ class SqliteStorage(Storage):
             log_debug(f"Deleting table: {self.table_name}")
             # Drop with checkfirst=True to avoid errors if the table doesn't exist
             self.table.drop(self.db_engine, checkfirst=True)
+            if self.runs_table is not None:
+                self.runs_table.drop(self.db_engine, checkfirst=True)
             # Clear metadata to ensure indexes are recreated properly
             self.metadata = MetaData()
             self.table = self.get_table()
+            self.runs_table = self.get_runs_table()
 
     def __deepcopy__(self, memo):
         """
@@ -630,7 +783,7 @@ class SqliteStorage(Storage):
 
         # Deep copy attributes
         for k, v in self.__dict__.items():
-            if k in {"metadata", "table", "inspector"}:
+            if k in {"metadata", "table", "runs_table", "inspector"}:
                 continue
             # Reuse db_engine and Session without copying
             elif k in {"db_engine", "SqlSession"}:
@@ -642,5 +795,6 @@ class SqliteStorage(Storage):
         copied_obj.metadata = MetaData()
         copied_obj.inspector = inspect(copied_obj.db_engine)
         copied_obj.table = copied_obj.get_table()
+        copied_obj.runs_table = copied_obj.get_runs_table()
 
         return copied_obj
@@ -1,15 +1,20 @@
 import asyncio
 import json
+import time
 from collections import ChainMap, defaultdict, deque
+from contextlib import asynccontextmanager, contextmanager
 from copy import deepcopy
 from dataclasses import asdict, dataclass, replace
 from os import getenv
 from textwrap import dedent
+from threading import Lock
 from typing import (
     Any,
+    AsyncIterable,
     AsyncIterator,
     Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
     Literal,
@@ -35,13 +40,17 @@ from agno.media import Audio, AudioArtifact, AudioResponse, File, Image, ImageAr
 from agno.memory.agent import AgentMemory
 from agno.memory.team import TeamMemory, TeamRun
 from agno.memory.v2.memory import Memory, SessionSummary
+from agno.memory.v2.team_context import TeamContextManager
 from agno.models.base import Model
 from agno.models.message import Citations, Message, MessageReferences
+from agno.models.rate_limit import get_retry_delay
 from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
 from agno.reasoning.step import NextAction, ReasoningStep, ReasoningSteps
 from agno.run.base import RunResponseExtraData, RunStatus
+from agno.run.encoder import acoalesce_content_events, coalesce_content_events
 from agno.run.messages import RunMessages
-from agno.run.response import RunEvent, RunResponse, RunResponseEvent
+from agno.run.response import RunEvent, RunResponse, RunResponseContentEvent, RunResponseEvent
+from agno.run.team import RunResponseContentEvent as TeamRunResponseContentEvent
 from agno.run.team import TeamRunEvent, TeamRunResponse, TeamRunResponseEvent, ToolCallCompletedEvent
 from agno.storage.base import Storage
 from agno.storage.session.team import TeamSession
@@ -63,6 +72,7 @@ from agno.utils.events import (
     create_team_tool_call_completed_event,
     create_team_tool_call_started_event,
 )
+from agno.utils.fanout import afan_out, agroup_exclusive_items, fan_out, group_exclusive_items
 from agno.utils.log import (
     log_debug,
     log_error,
@@ -90,6 +100,10 @@ from agno.utils.string import is_valid_uuid, parse_response_model_str, url_safe_
 from agno.utils.timer import Timer
 
 
+def _is_content_event(event: Any) -> bool:
+    return isinstance(event, (RunResponseContentEvent, TeamRunResponseContentEvent))
+
+
 @dataclass(init=False)
 class Team:
     """
@@ -99,6 +113,10 @@ class Team:
     members: List[Union[Agent, "Team"]]
 
     mode: Literal["route", "coordinate", "collaborate"] = "coordinate"
+    # Maximum number of members run at the same time in collaborate mode. None runs all members at once
+    max_concurrent_members: Optional[int] = None
+    # Seconds each member may run for in collaborate mode. Members that time out are left out of the response
+    member_timeout: Optional[float] = None
 
     # Model for this Team
     model: Optional[Model] = None
@@ -196,6 +214,8 @@ class Team:
     enable_agentic_context: bool = False
     # If True, send all previous member interactions to members
     share_member_interactions: bool = False
+    # Sends a window of recent member interactions and a summary of older ones, within a token budget
+    team_context_manager: Optional[TeamContextManager] = None
     # If True, add a tool to get information about the team members
     get_member_information_tool: bool = False
     # Add a tool to search the knowledge base (aka Agentic RAG)
@@ -303,6 +323,8 @@ class Team:
         self,
         members: List[Union[Agent, "Team"]],
         mode: Literal["route", "coordinate", "collaborate"] = "coordinate",
+        max_concurrent_members: Optional[int] = None,
+        member_timeout: Optional[float] = None,
         model: Optional[Model] = None,
         name: Optional[str] = None,
         team_id: Optional[str] = None,
@@ -335,6 +357,7 @@ class Team:
         references_format: Literal["json", "yaml"] = "json",
         enable_agentic_context: bool = False,
         share_member_interactions: bool = False,
+        team_context_manager: Optional[TeamContextManager] = None,
         get_member_information_tool: bool = False,
         search_knowledge: bool = True,
         read_team_history: bool = False,
@@ -379,6 +402,8 @@ class Team:
         self.members = members
 
         self.mode = mode
+        self.max_concurrent_members = max_concurrent_members
+        self.member_timeout = member_timeout
 
         self.model = model
 
@@ -419,6 +444,7 @@ class Team:
 
         self.enable_agentic_context = enable_agentic_context
         self.share_member_interactions = share_member_interactions
+        self.team_context_manager = team_context_manager
         self.get_member_information_tool = get_member_information_tool
         self.search_knowledge = search_knowledge
         self.read_team_history = read_team_history
@@ -487,6 +513,8 @@ class Team:
         self.run_input: Optional[Union[str, List, Dict, BaseModel]] = None
         self.run_messages: Optional[RunMessages] = None
         self.run_response: Optional[TeamRunResponse] = None
+        # Tokens saved by the team_context_manager in the run
+        self._member_context_tokens_saved: int = 0
 
         # Images generated during this session
         self.images: Optional[List[ImageArtifact]] = None
@@ -872,6 +900,7 @@ class Team:
 
         self.run_response = run_response
         self.run_id = run_id
+        self._member_context_tokens_saved = 0
 
         retries = retries or 3
 
@@ -946,13 +975,11 @@ class Team:
                     )
 
             except ModelProviderError as e:
-                import time
-
                 log_warning(f"Attempt {attempt + 1}/{num_attempts} failed: {str(e)}")
 
                 last_exception = e
                 if attempt < num_attempts - 1:
-                    time.sleep(2**attempt)
+                    time.sleep(get_retry_delay(attempt, exponential_backoff=True, exc=e))
             except (KeyboardInterrupt, RunCancelledException):
                 if stream:
                     return generator_wrapper(
@@ -1267,6 +1294,7 @@ class Team:
 
         self.run_response = run_response
         self.run_id = run_id
+        self._member_context_tokens_saved = 0
 
         retries = retries or 3
 
@@ -1339,7 +1367,7 @@ class Team:
                 log_warning(f"Attempt {attempt + 1}/{num_attempts} failed: {str(e)}")
                 last_exception = e
                 if attempt < num_attempts - 1:
-                    await asyncio.sleep(2**attempt)
+                    await asyncio.sleep(get_retry_delay(attempt, exponential_backoff=True, exc=e))
             except (KeyboardInterrupt, RunCancelledException):
                 if stream:
                     return async_generator_wrapper(
@@ -2420,6 +2448,7 @@ class Team:
         files: Optional[Sequence[File]] = None,
         markdown: Optional[bool] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
+        stream_coalesce_ms: Optional[int] = None,
         **kwargs: Any,
     ) -> None:
         if not tags_to_include_in_markdown:
@@ -2448,6 +2477,7 @@ class Team:
                 markdown=markdown,
                 stream_intermediate_steps=stream_intermediate_steps,
                 knowledge_filters=knowledge_filters,
+                stream_coalesce_ms=stream_coalesce_ms,
                 **kwargs,
             )
         else:
@@ -2772,6 +2802,7 @@ class Team:
         markdown: bool = False,
         stream_intermediate_steps: bool = False,  # type: ignore
         knowledge_filters: Optional[Dict[str, Any]] = None,
+        stream_coalesce_ms: Optional[int] = None,
         **kwargs: Any,
     ) -> None:
         import textwrap
@@ -2840,6 +2871,10 @@ class Team:
                 **kwargs,
             )
 
+            if stream_coalesce_ms:
+                # Merge content tokens to limit the number of re-renders
+                stream_resp = coalesce_content_events(stream_resp, stream_coalesce_ms)
+
             team_markdown = None
             member_markdown = {}
 
@@ -3291,6 +3326,7 @@ class Team:
         files: Optional[Sequence[File]] = None,
         markdown: Optional[bool] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
+        stream_coalesce_ms: Optional[int] = None,
         **kwargs: Any,
     ) -> None:
         if not tags_to_include_in_markdown:
@@ -3319,6 +3355,7 @@ class Team:
                 markdown=markdown,
                 stream_intermediate_steps=stream_intermediate_steps,
                 knowledge_filters=knowledge_filters,
+                stream_coalesce_ms=stream_coalesce_ms,
                 **kwargs,
             )
         else:
@@ -3640,6 +3677,7 @@ class Team:
         files: Optional[Sequence[File]] = None,
         markdown: bool = False,
         stream_intermediate_steps: bool = False,  # type: ignore
+        stream_coalesce_ms: Optional[int] = None,
         **kwargs: Any,
     ) -> None:
         import textwrap
@@ -3709,6 +3747,10 @@ class Team:
                 user_id=user_id,
                 **kwargs,
             )
+            if stream_coalesce_ms:
+                # Merge content tokens to limit the number of re-renders
+                stream_resp = acoalesce_content_events(stream_resp, stream_coalesce_ms)
+
             team_markdown = None
             member_markdown = {}
 
@@ -4238,6 +4280,8 @@ class Team:
                         continue
                     if v is not None:
                         aggregated_metrics[k].append(v)
+        if self._member_context_tokens_saved:
+            aggregated_metrics["member_context_tokens_saved"] = self._member_context_tokens_saved
         if aggregated_metrics is not None:
             aggregated_metrics = dict(aggregated_metrics)
         return aggregated_metrics
@@ -5893,35 +5937,20 @@ class Team:
                 session_id, images, videos, audio
             )
 
-            # 3. Run members
-            for member_agent_index, member_agent in enumerate(self.members):
+            # 3. Run members in parallel threads
+            member_tasks: List[Callable[[], Iterable[Any]]] = []
+            for member_agent in self.members:
                 self._initialize_member(member_agent, session_id=session_id)
 
                 # Don't override the expected output of a member agent
-                if member_agent.expected_output is not None:
-                    expected_output = None
-
                 member_agent_task = self._format_member_agent_task(
-                    task_description, expected_output, team_context_str, team_member_interactions_str
+                    task_description,
+                    expected_output if member_agent.expected_output is None else None,
+                    team_context_str,
+                    team_member_interactions_str,
                 )
 
-                if stream:
-                    member_agent_run_response_stream = member_agent.run(
-                        member_agent_task,
-                        user_id=user_id,
-                        # All members have the same session_id
-                        session_id=session_id,
-                        images=images,
-                        videos=videos,
-                        audio=audio,
-                        files=files,
-                        stream=True,
-                        stream_intermediate_steps=stream_intermediate_steps,
-                    )
-                    for member_agent_run_response_chunk in member_agent_run_response_stream:
-                        check_if_run_cancelled(member_agent_run_response_chunk)
-                        yield member_agent_run_response_chunk
-                else:
+                def run_member_agent(member_agent=member_agent, member_agent_task=member_agent_task) -> Iterable[Any]:
                     member_agent_run_response = member_agent.run(
                         member_agent_task,
                         user_id=user_id,
@@ -5931,68 +5960,48 @@ class Team:
                         videos=videos,
                         audio=audio,
                         files=files,
-                        stream=False,
-                    )
-
-                    check_if_run_cancelled(member_agent_run_response)
-
-                    try:
-                        if member_agent_run_response.content is None and (
-                            member_agent_run_response.tools is None or len(member_agent_run_response.tools) == 0
-                        ):
-                            yield f"Agent {member_agent.name}: No response from the member agent."
-                        elif isinstance(member_agent_run_response.content, str):
-                            if len(member_agent_run_response.content.strip()) > 0:
-                                yield f"Agent {member_agent.name}: {member_agent_run_response.content}"
-                            elif (
-                                member_agent_run_response.tools is not None and len(member_agent_run_response.tools) > 0
-                            ):
-                                yield f"Agent {member_agent.name}: {','.join([tool.result for tool in member_agent_run_response.tools])}"  # type: ignore
-                        elif issubclass(type(member_agent_run_response.content), BaseModel):
-                            yield f"Agent {member_agent.name}: {member_agent_run_response.content.model_dump_json(indent=2)}"  # type: ignore
-                        else:
-                            import json
-
-                            yield f"Agent {member_agent.name}: {json.dumps(member_agent_run_response.content, indent=2)}"
-                    except Exception as e:
-                        yield f"Agent {member_agent.name}: Error - {str(e)}"
-
-                # Update the memory
-                member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
-                if isinstance(self.memory, TeamMemory):
-                    self.memory = cast(TeamMemory, self.memory)
-                    self.memory.add_interaction_to_team_context(
-                        member_name=member_name,
-                        task=task_description,
-                        run_response=member_agent.run_response,  # type: ignore
-                    )
-                else:
-                    self.memory = cast(Memory, self.memory)
-                    self.memory.add_interaction_to_team_context(
-                        session_id=session_id,
-                        member_name=member_name,
-                        task=task_description,
-                        run_response=member_agent.run_response,  # type: ignore
+                        stream=stream,
+                        stream_intermediate_steps=stream_intermediate_steps if stream else False,
+                        refresh_session_before_write=True,
                     )
+                    return member_agent_run_response if stream else [member_agent_run_response]
 
-                # Add the member run to the team run response
-                self.run_response = cast(TeamRunResponse, self.run_response)
-                self.run_response.add_member_run(member_agent.run_response)  # type: ignore
+                member_tasks.append(run_member_agent)
 
-                # Update team session state
-                self._update_team_session_state(member_agent)
+            member_events = fan_out(member_tasks, max_workers=self.max_concurrent_members, timeout=self.member_timeout)
+            if stream:
+                # Stream the content of one member at a time, the other members keep running meanwhile
+                member_events = group_exclusive_items(member_events, exclusive=_is_content_event)
+
+            member_responses: Dict[int, Any] = {}
+            for member_event in member_events:
+                member_agent = self.members[member_event.index]
+                if not member_event.done:
+                    check_if_run_cancelled(member_event.item)
+                    if stream:
+                        yield member_event.item
+                    else:
+                        member_responses[member_event.index] = member_event.item
+                    continue
 
-                self._update_workflow_session_state(member_agent)
+                member_name = member_agent.name if member_agent.name else f"agent_{member_event.index}"
+                if member_event.error is not None:
+                    if isinstance(member_event.error, RunCancelledException):
+                        raise member_event.error
+                    log_warning(f"Member {member_name} failed: {member_event.error}")
+                    yield f"Agent {member_name}: Error - {str(member_event.error)}"
+                    continue
 
-                # Update the team media
-                self._update_team_media(member_agent.run_response)  # type: ignore
+                self._add_member_run_to_team(member_agent, member_name, task_description, session_id)
+                if not stream:
+                    yield self._get_member_response_str(member_name, member_responses.get(member_event.index))
 
             # Afterward, switch back to the team logger
             use_team_logger()
 
         async def arun_member_agents(
             task_description: str, expected_output: Optional[str] = None
-        ) -> AsyncIterator[str]:
+        ) -> AsyncIterator[Union[RunResponseEvent, TeamRunResponseEvent, str]]:
             """
             Send the same task to all the member agents and return the responses.
 
@@ -6012,24 +6021,23 @@ class Team:
                 session_id, images, videos, audio
             )
 
-            # Create tasks for all member agents
-            tasks = []
-            for member_agent_index, member_agent in enumerate(self.members):
-                # We cannot stream responses with async gather
-                current_agent = member_agent  # Create a reference to the current agent
-                current_index = member_agent_index  # Create a reference to the current index
-                self._initialize_member(current_agent, session_id=session_id)
+            # 3. Run members concurrently
+            member_tasks: List[Callable[[], AsyncIterable[Any]]] = []
+            for member_agent in self.members:
+                self._initialize_member(member_agent, session_id=session_id)
 
                 # Don't override the expected output of a member agent
-                if current_agent.expected_output is not None:
-                    expected_output = None
-
                 member_agent_task = self._format_member_agent_task(
-                    task_description, expected_output, team_context_str, team_member_interactions_str
+                    task_description,
+                    expected_output if member_agent.expected_output is None else None,
+                    team_context_str,
+                    team_member_interactions_str,
                 )
 
-                async def run_member_agent(agent=current_agent, idx=current_index) -> str:
-                    response = await agent.arun(
+                async def arun_member_agent(
+                    member_agent=member_agent, member_agent_task=member_agent_task
+                ) -> AsyncIterator[Any]:
+                    member_agent_run_response = await member_agent.arun(
                         member_agent_task,
                         user_id=user_id,
                         # All members have the same session_id
@@ -6038,66 +6046,47 @@ class Team:
                         videos=videos,
                         audio=audio,
                         files=files,
-                        stream=False,
+                        stream=stream,
+                        stream_intermediate_steps=stream_intermediate_steps if stream else False,
                         refresh_session_before_write=True,
                     )
-                    check_if_run_cancelled(response)
-
-                    member_name = agent.name if agent.name else f"agent_{idx}"
-                    self.memory = cast(TeamMemory, self.memory)
-                    if isinstance(self.memory, TeamMemory):
-                        self.memory = cast(TeamMemory, self.memory)
-                        self.memory.add_interaction_to_team_context(
-                            member_name=member_name, task=task_description, run_response=agent.run_response
-                        )
+                    if stream:
+                        async for member_agent_run_response_event in member_agent_run_response:
+                            yield member_agent_run_response_event
                     else:
-                        self.memory = cast(Memory, self.memory)
-                        self.memory.add_interaction_to_team_context(
-                            session_id=session_id,
-                            member_name=member_name,
-                            task=task_description,
-                            run_response=agent.run_response,
-                        )
-
-                    # Add the member run to the team run response
-                    self.run_response = cast(TeamRunResponse, self.run_response)
-                    self.run_response.add_member_run(agent.run_response)
-
-                    # Update team session state
-                    self._update_team_session_state(current_agent)
-
-                    self._update_workflow_session_state(current_agent)
+                        yield member_agent_run_response
 
-                    # Update the team media
-                    self._update_team_media(agent.run_response)
+                member_tasks.append(arun_member_agent)
 
-                    try:
-                        if response.content is None and (response.tools is None or len(response.tools) == 0):
-                            return f"Agent {member_name}: No response from the member agent."
-                        elif isinstance(response.content, str):
-                            if len(response.content.strip()) > 0:
-                                return f"Agent {member_name}: {response.content}"
-                            elif response.tools is not None and len(response.tools) > 0:
-                                return (
-                                    f"Agent {member_name}: {','.join([tool.get('content') for tool in response.tools])}"
-                                )
-                        elif issubclass(type(response.content), BaseModel):
-                            return f"Agent {member_name}: {response.content.model_dump_json(indent=2)}"  # type: ignore
-                        else:
-                            import json
-
-                            return f"Agent {member_name}: {json.dumps(response.content, indent=2)}"
-                    except Exception as e:
-                        return f"Agent {member_name}: Error - {str(e)}"
-
-                    return f"Agent {member_name}: No Response"
+            member_events = afan_out(
+                member_tasks, max_concurrency=self.max_concurrent_members, timeout=self.member_timeout
+            )
+            if stream:
+                # Stream the content of one member at a time, the other members keep running meanwhile
+                member_events = agroup_exclusive_items(member_events, exclusive=_is_content_event)
+
+            member_responses: Dict[int, Any] = {}
+            async for member_event in member_events:
+                member_agent = self.members[member_event.index]
+                if not member_event.done:
+                    check_if_run_cancelled(member_event.item)
+                    if stream:
+                        yield member_event.item
+                    else:
+                        member_responses[member_event.index] = member_event.item
+                    continue
 
-                tasks.append(run_member_agent)
+                member_name = member_agent.name if member_agent.name else f"agent_{member_event.index}"
+                if member_event.error is not None:
+                    if isinstance(member_event.error, RunCancelledException):
+                        raise member_event.error
+                    log_warning(f"Member {member_name} failed: {member_event.error}")
+                    yield f"Agent {member_name}: Error - {str(member_event.error)}"
+                    continue
 
-            # Need to collect and process yielded values from each task
-            results = await asyncio.gather(*[task() for task in tasks])
-            for result in results:
-                yield result
+                self._add_member_run_to_team(member_agent, member_name, task_description, session_id)
+                if not stream:
+                    yield self._get_member_response_str(member_name, member_responses.get(member_event.index))
 
             # Afterward, switch back to the team logger
             use_team_logger()
@@ -6113,6 +6102,64 @@ class Team:
 
         return run_member_agents_func
 
+    def _add_member_run_to_team(
+        self, member_agent: Union[Agent, "Team"], member_name: str, task_description: str, session_id: str
+    ) -> None:
+        """Add the run of a member to the team memory, run response, session state and media."""
+        if isinstance(self.memory, TeamMemory):
+            self.memory = cast(TeamMemory, self.memory)
+            self.memory.add_interaction_to_team_context(
+                member_name=member_name,
+                task=task_description,
+                run_response=member_agent.run_response,  # type: ignore
+            )
+        else:
+            self.memory = cast(Memory, self.memory)
+            self.memory.add_interaction_to_team_context(
+                session_id=session_id,
+                member_name=member_name,
+                task=task_description,
+                run_response=member_agent.run_response,  # type: ignore
+            )
+
+        # Add the member run to the team run response
+        self.run_response = cast(TeamRunResponse, self.run_response)
+        self.run_response.add_member_run(member_agent.run_response)  # type: ignore
+
+        # Update team session state
+        self._update_team_session_state(member_agent)
+
+        self._update_workflow_session_state(member_agent)
+
+        # Update the team media
+        self._update_team_media(member_agent.run_response)  # type: ignore
+
+    def _get_member_response_str(
+        self, member_name: str, member_run_response: Optional[Union[RunResponse, TeamRunResponse]]
+    ) -> str:
+        """Format the response of a member for the team model."""
+        try:
+            if member_run_response is None or (
+                member_run_response.content is None
+                and (member_run_response.tools is None or len(member_run_response.tools) == 0)
+            ):
+                return f"Agent {member_name}: No response from the member agent."
+            elif isinstance(member_run_response.content, str):
+                if len(member_run_response.content.strip()) > 0:
+                    return f"Agent {member_name}: {member_run_response.content}"
+                elif member_run_response.tools is not None and len(member_run_response.tools) > 0:
+                    return f"Agent {member_name}: {','.join([str(tool.result) for tool in member_run_response.tools])}"
+            elif issubclass(type(member_run_response.content), BaseModel):
+                return f"Agent {member_name}: {member_run_response.content.model_dump_json(indent=2)}"  # type: ignore
+            else:
+                import json
+
+                return f"Agent {member_name}: {json.dumps(member_run_response.content, indent=2)}"
+        except Exception as e:
+            return f"Agent {member_name}: Error - {str(e)}"
+
+        return f"Agent {member_name}: No Response"
+
     def _determine_team_context(
         self, session_id: str, images: List[Image], videos: List[Video], audio: List[Audio]
     ) -> Tuple[Optional[str], Optional[str]]:
@@ -6121,10 +6168,17 @@ class Team:
             team_context_str = None
             if self.enable_agentic_context:
                 team_context_str = self.memory.get_team_context_str()
+                if self.team_context_manager is not None:
+                    team_context_str = self._get_managed_team_context_str(team_context_str)
 
             team_member_interactions_str = None
             if self.share_member_interactions:
-                team_member_interactions_str = self.memory.get_team_member_interactions_str()
+                if self.team_context_manager is not None:
+                    team_member_interactions_str = self._get_managed_member_interactions_str(
+                        session_id, self.memory.team_context.member_interactions if self.memory.team_context else []
+                    )
+                else:
+                    team_member_interactions_str = self.memory.get_team_member_interactions_str()
                 if context_images := self.memory.get_team_context_images():
                     images.extend([Image.from_artifact(img) for img in context_images])
                 if context_videos := self.memory.get_team_context_videos():
@@ -6136,10 +6190,18 @@ class Team:
             team_context_str = None
             if self.enable_agentic_context:
                 team_context_str = self.memory.get_team_context_str(session_id=session_id)  # type: ignore
+                if self.team_context_manager is not None:
+                    team_context_str = self._get_managed_team_context_str(team_context_str)
 
             team_member_interactions_str = None
             if self.share_member_interactions:
-                team_member_interactions_str = self.memory.get_team_member_interactions_str(session_id=session_id)  # type: ignore
+                if self.team_context_manager is not None:
+                    session_team_context = (self.memory.team_context or {}).get(session_id)
+                    team_member_interactions_str = self._get_managed_member_interactions_str(
+                        session_id, session_team_context.member_interactions if session_team_context else []
+                    )
+                else:
+                    team_member_interactions_str = self.memory.get_team_member_interactions_str(session_id=session_id)  # type: ignore
                 if context_images := self.memory.get_team_context_images(session_id=session_id):  # type: ignore
                     images.extend([Image.from_artifact(img) for img in context_images])
                 if context_videos := self.memory.get_team_context_videos(session_id=session_id):  # type: ignore
@@ -6148,6 +6210,20 @@ class Team:
                     audio.extend([Audio.from_artifact(aud) for aud in context_audio])
         return team_context_str, team_member_interactions_str
 
+    def _get_managed_member_interactions_str(self, session_id: str, member_interactions: List[Any]) -> str:
+        """Get the member interactions from the team_context_manager and record the tokens it saved."""
+        team_member_interactions_str, tokens_saved = self.team_context_manager.get_member_interactions_str(  # type: ignore
+            session_id, member_interactions
+        )
+        self._member_context_tokens_saved += tokens_saved
+        return team_member_interactions_str
+
+    def _get_managed_team_context_str(self, team_context_str: str) -> str:
+        """Get the team context compacted by the team_context_manager and record the tokens it saved."""
+        team_context_str, tokens_saved = self.team_context_manager.get_team_context_str(team_context_str)  # type: ignore
+        self._member_context_tokens_saved += tokens_saved
+        return team_context_str
+
     def get_transfer_task_function(
         self,
         session_id: str,
@@ -6170,6 +6246,41 @@ class Team:
         if not files:
             files = []
 
+        # Transfers of the same model response run at the same time
+        member_locks: Dict[int, Lock] = {}
+        member_locks_lock = Lock()
+        team_update_lock = Lock()
+        amember_locks: Dict[int, asyncio.Lock] = {}
+
+        def get_member_lock(member_agent: Union[Agent, "Team"]) -> Lock:
+            with member_locks_lock:
+                return member_locks.setdefault(id(member_agent), Lock())
+
+        # The logger is shared, so transfers running at the same time only switch back to the team logger when the
+        # last of them ends
+        active_transfers = 0
+
+        @contextmanager
+        def use_member_logger() -> Iterator[None]:
+            nonlocal active_transfers
+            with member_locks_lock:
+                active_transfers += 1
+                # Make sure for the member agent, we are using the agent logger
+                use_agent_logger()
+            try:
+                yield
+            finally:
+                with member_locks_lock:
+                    active_transfers -= 1
+                    if active_transfers == 0:
+                        # Afterward, switch back to the team logger
+                        use_team_logger()
+
+        @asynccontextmanager
+        async def ause_member_logger() -> AsyncIterator[None]:
+            with use_member_logger():
+                yield
+
         def transfer_task_to_member(
             member_id: str, task_description: str, expected_output: Optional[str] = None
         ) -> Iterator[Union[RunResponseEvent, TeamRunResponseEvent, str]]:
@@ -6190,127 +6301,99 @@ class Team:
                 return
 
             member_agent_index, member_agent = result
-            self._initialize_member(member_agent, session_id=session_id)
-
-            # 2. Determine team context to send
-            team_context_str, team_member_interactions_str = self._determine_team_context(
-                session_id, images, videos, audio
-            )
-
-            # 3. Create the member agent task
-            # Don't override the expected output of a member agent
-            if member_agent.expected_output is not None:
-                expected_output = None
-            member_agent_task = self._format_member_agent_task(
-                task_description, expected_output, team_context_str, team_member_interactions_str
-            )
-
-            # Make sure for the member agent, we are using the agent logger
-            use_agent_logger()
-
-            # Handle enable_agentic_knowledge_filters on the member agent
-            if self.enable_agentic_knowledge_filters and not member_agent.enable_agentic_knowledge_filters:
-                member_agent.enable_agentic_knowledge_filters = self.enable_agentic_knowledge_filters
+            # Transfers to the same member wait for each other
+            with get_member_lock(member_agent), use_member_logger():
+                self._initialize_member(member_agent, session_id=session_id)
 
-            if stream:
-                member_agent_run_response_stream = member_agent.run(
-                    member_agent_task,
-                    user_id=user_id,
-                    # All members have the same session_id
-                    session_id=session_id,
-                    images=images,
-                    videos=videos,
-                    audio=audio,
-                    files=files,
-                    stream=True,
-                    stream_intermediate_steps=stream_intermediate_steps,
-                    knowledge_filters=knowledge_filters
-                    if not member_agent.knowledge_filters and member_agent.knowledge
-                    else None,
+                # 2. Determine team context to send
+                team_context_str, team_member_interactions_str = self._determine_team_context(
+                    session_id, images, videos, audio
                 )
-                for member_agent_run_response_event in member_agent_run_response_stream:
-                    check_if_run_cancelled(member_agent_run_response_event)
 
-                    # Yield the member event directly
-                    yield member_agent_run_response_event
-            else:
-                member_agent_run_response = member_agent.run(
-                    member_agent_task,
-                    user_id=user_id,
-                    # All members have the same session_id
-                    session_id=session_id,
-                    images=images,
-                    videos=videos,
-                    audio=audio,
-                    files=files,
-                    stream=False,
-                    knowledge_filters=knowledge_filters
-                    if not member_agent.knowledge_filters and member_agent.knowledge
-                    else None,
+                # 3. Create the member agent task
+                # Don't override the expected output of a member agent
+                if member_agent.expected_output is not None:
+                    expected_output = None
+                member_agent_task = self._format_member_agent_task(
+                    task_description, expected_output, team_context_str, team_member_interactions_str
                 )
 
-                check_if_run_cancelled(member_agent_run_response)
-
-                try:
-                    if member_agent_run_response.content is None and (
-                        member_agent_run_response.tools is None or len(member_agent_run_response.tools) == 0
-                    ):
-                        yield "No response from the member agent."
-                    elif isinstance(member_agent_run_response.content, str):
-                        content = member_agent_run_response.content.strip()
-                        if len(content) > 0:
-                            yield content
-
-                        # If the content is empty but we have tool calls
-                        elif member_agent_run_response.tools is not None and len(member_agent_run_response.tools) > 0:
-                            tool_str = ""
-                            for tool in member_agent_run_response.tools:
-                                if tool.result:
-                                    tool_str += f"{tool.result},"
-                            yield tool_str.rstrip(",")
-
-                    elif issubclass(type(member_agent_run_response.content), BaseModel):
-                        yield member_agent_run_response.content.model_dump_json(indent=2)  # type: ignore
-                    else:
-                        import json
+                # Handle enable_agentic_knowledge_filters on the member agent
+                if self.enable_agentic_knowledge_filters and not member_agent.enable_agentic_knowledge_filters:
+                    member_agent.enable_agentic_knowledge_filters = self.enable_agentic_knowledge_filters
 
-                        yield json.dumps(member_agent_run_response.content, indent=2)
-                except Exception as e:
-                    yield str(e)
+                if stream:
+                    member_agent_run_response_stream = member_agent.run(
+                        member_agent_task,
+                        user_id=user_id,
+                        # All members have the same session_id
+                        session_id=session_id,
+                        images=images,
+                        videos=videos,
+                        audio=audio,
+                        files=files,
+                        stream=True,
+                        stream_intermediate_steps=stream_intermediate_steps,
+                        knowledge_filters=knowledge_filters
+                        if not member_agent.knowledge_filters and member_agent.knowledge
+                        else None,
+                    )
+                    for member_agent_run_response_event in member_agent_run_response_stream:
+                        check_if_run_cancelled(member_agent_run_response_event)
 
-            # Afterward, switch back to the team logger
-            use_team_logger()
+                        # Yield the member event directly
+                        yield member_agent_run_response_event
+                else:
+                    member_agent_run_response = member_agent.run(
+                        member_agent_task,
+                        user_id=user_id,
+                        # All members have the same session_id
+                        session_id=session_id,
+                        images=images,
+                        videos=videos,
+                        audio=audio,
+                        files=files,
+                        stream=False,
+                        knowledge_filters=knowledge_filters
+                        if not member_agent.knowledge_filters and member_agent.knowledge
+                        else None,
+                    )
 
-            # Update the memory
-            member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
+                    check_if_run_cancelled(member_agent_run_response)
 
-            if isinstance(self.memory, TeamMemory):
-                self.memory = cast(TeamMemory, self.memory)
-                self.memory.add_interaction_to_team_context(
-                    member_name=member_name,
-                    task=task_description,
-                    run_response=member_agent.run_response,  # type: ignore
-                )
-            else:
-                self.memory = cast(Memory, self.memory)
-                self.memory.add_interaction_to_team_context(
-                    session_id=session_id,
-                    member_name=member_name,
-                    task=task_description,
-                    run_response=member_agent.run_response,  # type: ignore
-                )
+                    try:
+                        if member_agent_run_response.content is None and (
+                            member_agent_run_response.tools is None or len(member_agent_run_response.tools) == 0
+                        ):
+                            yield "No response from the member agent."
+                        elif isinstance(member_agent_run_response.content, str):
+                            content = member_agent_run_response.content.strip()
+                            if len(content) > 0:
+                                yield content
 
-            # Add the member run to the team run response
-            self.run_response = cast(TeamRunResponse, self.run_response)
-            self.run_response.add_member_run(member_agent.run_response)  # type: ignore
+                            # If the content is empty but we have tool calls
+                            elif (
+                                member_agent_run_response.tools is not None and len(member_agent_run_response.tools) > 0
+                            ):
+                                tool_str = ""
+                                for tool in member_agent_run_response.tools:
+                                    if tool.result:
+                                        tool_str += f"{tool.result},"
+                                yield tool_str.rstrip(",")
 
-            # Update team session state
-            self._update_team_session_state(member_agent)
+                        elif issubclass(type(member_agent_run_response.content), BaseModel):
+                            yield member_agent_run_response.content.model_dump_json(indent=2)  # type: ignore
+                        else:
+                            import json
 
-            self._update_workflow_session_state(member_agent)
+                            yield json.dumps(member_agent_run_response.content, indent=2)
+                    except Exception as e:
+                        yield str(e)
 
-            # Update the team media
-            self._update_team_media(member_agent.run_response)  # type: ignore
+                # Add the member run to the team
+                member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
+                with team_update_lock:
+                    self._add_member_run_to_team(member_agent, member_name, task_description, session_id)
 
         async def atransfer_task_to_member(
             member_id: str, task_description: str, expected_output: Optional[str] = None
@@ -6333,119 +6416,91 @@ class Team:
                 return
 
             member_agent_index, member_agent = result
-            self._initialize_member(member_agent, session_id=session_id)
-
-            # 2. Determine team context to send
-            team_context_str, team_member_interactions_str = self._determine_team_context(
-                session_id, images, videos, audio
-            )
-
-            # 3. Create the member agent task
-            # Don't override the expected output of a member agent
-            if member_agent.expected_output is not None:
-                expected_output = None
-            member_agent_task = self._format_member_agent_task(
-                task_description, expected_output, team_context_str, team_member_interactions_str
-            )
-
-            # Make sure for the member agent, we are using the agent logger
-            use_agent_logger()
-
-            # Handle enable_agentic_knowledge_filters
-            if self.enable_agentic_knowledge_filters and not member_agent.enable_agentic_knowledge_filters:
-                member_agent.enable_agentic_knowledge_filters = self.enable_agentic_knowledge_filters
+            # Transfers to the same member wait for each other
+            async with amember_locks.setdefault(id(member_agent), asyncio.Lock()), ause_member_logger():
+                self._initialize_member(member_agent, session_id=session_id)
 
-            if stream:
-                member_agent_run_response_stream = await member_agent.arun(
-                    member_agent_task,
-                    user_id=user_id,
-                    # All members have the same session_id
-                    session_id=session_id,
-                    images=images,
-                    videos=videos,
-                    audio=audio,
-                    files=files,
-                    stream=True,
-                    stream_intermediate_steps=stream_intermediate_steps,
-                    knowledge_filters=knowledge_filters
-                    if not member_agent.knowledge_filters and member_agent.knowledge
-                    else None,
-                    refresh_session_before_write=True,
+                # 2. Determine team context to send
+                team_context_str, team_member_interactions_str = self._determine_team_context(
+                    session_id, images, videos, audio
                 )
-                async for member_agent_run_response_event in member_agent_run_response_stream:
-                    check_if_run_cancelled(member_agent_run_response_event)
-                    yield member_agent_run_response_event
-            else:
-                member_agent_run_response = await member_agent.arun(
-                    member_agent_task,
-                    user_id=user_id,
-                    # All members have the same session_id
-                    session_id=session_id,
-                    images=images,
-                    videos=videos,
-                    audio=audio,
-                    files=files,
-                    stream=False,
-                    knowledge_filters=knowledge_filters
-                    if not member_agent.knowledge_filters and member_agent.knowledge
-                    else None,
-                    refresh_session_before_write=True,
-                )
-                check_if_run_cancelled(member_agent_run_response)
-
-                try:
-                    if member_agent_run_response.content is None and (
-                        member_agent_run_response.tools is None or len(member_agent_run_response.tools) == 0
-                    ):
-                        yield "No response from the member agent."
-                    elif isinstance(member_agent_run_response.content, str):
-                        if len(member_agent_run_response.content.strip()) > 0:
-                            yield member_agent_run_response.content
-
-                        # If the content is empty but we have tool calls
-                        elif member_agent_run_response.tools is not None and len(member_agent_run_response.tools) > 0:
-                            yield ",".join([tool.result for tool in member_agent_run_response.tools if tool.result])  # type: ignore
-                    elif issubclass(type(member_agent_run_response.content), BaseModel):
-                        yield member_agent_run_response.content.model_dump_json(indent=2)  # type: ignore
-                    else:
-                        import json
 
-                        yield json.dumps(member_agent_run_response.content, indent=2)
-                except Exception as e:
-                    yield str(e)
+                # 3. Create the member agent task
+                # Don't override the expected output of a member agent
+                if member_agent.expected_output is not None:
+                    expected_output = None
+                member_agent_task = self._format_member_agent_task(
+                    task_description, expected_output, team_context_str, team_member_interactions_str
+                )
 
-            # Afterward, switch back to the team logger
-            use_team_logger()
+                # Handle enable_agentic_knowledge_filters
+                if self.enable_agentic_knowledge_filters and not member_agent.enable_agentic_knowledge_filters:
+                    member_agent.enable_agentic_knowledge_filters = self.enable_agentic_knowledge_filters
 
-            # Update the memory
-            member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
-            if isinstance(self.memory, TeamMemory):
-                self.memory = cast(TeamMemory, self.memory)
-                self.memory.add_interaction_to_team_context(
-                    member_name=member_name,
-                    task=task_description,
-                    run_response=member_agent.run_response,  # type: ignore
-                )
-            else:
-                self.memory = cast(Memory, self.memory)
-                self.memory.add_interaction_to_team_context(
-                    session_id=session_id,
-                    member_name=member_name,
-                    task=task_description,
-                    run_response=member_agent.run_response,  # type: ignore
-                )
+                if stream:
+                    member_agent_run_response_stream = await member_agent.arun(
+                        member_agent_task,
+                        user_id=user_id,
+                        # All members have the same session_id
+                        session_id=session_id,
+                        images=images,
+                        videos=videos,
+                        audio=audio,
+                        files=files,
+                        stream=True,
+                        stream_intermediate_steps=stream_intermediate_steps,
+                        knowledge_filters=knowledge_filters
+                        if not member_agent.knowledge_filters and member_agent.knowledge
+                        else None,
+                        refresh_session_before_write=True,
+                    )
+                    async for member_agent_run_response_event in member_agent_run_response_stream:
+                        check_if_run_cancelled(member_agent_run_response_event)
+                        yield member_agent_run_response_event
+                else:
+                    member_agent_run_response = await member_agent.arun(
+                        member_agent_task,
+                        user_id=user_id,
+                        # All members have the same session_id
+                        session_id=session_id,
+                        images=images,
+                        videos=videos,
+                        audio=audio,
+                        files=files,
+                        stream=False,
+                        knowledge_filters=knowledge_filters
+                        if not member_agent.knowledge_filters and member_agent.knowledge
+                        else None,
+                        refresh_session_before_write=True,
+                    )
+                    check_if_run_cancelled(member_agent_run_response)
 
-            # Add the member run to the team run response
-            self.run_response = cast(TeamRunResponse, self.run_response)
-            self.run_response.add_member_run(member_agent.run_response)  # type: ignore
+                    try:
+                        if member_agent_run_response.content is None and (
+                            member_agent_run_response.tools is None or len(member_agent_run_response.tools) == 0
+                        ):
+                            yield "No response from the member agent."
+                        elif isinstance(member_agent_run_response.content, str):
+                            if len(member_agent_run_response.content.strip()) > 0:
+                                yield member_agent_run_response.content
 
-            # Update team session state
-            self._update_team_session_state(member_agent)
+                            # If the content is empty but we have tool calls
+                            elif (
+                                member_agent_run_response.tools is not None and len(member_agent_run_response.tools) > 0
+                            ):
+                                yield ",".join([tool.result for tool in member_agent_run_response.tools if tool.result])  # type: ignore
+                        elif issubclass(type(member_agent_run_response.content), BaseModel):
+                            yield member_agent_run_response.content.model_dump_json(indent=2)  # type: ignore
+                        else:
+                            import json
 
-            self._update_workflow_session_state(member_agent)
+                            yield json.dumps(member_agent_run_response.content, indent=2)
+                    except Exception as e:
+                        yield str(e)
 
-            # Update the team media
-            self._update_team_media(member_agent.run_response)  # type: ignore
+                # Add the member run to the team
+                member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
+                self._add_member_run_to_team(member_agent, member_name, task_description, session_id)
 
         if async_mode:
             transfer_function = atransfer_task_to_member  # type: ignore
@@ -6453,6 +6508,8 @@ class Team:
             transfer_function = transfer_task_to_member  # type: ignore
 
         transfer_func = Function.from_callable(transfer_function, name="transfer_task_to_member", strict=True)
+        # Members run at the same time when the model transfers several tasks at once
+        transfer_func.parallel = True
 
         return transfer_func
 
@@ -1,6 +1,11 @@
-from dataclasses import dataclass
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import dataclass, field, replace
 from functools import partial
-from typing import Any, Callable, Dict, List, Literal, Optional, Type, TypeVar, get_type_hints
+from inspect import getdoc, ismethod, signature, unwrap
+from threading import Lock
+from types import FunctionType, MethodType
+from typing import Any, Callable, Dict, Hashable, List, Literal, Optional, Tuple, Type, TypeVar, get_type_hints
 
 from docstring_parser import parse
 from pydantic import BaseModel, Field, validate_call
@@ -58,6 +63,247 @@ class UserInputField:
         )
 
 
+@dataclass
+class ToolSchema:
+    """The compiled schema of a tool entrypoint. Cached and shared by all Functions with the same entrypoint."""
+
+    parameters: Dict[str, Any]
+    description: str
+    # Parameters without a default value
+    required: List[str] = field(default_factory=list)
+    # Parameters that are not sent to the model
+    excluded_params: List[str] = field(default_factory=list)
+    user_input_schema: Optional[List[UserInputField]] = None
+
+
+class _LRUCache:
+    """A small thread-safe LRU cache."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# Compiled tool schemas, keyed by the entrypoint's qualified name, signature, docstring and schema options
+_tool_schema_cache = _LRUCache(maxsize=2048)
+# Entrypoints wrapped with pydantic's validate_call, keyed by the original function
+_validated_callable_cache = _LRUCache(maxsize=2048)
+
+
+def clear_tool_schema_cache() -> None:
+    """Clear the compiled tool schemas and argument validators shared by all Functions."""
+    _tool_schema_cache.clear()
+    _validated_callable_cache.clear()
+
+
+def _get_tool_schema_cache_key(entrypoint: Callable, *options: Hashable) -> Optional[Tuple]:
+    """Return the schema cache key for an entrypoint, or None if the entrypoint can not be cached."""
+    if isinstance(entrypoint, partial):
+        return None
+    target = unwrap(getattr(entrypoint, "__func__", entrypoint))
+    qualname = getattr(target, "__qualname__", None)
+    if qualname is None:
+        return None
+    try:
+        key = (getattr(target, "__module__", None), qualname, signature(entrypoint), entrypoint.__doc__, *options)
+        hash(key)
+    except (TypeError, ValueError):
+        # Unhashable default values or callables without a signature
+        return None
+    return key
+
+
+def _compile_entrypoint_schema(
+    entrypoint: Callable, strict: bool, requires_user_input: bool, user_input_fields: Optional[List[str]]
+) -> ToolSchema:
+    from agno.utils.json_schema import get_json_schema
+
+    sig = signature(entrypoint)
+    type_hints = get_type_hints(entrypoint)
+
+    # If function has an the agent argument, remove the agent parameter from the type hints
+    if "agent" in sig.parameters:
+        del type_hints["agent"]
+    if "team" in sig.parameters:
+        del type_hints["team"]
+
+    # Filter out return type and only process parameters
+    excluded_params = ["return", "agent", "team", "self"]
+    if requires_user_input and user_input_fields:
+        if len(user_input_fields) == 0:
+            excluded_params.extend(list(type_hints.keys()))
+        else:
+            excluded_params.extend(user_input_fields)
+
+    # Get filtered list of parameter types
+    param_type_hints = {name: type_hints.get(name) for name in sig.parameters if name not in excluded_params}
+
+    # Parse docstring for parameters
+    param_descriptions = {}
+    param_descriptions_clean = {}
+    if docstring := getdoc(entrypoint):
+        parsed_doc = parse(docstring)
+        param_docs = parsed_doc.params
+
+        if param_docs is not None:
+            for param in param_docs:
+                param_name = param.arg_name
+                param_type = param.type_name
+
+                # TODO: We should use type hints first, then map param types in docs to json schema types.
+                # This is temporary to not lose information
+                param_descriptions[param_name] = f"({param_type}) {param.description}"
+                param_descriptions_clean[param_name] = param.description
+
+    # If the function requires user input, we should set the user_input_schema to all parameters. The arguments provided by the model are filled in later.
+    user_input_schema = None
+    if requires_user_input:
+        user_input_schema = [
+            UserInputField(
+                name=name,
+                description=param_descriptions_clean.get(name),
+                field_type=type_hints.get(name, str),
+            )
+            for name in sig.parameters
+        ]
+
+    # Get JSON schema for parameters only
+    parameters = get_json_schema(type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict)
+
+    # Mark a field as required if it has no default value
+    required = [
+        name
+        for name, param in sig.parameters.items()
+        if param.default == param.empty and name != "self" and name not in excluded_params
+    ]
+
+    # If strict=True mark all fields as required
+    # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
+    if strict:
+        parameters["required"] = [name for name in parameters["properties"] if name not in excluded_params]
+    else:
+        parameters["required"] = required
+
+    return ToolSchema(
+        parameters=parameters,
+        description=get_entrypoint_docstring(entrypoint),
+        required=required,
+        excluded_params=excluded_params,
+        user_input_schema=user_input_schema,
+    )
+
+
+def _compile_callable_schema(c: Callable, strict: bool) -> ToolSchema:
+    from agno.utils.json_schema import get_json_schema
+
+    sig = signature(c)
+    type_hints = get_type_hints(c)
+
+    # If function has an the agent argument, remove the agent parameter from the type hints
+    if "agent" in sig.parameters:
+        del type_hints["agent"]
+    if "team" in sig.parameters:
+        del type_hints["team"]
+
+    # Filter out return type and only process parameters
+    param_type_hints = {
+        name: type_hints.get(name)
+        for name in sig.parameters
+        if name != "return" and name not in ["agent", "team", "self"]
+    }
+
+    # Parse docstring for parameters
+    param_descriptions: Dict[str, Any] = {}
+    if docstring := getdoc(c):
+        parsed_doc = parse(docstring)
+        param_docs = parsed_doc.params
+
+        if param_docs is not None:
+            for param in param_docs:
+                param_name = param.arg_name
+                param_type = param.type_name
+                if param_type is None:
+                    param_descriptions[param_name] = param.description
+                else:
+                    param_descriptions[param_name] = f"({param_type}) {param.description}"
+
+    # Get JSON schema for parameters only
+    parameters = get_json_schema(type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict)
+
+    # If strict=True mark all fields as required
+    # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
+    if strict:
+        parameters["required"] = [name for name in parameters["properties"] if name not in ["agent", "team", "self"]]
+    else:
+        # Mark a field as required if it has no default value (this would include optional fields)
+        parameters["required"] = [
+            name
+            for name, param in sig.parameters.items()
+            if param.default == param.empty and name != "self" and name not in ["agent", "team"]
+        ]
+
+    return ToolSchema(parameters=parameters, description=get_entrypoint_docstring(entrypoint=c))
+
+
+def get_tool_schema(
+    entrypoint: Callable,
+    strict: bool = False,
+    requires_user_input: Optional[bool] = None,
+    user_input_fields: Optional[List[str]] = None,
+) -> ToolSchema:
+    """Return the compiled schema for a Function entrypoint, from the global cache if possible.
+
+    The returned schema is shared, so it must not be modified.
+    """
+    user_input_key = tuple(user_input_fields) if user_input_fields is not None else None
+    cache_key = _get_tool_schema_cache_key(entrypoint, "entrypoint", strict, bool(requires_user_input), user_input_key)
+    if cache_key is not None:
+        schema = _tool_schema_cache.get(cache_key)
+        if schema is not None:
+            return schema
+    schema = _compile_entrypoint_schema(
+        entrypoint, strict=strict, requires_user_input=bool(requires_user_input), user_input_fields=user_input_fields
+    )
+    if cache_key is not None:
+        _tool_schema_cache.set(cache_key, schema)
+    return schema
+
+
+def get_callable_schema(c: Callable, strict: bool = False) -> ToolSchema:
+    """Return the compiled schema for a callable passed as a tool, from the global cache if possible.
+
+    The returned schema is shared, so it must not be modified.
+    """
+    cache_key = _get_tool_schema_cache_key(c, "callable", strict)
+    if cache_key is not None:
+        schema = _tool_schema_cache.get(cache_key)
+        if schema is not None:
+            return schema
+    schema = _compile_callable_schema(c, strict=strict)
+    if cache_key is not None:
+        _tool_schema_cache.set(cache_key, schema)
+    return schema
+
+
 class Function(BaseModel):
     """Model for storing functions that can be called by an agent."""
 
@@ -88,6 +334,8 @@ class Function(BaseModel):
     show_result: bool = False
     # If True, the agent will stop after the function call.
     stop_after_tool_call: bool = False
+    # If True, the function runs at the same time as the other parallel function calls of the same model response.
+    parallel: bool = False
     # Hook that runs before the function is executed.
     # If defined, can accept the FunctionCall instance as a parameter.
     pre_hook: Optional[Callable] = None
@@ -130,65 +378,13 @@ class Function(BaseModel):
 
     @classmethod
     def from_callable(cls, c: Callable, name: Optional[str] = None, strict: bool = False) -> "Function":
-        from inspect import getdoc, signature
-
-        from agno.utils.json_schema import get_json_schema
-
         function_name = name or c.__name__
         parameters = {"type": "object", "properties": {}, "required": []}
+        description: Optional[str] = None
         try:
-            sig = signature(c)
-            type_hints = get_type_hints(c)
-
-            # If function has an the agent argument, remove the agent parameter from the type hints
-            if "agent" in sig.parameters:
-                del type_hints["agent"]
-            if "team" in sig.parameters:
-                del type_hints["team"]
-            # log_info(f"Type hints for {function_name}: {type_hints}")
-
-            # Filter out return type and only process parameters
-            param_type_hints = {
-                name: type_hints.get(name)
-                for name in sig.parameters
-                if name != "return" and name not in ["agent", "team", "self"]
-            }
-
-            # Parse docstring for parameters
-            param_descriptions: Dict[str, Any] = {}
-            if docstring := getdoc(c):
-                parsed_doc = parse(docstring)
-                param_docs = parsed_doc.params
-
-                if param_docs is not None:
-                    for param in param_docs:
-                        param_name = param.arg_name
-                        param_type = param.type_name
-                        if param_type is None:
-                            param_descriptions[param_name] = param.description
-                        else:
-                            param_descriptions[param_name] = f"({param_type}) {param.description}"
-
-            # Get JSON schema for parameters only
-            parameters = get_json_schema(
-                type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict
-            )
-
-            # If strict=True mark all fields as required
-            # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
-            if strict:
-                parameters["required"] = [
-                    name for name in parameters["properties"] if name not in ["agent", "team", "self"]
-                ]
-            else:
-                # Mark a field as required if it has no default value (this would include optional fields)
-                parameters["required"] = [
-                    name
-                    for name, param in sig.parameters.items()
-                    if param.default == param.empty and name != "self" and name not in ["agent", "team"]
-                ]
-
-            # log_debug(f"JSON schema for {function_name}: {parameters}")
+            schema = get_callable_schema(c, strict=strict)
+            parameters = deepcopy(schema.parameters)
+            description = schema.description
         except Exception as e:
             log_warning(f"Could not parse args for {function_name}: {e}", exc_info=True)
 
@@ -196,17 +392,13 @@ class Function(BaseModel):
 
         return cls(
             name=function_name,
-            description=get_entrypoint_docstring(entrypoint=c),
+            description=description if description is not None else get_entrypoint_docstring(entrypoint=c),
             parameters=parameters,
             entrypoint=entrypoint,
         )
 
     def process_entrypoint(self, strict: bool = False):
         """Process the entrypoint and make it ready for use by an agent."""
-        from inspect import getdoc, signature
-
-        from agno.utils.json_schema import get_json_schema
-
         if self.skip_entrypoint_processing:
             if strict:
                 self.process_schema_for_strict()
@@ -226,89 +418,29 @@ class Function(BaseModel):
             self.user_input_schema = self.user_input_schema or []
 
         try:
-            sig = signature(self.entrypoint)
-            type_hints = get_type_hints(self.entrypoint)
-
-            # If function has an the agent argument, remove the agent parameter from the type hints
-            if "agent" in sig.parameters:
-                del type_hints["agent"]
-            if "team" in sig.parameters:
-                del type_hints["team"]
-            # log_info(f"Type hints for {self.name}: {type_hints}")
-
-            # Filter out return type and only process parameters
-            excluded_params = ["return", "agent", "team", "self"]
-            if self.requires_user_input and self.user_input_fields:
-                if len(self.user_input_fields) == 0:
-                    excluded_params.extend(list(type_hints.keys()))
-                else:
-                    excluded_params.extend(self.user_input_fields)
-
-            # Get filtered list of parameter types
-            param_type_hints = {name: type_hints.get(name) for name in sig.parameters if name not in excluded_params}
-
-            # Parse docstring for parameters
-            param_descriptions = {}
-            param_descriptions_clean = {}
-            if docstring := getdoc(self.entrypoint):
-                parsed_doc = parse(docstring)
-                param_docs = parsed_doc.params
-
-                if param_docs is not None:
-                    for param in param_docs:
-                        param_name = param.arg_name
-                        param_type = param.type_name
-
-                        # TODO: We should use type hints first, then map param types in docs to json schema types.
-                        # This is temporary to not lose information
-                        param_descriptions[param_name] = f"({param_type}) {param.description}"
-                        param_descriptions_clean[param_name] = param.description
-
-            # If the function requires user input, we should set the user_input_schema to all parameters. The arguments provided by the model are filled in later.
-            if self.requires_user_input:
-                self.user_input_schema = [
-                    UserInputField(
-                        name=name,
-                        description=param_descriptions_clean.get(name),
-                        field_type=type_hints.get(name, str),
-                    )
-                    for name in sig.parameters
-                ]
-
-            # Get JSON schema for parameters only
-            parameters = get_json_schema(
-                type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict
+            schema = get_tool_schema(
+                self.entrypoint,
+                strict=strict,
+                requires_user_input=self.requires_user_input,
+                user_input_fields=self.user_input_fields,
             )
 
-            # If strict=True mark all fields as required
-            # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
-            if strict:
-                parameters["required"] = [name for name in parameters["properties"] if name not in excluded_params]
-            else:
-                # Mark a field as required if it has no default value
-                parameters["required"] = [
-                    name
-                    for name, param in sig.parameters.items()
-                    if param.default == param.empty and name != "self" and name not in excluded_params
-                ]
+            if schema.user_input_schema is not None:
+                self.user_input_schema = [replace(f) for f in schema.user_input_schema]
 
             if params_set_by_user:
                 self.parameters["additionalProperties"] = False
                 if strict:
                     self.parameters["required"] = [
-                        name for name in self.parameters["properties"] if name not in excluded_params
+                        name for name in self.parameters["properties"] if name not in schema.excluded_params
                     ]
                 else:
                     # Mark a field as required if it has no default value
-                    self.parameters["required"] = [
-                        name
-                        for name, param in sig.parameters.items()
-                        if param.default == param.empty and name != "self" and name not in excluded_params
-                    ]
-
-            self.description = self.description or get_entrypoint_docstring(self.entrypoint)
+                    self.parameters["required"] = list(schema.required)
+            else:
+                parameters = deepcopy(schema.parameters)
 
-            # log_debug(f"JSON schema for {self.name}: {parameters}")
+            self.description = self.description or schema.description
         except Exception as e:
             log_warning(f"Could not parse args for {self.name}: {e}", exc_info=True)
 
@@ -333,8 +465,18 @@ class Function(BaseModel):
             return func
         # Wrap the callable with validate_call
         else:
-            wrapped = validate_call(func, config=dict(arbitrary_types_allowed=True))  # type: ignore
-            wrapped._wrapped_for_validation = True  # Mark as wrapped to avoid infinite recursion
+            # Bound methods share the validator of the underlying function, so toolkits are only wrapped once.
+            # Closures are not cached, as they are usually created per agent and hold references to it.
+            target = func.__func__ if ismethod(func) else func
+            cacheable = isinstance(target, FunctionType) and target.__closure__ is None
+            wrapped = _validated_callable_cache.get(target) if cacheable else None
+            if wrapped is None:
+                wrapped = validate_call(target, config=dict(arbitrary_types_allowed=True))  # type: ignore
+                wrapped._wrapped_for_validation = True  # Mark as wrapped to avoid infinite recursion
+                if cacheable:
+                    _validated_callable_cache.set(target, wrapped)
+            if target is not func:
+                return MethodType(wrapped, func.__self__)  # type: ignore
             return wrapped
 
     def process_schema_for_strict(self):
@@ -0,0 +1,210 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from queue import Empty, Queue
+from threading import Event
+from time import monotonic
+from typing import AsyncIterable, AsyncIterator, Callable, Dict, Generic, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Seconds between checks for timed out tasks, while no task has started yet
+_POLL_INTERVAL = 0.05
+
+
+@dataclass
+class FanOutEvent(Generic[T]):
+    """An item yielded by one of the tasks, or the end of the task when done is set."""
+
+    # Position of the task in the list of tasks
+    index: int
+    item: Optional[T] = None
+    done: bool = False
+    # The exception raised by the task, a TimeoutError if it ran for longer than the timeout
+    error: Optional[BaseException] = None
+
+
+def fan_out(
+    tasks: List[Callable[[], Iterable[T]]],
+    max_workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> Iterator[FanOutEvent[T]]:
+    """Run tasks in threads and yield their items as they are produced.
+
+    The items of each task are yielded in order, followed by a done event with the error of the task, if any.
+    A task that runs for longer than `timeout` seconds is ended with a TimeoutError and its later items are dropped.
+    Closing the iterator stops the tasks at their next item.
+
+    Args:
+        tasks: Functions returning the items of each task. A function returning a single value should wrap it in a list.
+        max_workers: Maximum number of tasks run at the same time. None runs all tasks at once.
+        timeout: Seconds each task may run for, from the moment it starts.
+    """
+    if len(tasks) == 0:
+        return
+
+    events: "Queue[FanOutEvent[T]]" = Queue()
+    stopped = Event()
+    started_at: Dict[int, float] = {}
+
+    def run_task(index: int, task: Callable[[], Iterable[T]]) -> None:
+        started_at[index] = monotonic()
+        iterator = None
+        try:
+            iterator = iter(task())
+            for item in iterator:
+                if stopped.is_set():
+                    return
+                events.put(FanOutEvent(index=index, item=item))
+        except Exception as e:
+            events.put(FanOutEvent(index=index, done=True, error=e))
+            return
+        finally:
+            close = getattr(iterator, "close", None)
+            if stopped.is_set() and close is not None:
+                close()
+        events.put(FanOutEvent(index=index, done=True))
+
+    executor = ThreadPoolExecutor(max_workers=max_workers or len(tasks), thread_name_prefix="fan-out")
+    try:
+        for index, task in enumerate(tasks):
+            executor.submit(run_task, index, task)
+
+        pending = set(range(len(tasks)))
+        while pending:
+            wait: Optional[float] = None
+            if timeout is not None:
+                now = monotonic()
+                for index in sorted(pending):
+                    if index in started_at and now - started_at[index] >= timeout:
+                        pending.discard(index)
+                        yield FanOutEvent(index=index, done=True, error=TimeoutError(f"Timed out after {timeout}s"))
+                if not pending:
+                    break
+                deadlines = [started_at[index] + timeout for index in pending if index in started_at]
+                wait = max(min(deadlines) - now, 0) if len(deadlines) == len(pending) else _POLL_INTERVAL
+            try:
+                event = events.get(timeout=wait)
+            except Empty:
+                continue
+            # Drop the items of tasks that timed out
+            if event.index not in pending:
+                continue
+            if event.done:
+                pending.discard(event.index)
+            yield event
+    finally:
+        stopped.set()
+        # Do not wait for tasks that timed out
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def afan_out(
+    tasks: List[Callable[[], AsyncIterable[T]]],
+    max_concurrency: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> AsyncIterator[FanOutEvent[T]]:
+    """Run tasks concurrently and yield their items as they are produced.
+
+    The items of each task are yielded in order, followed by a done event with the error of the task, if any.
+    A task that runs for longer than `timeout` seconds is cancelled and ended with a TimeoutError.
+    Closing the iterator cancels the tasks.
+
+    Args:
+        tasks: Functions returning the async items of each task.
+        max_concurrency: Maximum number of tasks run at the same time. None runs all tasks at once.
+        timeout: Seconds each task may run for, from the moment it starts.
+    """
+    if len(tasks) == 0:
+        return
+
+    events: "asyncio.Queue[FanOutEvent[T]]" = asyncio.Queue()
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def consume(index: int, task: Callable[[], AsyncIterable[T]]) -> None:
+        async for item in task():
+            await events.put(FanOutEvent(index=index, item=item))
+
+    async def run_task(index: int, task: Callable[[], AsyncIterable[T]]) -> None:
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            await asyncio.wait_for(consume(index, task), timeout=timeout)
+        except asyncio.TimeoutError:
+            await events.put(FanOutEvent(index=index, done=True, error=TimeoutError(f"Timed out after {timeout}s")))
+        except Exception as e:
+            await events.put(FanOutEvent(index=index, done=True, error=e))
+        else:
+            await events.put(FanOutEvent(index=index, done=True))
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    runners = [asyncio.ensure_future(run_task(index, task)) for index, task in enumerate(tasks)]
+    try:
+        remaining = len(tasks)
+        while remaining > 0:
+            event = await events.get()
+            if event.done:
+                remaining -= 1
+            yield event
+    finally:
+        for runner in runners:
+            runner.cancel()
+
+
+class _ExclusiveItemGrouper(Generic[T]):
+    """Holds back the exclusive items of a task while another task is yielding its exclusive items."""
+
+    def __init__(self, exclusive: Callable[[T], bool]):
+        self.exclusive = exclusive
+        # Task whose exclusive items are being yielded
+        self.owner: Optional[int] = None
+        # Events held back for each waiting task, in the order the tasks started waiting
+        self.waiting: Dict[int, List[FanOutEvent[T]]] = {}
+
+    def add(self, event: FanOutEvent[T]) -> List[FanOutEvent[T]]:
+        """Return the events to yield after receiving an event."""
+        if event.index in self.waiting:
+            # Keep the events of a waiting task in order
+            self.waiting[event.index].append(event)
+            return []
+        if not event.done and self.exclusive(event.item) and self.owner != event.index:  # type: ignore
+            if self.owner is not None:
+                self.waiting[event.index] = [event]
+                return []
+            self.owner = event.index
+
+        ready = [event]
+        if event.done and event.index == self.owner:
+            # Hand over to the task that has waited the longest
+            self.owner = None
+            while self.owner is None and self.waiting:
+                index = next(iter(self.waiting))
+                held = self.waiting.pop(index)
+                ready.extend(held)
+                if not held[-1].done:
+                    self.owner = index
+        return ready
+
+
+def group_exclusive_items(events: Iterable[FanOutEvent[T]], exclusive: Callable[[T], bool]) -> Iterator[FanOutEvent[T]]:
+    """Yield the exclusive items of one task at a time, so they are not interleaved between tasks.
+
+    The first task to yield an exclusive item holds the stream until it is done. Other tasks keep running, and their
+    events are held back from their first exclusive item until the stream is handed over to them.
+    Other events pass through as they are produced.
+    """
+    grouper = _ExclusiveItemGrouper(exclusive)
+    for event in events:
+        yield from grouper.add(event)
+
+
+async def agroup_exclusive_items(
+    events: AsyncIterable[FanOutEvent[T]], exclusive: Callable[[T], bool]
+) -> AsyncIterator[FanOutEvent[T]]:
+    """Async version of group_exclusive_items."""
+    grouper = _ExclusiveItemGrouper(exclusive)
+    async for event in events:
+        for ready in grouper.add(event):
+            yield ready
@@ -54,15 +54,40 @@ class VectorDb(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
+        """Search for documents matching a query.
+
+        Embeddings are only returned on the documents when include_embeddings is True,
+        as they are usually much larger than the content and not needed by the caller.
+        """
         raise NotImplementedError
 
     @abstractmethod
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         raise NotImplementedError
 
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """Fetch the stored embeddings of documents by id, e.g. for search results returned without embeddings.
+
+        Ids that are not found are left out of the result.
+        """
+        raise NotImplementedError
+
+    async def async_get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        return self.get_embeddings(ids)
+
     def vector_search(self, query: str, limit: int = 5) -> List[Document]:
         raise NotImplementedError
 
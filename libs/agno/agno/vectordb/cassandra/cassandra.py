@@ -1,7 +1,7 @@
 import asyncio
 from typing import Any, Dict, Iterable, List, Optional
 
-from agno.document import Document
+from agno.document import Document, async_embed_documents
 from agno.embedder import Embedder
 from agno.utils.log import log_debug, log_info
 from agno.vectordb.base import VectorDb
@@ -55,12 +55,12 @@ class Cassandra(VectorDb):
         """Create the table asynchronously by running in a thread."""
         await asyncio.to_thread(self.create)
 
-    def _row_to_document(self, row: Dict[str, Any]) -> Document:
+    def _row_to_document(self, row: Dict[str, Any], include_embeddings: bool = True) -> Document:
         return Document(
             id=row["row_id"],
             content=row["body_blob"],
             meta_data=row["metadata"],
-            embedding=row["vector"],
+            embedding=row["vector"] if include_embeddings else None,
             name=row["document_name"],
         )
 
@@ -91,10 +91,15 @@ class Cassandra(VectorDb):
         return result.one()[0] > 0
 
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        for doc in documents:
+            doc.embed(embedder=self.embedder)
+        self._insert(documents)
+
+    def _insert(self, documents: List[Document]) -> None:
+        """Insert documents that are already embedded."""
         log_debug(f"Cassandra VectorDB : Inserting Documents to the table {self.table_name}")
         futures = []
         for doc in documents:
-            doc.embed(embedder=self.embedder)
             metadata = {key: str(value) for key, value in doc.meta_data.items()}
             futures.append(
                 self.table.put_async(
@@ -110,37 +115,58 @@ class Cassandra(VectorDb):
             f.result()
 
     async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
-        """Insert documents asynchronously by running in a thread."""
-        await asyncio.to_thread(self.insert, documents, filters)
+        """Embed documents concurrently, then insert them in a thread."""
+        await async_embed_documents(documents, self.embedder)
+        await asyncio.to_thread(self._insert, documents)
 
     def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """Insert or update documents based on primary key."""
         self.insert(documents, filters)
 
     async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
-        """Upsert documents asynchronously by running in a thread."""
-        await asyncio.to_thread(self.upsert, documents, filters)
+        """Upsert documents asynchronously, inserting replaces documents with the same primary key."""
+        await self.async_insert(documents, filters)
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         """Keyword-based search on document metadata."""
         log_debug(f"Cassandra VectorDB : Performing Vector Search on {self.table_name} with query {query}")
-        return self.vector_search(query=query, limit=limit)
+        return self.vector_search(query=query, limit=limit, include_embeddings=include_embeddings)
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
-        """Search asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.search, query, limit, filters)
+        """Embed the query asynchronously, then search in a thread."""
+        log_debug(f"Cassandra VectorDB : Performing Vector Search on {self.table_name} with query {query}")
+        query_embedding = await self.embedder.aget_embedding(query)
+        return await asyncio.to_thread(self.vector_search, query, limit, include_embeddings, query_embedding)
 
     def _search_to_documents(
         self,
         hits: Iterable[Dict[str, Any]],
+        include_embeddings: bool = True,
     ) -> List[Document]:
-        return [self._row_to_document(row=hit) for hit in hits]
+        return [self._row_to_document(row=hit, include_embeddings=include_embeddings) for hit in hits]
 
-    def vector_search(self, query: str, limit: int = 5) -> List[Document]:
+    def vector_search(
+        self,
+        query: str,
+        limit: int = 5,
+        include_embeddings: bool = False,
+        query_embedding: Optional[List[float]] = None,
+    ) -> List[Document]:
         """Vector similarity search implementation."""
-        query_embedding = self.embedder.get_embedding(query)
+        if query_embedding is None:
+            query_embedding = self.embedder.get_embedding(query)
         hits = list(
             self.table.metric_ann_search(
                 vector=query_embedding,
@@ -148,9 +174,17 @@ class Cassandra(VectorDb):
                 metric="cos",
             )
         )
-        d = self._search_to_documents(hits)
+        d = self._search_to_documents(hits, include_embeddings=include_embeddings)
         return d
 
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """Fetch the stored vectors of documents by id."""
+        if len(ids) == 0:
+            return {}
+        query = f"SELECT row_id, vector FROM {self.keyspace}.{self.table_name} WHERE row_id IN %s"
+        rows = self.session.execute(query, (tuple(ids),))
+        return {row.row_id: list(row.vector) for row in rows if row.vector is not None}
+
     def drop(self) -> None:
         """Drop the vector table in Cassandra."""
         log_debug(f"Cassandra VectorDB : Dropping Table {self.table_name}")
@@ -1,6 +1,6 @@
 import asyncio
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 try:
     from chromadb import Client as ChromaDbClient
@@ -12,12 +12,13 @@ try:
 except ImportError:
     raise ImportError("The `chromadb` package is not installed. Please install it via `pip install chromadb`.")
 
-from agno.document import Document
+from agno.document import Document, async_embed_documents
 from agno.embedder import Embedder
 from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, logger
 from agno.vectordb.base import VectorDb
 from agno.vectordb.distance import Distance
+from agno.vectordb.filters import AND, EQ, OR, RANGE, FilterExpr, parse_filters
 
 
 class ChromaDb(VectorDb):
@@ -144,6 +145,12 @@ class ChromaDb(VectorDb):
             documents (List[Document]): List of documents to insert
             filters (Optional[Dict[str, Any]]): Filters to merge with document metadata
         """
+        for document in documents:
+            document.embed(embedder=self.embedder)
+        self._insert(documents, filters)
+
+    def _insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Insert documents that are already embedded."""
         log_debug(f"Inserting {len(documents)} documents")
         ids: List = []
         docs: List = []
@@ -154,7 +161,6 @@ class ChromaDb(VectorDb):
             self._collection = self.client.get_collection(name=self.collection_name)
 
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
 
@@ -177,8 +183,9 @@ class ChromaDb(VectorDb):
                 log_debug(f"Committed {len(docs)} documents")
 
     async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
-        """Insert documents asynchronously by running in a thread."""
-        await asyncio.to_thread(self.insert, documents, filters)
+        """Embed documents concurrently, then insert them in a thread."""
+        await async_embed_documents(documents, self.embedder)
+        await asyncio.to_thread(self._insert, documents, filters)
 
     def upsert_available(self) -> bool:
         """Check if upsert is available in ChromaDB."""
@@ -191,6 +198,12 @@ class ChromaDb(VectorDb):
             documents (List[Document]): List of documents to upsert
             filters (Optional[Dict[str, Any]]): Filters to apply while upserting
         """
+        for document in documents:
+            document.embed(embedder=self.embedder)
+        self._upsert(documents, filters)
+
+    def _upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Upsert documents that are already embedded."""
         log_debug(f"Upserting {len(documents)} documents")
         ids: List = []
         docs: List = []
@@ -201,7 +214,6 @@ class ChromaDb(VectorDb):
             self._collection = self.client.get_collection(name=self.collection_name)
 
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             docs_embeddings.append(document.embedding)
@@ -218,10 +230,17 @@ class ChromaDb(VectorDb):
                 log_debug(f"Committed {len(docs)} documents")
 
     async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
-        """Upsert documents asynchronously by running in a thread."""
-        await asyncio.to_thread(self.upsert, documents, filters)
+        """Embed documents concurrently, then upsert them in a thread."""
+        await async_embed_documents(documents, self.embedder)
+        await asyncio.to_thread(self._upsert, documents, filters)
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         """Search the collection for a query.
 
         Args:
@@ -233,10 +252,22 @@ class ChromaDb(VectorDb):
                 - $gt, $gte, $lt, $lte: Numeric comparisons
                 - $in, $nin: List inclusion/exclusion
                 - $and, $or: Logical operators
+            include_embeddings (bool): Whether to return the embeddings of the documents.
         Returns:
             List[Document]: List of search results.
         """
         query_embedding = self.embedder.get_embedding(query)
+        return self._search(query, query_embedding, limit, filters, include_embeddings)
+
+    def _search(
+        self,
+        query: str,
+        query_embedding: Optional[List[float]],
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
+        """Search the collection with an embedded query."""
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -247,11 +278,14 @@ class ChromaDb(VectorDb):
         # Convert simple filters to ChromaDB's format if needed
         where_filter = self._convert_filters(filters) if filters else None
 
+        include: List[Any] = ["metadatas", "documents", "distances", "uris"]
+        if include_embeddings:
+            include.append("embeddings")
         result: QueryResult = self._collection.query(
             query_embeddings=query_embedding,
             n_results=limit,
             where=where_filter,  # Add where filter
-            include=["metadatas", "documents", "embeddings", "distances", "uris"],
+            include=include,
         )
 
         # Build search results
@@ -260,8 +294,9 @@ class ChromaDb(VectorDb):
         ids = result.get("ids", [[]])[0]
         metadata = result.get("metadatas", [{}])[0]
         documents = result.get("documents", [[]])[0]
-        embeddings = result.get("embeddings")[0]
-        embeddings = [e.tolist() if hasattr(e, "tolist") else e for e in embeddings]
+        embeddings: List[Any] = [None] * len(ids)
+        if include_embeddings:
+            embeddings = [e.tolist() if hasattr(e, "tolist") else e for e in result.get("embeddings")[0]]
         distances = result.get("distances", [[]])[0]
 
         for idx, distance in enumerate(distances):
@@ -286,36 +321,62 @@ class ChromaDb(VectorDb):
         log_info(f"Found {len(search_results)} documents")
         return search_results
 
-    def _convert_filters(self, filters: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert simple filters to ChromaDB's filter format.
+    def _convert_filters(self, filters: Union[Dict[str, Any], FilterExpr]) -> Dict[str, Any]:
+        """Convert filters to ChromaDB's filter format.
 
-        Handles conversion of simple key-value filters to ChromaDB's operator format
-        when needed.
+        Filters are parsed to a filter expression and compiled to ChromaDB's operators,
+        so lists become $in, ranges become $gt/$gte/$lt/$lte and multiple keys are combined with $and.
         """
         if not filters:
             return {}
 
-        # If filters already use ChromaDB operators ($eq, $ne, etc.), return as is
-        if any(key.startswith("$") for key in filters.keys()):
-            return filters
-
-        # Convert simple key-value pairs to ChromaDB's format
-        converted = {}
-        for key, value in filters.items():
-            if isinstance(value, (list, tuple)):
-                # Convert lists to $in operator
-                converted[key] = {"$in": list(value)}
-            else:
-                # Convert simple equality to $eq
-                converted[key] = {"$eq": value}
-
-        return converted
+        try:
+            expression = parse_filters(filters)
+        except ValueError:
+            # Filters using other ChromaDB operators ($ne, $nin, etc.) are passed as is
+            return filters  # type: ignore
+        return self._compile_filter(expression) if expression is not None else {}
+
+    def _compile_filter(self, expression: FilterExpr) -> Dict[str, Any]:
+        if isinstance(expression, (AND, OR)):
+            clauses = [self._compile_filter(nested) for nested in expression.expressions]
+            if len(clauses) == 1:
+                return clauses[0]
+            return {"$and" if isinstance(expression, AND) else "$or": clauses}
+        if isinstance(expression, RANGE):
+            # ChromaDB takes one operator per clause
+            bounds = [{expression.key: {f"${name}": bound}} for name, bound in expression.bounds.items()]
+            return bounds[0] if len(bounds) == 1 else {"$and": bounds}
+        if isinstance(expression, EQ) and isinstance(expression.value, list):
+            # A list value in dict filters matches any of its items
+            return {expression.key: {"$in": expression.value}}
+        return expression.to_dict()
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
-        """Search asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.search, query, limit, filters)
+        """Embed the query asynchronously, then search in a thread."""
+        query_embedding = await self.embedder.aget_embedding(query)
+        return await asyncio.to_thread(self._search, query, query_embedding, limit, filters, include_embeddings)
+
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """Fetch the stored embeddings of documents by id."""
+        if len(ids) == 0:
+            return {}
+        if not self._collection:
+            self._collection = self.client.get_collection(name=self.collection_name)
+        result: GetResult = self._collection.get(ids=ids, include=["embeddings"])
+        embeddings = result.get("embeddings")
+        if embeddings is None:
+            return {}
+        return {
+            id_: embedding.tolist() if hasattr(embedding, "tolist") else embedding
+            for id_, embedding in zip(result.get("ids", []), embeddings)
+        }
 
     def drop(self) -> None:
         """Delete the collection."""
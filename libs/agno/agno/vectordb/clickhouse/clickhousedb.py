@@ -10,7 +10,7 @@ try:
 except ImportError:
     raise ImportError("`clickhouse-connect` not installed. Use `pip install clickhouse-connect` to install it")
 
-from agno.document import Document
+from agno.document import Document, async_embed_documents
 from agno.embedder import Embedder
 from agno.utils.log import log_debug, log_info, logger
 from agno.vectordb.base import VectorDb
@@ -331,9 +331,9 @@ class Clickhouse(VectorDb):
         """Insert documents asynchronously."""
         rows: List[List[Any]] = []
         async_client = await self._ensure_async_client()
+        await async_embed_documents(documents, self.embedder)
 
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             content_hash = md5(cleaned_content.encode()).hexdigest()
             _id = document.id or content_hash
@@ -404,7 +404,32 @@ class Clickhouse(VectorDb):
             parameters=parameters,
         )
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def _get_search_columns(self, include_embeddings: bool = False) -> str:
+        # The embedding column is only read when it is needed, it is much larger than the rest of the row
+        return "name, meta_data, content, usage, embedding" if include_embeddings else "name, meta_data, content, usage"
+
+    def _build_search_results(self, result_rows: Any, include_embeddings: bool = False) -> List[Document]:
+        search_results: List[Document] = []
+        for result in result_rows:
+            search_results.append(
+                Document(
+                    name=result[0],
+                    meta_data=result[1],
+                    content=result[2],
+                    embedder=self.embedder,
+                    embedding=result[4] if include_embeddings else None,
+                    usage=result[3],
+                )
+            )
+        return search_results
+
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         query_embedding = self.embedder.get_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
@@ -429,7 +454,7 @@ class Clickhouse(VectorDb):
             parameters["query_embedding"] = query_embedding
 
         clickhouse_query = (
-            "SELECT name, meta_data, content, embedding, usage FROM "
+            f"SELECT {self._get_search_columns(include_embeddings)} FROM "
             "{database_name:Identifier}.{table_name:Identifier} "
             f"{where_query} {order_by_query} LIMIT {limit}"
         )
@@ -447,29 +472,19 @@ class Clickhouse(VectorDb):
             self.create()
             return []
 
-        # Build search results
-        search_results: List[Document] = []
-        for result in results.result_rows:
-            search_results.append(
-                Document(
-                    name=result[0],
-                    meta_data=result[1],
-                    content=result[2],
-                    embedder=self.embedder,
-                    embedding=result[3],
-                    usage=result[4],
-                )
-            )
-
-        return search_results
+        return self._build_search_results(results.result_rows, include_embeddings)
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """Search for documents asynchronously."""
         async_client = await self._ensure_async_client()
 
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = await self.embedder.aget_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -493,7 +508,7 @@ class Clickhouse(VectorDb):
             parameters["query_embedding"] = query_embedding
 
         clickhouse_query = (
-            "SELECT name, meta_data, content, embedding, usage FROM "
+            f"SELECT {self._get_search_columns(include_embeddings)} FROM "
             "{database_name:Identifier}.{table_name:Identifier} "
             f"{where_query} {order_by_query} LIMIT {limit}"
         )
@@ -511,21 +526,7 @@ class Clickhouse(VectorDb):
             await self.async_create()
             return []
 
-        # Build search results
-        search_results: List[Document] = []
-        for result in results.result_rows:
-            search_results.append(
-                Document(
-                    name=result[0],
-                    meta_data=result[1],
-                    content=result[2],
-                    embedder=self.embedder,
-                    embedding=result[3],
-                    usage=result[4],
-                )
-            )
-
-        return search_results
+        return self._build_search_results(results.result_rows, include_embeddings)
 
     def drop(self) -> None:
         if self.table_exists():
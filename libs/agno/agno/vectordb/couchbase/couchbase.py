@@ -3,7 +3,7 @@ import time
 from datetime import timedelta
 from typing import Any, Dict, List, Optional, Union
 
-from agno.document import Document
+from agno.document import Document, async_embed_documents
 from agno.embedder import Embedder
 from agno.embedder.openai import OpenAIEmbedder
 from agno.utils.log import log_debug, logger
@@ -433,7 +433,13 @@ class CouchbaseSearch(VectorDb):
         if errors_occurred:
             logger.warning("Some errors occurred during the upsert operation. Please check logs for details.")
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         """Search the Couchbase bucket for documents relevant to the query."""
         query_embedding = self.embedder.get_embedding(query)
         if query_embedding is None:
@@ -447,8 +453,9 @@ class CouchbaseSearch(VectorDb):
             )
             request = SearchRequest.create(vector_search)
 
-            # Prepare the options dictionary
-            options_dict = {"limit": limit, "fields": ["*"]}
+            # Prepare the options dictionary. No stored fields are requested,
+            # as the documents are read from the KV store.
+            options_dict: Dict[str, Any] = {"limit": limit}
             if filters:
                 options_dict["raw"] = filters
 
@@ -463,17 +470,18 @@ class CouchbaseSearch(VectorDb):
             else:
                 results = self.scope.search(**search_args)
 
-            return self.__get_doc_from_kv(results)
+            return self.__get_doc_from_kv(results, include_embeddings)
         except Exception as e:
             logger.error(f"Error during search: {e}")
             raise
 
-    def __get_doc_from_kv(self, response: SearchResult) -> List[Document]:
+    def __get_doc_from_kv(self, response: SearchResult, include_embeddings: bool = False) -> List[Document]:
         """
         Convert search results to Document objects by fetching full documents from KV store.
 
         Args:
             response: SearchResult from Couchbase search query
+            include_embeddings: Whether to set the embeddings of the documents
 
         Returns:
             List of Document objects
@@ -505,12 +513,23 @@ class CouchbaseSearch(VectorDb):
                     name=value["name"],
                     content=value["content"],
                     meta_data=value["meta_data"],
-                    embedding=value["embedding"],
+                    embedding=value["embedding"] if include_embeddings else None,
                 )
             )
 
         return documents
 
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """Fetch the stored embeddings of documents by id from the KV store."""
+        if len(ids) == 0:
+            return {}
+        kv_response = self.collection.get_multi(keys=ids)
+        embeddings: Dict[str, List[float]] = {}
+        for doc_id, get_result in kv_response.results.items():
+            if get_result is not None and get_result.success and get_result.value.get("embedding") is not None:
+                embeddings[doc_id] = get_result.value["embedding"]
+        return embeddings
+
     def drop(self) -> None:
         """Delete the collection from the scope."""
         if self.exists():
@@ -839,6 +858,8 @@ class CouchbaseSearch(VectorDb):
         logger.info(f"[async] Inserting {len(documents)} documents")
 
         async_collection_instance = await self.get_async_collection()
+        # Embed the documents that are not embedded yet concurrently, so prepare_doc does not block the event loop
+        await async_embed_documents([document for document in documents if document.embedding is None], self.embedder)
         all_docs_to_insert: Dict[str, Any] = {}
 
         for document in documents:
@@ -892,6 +913,8 @@ class CouchbaseSearch(VectorDb):
         logger.info(f"[async] Upserting {len(documents)} documents")
 
         async_collection_instance = await self.get_async_collection()
+        # Embed the documents that are not embedded yet concurrently, so prepare_doc does not block the event loop
+        await async_embed_documents([document for document in documents if document.embedding is None], self.embedder)
         all_docs_to_upsert: Dict[str, Any] = {}
 
         for document in documents:
@@ -943,9 +966,13 @@ class CouchbaseSearch(VectorDb):
         logger.info(f"[async] Total successfully upserted: {total_upserted_count}, Total failed: {total_failed_count}.")
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = await self.embedder.aget_embedding(query)
         if query_embedding is None:
             logger.error(f"[async] Failed to generate embedding for query: {query}")
             return []
@@ -956,8 +983,9 @@ class CouchbaseSearch(VectorDb):
             )
             request = SearchRequest.create(vector_search)
 
-            # Prepare the options dictionary
-            options_dict = {"limit": limit, "fields": ["*"]}
+            # Prepare the options dictionary. No stored fields are requested,
+            # as the documents are read from the KV store.
+            options_dict: Dict[str, Any] = {"limit": limit}
             if filters:
                 options_dict["raw"] = filters
 
@@ -974,7 +1002,7 @@ class CouchbaseSearch(VectorDb):
                 async_scope_instance = await self.get_async_scope()
                 results = async_scope_instance.search(**search_args)
 
-            return await self.__async_get_doc_from_kv(results)
+            return await self.__async_get_doc_from_kv(results, include_embeddings)
         except Exception as e:
             logger.error(f"[async] Error during search: {e}")
             raise
@@ -1004,12 +1032,15 @@ class CouchbaseSearch(VectorDb):
         except Exception:
             return False
 
-    async def __async_get_doc_from_kv(self, response: AsyncSearchIndex) -> List[Document]:
+    async def __async_get_doc_from_kv(
+        self, response: AsyncSearchIndex, include_embeddings: bool = False
+    ) -> List[Document]:
         """
         Convert search results to Document objects by fetching full documents from KV store concurrently.
 
         Args:
             response: SearchResult from Couchbase search query
+            include_embeddings: Whether to set the embeddings of the documents
 
         Returns:
             List of Document objects
@@ -1059,7 +1090,7 @@ class CouchbaseSearch(VectorDb):
                             name=value.get("name"),
                             content=value.get("content", ""),
                             meta_data=value.get("meta_data", {}),
-                            embedding=value.get("embedding", []),
+                            embedding=value.get("embedding", []) if include_embeddings else None,
                         )
                     )
                 except Exception as e:
@@ -0,0 +1,168 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+
+class FilterExpr:
+    """Base class for typed metadata filter expressions.
+
+    Vector dbs compile expressions to their native predicates. Filters given as dicts are parsed with
+    `parse_filters`, so `{"year": {"$gte": 2020}, "$or": [{"type": "soup"}, {"type": "curry"}]}`
+    and `AND([RANGE("year", gte=2020), OR([EQ("type", "soup"), EQ("type", "curry")])])` are the same filter.
+    """
+
+    def to_dict(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def get_keys(self) -> List[str]:
+        """The metadata keys the expression filters on."""
+        raise NotImplementedError
+
+
+@dataclass(frozen=True)
+class EQ(FilterExpr):
+    """The metadata value of `key` equals `value`."""
+
+    key: str
+    value: Any
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {self.key: {"$eq": self.value}}
+
+    def get_keys(self) -> List[str]:
+        return [self.key]
+
+
+@dataclass(frozen=True)
+class IN(FilterExpr):
+    """The metadata value of `key` is one of `values`."""
+
+    key: str
+    values: List[Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {self.key: {"$in": list(self.values)}}
+
+    def get_keys(self) -> List[str]:
+        return [self.key]
+
+
+@dataclass(frozen=True)
+class RANGE(FilterExpr):
+    """The metadata value of `key` is within the given bounds."""
+
+    key: str
+    gt: Optional[Any] = None
+    gte: Optional[Any] = None
+    lt: Optional[Any] = None
+    lte: Optional[Any] = None
+
+    @property
+    def bounds(self) -> Dict[str, Any]:
+        """The bounds that are set, by operator name."""
+        return {
+            operator: value
+            for operator, value in (("gt", self.gt), ("gte", self.gte), ("lt", self.lt), ("lte", self.lte))
+            if value is not None
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {self.key: {f"${operator}": value for operator, value in self.bounds.items()}}
+
+    def get_keys(self) -> List[str]:
+        return [self.key]
+
+
+@dataclass(frozen=True)
+class AND(FilterExpr):
+    """All expressions match."""
+
+    expressions: List[FilterExpr] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"$and": [expression.to_dict() for expression in self.expressions]}
+
+    def get_keys(self) -> List[str]:
+        return [key for expression in self.expressions for key in expression.get_keys()]
+
+
+@dataclass(frozen=True)
+class OR(FilterExpr):
+    """At least one expression matches."""
+
+    expressions: List[FilterExpr] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"$or": [expression.to_dict() for expression in self.expressions]}
+
+    def get_keys(self) -> List[str]:
+        return [key for expression in self.expressions for key in expression.get_keys()]
+
+
+_RANGE_OPERATORS = {"$gt", "$gte", "$lt", "$lte"}
+
+
+def _is_operator_dict(value: Any) -> bool:
+    return isinstance(value, dict) and len(value) > 0 and all(str(key).startswith("$") for key in value)
+
+
+def _parse_field(key: str, value: Any) -> FilterExpr:
+    if isinstance(value, (tuple, set)):
+        value = list(value)
+    if not _is_operator_dict(value):
+        # Plain values, including lists and nested dicts, keep their meaning in the dict filters of each vector db
+        return EQ(key, value)
+
+    expressions: List[FilterExpr] = []
+    bounds = {operator[1:]: bound for operator, bound in value.items() if operator in _RANGE_OPERATORS}
+    if bounds:
+        expressions.append(RANGE(key, **bounds))
+    for operator, operand in value.items():
+        if operator == "$eq":
+            expressions.append(EQ(key, operand))
+        elif operator == "$in":
+            expressions.append(IN(key, list(operand)))
+        elif operator not in _RANGE_OPERATORS:
+            raise ValueError(f"Unsupported filter operator for '{key}': {operator}")
+    return expressions[0] if len(expressions) == 1 else AND(expressions)
+
+
+def parse_filters(filters: Optional[Union[Dict[str, Any], FilterExpr]]) -> Optional[FilterExpr]:
+    """Parse dict filters into a filter expression.
+
+    Each key of the dict is a metadata key, except the logical operators `$and` and `$or`, which take a list of
+    filters. A dict of operators (`$eq`, `$in`, `$gt`, `$gte`, `$lt`, `$lte`) applies each operator, and any other
+    value must be equal. A list value is parsed as `EQ` and keeps the meaning it has in the dict filters of each
+    vector db: JSONB containment in PgVector, and any of its items in ChromaDb, Qdrant and LocalVectorDb. Use `$in`
+    to match any of the items everywhere. All keys of the dict must match.
+
+    Returns:
+        Optional[FilterExpr]: The filter expression, None if there are no filters.
+    """
+    if filters is None or isinstance(filters, FilterExpr):
+        return filters
+
+    expressions: List[FilterExpr] = []
+    for key, value in filters.items():
+        if key in ("$and", "$or"):
+            if not isinstance(value, (list, tuple)):
+                raise ValueError(f"{key} takes a list of filters, got {type(value).__name__}")
+            parsed = [expression for expression in (parse_filters(item) for item in value) if expression is not None]
+            expressions.append(AND(parsed) if key == "$and" else OR(parsed))
+        elif str(key).startswith("$"):
+            raise ValueError(f"Unsupported filter operator: {key}")
+        else:
+            expressions.append(_parse_field(key, value))
+
+    if len(expressions) == 0:
+        return None
+    return expressions[0] if len(expressions) == 1 else AND(expressions)
+
+
+def walk_filters(expression: Optional[FilterExpr]) -> Iterator[FilterExpr]:
+    """Yield the expression and all expressions nested in it."""
+    if expression is None:
+        return
+    yield expression
+    if isinstance(expression, (AND, OR)):
+        for nested in expression.expressions:
+            yield from walk_filters(nested)
@@ -8,12 +8,13 @@ try:
 except ImportError:
     raise ImportError("`lancedb` not installed. Please install using `pip install lancedb`")
 
-from agno.document import Document
+from agno.document import Document, async_embed_documents
 from agno.embedder import Embedder
 from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, logger
 from agno.vectordb.base import VectorDb
 from agno.vectordb.distance import Distance
+from agno.vectordb.quantization import Quantization
 from agno.vectordb.search import SearchType
 
 
@@ -37,6 +38,8 @@ class LanceDb(VectorDb):
         use_tantivy: Whether to use Tantivy for full text search.
         on_bad_vectors: What to do if the vector is bad. One of "error", "drop", "fill", "null".
         fill_value: The value to fill the vector with if on_bad_vectors is "fill".
+        quantization: Index the vectors with int8 scalar quantization (Quantization.int8) when optimizing the table.
+        rescore_factor: With quantization, the number of candidates re-ranked with the full vectors per result.
     """
 
     def __init__(
@@ -56,6 +59,8 @@ class LanceDb(VectorDb):
         use_tantivy: bool = True,
         on_bad_vectors: Optional[str] = None,  # One of "error", "drop", "fill", "null".
         fill_value: Optional[float] = None,  # Only used if on_bad_vectors is "fill"
+        quantization: Optional[Quantization] = None,
+        rescore_factor: int = 4,
     ):
         # Embedder for embedding the document contents
         if embedder is None:
@@ -73,6 +78,12 @@ class LanceDb(VectorDb):
         self.search_type: SearchType = search_type
         # Distance metric
         self.distance: Distance = distance
+        # Quantization of the vector index
+        if quantization is not None and quantization != Quantization.int8:
+            raise ValueError("LanceDb supports Quantization.int8 only")
+        self.quantization: Optional[Quantization] = quantization
+        # Number of candidates re-ranked per result with quantization
+        self.rescore_factor: int = rescore_factor
 
         # LanceDB connection details
         self.uri: lancedb.URI = uri
@@ -144,19 +155,21 @@ class LanceDb(VectorDb):
         """Create the table asynchronously if it does not exist."""
         if not self.exists():
             conn = await self._get_async_connection()
-            schema = self._base_schema()
+            schema = self._base_schema(dimensions=len(await self.embedder.aget_embedding("test")))  # type: ignore
 
             log_debug(f"Creating table asynchronously: {self.table_name}")
             self.async_table = await conn.create_table(self.table_name, schema=schema, mode="overwrite", exist_ok=True)
 
-    def _base_schema(self) -> pa.Schema:
+    def _base_schema(self, dimensions: Optional[int] = None) -> pa.Schema:
+        if dimensions is None:
+            dimensions = len(self.embedder.get_embedding("test"))  # type: ignore
         return pa.schema(
             [
                 pa.field(
                     self._vector_col,
                     pa.list_(
                         pa.float32(),
-                        len(self.embedder.get_embedding("test")),  # type: ignore
+                        dimensions,
                     ),
                 ),
                 pa.field(self._id, pa.string()),
@@ -277,18 +290,17 @@ class LanceDb(VectorDb):
         log_debug(f"Inserting {len(documents)} documents")
         data = []
 
-        # Prepare documents for insertion
-        for document in documents:
-            if await self.async_doc_exists(document):
-                continue
+        new_documents = [document for document in documents if not await self.async_doc_exists(document)]
+        await async_embed_documents(new_documents, self.embedder)
 
+        # Prepare documents for insertion
+        for document in new_documents:
             # Add filters to document metadata if provided
             if filters:
                 meta_data = document.meta_data.copy() if document.meta_data else {}
                 meta_data.update(filters)
                 document.meta_data = meta_data
 
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = str(md5(cleaned_content.encode()).hexdigest())
             payload = {
@@ -336,7 +348,13 @@ class LanceDb(VectorDb):
     async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         await self.async_insert(documents, filters)
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         """
         Search for documents matching the query.
 
@@ -344,6 +362,7 @@ class LanceDb(VectorDb):
             query (str): Query string to search for
             limit (int): Maximum number of results to return
             filters (Optional[Dict[str, Any]]): Filters to apply to the search
+            include_embeddings (bool): Whether to return the vectors of the documents
 
         Returns:
             List[Document]: List of matching documents
@@ -354,11 +373,11 @@ class LanceDb(VectorDb):
         results = None
 
         if self.search_type == SearchType.vector:
-            results = self.vector_search(query, limit)
+            results = self.vector_search(query, limit, include_embeddings)
         elif self.search_type == SearchType.keyword:
-            results = self.keyword_search(query, limit)
+            results = self.keyword_search(query, limit, include_embeddings)
         elif self.search_type == SearchType.hybrid:
-            results = self.hybrid_search(query, limit)
+            results = self.hybrid_search(query, limit, include_embeddings)
         else:
             logger.error(f"Invalid search type '{self.search_type}'.")
             return []
@@ -366,7 +385,7 @@ class LanceDb(VectorDb):
         if results is None:
             return []
 
-        search_results = self._build_search_results(results)
+        search_results = self._build_search_results(results, include_embeddings)
 
         # Filter results based on metadata if filters are provided
         if filters and search_results:
@@ -394,7 +413,11 @@ class LanceDb(VectorDb):
         return search_results
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """
         Asynchronously search for documents matching the query.
@@ -403,6 +426,7 @@ class LanceDb(VectorDb):
             query (str): Query string to search for
             limit (int): Maximum number of results to return
             filters (Optional[Dict[str, Any]]): Filters to apply to the search
+            include_embeddings (bool): Whether to return the vectors of the documents
 
         Returns:
             List[Document]: List of matching documents
@@ -414,11 +438,13 @@ class LanceDb(VectorDb):
         results = None
 
         if self.search_type == SearchType.vector:
-            results = self.vector_search(query, limit)
+            query_embedding = await self.embedder.aget_embedding(query)
+            results = self.vector_search(query, limit, include_embeddings, query_embedding=query_embedding)
         elif self.search_type == SearchType.keyword:
-            results = self.keyword_search(query, limit)
+            results = self.keyword_search(query, limit, include_embeddings)
         elif self.search_type == SearchType.hybrid:
-            results = self.hybrid_search(query, limit)
+            query_embedding = await self.embedder.aget_embedding(query)
+            results = self.hybrid_search(query, limit, include_embeddings, query_embedding=query_embedding)
         else:
             logger.error(f"Invalid search type '{self.search_type}'.")
             return []
@@ -426,7 +452,7 @@ class LanceDb(VectorDb):
         if results is None:
             return []
 
-        search_results = self._build_search_results(results)
+        search_results = self._build_search_results(results, include_embeddings)
 
         # Filter results based on metadata if filters are provided
         if filters and search_results:
@@ -448,13 +474,39 @@ class LanceDb(VectorDb):
             search_results = filtered_results
 
         if self.reranker and search_results:
-            search_results = self.reranker.rerank(query=query, documents=search_results)
+            search_results = await self.reranker.arerank(query=query, documents=search_results)
 
         log_info(f"Found {len(search_results)} documents")
         return search_results
 
-    def vector_search(self, query: str, limit: int = 5) -> List[Document]:
-        query_embedding = self.embedder.get_embedding(query)
+    @property
+    def _metric(self) -> str:
+        return {Distance.cosine: "cosine", Distance.l2: "l2", Distance.max_inner_product: "dot"}[self.distance]
+
+    def _apply_quantization(self, results: Any) -> None:
+        """Search the quantized index with the metric it was built with,
+        and re-rank the candidates with the full vectors."""
+        if self.quantization is None:
+            return
+        results.distance_type(self._metric)
+        results.refine_factor(max(self.rescore_factor, 1))
+
+    def _get_select_columns(self, include_embeddings: bool = False) -> List[str]:
+        """The columns returned by searches. The vector column is only read when it is needed."""
+        columns = [self._id, "payload"]
+        if include_embeddings:
+            columns.append(self._vector_col)
+        return columns
+
+    def vector_search(
+        self,
+        query: str,
+        limit: int = 5,
+        include_embeddings: bool = False,
+        query_embedding: Optional[List[float]] = None,
+    ) -> List[Document]:
+        if query_embedding is None:
+            query_embedding = self.embedder.get_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return None
@@ -463,18 +515,30 @@ class LanceDb(VectorDb):
             logger.error("Table not initialized. Please create the table first")
             return None  # type: ignore
 
-        results = self.table.search(
-            query=query_embedding,
-            vector_column_name=self._vector_col,
-        ).limit(limit)
+        results = (
+            self.table.search(
+                query=query_embedding,
+                vector_column_name=self._vector_col,
+            )
+            .select(self._get_select_columns(include_embeddings))
+            .limit(limit)
+        )
 
         if self.nprobes:
             results.nprobes(self.nprobes)
+        self._apply_quantization(results)
 
         return results.to_pandas()
 
-    def hybrid_search(self, query: str, limit: int = 5) -> List[Document]:
-        query_embedding = self.embedder.get_embedding(query)
+    def hybrid_search(
+        self,
+        query: str,
+        limit: int = 5,
+        include_embeddings: bool = False,
+        query_embedding: Optional[List[float]] = None,
+    ) -> List[Document]:
+        if query_embedding is None:
+            query_embedding = self.embedder.get_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -494,15 +558,17 @@ class LanceDb(VectorDb):
             )
             .vector(query_embedding)
             .text(query)
+            .select(self._get_select_columns(include_embeddings))
             .limit(limit)
         )
 
         if self.nprobes:
             results.nprobes(self.nprobes)
+        self._apply_quantization(results)
 
         return results.to_pandas()
 
-    def keyword_search(self, query: str, limit: int = 5) -> List[Document]:
+    def keyword_search(self, query: str, limit: int = 5, include_embeddings: bool = False) -> List[Document]:
         if self.table is None:
             logger.error("Table not initialized. Please create the table first")
             return []
@@ -511,25 +577,32 @@ class LanceDb(VectorDb):
             self.table.create_fts_index("payload", use_tantivy=self.use_tantivy, replace=True)
             self.fts_index_exists = True
 
-        results = self.table.search(
-            query=query,
-            query_type="fts",
-        ).limit(limit)
+        results = (
+            self.table.search(
+                query=query,
+                query_type="fts",
+            )
+            .select(self._get_select_columns(include_embeddings))
+            .limit(limit)
+        )
 
         return results.to_pandas()
 
-    def _build_search_results(self, results) -> List[Document]:  # TODO: typehint pandas?
+    def _build_search_results(
+        self, results, include_embeddings: bool = False
+    ) -> List[Document]:  # TODO: typehint pandas?
         search_results: List[Document] = []
         try:
             for _, item in results.iterrows():
                 payload = json.loads(item["payload"])
                 search_results.append(
                     Document(
+                        id=item[self._id],
                         name=payload["name"],
                         meta_data=payload["meta_data"],
                         content=payload["content"],
                         embedder=self.embedder,
-                        embedding=item["vector"],
+                        embedding=item[self._vector_col] if include_embeddings else None,
                         usage=payload["usage"],
                     )
                 )
@@ -539,6 +612,29 @@ class LanceDb(VectorDb):
 
         return search_results
 
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """
+        Fetch the stored vectors of documents by id.
+
+        Args:
+            ids (List[str]): The ids of the documents
+
+        Returns:
+            Dict[str, List[float]]: The vector of each document that was found, by id
+        """
+        if len(ids) == 0 or self.table is None:
+            return {}
+        id_list = ", ".join("'" + id_.replace("'", "''") + "'" for id_ in ids)
+        results = (
+            self.table.search()
+            .where(f"{self._id} IN ({id_list})")
+            .select([self._id, self._vector_col])
+            .limit(len(ids))
+            .to_arrow()
+            .to_pylist()
+        )
+        return {row[self._id]: row[self._vector_col] for row in results}
+
     def drop(self) -> None:
         if self.exists():
             log_debug(f"Deleting collection: {self.table_name}")
@@ -575,7 +671,19 @@ class LanceDb(VectorDb):
         return 0
 
     def optimize(self) -> None:
-        pass
+        """Build the quantized vector index. Only used with quantization."""
+        if self.quantization is None or self.table is None:
+            return
+        log_debug(f"Creating IVF_HNSW_SQ index on table: {self.table_name}")
+        try:
+            self.table.create_index(
+                metric=self._metric,
+                vector_column_name=self._vector_col,
+                index_type="IVF_HNSW_SQ",
+                replace=True,
+            )
+        except Exception as e:
+            logger.error(f"Error creating vector index: {e}")
 
     def delete(self) -> bool:
         return False
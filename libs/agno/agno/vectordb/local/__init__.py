@@ -0,0 +1,5 @@
+from agno.vectordb.local.local_db import LocalVectorDb
+
+__all__ = [
+    "LocalVectorDb",
+]
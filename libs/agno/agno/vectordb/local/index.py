@@ -0,0 +1,673 @@
+import math
+import os
+from abc import ABC, abstractmethod
+from heapq import heapify, heappop, heappush
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("`numpy` not installed. Please install using `pip install numpy`")
+
+from agno.utils.log import log_debug
+from agno.vectordb.distance import Distance
+from agno.vectordb.quantization import Quantization
+
+# Filtered searches fall back to an exact scan when less than this fraction of the vectors match the filters
+EXACT_SEARCH_FRACTION = 0.05
+# Number of quantized vectors decoded at once when scoring, which bounds the memory used by a scan
+QUANTIZED_BATCH_SIZE = 8192
+
+
+def _scores_from_dots(dots: np.ndarray, norms: np.ndarray, query_norm: float, distance: Distance) -> np.ndarray:
+    if distance == Distance.cosine:
+        # Zero vectors have a dot product of 0, so they score 0
+        return dots / np.maximum(norms * query_norm, 1e-12)
+    if distance == Distance.l2:
+        # Negative squared euclidean distance: |x - q|^2 = |x|^2 - 2 x.q + |q|^2
+        return -(norms * norms - 2 * dots + query_norm * query_norm)
+    return dots
+
+
+def get_scores(
+    vectors: np.ndarray, norms: np.ndarray, query: np.ndarray, query_norm: float, distance: Distance
+) -> np.ndarray:
+    """Score all vectors against the query. Higher scores are better for every distance metric."""
+    return _scores_from_dots(vectors @ query, norms, query_norm, distance)
+
+
+def quantize(vectors: np.ndarray, quantization: Quantization) -> Tuple[np.ndarray, np.ndarray]:
+    """Compress float32 vectors. Returns the codes and the scale of each vector, which is 1 unless int8."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    scales = np.ones(len(vectors), dtype=np.float32)
+    if quantization == Quantization.half:
+        return vectors.astype(np.float16), scales
+    if quantization == Quantization.int8:
+        # Symmetric quantization with a scale per vector, so no training data is needed
+        max_abs = np.abs(vectors).max(axis=1) if vectors.size > 0 else scales
+        scales = np.where(max_abs > 0, max_abs / 127, 1).astype(np.float32)
+        return np.round(vectors / scales[:, None]).astype(np.int8), scales
+    if quantization == Quantization.binary:
+        return np.packbits(vectors > 0, axis=1), scales
+    raise ValueError(f"Unknown quantization: {quantization}")
+
+
+def get_quantized_scores(
+    codes: np.ndarray,
+    scales: np.ndarray,
+    norms: np.ndarray,
+    query: np.ndarray,
+    query_norm: float,
+    distance: Distance,
+    quantization: Quantization,
+) -> np.ndarray:
+    """Approximate the scores of quantized vectors against the query. Higher scores are better.
+
+    Half and int8 codes are scored like `get_scores`, using the exact norms. Binary codes are scored by the dot
+    product of the full precision query with the signs of the vectors, which only preserves the order of the
+    candidates.
+    """
+    scores = np.empty(len(codes), dtype=np.float32)
+    if quantization == Quantization.binary:
+        for start in range(0, len(codes), QUANTIZED_BATCH_SIZE):
+            bits = np.unpackbits(np.asarray(codes[start : start + QUANTIZED_BATCH_SIZE]), axis=1, count=len(query))
+            # Sum of the query values where the sign is positive minus where it is negative
+            scores[start : start + len(bits)] = 2 * (bits @ query) - query.sum()
+        return scores
+    for start in range(0, len(codes), QUANTIZED_BATCH_SIZE):
+        batch = np.asarray(codes[start : start + QUANTIZED_BATCH_SIZE], dtype=np.float32)
+        scores[start : start + len(batch)] = (batch @ query) * scales[start : start + len(batch)]
+    return _scores_from_dots(scores, norms, query_norm, distance)
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first."""
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k < len(scores):
+        indices = np.argpartition(-scores, k - 1)[:k]
+    else:
+        indices = np.arange(len(scores))
+    return indices[np.argsort(-scores[indices], kind="stable")]
+
+
+class VectorIndex(ABC):
+    """An in-memory approximate nearest neighbour index.
+
+    Vectors are added with integer labels (the row ids of the local vector store) and the index keeps its own
+    copy of them. Removed vectors are only marked as deleted until the index is compacted.
+    """
+
+    index_type: str
+
+    def __init__(self, distance: Distance = Distance.cosine):
+        self.distance: Distance = distance
+        self.dimensions: Optional[int] = None
+        # Number of nodes in the index, including deleted nodes
+        self.size: int = 0
+        self._vectors: np.ndarray = np.empty((0, 0), dtype=np.float32)
+        self._norms: np.ndarray = np.empty(0, dtype=np.float32)
+        self._labels: np.ndarray = np.empty(0, dtype=np.int64)
+        self._deleted: np.ndarray = np.empty(0, dtype=bool)
+        self._nodes: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    @property
+    def labels(self) -> np.ndarray:
+        """Labels of all vectors that are not deleted."""
+        return self._labels[: self.size][~self._deleted[: self.size]]
+
+    @property
+    def deleted_fraction(self) -> float:
+        return 1 - len(self) / self.size if self.size > 0 else 0.0
+
+    def _resize(self, capacity: int) -> None:
+        vectors = np.zeros((capacity, self.dimensions or 0), dtype=np.float32)
+        vectors[: self.size] = self._vectors[: self.size]
+        self._vectors = vectors
+        self._norms = np.resize(self._norms, capacity)
+        self._labels = np.resize(self._labels, capacity)
+        deleted = np.zeros(capacity, dtype=bool)
+        deleted[: self.size] = self._deleted[: self.size]
+        self._deleted = deleted
+
+    def add(self, labels: np.ndarray, vectors: np.ndarray) -> None:
+        """Add vectors to the index, replacing any vectors with the same labels."""
+        if len(labels) == 0:
+            return
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if self.dimensions is None:
+            self.dimensions = vectors.shape[1]
+            self._vectors = np.zeros((0, self.dimensions), dtype=np.float32)
+        self.remove(labels)
+
+        if self.size + len(labels) > len(self._labels):
+            self._resize(max(2 * len(self._labels), self.size + len(labels), 1024))
+        nodes = np.arange(self.size, self.size + len(labels))
+        self._vectors[nodes] = vectors
+        self._norms[nodes] = np.linalg.norm(vectors, axis=1)
+        self._labels[nodes] = labels
+        self._deleted[nodes] = False
+        self.size += len(labels)
+        for node, label in zip(nodes.tolist(), np.asarray(labels).tolist()):
+            self._nodes[label] = node
+        self._index_nodes(nodes)
+
+    def remove(self, labels: np.ndarray) -> None:
+        """Mark the vectors with the given labels as deleted."""
+        for label in np.asarray(labels).tolist():
+            node = self._nodes.pop(label, None)
+            if node is not None:
+                self._deleted[node] = True
+
+    def get_vectors(self, labels: np.ndarray) -> np.ndarray:
+        return self._vectors[[self._nodes[label] for label in np.asarray(labels).tolist()]]
+
+    def _get_scores(self, nodes: np.ndarray, query: np.ndarray, query_norm: float) -> np.ndarray:
+        return get_scores(self._vectors[nodes], self._norms[nodes], query, query_norm, self.distance)
+
+    def _exact_search(
+        self, query: np.ndarray, query_norm: float, k: int, nodes: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        scores = self._get_scores(nodes, query, query_norm)
+        best = top_k(scores, k)
+        return nodes[best], scores[best]
+
+    def search(
+        self, query: np.ndarray, k: int, allowed_labels: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the labels and scores of the (approximately) k best vectors for the query, best first.
+
+        Args:
+            query: The query vector.
+            k: The number of results to return.
+            allowed_labels: If set, only vectors with these labels are returned.
+        """
+        if len(self) == 0 or k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        query = np.asarray(query, dtype=np.float32)
+        query_norm = float(np.linalg.norm(query))
+
+        valid: Optional[np.ndarray] = None
+        if allowed_labels is not None:
+            valid = np.isin(self._labels[: self.size], allowed_labels) & ~self._deleted[: self.size]
+        elif len(self) < self.size:
+            valid = ~self._deleted[: self.size]
+
+        if valid is not None:
+            num_valid = int(np.count_nonzero(valid))
+            if num_valid == 0:
+                return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+            # A small subset is faster to scan than to find in the index
+            if num_valid <= k or num_valid < EXACT_SEARCH_FRACTION * self.size:
+                nodes, scores = self._exact_search(query, query_norm, k, np.flatnonzero(valid))
+                return self._labels[nodes], scores
+
+        nodes, scores = self._search(query, query_norm, k, valid)
+        return self._labels[nodes], scores
+
+    @abstractmethod
+    def _index_nodes(self, nodes: np.ndarray) -> None:
+        """Add the nodes, whose vectors are already stored, to the index structure."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _search(
+        self, query: np.ndarray, query_norm: float, k: int, valid: Optional[np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the nodes and scores of the best k valid nodes. `valid` is None if all nodes are valid."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_params(self) -> Dict[str, Any]:
+        """The parameters that the index structure depends on. A saved index is only loaded if they match."""
+        raise NotImplementedError
+
+    def get_search_params(self) -> Dict[str, Any]:
+        """The parameters that only affect searches."""
+        return {}
+
+    def _reset(self) -> None:
+        self.__init__(**self.get_params(), **self.get_search_params(), seed=getattr(self, "seed", None))  # type: ignore[misc]
+
+    def compact(self) -> None:
+        """Rebuild the index without the deleted vectors."""
+        if len(self) == self.size:
+            return
+        labels = self.labels
+        vectors = self._vectors[: self.size][~self._deleted[: self.size]]
+        log_debug(f"Rebuilding {self.index_type} index with {len(labels)} vectors")
+        self._reset()
+        self.add(labels, vectors)
+
+    def _get_state(self) -> Dict[str, np.ndarray]:
+        return {
+            "vectors": self._vectors[: self.size],
+            "labels": self._labels[: self.size],
+            "deleted": self._deleted[: self.size],
+        }
+
+    def _set_state(self, state: Dict[str, np.ndarray]) -> None:
+        vectors = state["vectors"]
+        self.size = len(vectors)
+        self.dimensions = vectors.shape[1] if self.size > 0 else None
+        self._vectors = np.array(vectors, dtype=np.float32)
+        self._norms = np.linalg.norm(self._vectors, axis=1).astype(np.float32)
+        self._labels = np.array(state["labels"], dtype=np.int64)
+        self._deleted = np.array(state["deleted"], dtype=bool)
+        self._nodes = {
+            label: node
+            for node, (label, deleted) in enumerate(zip(self._labels.tolist(), self._deleted.tolist()))
+            if not deleted
+        }
+
+    def save(self, file: Path) -> None:
+        """Save the index to a file."""
+        state = self._get_state()
+        state["index_type"] = np.array(self.index_type)
+        for key, value in self.get_params().items():
+            state[f"param_{key}"] = np.array(value.value if isinstance(value, Distance) else value)
+        # Write to a temporary file first, so a crash never leaves a partially written index
+        tmp_file = file.with_suffix(".tmp")
+        with open(tmp_file, "wb") as f:
+            np.savez(f, **state)
+        os.replace(tmp_file, file)
+
+    def load(self, file: Path) -> bool:
+        """Load the index from a file. Returns False if the file holds a different kind of index."""
+        with np.load(file) as data:
+            if str(data["index_type"]) != self.index_type:
+                return False
+            for key, value in self.get_params().items():
+                expected = value.value if isinstance(value, Distance) else value
+                if f"param_{key}" not in data or data[f"param_{key}"].item() != expected:
+                    return False
+            self._set_state({key: data[key] for key in data.files})
+        return True
+
+
+class HnswIndex(VectorIndex):
+    """A Hierarchical Navigable Small World graph.
+
+    Args:
+        distance: The distance metric.
+        m: The number of neighbours of each node (twice as many on the bottom layer).
+        ef_construction: The number of candidates considered when inserting a node.
+        ef_search: The number of candidates considered when searching. Searches use at least `k`.
+        seed: Seed for the random choice of node levels.
+    """
+
+    index_type = "hnsw"
+
+    def __init__(
+        self,
+        distance: Distance = Distance.cosine,
+        m: int = 16,
+        ef_construction: int = 200,
+        ef_search: int = 40,
+        seed: Optional[int] = None,
+    ):
+        super().__init__(distance=distance)
+        self.m: int = m
+        self.ef_construction: int = ef_construction
+        self.ef_search: int = ef_search
+        self.seed: Optional[int] = seed
+        self._max_m0: int = 2 * m
+        self._level_multiplier: float = 1 / math.log(max(m, 2))
+        self._rng = np.random.default_rng(seed)
+        # Neighbours on the bottom layer, padded with -1
+        self._layer0: np.ndarray = np.empty((0, self._max_m0), dtype=np.int32)
+        # Neighbours on the upper layers, by node
+        self._upper_layers: List[Dict[int, List[int]]] = []
+        self._entry_point: int = -1
+
+    def get_params(self) -> Dict[str, Any]:
+        return {"distance": self.distance, "m": self.m, "ef_construction": self.ef_construction}
+
+    def get_search_params(self) -> Dict[str, Any]:
+        return {"ef_search": self.ef_search}
+
+    def _resize(self, capacity: int) -> None:
+        super()._resize(capacity)
+        layer0 = np.full((capacity, self._max_m0), -1, dtype=np.int32)
+        layer0[: len(self._layer0)] = self._layer0[:capacity]
+        self._layer0 = layer0
+
+    def _neighbors(self, node: int, level: int) -> List[int]:
+        if level == 0:
+            row = self._layer0[node]
+            return row[row >= 0].tolist()
+        return self._upper_layers[level - 1].get(node, [])
+
+    def _set_neighbors(self, node: int, level: int, neighbors: List[int]) -> None:
+        if level == 0:
+            self._layer0[node] = -1
+            self._layer0[node, : len(neighbors)] = neighbors
+        else:
+            self._upper_layers[level - 1][node] = neighbors
+
+    def _search_layer(
+        self, query: np.ndarray, query_norm: float, entry_points: List[Tuple[float, int]], ef: int, level: int
+    ) -> List[Tuple[float, int]]:
+        """Return the ef nodes closest to the query on a layer, as (distance, node) sorted by distance."""
+        visited = {node for _, node in entry_points}
+        candidates = list(entry_points)
+        heapify(candidates)
+        # Max heap of the best results found so far
+        results = [(-distance, node) for distance, node in entry_points]
+        heapify(results)
+        while len(results) > ef:
+            heappop(results)
+
+        while candidates:
+            distance, node = heappop(candidates)
+            if distance > -results[0][0] and len(results) >= ef:
+                break
+            new_nodes = [neighbor for neighbor in self._neighbors(node, level) if neighbor not in visited]
+            if not new_nodes:
+                continue
+            visited.update(new_nodes)
+            distances = (-self._get_scores(np.array(new_nodes), query, query_norm)).tolist()
+            furthest = -results[0][0]
+            for neighbor_distance, neighbor in zip(distances, new_nodes):
+                if len(results) < ef or neighbor_distance < furthest:
+                    heappush(candidates, (neighbor_distance, neighbor))
+                    heappush(results, (-neighbor_distance, neighbor))
+                    if len(results) > ef:
+                        heappop(results)
+                    furthest = -results[0][0]
+        return sorted((-distance, node) for distance, node in results)
+
+    def _get_pairwise_distances(self, nodes: np.ndarray) -> np.ndarray:
+        vectors = self._vectors[nodes]
+        norms = self._norms[nodes]
+        dots = vectors @ vectors.T
+        if self.distance == Distance.cosine:
+            return -dots / np.maximum(np.outer(norms, norms), 1e-12)
+        if self.distance == Distance.l2:
+            squared_norms = norms * norms
+            return squared_norms[:, None] + squared_norms[None, :] - 2 * dots
+        return -dots
+
+    def _select_neighbors(self, candidates: List[Tuple[float, int]], max_neighbors: int) -> List[int]:
+        """Select neighbours from candidates sorted by distance, skipping candidates that are closer to an already
+        selected neighbour than to the base node. This keeps edges pointing in different directions."""
+        if len(candidates) <= max_neighbors:
+            return [node for _, node in candidates]
+        # Only the closest candidates are considered, which bounds the cost of each insert
+        candidates = candidates[: 3 * max_neighbors]
+        nodes = np.array([node for _, node in candidates])
+        pairwise_distances = self._get_pairwise_distances(nodes).tolist()
+        selected: List[int] = []
+        for i, (distance, _) in enumerate(candidates):
+            distances = pairwise_distances[i]
+            if all(distances[j] >= distance for j in selected):
+                selected.append(i)
+                if len(selected) == max_neighbors:
+                    break
+        # Fill up with the closest skipped candidates, so nodes stay well connected
+        if len(selected) < max_neighbors:
+            chosen = set(selected)
+            selected += [i for i in range(len(candidates)) if i not in chosen][: max_neighbors - len(selected)]
+        return nodes[selected].tolist()
+
+    def _connect(self, node: int, new_neighbor: int, level: int) -> None:
+        neighbors = self._neighbors(node, level)
+        max_neighbors = self._max_m0 if level == 0 else self.m
+        if len(neighbors) < max_neighbors:
+            self._set_neighbors(node, level, neighbors + [new_neighbor])
+            return
+        candidates = np.array(neighbors + [new_neighbor])
+        distances = -self._get_scores(candidates, self._vectors[node], float(self._norms[node]))
+        order = np.argsort(distances, kind="stable")
+        self._set_neighbors(
+            node,
+            level,
+            self._select_neighbors([(distances[i], int(candidates[i])) for i in order], max_neighbors),
+        )
+
+    def _greedy_search(self, query: np.ndarray, query_norm: float, to_level: int) -> List[Tuple[float, int]]:
+        """Descend from the entry point to `to_level`, keeping the single closest node on each layer."""
+        entry_point = self._entry_point
+        distance = float(-self._get_scores(np.array([entry_point]), query, query_norm)[0])
+        closest = [(distance, entry_point)]
+        for level in range(len(self._upper_layers), to_level, -1):
+            closest = self._search_layer(query, query_norm, closest, 1, level)
+        return closest
+
+    def _index_nodes(self, nodes: np.ndarray) -> None:
+        for node in nodes.tolist():
+            self._insert(node)
+
+    def _insert(self, node: int) -> None:
+        level = int(-math.log(1.0 - self._rng.random()) * self._level_multiplier)
+        self._layer0[node] = -1
+        if self._entry_point < 0:
+            self._entry_point = node
+            for _ in range(level):
+                self._upper_layers.append({node: []})
+            return
+
+        query = self._vectors[node]
+        query_norm = float(self._norms[node])
+        max_level = len(self._upper_layers)
+        entry_points = self._greedy_search(query, query_norm, level)
+        for layer in range(min(level, max_level), -1, -1):
+            candidates = self._search_layer(query, query_norm, entry_points, self.ef_construction, layer)
+            neighbors = self._select_neighbors(candidates, self.m)
+            self._set_neighbors(node, layer, neighbors)
+            for neighbor in neighbors:
+                self._connect(neighbor, node, layer)
+            entry_points = candidates
+
+        if level > max_level:
+            for _ in range(max_level, level):
+                self._upper_layers.append({node: []})
+            self._entry_point = node
+
+    def _search(
+        self, query: np.ndarray, query_norm: float, k: int, valid: Optional[np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        ef = max(self.ef_search, k)
+        if valid is not None:
+            # Search wider when only some of the nodes can be returned
+            ef = min(int(ef * self.size / np.count_nonzero(valid)), self.size)
+        entry_points = self._greedy_search(query, query_norm, 0)
+        results = self._search_layer(query, query_norm, entry_points, ef, 0)
+        if valid is not None:
+            results = [(distance, node) for distance, node in results if valid[node]]
+        results = results[:k]
+        return (
+            np.array([node for _, node in results], dtype=np.int64),
+            np.array([-distance for distance, _ in results], dtype=np.float32),
+        )
+
+    def _get_state(self) -> Dict[str, np.ndarray]:
+        state = super()._get_state()
+        state["layer0"] = self._layer0[: self.size]
+        state["entry_point"] = np.array(self._entry_point)
+        for level, layer in enumerate(self._upper_layers, start=1):
+            nodes = list(layer.keys())
+            state[f"layer{level}_nodes"] = np.array(nodes, dtype=np.int32)
+            state[f"layer{level}_counts"] = np.array([len(layer[node]) for node in nodes], dtype=np.int32)
+            state[f"layer{level}_neighbors"] = np.array(
+                [neighbor for node in nodes for neighbor in layer[node]], dtype=np.int32
+            )
+        return state
+
+    def _set_state(self, state: Dict[str, np.ndarray]) -> None:
+        super()._set_state(state)
+        self._layer0 = np.array(state["layer0"], dtype=np.int32).reshape(-1, self._max_m0)
+        self._entry_point = int(state["entry_point"])
+        self._upper_layers = []
+        level = 1
+        while f"layer{level}_nodes" in state:
+            nodes = state[f"layer{level}_nodes"].tolist()
+            offsets = np.cumsum(state[f"layer{level}_counts"]).tolist()
+            neighbors = state[f"layer{level}_neighbors"].tolist()
+            self._upper_layers.append(
+                {node: neighbors[start:end] for node, start, end in zip(nodes, [0] + offsets[:-1], offsets)}
+            )
+            level += 1
+
+
+class IvfFlatIndex(VectorIndex):
+    """An inverted file index. Vectors are clustered around centroids with k-means, and a search only scans the
+    clusters with the centroids closest to the query.
+
+    Until there are enough vectors to train the centroids, searches scan all vectors. The centroids are retrained
+    each time the number of vectors doubles.
+
+    Args:
+        distance: The distance metric.
+        lists: The number of clusters.
+        probes: The number of clusters scanned by a search.
+        dynamic_lists: Set the number of clusters from the number of vectors, the same way as PgVector:
+            one per 1000 vectors up to 1M vectors, and the square root of the number of vectors above that.
+        seed: Seed for the k-means initialization.
+    """
+
+    index_type = "ivfflat"
+
+    # Minimum number of vectors per cluster before the centroids are trained
+    min_vectors_per_list = 39
+    max_iterations = 10
+
+    def __init__(
+        self,
+        distance: Distance = Distance.cosine,
+        lists: int = 100,
+        probes: int = 10,
+        dynamic_lists: bool = True,
+        seed: Optional[int] = None,
+    ):
+        super().__init__(distance=distance)
+        self.lists: int = lists
+        self.probes: int = probes
+        self.dynamic_lists: bool = dynamic_lists
+        self.seed: Optional[int] = seed
+        self._rng = np.random.default_rng(seed)
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments: np.ndarray = np.empty(0, dtype=np.int32)
+        self._members: List[np.ndarray] = []
+        self._trained_size: int = 0
+
+    def get_params(self) -> Dict[str, Any]:
+        return {"distance": self.distance, "lists": self.lists, "dynamic_lists": self.dynamic_lists}
+
+    def get_search_params(self) -> Dict[str, Any]:
+        return {"probes": self.probes}
+
+    def _resize(self, capacity: int) -> None:
+        super()._resize(capacity)
+        self._assignments = np.resize(self._assignments, capacity)
+
+    def _get_num_lists(self, num_vectors: int) -> int:
+        if not self.dynamic_lists:
+            return self.lists
+        if num_vectors < 1000000:
+            return max(num_vectors // 1000, 1)
+        return max(int(math.sqrt(num_vectors)), 1)
+
+    def _assign(self, vectors: np.ndarray, batch_size: int = 8192) -> np.ndarray:
+        """Return the closest centroid for each vector."""
+        assert self._centroids is not None
+        centroid_norms = np.linalg.norm(self._centroids, axis=1)
+        assignments = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), batch_size):
+            dots = vectors[start : start + batch_size] @ self._centroids.T
+            if self.distance == Distance.cosine:
+                scores = dots / np.maximum(centroid_norms, 1e-12)
+            elif self.distance == Distance.l2:
+                scores = 2 * dots - centroid_norms * centroid_norms
+            else:
+                scores = dots
+            assignments[start : start + batch_size] = np.argmax(scores, axis=1)
+        return assignments
+
+    def _train(self) -> None:
+        """Cluster the vectors with k-means, on a sample of at most 256 vectors per cluster."""
+        alive = np.flatnonzero(~self._deleted[: self.size])
+        num_lists = min(self._get_num_lists(len(alive)), len(alive))
+        sample = alive
+        if len(sample) > num_lists * 256:
+            sample = self._rng.choice(alive, num_lists * 256, replace=False)
+        vectors = self._vectors[sample]
+        if self.distance == Distance.cosine:
+            vectors = vectors / np.maximum(self._norms[sample], 1e-12)[:, None]
+
+        self._centroids = vectors[self._rng.choice(len(vectors), num_lists, replace=False)].copy()
+        for _ in range(self.max_iterations):
+            assignments = self._assign(vectors)
+            sums = np.zeros_like(self._centroids)
+            np.add.at(sums, assignments, vectors)
+            counts = np.bincount(assignments, minlength=num_lists)
+            non_empty = counts > 0
+            self._centroids[non_empty] = sums[non_empty] / counts[non_empty, None]
+
+        self._assignments[: self.size] = -1
+        self._assignments[alive] = self._assign(self._vectors[alive])
+        order = np.argsort(self._assignments[alive], kind="stable")
+        boundaries = np.searchsorted(self._assignments[alive][order], np.arange(num_lists + 1))
+        self._members = [alive[order[boundaries[i] : boundaries[i + 1]]] for i in range(num_lists)]
+        self._trained_size = len(alive)
+        log_debug(f"Trained ivfflat index with {num_lists} lists on {len(sample)} vectors")
+
+    def _index_nodes(self, nodes: np.ndarray) -> None:
+        num_alive = len(self)
+        if self._centroids is None:
+            if num_alive >= self._get_num_lists(num_alive) * self.min_vectors_per_list:
+                self._train()
+            return
+        if num_alive >= 2 * self._trained_size:
+            self._train()
+            return
+        assignments = self._assign(self._vectors[nodes])
+        self._assignments[nodes] = assignments
+        for cluster in np.unique(assignments).tolist():
+            self._members[cluster] = np.concatenate([self._members[cluster], nodes[assignments == cluster]])
+
+    def _search(
+        self, query: np.ndarray, query_norm: float, k: int, valid: Optional[np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        if self._centroids is None:
+            nodes = np.flatnonzero(valid) if valid is not None else np.arange(self.size)
+            return self._exact_search(query, query_norm, k, nodes)
+
+        centroid_scores = get_scores(
+            self._centroids, np.linalg.norm(self._centroids, axis=1), query, query_norm, self.distance
+        )
+        clusters = np.argsort(-centroid_scores, kind="stable")
+        probes = min(self.probes, len(clusters))
+        while True:
+            candidates = np.concatenate([self._members[cluster] for cluster in clusters[:probes]])
+            if valid is not None:
+                candidates = candidates[valid[candidates]]
+            # Scan more clusters if the probed clusters do not have enough results
+            if len(candidates) >= k or probes == len(clusters):
+                break
+            probes = min(2 * probes, len(clusters))
+        return self._exact_search(query, query_norm, k, candidates)
+
+    def _get_state(self) -> Dict[str, np.ndarray]:
+        state = super()._get_state()
+        state["trained_size"] = np.array(self._trained_size)
+        if self._centroids is not None:
+            state["centroids"] = self._centroids
+            state["assignments"] = self._assignments[: self.size]
+        return state
+
+    def _set_state(self, state: Dict[str, np.ndarray]) -> None:
+        super()._set_state(state)
+        self._trained_size = int(state["trained_size"])
+        self._centroids = None
+        self._assignments = np.full(self.size, -1, dtype=np.int32)
+        self._members = []
+        if "centroids" in state:
+            self._centroids = np.array(state["centroids"], dtype=np.float32)
+            self._assignments = np.array(state["assignments"], dtype=np.int32)
+            alive = np.flatnonzero(~self._deleted[: self.size])
+            self._members = [alive[self._assignments[alive] == i] for i in range(len(self._centroids))]
@@ -0,0 +1,941 @@
+import asyncio
+import json
+import os
+import shutil
+import sqlite3
+from dataclasses import dataclass, replace
+from pathlib import Path
+from threading import RLock
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("`numpy` not installed. Please install using `pip install numpy`")
+
+from agno.document import Document, async_embed_documents
+from agno.embedder import Embedder
+from agno.reranker.base import Reranker
+from agno.utils.log import log_debug, log_info, logger
+from agno.utils.string import safe_content_hash
+from agno.vectordb.base import VectorDb
+from agno.vectordb.distance import Distance
+from agno.vectordb.filters import AND, EQ, IN, OR, RANGE, FilterExpr, parse_filters
+from agno.vectordb.index import HNSW, Ivfflat
+from agno.vectordb.local.index import (
+    HnswIndex,
+    IvfFlatIndex,
+    VectorIndex,
+    get_quantized_scores,
+    get_scores,
+    quantize,
+    top_k,
+)
+from agno.vectordb.quantization import Quantization
+
+_SEGMENT_PREFIX = "segment_"
+# Minimum number of changes to the index before it is saved. Saving writes the whole index.
+INDEX_SAVE_INTERVAL = 100
+
+
+@dataclass
+class Segment:
+    """An immutable file of embeddings, memory-mapped from disk."""
+
+    number: int
+    # float32 embeddings, one row per document
+    vectors: np.ndarray
+    # L2 norm of each embedding
+    norms: np.ndarray
+    # Row id (in the metadata database) of each embedding, -1 once the document is deleted
+    row_ids: np.ndarray
+    # Quantized embeddings and the scale of each one, only with quantization
+    codes: Optional[np.ndarray] = None
+    scales: Optional[np.ndarray] = None
+
+    @property
+    def alive(self) -> np.ndarray:
+        return self.row_ids >= 0
+
+    @property
+    def num_alive(self) -> int:
+        return int(np.count_nonzero(self.row_ids >= 0))
+
+
+class LocalVectorDb(VectorDb):
+    """
+    Vector database stored in a local directory, with no server to run.
+
+    Embeddings are stored as float32 in append-only, memory-mapped `.npy` segments. Document contents and
+    metadata are stored in SQLite. Without a `vector_index`, search is exact: the query is scored against every
+    embedding with a matrix-vector product and the top results are selected with `argpartition`.
+
+    With a `vector_index`, search uses an in-memory approximate nearest neighbour index, configured with the same
+    `HNSW` and `Ivfflat` settings as PgVector. The index is updated on every insert, saved to the collection
+    directory, and brought up to date with the segments when the collection is opened.
+
+    With `quantization`, exact search scans a compressed copy of each segment (half, int8 or binary codes) and
+    re-ranks the best `limit * rescore_factor` candidates with their float32 embeddings.
+
+    Deleted and updated documents leave unused rows in their segment. Segments are compacted into one once there
+    are more than `max_segments`, or more than `compaction_threshold` of the rows are unused.
+
+    Args:
+        collection: The name of the collection. Stored in a directory of the same name under `path`.
+        path: The directory to store collections in.
+        embedder: The embedder to use when embedding the document contents.
+        distance: The distance metric to use when searching for documents.
+        reranker: The reranker to use when reranking documents.
+        max_segments: The number of segments after which segments are compacted.
+        compaction_threshold: The fraction of unused rows after which segments are compacted.
+        vector_index: The approximate nearest neighbour index to search with. None searches exactly.
+        quantization: Scan quantized embeddings in exact search. Cannot be combined with a vector_index.
+        rescore_factor: With quantization, the number of candidates re-ranked per requested result.
+    """
+
+    def __init__(
+        self,
+        collection: str,
+        path: str = "tmp/localdb",
+        embedder: Optional[Embedder] = None,
+        distance: Distance = Distance.cosine,
+        reranker: Optional[Reranker] = None,
+        max_segments: int = 16,
+        compaction_threshold: float = 0.3,
+        vector_index: Optional[Union[HNSW, Ivfflat]] = None,
+        quantization: Optional[Quantization] = None,
+        rescore_factor: int = 4,
+    ):
+        # Collection attributes
+        self.collection_name: str = collection
+        self.path: Path = Path(path)
+        self.collection_path: Path = self.path / collection
+
+        # Embedder for embedding the document contents
+        if embedder is None:
+            from agno.embedder.openai import OpenAIEmbedder
+
+            embedder = OpenAIEmbedder()
+            log_info("Embedder not provided, using OpenAIEmbedder as default.")
+        self.embedder: Embedder = embedder
+        self.dimensions: Optional[int] = self.embedder.dimensions
+
+        # Distance metric
+        self.distance: Distance = distance
+
+        # Reranker instance
+        self.reranker: Optional[Reranker] = reranker
+
+        # Compaction settings
+        self.max_segments: int = max_segments
+        self.compaction_threshold: float = compaction_threshold
+
+        # Approximate nearest neighbour index
+        self.vector_index: Optional[Union[HNSW, Ivfflat]] = vector_index
+
+        # Quantization of the embeddings scanned by exact search
+        if quantization is not None and vector_index is not None:
+            raise ValueError("quantization applies to exact search and cannot be combined with a vector_index")
+        self.quantization: Optional[Quantization] = quantization
+        # Number of candidates re-ranked per result with quantization
+        self.rescore_factor: int = rescore_factor
+
+        self._lock = RLock()
+        self._connection: Optional[sqlite3.Connection] = None
+        # Segments are loaded on first use
+        self._segments: Optional[List[Segment]] = None
+        # The index is loaded on first use
+        self._index: Optional[VectorIndex] = None
+        # Number of changes to the index since it was last saved
+        self._unsaved_index_changes: int = 0
+
+    @property
+    def db_file(self) -> Path:
+        return self.collection_path / "metadata.db"
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.collection_path.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(self.db_file), check_same_thread=False)
+            self._connection.row_factory = sqlite3.Row
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        return self._connection
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        self._segments = None
+        self._index = None
+
+    def create(self) -> None:
+        """Create the collection if it does not exist."""
+        with self._lock:
+            log_debug(f"Creating collection: {self.collection_name}")
+            self.connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS documents (
+                    row_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id TEXT NOT NULL UNIQUE,
+                    name TEXT,
+                    content TEXT,
+                    content_hash TEXT,
+                    meta_data TEXT,
+                    usage TEXT,
+                    segment INTEGER NOT NULL,
+                    offset INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_documents_name ON documents (name);
+                CREATE INDEX IF NOT EXISTS idx_documents_content_hash ON documents (content_hash);
+                CREATE TABLE IF NOT EXISTS collection (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+                """
+            )
+            stored_distance = self._get_setting("distance")
+            if stored_distance is None:
+                self._set_setting("distance", self.distance.value)
+            elif stored_distance != self.distance.value:
+                logger.warning(
+                    f"Collection {self.collection_name} was created with distance '{stored_distance}', using it instead of '{self.distance.value}'"
+                )
+                self.distance = Distance(stored_distance)
+            stored_dimensions = self._get_setting("dimensions")
+            if stored_dimensions is not None:
+                self.dimensions = int(stored_dimensions)
+            self.connection.commit()
+
+    async def async_create(self) -> None:
+        """Create the collection asynchronously by running in a thread."""
+        await asyncio.to_thread(self.create)
+
+    def _get_setting(self, key: str) -> Optional[str]:
+        row = self.connection.execute("SELECT value FROM collection WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row is not None else None
+
+    def _set_setting(self, key: str, value: str) -> None:
+        self.connection.execute("INSERT OR REPLACE INTO collection (key, value) VALUES (?, ?)", (key, value))
+
+    def _segment_file(self, number: int) -> Path:
+        return self.collection_path / f"{_SEGMENT_PREFIX}{number:06d}.npy"
+
+    def _norms_file(self, number: int) -> Path:
+        return self.collection_path / f"{_SEGMENT_PREFIX}{number:06d}_norms.npy"
+
+    def _codes_file(self, number: int) -> Path:
+        return self.collection_path / f"{_SEGMENT_PREFIX}{number:06d}_{self.quantization.value}.npy"  # type: ignore
+
+    def _scales_file(self, number: int) -> Path:
+        return self.collection_path / f"{_SEGMENT_PREFIX}{number:06d}_{self.quantization.value}_scales.npy"  # type: ignore
+
+    def _segment_files(self) -> Dict[int, List[Path]]:
+        """All segment files in the collection directory, by segment number."""
+        files: Dict[int, List[Path]] = {}
+        if not self.collection_path.exists():
+            return files
+        for file in self.collection_path.glob(f"{_SEGMENT_PREFIX}*.npy"):
+            try:
+                number = int(file.stem[len(_SEGMENT_PREFIX) :].split("_")[0])
+            except ValueError:
+                continue
+            files.setdefault(number, []).append(file)
+        return files
+
+    @staticmethod
+    def _save_array(file: Path, array: np.ndarray) -> None:
+        # Write to a temporary file first, so a crash never leaves a partially written segment
+        tmp_file = file.with_suffix(".tmp")
+        with open(tmp_file, "wb") as f:
+            np.save(f, array)
+        os.replace(tmp_file, file)
+
+    def _write_segment(self, vectors: np.ndarray) -> int:
+        numbers = self._segment_files().keys()
+        number = max(numbers) + 1 if numbers else 1
+        self._save_array(self._norms_file(number), np.linalg.norm(vectors, axis=1).astype(np.float32))
+        if self.quantization is not None:
+            self._write_codes(number, vectors)
+        self._save_array(self._segment_file(number), vectors)
+        return number
+
+    def _write_codes(self, number: int, vectors: np.ndarray) -> None:
+        codes, scales = quantize(vectors, self.quantization)  # type: ignore
+        self._save_array(self._scales_file(number), scales)
+        self._save_array(self._codes_file(number), codes)
+
+    def _with_codes(self, segment: Segment) -> Segment:
+        """Memory-map the quantized embeddings of a segment, quantizing them if the segment has none yet."""
+        if self.quantization is None:
+            return segment
+        if not self._codes_file(segment.number).exists() or not self._scales_file(segment.number).exists():
+            log_debug(f"Quantizing segment {segment.number}")
+            self._write_codes(segment.number, np.asarray(segment.vectors))
+        codes = np.load(self._codes_file(segment.number), mmap_mode="r")
+        scales = np.load(self._scales_file(segment.number), mmap_mode="r")
+        return replace(segment, codes=codes, scales=scales)
+
+    def _open_segment(self, number: int) -> Tuple[np.ndarray, np.ndarray]:
+        vectors = np.load(self._segment_file(number), mmap_mode="r")
+        norms = np.load(self._norms_file(number), mmap_mode="r")
+        return vectors, norms
+
+    def _load_segments(self) -> List[Segment]:
+        """Memory-map all segments that hold documents. Only the row ids are read into memory."""
+        if self._segments is not None:
+            return self._segments
+        with self._lock:
+            if self._segments is not None:
+                return self._segments
+            if not self.exists():
+                return []
+            rows = self.connection.execute("SELECT row_id, segment, offset FROM documents").fetchall()
+            locations = np.array([tuple(row) for row in rows], dtype=np.int64).reshape(-1, 3)
+            segments: List[Segment] = []
+            for number in np.unique(locations[:, 1]):
+                vectors, norms = self._open_segment(int(number))
+                in_segment = locations[locations[:, 1] == number]
+                row_ids = np.full(len(vectors), -1, dtype=np.int64)
+                row_ids[in_segment[:, 2]] = in_segment[:, 0]
+                segments.append(
+                    self._with_codes(Segment(number=int(number), vectors=vectors, norms=norms, row_ids=row_ids))
+                )
+            self._segments = segments
+            log_debug(f"Loaded {len(segments)} segments with {len(locations)} documents")
+            return segments
+
+    @property
+    def index_file(self) -> Path:
+        return self.collection_path / "index.npz"
+
+    def _create_index(self) -> VectorIndex:
+        if isinstance(self.vector_index, Ivfflat):
+            return IvfFlatIndex(
+                distance=self.distance,
+                lists=self.vector_index.lists,
+                probes=self.vector_index.probes,
+                dynamic_lists=self.vector_index.dynamic_lists,
+            )
+        if isinstance(self.vector_index, HNSW):
+            return HnswIndex(
+                distance=self.distance,
+                m=self.vector_index.m,
+                ef_construction=self.vector_index.ef_construction,
+                ef_search=self.vector_index.ef_search,
+            )
+        raise ValueError(f"Unknown index type: {type(self.vector_index)}")
+
+    def _load_index(self) -> Optional[VectorIndex]:
+        """Load the saved index and bring it up to date with the segments."""
+        if self.vector_index is None:
+            return None
+        if self._index is not None:
+            return self._index
+        with self._lock:
+            if self._index is not None:
+                return self._index
+            segments = self._load_segments()
+            index = self._create_index()
+            if self.index_file.exists():
+                try:
+                    if not index.load(self.index_file):
+                        log_info(f"Index settings changed, rebuilding the index of collection: {self.collection_name}")
+                        index = self._create_index()
+                except Exception as e:
+                    logger.warning(f"Error loading index, rebuilding it: {e}")
+                    index = self._create_index()
+
+            # Catch up with changes that were not saved to the index
+            alive_row_ids = [segment.row_ids[segment.alive] for segment in segments]
+            alive = np.concatenate(alive_row_ids) if alive_row_ids else np.empty(0, dtype=np.int64)
+            stale = np.setdiff1d(index.labels, alive)
+            missing = np.setdiff1d(alive, index.labels)
+            index.remove(stale)
+            if len(missing) > 0:
+                log_debug(f"Adding {len(missing)} embeddings to the index")
+                for segment in segments:
+                    in_segment = np.isin(segment.row_ids, missing)
+                    if in_segment.any():
+                        index.add(segment.row_ids[in_segment], np.asarray(segment.vectors[in_segment]))
+            self._index = index
+            if len(stale) > 0 or len(missing) > 0:
+                self._save_index()
+            return index
+
+    def _save_index(self) -> None:
+        if self._index is not None and self.collection_path.exists():
+            self._index.save(self.index_file)
+            self._unsaved_index_changes = 0
+
+    def _record_index_changes(self, num_changes: int) -> None:
+        """Save the index once enough changes were made. Changes that were not saved are replayed from the
+        segments when the index is loaded."""
+        if self._index is None:
+            return
+        self._unsaved_index_changes += num_changes
+        if self._unsaved_index_changes >= max(INDEX_SAVE_INTERVAL, len(self._index) // 10):
+            self._save_index()
+
+    def _prepare_documents(
+        self, documents: List[Document], filters: Optional[Dict[str, Any]] = None, embed: bool = True
+    ) -> List[Tuple[Dict[str, Any], List[float]]]:
+        """Embed the documents, unless they are already embedded, and return the records to store."""
+        records: List[Tuple[Dict[str, Any], List[float]]] = []
+        seen_ids = set()
+        for document in documents:
+            try:
+                if embed:
+                    document.embed(embedder=self.embedder)
+                if document.embedding is None:
+                    logger.error(f"Error getting embedding for document: {document.name}")
+                    continue
+                content_hash = safe_content_hash(document.content)
+                _id = document.id or content_hash
+                if _id in seen_ids:
+                    continue
+                seen_ids.add(_id)
+
+                meta_data = document.meta_data.copy() if document.meta_data else {}
+                if filters:
+                    meta_data.update(filters)
+
+                record = {
+                    "id": _id,
+                    "name": document.name,
+                    "content": document.content.replace("\x00", "\ufffd"),
+                    "content_hash": content_hash,
+                    "meta_data": json.dumps(meta_data, default=str),
+                    "usage": json.dumps(document.usage, default=str) if document.usage is not None else None,
+                }
+                records.append((record, document.embedding))
+                log_debug(f"Prepared document: {_id} | {document.name} | {meta_data}")
+            except Exception as e:
+                logger.error(f"Error processing document '{document.name}': {e}")
+        return records
+
+    def _append(self, records: List[Tuple[Dict[str, Any], List[float]]]) -> None:
+        """Write the embeddings to a new segment and the records to the metadata database."""
+        if len(records) == 0:
+            return
+        vectors = np.asarray([embedding for _, embedding in records], dtype=np.float32)
+        if vectors.ndim != 2:
+            raise ValueError("All embeddings must have the same dimensions")
+        if self.dimensions is None:
+            self.dimensions = vectors.shape[1]
+        if vectors.shape[1] != self.dimensions:
+            raise ValueError(f"Expected embeddings with {self.dimensions} dimensions, got {vectors.shape[1]}")
+
+        segments = self._load_segments()
+        index = self._load_index()
+        number = self._write_segment(vectors)
+        with self.connection:
+            self._set_setting("dimensions", str(self.dimensions))
+            cursor = self.connection.executemany(
+                "INSERT INTO documents (id, name, content, content_hash, meta_data, usage, segment, offset) "
+                "VALUES (:id, :name, :content, :content_hash, :meta_data, :usage, :segment, :offset)",
+                [{**record, "segment": number, "offset": offset} for offset, (record, _) in enumerate(records)],
+            )
+            log_debug(f"Committed {cursor.rowcount} documents to segment {number}")
+        row_ids = self.connection.execute(
+            "SELECT row_id, offset FROM documents WHERE segment = ?", (number,)
+        ).fetchall()
+        segment_row_ids = np.full(len(vectors), -1, dtype=np.int64)
+        for row in row_ids:
+            segment_row_ids[row["offset"]] = row["row_id"]
+        vectors_mmap, norms_mmap = self._open_segment(number)
+        self._segments = segments + [
+            self._with_codes(Segment(number=number, vectors=vectors_mmap, norms=norms_mmap, row_ids=segment_row_ids))
+        ]
+        if index is not None:
+            index.add(segment_row_ids, vectors)
+            self._record_index_changes(len(vectors))
+        self._maybe_compact()
+
+    def _remove_rows(self, where: str, params: Tuple = ()) -> int:
+        """Delete documents from the metadata database and mark their embeddings as unused."""
+        with self._lock:
+            segments = self._load_segments()
+            rows = self.connection.execute(
+                f"SELECT row_id, segment, offset FROM documents WHERE {where}", params
+            ).fetchall()
+            if len(rows) == 0:
+                return 0
+            with self.connection:
+                self.connection.execute(f"DELETE FROM documents WHERE {where}", params)
+            removed: Dict[int, List[int]] = {}
+            for row in rows:
+                removed.setdefault(row["segment"], []).append(row["offset"])
+            # Copy on write, so that concurrent searches see a consistent segment
+            updated_segments = []
+            for segment in segments:
+                if segment.number in removed:
+                    row_ids = segment.row_ids.copy()
+                    row_ids[removed[segment.number]] = -1
+                    segment = replace(segment, row_ids=row_ids)
+                updated_segments.append(segment)
+            self._segments = updated_segments
+            if self._index is not None:
+                self._index.remove(np.array([row["row_id"] for row in rows], dtype=np.int64))
+                self._record_index_changes(len(rows))
+            return len(rows)
+
+    def _maybe_compact(self) -> None:
+        segments = self._segments or []
+        total = sum(len(segment.row_ids) for segment in segments)
+        unused = total - sum(segment.num_alive for segment in segments)
+        if len(segments) > self.max_segments or (total > 0 and unused / total > self.compaction_threshold):
+            self.compact()
+
+    def compact(self) -> None:
+        """Merge all segments into one, dropping the embeddings of deleted documents, and save the index."""
+        with self._lock:
+            if not self.exists():
+                return
+            self._compact_segments()
+            if self._index is not None:
+                if self._index.deleted_fraction > self.compaction_threshold:
+                    self._index.compact()
+                self._save_index()
+
+    def _compact_segments(self) -> None:
+        with self._lock:
+            segments = self._load_segments()
+            if len(segments) <= 1 and all(segment.num_alive == len(segment.row_ids) for segment in segments):
+                return
+            log_debug(f"Compacting {len(segments)} segments in collection: {self.collection_name}")
+            alive_vectors = [np.asarray(segment.vectors[segment.alive]) for segment in segments]
+            alive_row_ids = [segment.row_ids[segment.alive] for segment in segments]
+            row_ids = np.concatenate(alive_row_ids) if alive_row_ids else np.empty(0, dtype=np.int64)
+
+            new_segments: List[Segment] = []
+            if len(row_ids) > 0:
+                vectors = np.concatenate(alive_vectors).astype(np.float32, copy=False)
+                number = self._write_segment(vectors)
+                with self.connection:
+                    self.connection.executemany(
+                        "UPDATE documents SET segment = ?, offset = ? WHERE row_id = ?",
+                        [(number, offset, int(row_id)) for offset, row_id in enumerate(row_ids)],
+                    )
+                vectors_mmap, norms_mmap = self._open_segment(number)
+                new_segments.append(
+                    self._with_codes(Segment(number=number, vectors=vectors_mmap, norms=norms_mmap, row_ids=row_ids))
+                )
+            self._segments = new_segments
+
+            # Remove segment files that are no longer used, including any left over from an interrupted write
+            used = {segment.number for segment in new_segments}
+            for number, files in self._segment_files().items():
+                if number not in used:
+                    for file in files:
+                        file.unlink(missing_ok=True)
+
+    def doc_exists(self, document: Document) -> bool:
+        """Check if a document with the same content exists in the collection."""
+        if not self.exists():
+            return False
+        content_hash = safe_content_hash(document.content)
+        row = self.connection.execute(
+            "SELECT 1 FROM documents WHERE content_hash = ? LIMIT 1", (content_hash,)
+        ).fetchone()
+        return row is not None
+
+    async def async_doc_exists(self, document: Document) -> bool:
+        """Check if a document exists asynchronously by running in a thread."""
+        return await asyncio.to_thread(self.doc_exists, document)
+
+    def name_exists(self, name: str) -> bool:
+        """Check if a document with the given name exists in the collection."""
+        if not self.exists():
+            return False
+        row = self.connection.execute("SELECT 1 FROM documents WHERE name = ? LIMIT 1", (name,)).fetchone()
+        return row is not None
+
+    async def async_name_exists(self, name: str) -> bool:
+        """Check if a document with the given name exists asynchronously by running in a thread."""
+        return await asyncio.to_thread(self.name_exists, name)
+
+    def id_exists(self, id: str) -> bool:
+        """Check if a document with the given id exists in the collection."""
+        if not self.exists():
+            return False
+        row = self.connection.execute("SELECT 1 FROM documents WHERE id = ? LIMIT 1", (id,)).fetchone()
+        return row is not None
+
+    def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Insert documents into the collection. Documents with an id that already exists are skipped.
+
+        Args:
+            documents (List[Document]): List of documents to insert
+            filters (Optional[Dict[str, Any]]): Filters to merge with document metadata
+        """
+        log_debug(f"Inserting {len(documents)} documents")
+        self._insert_records(self._prepare_documents(documents, filters))
+
+    def _insert_records(self, records: List[Tuple[Dict[str, Any], List[float]]]) -> None:
+        with self._lock:
+            if not self.exists():
+                self.create()
+            ids = [record["id"] for record, _ in records]
+            existing = set()
+            for i in range(0, len(ids), 500):
+                batch = ids[i : i + 500]
+                placeholders = ",".join("?" * len(batch))
+                existing.update(
+                    row["id"]
+                    for row in self.connection.execute(f"SELECT id FROM documents WHERE id IN ({placeholders})", batch)
+                )
+            self._append([(record, embedding) for record, embedding in records if record["id"] not in existing])
+
+    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Embed documents concurrently, then insert them in a thread."""
+        log_debug(f"Inserting {len(documents)} documents")
+        await async_embed_documents(documents, self.embedder)
+        records = self._prepare_documents(documents, filters, embed=False)
+        await asyncio.to_thread(self._insert_records, records)
+
+    def upsert_available(self) -> bool:
+        return True
+
+    def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Insert documents into the collection, replacing documents with the same id.
+
+        Args:
+            documents (List[Document]): List of documents to upsert
+            filters (Optional[Dict[str, Any]]): Filters to merge with document metadata
+        """
+        log_debug(f"Upserting {len(documents)} documents")
+        self._upsert_records(self._prepare_documents(documents, filters))
+
+    def _upsert_records(self, records: List[Tuple[Dict[str, Any], List[float]]]) -> None:
+        with self._lock:
+            if not self.exists():
+                self.create()
+            ids = [record["id"] for record, _ in records]
+            for i in range(0, len(ids), 500):
+                batch = tuple(ids[i : i + 500])
+                self._remove_rows(f"id IN ({','.join('?' * len(batch))})", batch)
+            self._append(records)
+
+    async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Embed documents concurrently, then upsert them in a thread."""
+        log_debug(f"Upserting {len(documents)} documents")
+        await async_embed_documents(documents, self.embedder)
+        records = self._prepare_documents(documents, filters, embed=False)
+        await asyncio.to_thread(self._upsert_records, records)
+
+    def _get_filter_row_ids(self, filters: Union[Dict[str, Any], FilterExpr]) -> np.ndarray:
+        """Return the row ids of documents whose metadata matches the filters.
+
+        A list value matches any of its items, None matches a missing key, and any other value must be equal.
+        Filters are compiled to a SQLite query on the metadata, so ranges and $and/$or are evaluated by SQLite.
+        """
+        expression = parse_filters(filters)
+        params: List[Any] = []
+        where = self._compile_filter(expression, params) if expression is not None else "1"
+        rows = self.connection.execute(f"SELECT row_id FROM documents WHERE {where}", params)
+        return np.fromiter((row["row_id"] for row in rows), dtype=np.int64)
+
+    def _compile_filter(self, expression: FilterExpr, params: List[Any]) -> str:
+        """Compile a filter expression to a SQLite condition, appending its parameters to params."""
+        if isinstance(expression, (AND, OR)):
+            if len(expression.expressions) == 0:
+                return "1" if isinstance(expression, AND) else "0"
+            separator = " AND " if isinstance(expression, AND) else " OR "
+            return "(" + separator.join(self._compile_filter(nested, params) for nested in expression.expressions) + ")"
+
+        path = "$." + json.dumps(str(expression.key))  # type: ignore
+        if isinstance(expression, EQ) and isinstance(expression.value, list):
+            # A list value in dict filters matches any of its items
+            expression = IN(expression.key, expression.value)
+        if isinstance(expression, IN):
+            if len(expression.values) == 0:
+                return "0"
+            params.append(path)
+            params.extend(expression.values)
+            return f"json_extract(meta_data, ?) IN ({','.join('?' * len(expression.values))})"
+        if isinstance(expression, RANGE):
+            comparisons = {"gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+            conditions = []
+            for name, bound in expression.bounds.items():
+                conditions.append(f"json_extract(meta_data, ?) {comparisons[name]} ?")
+                params.extend([path, bound])
+            return "(" + " AND ".join(conditions) + ")" if conditions else "1"
+        if isinstance(expression, EQ):
+            if expression.value is None:
+                params.append(path)
+                return "json_extract(meta_data, ?) IS NULL"
+            if isinstance(expression.value, dict):
+                params.extend([path, json.dumps(expression.value)])
+                return "json(json_extract(meta_data, ?)) = json(?)"
+            params.extend([path, expression.value])
+            return "json_extract(meta_data, ?) = ?"
+        raise ValueError(f"Unsupported filter expression: {expression}")
+
+    def search_by_embedding(
+        self,
+        embedding: List[float],
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
+        """Return the documents with the embeddings closest to the given embedding."""
+        segments = self._load_segments()
+        if len(segments) == 0 or limit <= 0:
+            return []
+
+        query = np.asarray(embedding, dtype=np.float32)
+        if self.dimensions is not None and query.shape[0] != self.dimensions:
+            logger.error(f"Expected a query embedding with {self.dimensions} dimensions, got {query.shape[0]}")
+            return []
+        query_norm = float(np.linalg.norm(query))
+
+        allowed_row_ids = self._get_filter_row_ids(filters) if filters else None
+
+        index = self._load_index()
+        if index is not None:
+            with self._lock:
+                row_ids, _ = index.search(query, limit, allowed_labels=allowed_row_ids)
+                vectors = index.get_vectors(row_ids) if include_embeddings else [None] * len(row_ids)
+                matches = list(zip(row_ids.tolist(), vectors))
+            return self._get_documents(matches)
+
+        # Select the best candidates in each segment, then the best overall
+        candidate_scores: List[np.ndarray] = []
+        candidate_locations: List[Tuple[Segment, np.ndarray]] = []
+        for segment in segments:
+            mask = segment.alive
+            if allowed_row_ids is not None:
+                mask = mask & np.isin(segment.row_ids, allowed_row_ids)
+            if not mask.any():
+                continue
+            num_valid = int(np.count_nonzero(mask))
+            if segment.codes is not None and segment.scales is not None:
+                scores = get_quantized_scores(
+                    segment.codes,
+                    segment.scales,
+                    segment.norms,
+                    query,
+                    query_norm,
+                    self.distance,
+                    self.quantization,  # type: ignore
+                )
+                scores = np.where(mask, scores, -np.inf)
+                candidates = top_k(scores, min(limit * max(self.rescore_factor, 1), num_valid))
+                # Re-rank the candidates with their full precision embeddings
+                candidates = np.sort(candidates)
+                exact_scores = get_scores(
+                    np.asarray(segment.vectors[candidates]), segment.norms[candidates], query, query_norm, self.distance
+                )
+                best_candidates = top_k(exact_scores, min(limit, len(candidates)))
+                candidate_scores.append(exact_scores[best_candidates])
+                candidate_locations.append((segment, candidates[best_candidates]))
+                continue
+            scores = get_scores(segment.vectors, segment.norms, query, query_norm, self.distance)
+            scores = np.where(mask, scores, -np.inf)
+            best = top_k(scores, min(limit, num_valid))
+            candidate_scores.append(scores[best])
+            candidate_locations.append((segment, best))
+        if len(candidate_scores) == 0:
+            return []
+
+        all_scores = np.concatenate(candidate_scores)
+        all_locations = [(segment, int(offset)) for segment, offsets in candidate_locations for offset in offsets]
+        results = [all_locations[i] for i in top_k(all_scores, min(limit, len(all_scores)))]
+        return self._get_documents(
+            [
+                (int(segment.row_ids[offset]), segment.vectors[offset] if include_embeddings else None)
+                for segment, offset in results
+            ]
+        )
+
+    def _get_documents(self, matches: List[Tuple[int, Optional[np.ndarray]]]) -> List[Document]:
+        """Build documents from (row id, embedding) pairs, in order."""
+        if len(matches) == 0:
+            return []
+        row_ids = [row_id for row_id, _ in matches]
+        placeholders = ",".join("?" * len(row_ids))
+        rows = {
+            row["row_id"]: row
+            for row in self.connection.execute(
+                f"SELECT row_id, id, name, content, meta_data, usage FROM documents WHERE row_id IN ({placeholders})",
+                row_ids,
+            )
+        }
+
+        search_results: List[Document] = []
+        for row_id, embedding in matches:
+            row = rows.get(row_id)
+            # The document was deleted after the search started
+            if row is None:
+                continue
+            search_results.append(
+                Document(
+                    id=row["id"],
+                    name=row["name"],
+                    meta_data=json.loads(row["meta_data"]) if row["meta_data"] else {},
+                    content=row["content"],
+                    embedder=self.embedder,
+                    embedding=embedding.tolist() if embedding is not None else None,
+                    usage=json.loads(row["usage"]) if row["usage"] else None,
+                )
+            )
+        return search_results
+
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
+        """Search the collection for a query.
+
+        Args:
+            query (str): Query to search for.
+            limit (int): Number of results to return.
+            filters (Optional[Dict[str, Any]]): Metadata filters. A list value matches any of its items.
+            include_embeddings (bool): Whether to return the embeddings of the documents.
+        Returns:
+            List[Document]: List of search results.
+        """
+        query_embedding = self.embedder.get_embedding(query)
+        if query_embedding is None:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+
+        search_results = self.search_by_embedding(
+            query_embedding, limit=limit, filters=filters, include_embeddings=include_embeddings
+        )
+
+        if self.reranker and search_results:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+
+        log_info(f"Found {len(search_results)} documents")
+        return search_results
+
+    async def async_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
+        """Embed the query asynchronously, then search in a thread."""
+        query_embedding = await self.embedder.aget_embedding(query)
+        if query_embedding is None:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+
+        search_results = await asyncio.to_thread(
+            self.search_by_embedding, query_embedding, limit, filters, include_embeddings
+        )
+
+        if self.reranker and search_results:
+            search_results = await self.reranker.arerank(query=query, documents=search_results)
+
+        log_info(f"Found {len(search_results)} documents")
+        return search_results
+
+    def vector_search(self, query: str, limit: int = 5, include_embeddings: bool = False) -> List[Document]:
+        return self.search(query, limit=limit, include_embeddings=include_embeddings)
+
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """Return the stored embeddings of the documents with the given ids."""
+        if not self.exists() or len(ids) == 0:
+            return {}
+        embeddings: Dict[str, List[float]] = {}
+        with self._lock:
+            segments = {segment.number: segment for segment in self._load_segments()}
+            for i in range(0, len(ids), 500):
+                batch = tuple(ids[i : i + 500])
+                for row in self.connection.execute(
+                    f"SELECT id, segment, offset FROM documents WHERE id IN ({','.join('?' * len(batch))})", batch
+                ):
+                    segment = segments.get(row["segment"])
+                    if segment is not None:
+                        embeddings[row["id"]] = segment.vectors[row["offset"]].tolist()
+        return embeddings
+
+    async def async_get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        return await asyncio.to_thread(self.get_embeddings, ids)
+
+    def delete_by_id(self, id: str) -> bool:
+        """Delete the document with the given id."""
+        return self._delete_where("id = ?", (id,))
+
+    def delete_by_name(self, name: str) -> bool:
+        """Delete all documents with the given name."""
+        return self._delete_where("name = ?", (name,))
+
+    def delete_by_metadata(self, metadata: Dict[str, Any]) -> bool:
+        """Delete all documents whose metadata matches the given filters."""
+        if not self.exists() or not metadata:
+            return False
+        row_ids = tuple(int(row_id) for row_id in self._get_filter_row_ids(metadata))
+        deleted = False
+        for i in range(0, len(row_ids), 500):
+            batch = row_ids[i : i + 500]
+            deleted = self._delete_where(f"row_id IN ({','.join('?' * len(batch))})", batch) or deleted
+        return deleted
+
+    def _delete_where(self, where: str, params: Tuple) -> bool:
+        if not self.exists():
+            return False
+        with self._lock:
+            deleted = self._remove_rows(where, params)
+            if deleted > 0:
+                self._maybe_compact()
+            return deleted > 0
+
+    def drop(self) -> None:
+        """Delete the collection and all its files."""
+        with self._lock:
+            if self.exists():
+                log_debug(f"Deleting collection: {self.collection_name}")
+            self._close()
+            shutil.rmtree(self.collection_path, ignore_errors=True)
+
+    async def async_drop(self) -> None:
+        """Drop the collection asynchronously by running in a thread."""
+        await asyncio.to_thread(self.drop)
+
+    def exists(self) -> bool:
+        """Check if the collection exists."""
+        return self.db_file.exists()
+
+    async def async_exists(self) -> bool:
+        """Check if the collection exists asynchronously by running in a thread."""
+        return await asyncio.to_thread(self.exists)
+
+    def get_count(self) -> int:
+        """Get the number of documents in the collection."""
+        if not self.exists():
+            return 0
+        return self.connection.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def optimize(self) -> None:
+        self.compact()
+
+    def delete(self) -> bool:
+        """Delete all documents, keeping the collection."""
+        if not self.exists():
+            return False
+        try:
+            with self._lock:
+                with self.connection:
+                    self.connection.execute("DELETE FROM documents")
+                self._segments = []
+                for files in self._segment_files().values():
+                    for file in files:
+                        file.unlink(missing_ok=True)
+                self._index = None
+                self.index_file.unlink(missing_ok=True)
+            return True
+        except Exception as e:
+            logger.error(f"Error clearing collection: {e}")
+            return False
+
+    def __deepcopy__(self, memo):
+        # The copy shares the collection files, so it shares the lock and loaded segments as well
+        return self
@@ -9,7 +9,7 @@ try:
 except ImportError:
     raise ImportError("The `pymilvus` package is not installed. Please install it via `pip install pymilvus`.")
 
-from agno.document import Document
+from agno.document import Document, async_embed_documents
 from agno.embedder import Embedder
 from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, logger
@@ -413,13 +413,13 @@ class Milvus(VectorDb):
     async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """Insert documents asynchronously based on search type."""
         log_debug(f"Inserting {len(documents)} documents asynchronously")
+        await async_embed_documents(documents, self.embedder)
 
         if self.search_type == SearchType.hybrid:
             await asyncio.gather(*[self._async_insert_hybrid_document(doc) for doc in documents])
         else:
 
             async def process_document(document):
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 doc_id = md5(cleaned_content.encode()).hexdigest()
 
@@ -484,9 +484,9 @@ class Milvus(VectorDb):
 
     async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         log_debug(f"Upserting {len(documents)} documents asynchronously")
+        await async_embed_documents(documents, self.embedder)
 
         async def process_document(document):
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             data = {
@@ -518,7 +518,24 @@ class Milvus(VectorDb):
         """
         return MILVUS_DISTANCE_MAP.get(self.distance, "COSINE")
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    @property
+    def _vector_field(self) -> str:
+        return "dense_vector" if self.search_type == SearchType.hybrid else "vector"
+
+    def _get_output_fields(self, include_embeddings: bool = False) -> List[str]:
+        """The fields returned by searches. The vector field is only returned when it is needed."""
+        output_fields = ["name", "content", "meta_data", "usage"]
+        if include_embeddings:
+            output_fields.append(self._vector_field)
+        return output_fields
+
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         """
         Search for documents matching the query.
 
@@ -526,12 +543,13 @@ class Milvus(VectorDb):
             query (str): Query string to search for
             limit (int): Maximum number of results to return
             filters (Optional[Dict[str, Any]]): Filters to apply to the search
+            include_embeddings (bool): Whether to return the vectors of the documents
 
         Returns:
             List[Document]: List of matching documents
         """
         if self.search_type == SearchType.hybrid:
-            return self.hybrid_search(query, limit)
+            return self.hybrid_search(query, limit, include_embeddings=include_embeddings)
 
         query_embedding = self.embedder.get_embedding(query)
         if query_embedding is None:
@@ -542,7 +560,7 @@ class Milvus(VectorDb):
             collection_name=self.collection,
             data=[query_embedding],
             filter=self._build_expr(filters),
-            output_fields=["*"],
+            output_fields=self._get_output_fields(include_embeddings),
             limit=limit,
         )
 
@@ -565,12 +583,16 @@ class Milvus(VectorDb):
         return search_results
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
+        query_embedding = await self.embedder.aget_embedding(query)
         if self.search_type == SearchType.hybrid:
-            return self.hybrid_search(query, limit, filters)
+            return self.hybrid_search(query, limit, filters, include_embeddings, query_embedding=query_embedding)
 
-        query_embedding = self.embedder.get_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -579,7 +601,7 @@ class Milvus(VectorDb):
             collection_name=self.collection,
             data=[query_embedding],
             filter=self._build_expr(filters),
-            output_fields=["*"],
+            output_fields=self._get_output_fields(include_embeddings),
             limit=limit,
         )
 
@@ -601,7 +623,14 @@ class Milvus(VectorDb):
         log_info(f"Found {len(search_results)} documents")
         return search_results
 
-    def hybrid_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def hybrid_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+        query_embedding: Optional[List[float]] = None,
+    ) -> List[Document]:
         """
         Perform a hybrid search combining dense and sparse vector similarity.
 
@@ -609,6 +638,8 @@ class Milvus(VectorDb):
             query (str): Query string to search for
             limit (int): Maximum number of results to return
             filters (Optional[Dict[str, Any]]): Filters to apply to the search
+            include_embeddings (bool): Whether to return the dense vectors of the documents
+            query_embedding (Optional[List[float]]): The dense embedding of the query, computed if not given
 
         Returns:
             List[Document]: List of matching documents
@@ -616,7 +647,7 @@ class Milvus(VectorDb):
         from pymilvus import AnnSearchRequest, RRFRanker
 
         # Get query embeddings
-        dense_vector = self.embedder.get_embedding(query)
+        dense_vector = query_embedding if query_embedding is not None else self.embedder.get_embedding(query)
         sparse_vector = self._get_sparse_vector(query)
 
         if dense_vector is None:
@@ -657,7 +688,11 @@ class Milvus(VectorDb):
 
             log_info("Performing hybrid search")
             results = self._client.hybrid_search(
-                collection_name=self.collection, reqs=reqs, ranker=ranker, limit=limit, output_fields=["*"]
+                collection_name=self.collection,
+                reqs=reqs,
+                ranker=ranker,
+                limit=limit,
+                output_fields=self._get_output_fields(include_embeddings),
             )
 
             # Build search results
@@ -691,6 +726,25 @@ class Milvus(VectorDb):
             logger.error(f"Error during hybrid search: {e}")
             return []
 
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """
+        Fetch the stored vectors of documents by id.
+
+        Args:
+            ids (List[str]): The ids of the documents
+
+        Returns:
+            Dict[str, List[float]]: The vector of each document that was found, by id
+        """
+        if len(ids) == 0:
+            return {}
+        results = self.client.get(collection_name=self.collection, ids=ids, output_fields=[self._vector_field])
+        return {
+            result["id"]: list(result[self._vector_field])
+            for result in results
+            if result.get(self._vector_field) is not None
+        }
+
     def drop(self) -> None:
         if self.exists():
             log_debug(f"Deleting collection: {self.collection}")
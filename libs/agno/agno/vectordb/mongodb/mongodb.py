@@ -4,7 +4,7 @@ from typing import Any, Dict, List, Optional
 
 from bson import ObjectId
 
-from agno.document import Document
+from agno.document import Document, async_embed_documents
 from agno.embedder import Embedder
 from agno.utils.log import log_debug, log_info, log_warning, logger
 from agno.vectordb.base import VectorDb
@@ -531,11 +531,16 @@ class MongoDb(VectorDb):
         return True
 
     def search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, min_score: float = 0.0
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        min_score: float = 0.0,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """Search for documents using vector similarity."""
         if self.search_type == SearchType.hybrid:
-            return self.hybrid_search(query, limit=limit, filters=filters)
+            return self.hybrid_search(query, limit=limit, filters=filters, include_embeddings=include_embeddings)
 
         query_embedding = self.embedder.get_embedding(query)
         if query_embedding is None:
@@ -564,6 +569,7 @@ class MongoDb(VectorDb):
                             "name": 1,
                             "content": 1,
                             "meta_data": 1,
+                            **({"embedding": 1} if include_embeddings else {}),
                         }
                     },
                 ]
@@ -575,6 +581,7 @@ class MongoDb(VectorDb):
                         name=doc.get("name"),
                         content=doc["content"],
                         meta_data={**doc.get("meta_data", {}), "score": doc.get("similarityScore", 0.0)},
+                        embedding=doc.get("embedding"),
                     )
                     for doc in results
                 ]
@@ -622,7 +629,8 @@ class MongoDb(VectorDb):
                 if match_filters:
                     pipeline.append({"$match": match_filters})  # type: ignore
 
-                pipeline.append({"$project": {"embedding": 0}})
+                if not include_embeddings:
+                    pipeline.append({"$project": {"embedding": 0}})
 
                 results = list(collection.aggregate(pipeline))  # type: ignore
 
@@ -635,6 +643,7 @@ class MongoDb(VectorDb):
                         name=clean_doc.get("name"),
                         content=clean_doc["content"],
                         meta_data={**clean_doc.get("meta_data", {}), "score": clean_doc.get("score", 0.0)},
+                        embedding=clean_doc.get("embedding"),
                     )
                     docs.append(document)
 
@@ -645,12 +654,28 @@ class MongoDb(VectorDb):
                 logger.error(f"Error during search: {e}")
                 raise
 
-    def vector_search(self, query: str, limit: int = 5) -> List[Document]:
+    def vector_search(self, query: str, limit: int = 5, include_embeddings: bool = False) -> List[Document]:
         """Perform a vector-based search."""
         log_debug("Performing vector search.")
-        return self.search(query, limit=limit)
+        return self.search(query, limit=limit, include_embeddings=include_embeddings)
+
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """Fetch the stored embeddings of documents by id."""
+        if len(ids) == 0:
+            return {}
+        collection = self._get_collection()
+        cursor = collection.find({"_id": {"$in": ids}}, {"_id": 1, "embedding": 1})
+        return {str(doc["_id"]): doc["embedding"] for doc in cursor if doc.get("embedding") is not None}
+
+    def _add_embeddings(self, documents: List[Document]) -> List[Document]:
+        """Set the embeddings of documents returned by a search that does not read them."""
+        embeddings = self.get_embeddings([document.id for document in documents if document.id is not None])
+        for document in documents:
+            if document.id is not None:
+                document.embedding = embeddings.get(document.id)
+        return documents
 
-    def keyword_search(self, query: str, limit: int = 5) -> List[Document]:
+    def keyword_search(self, query: str, limit: int = 5, include_embeddings: bool = False) -> List[Document]:
         """Perform a keyword-based search."""
         try:
             collection = self._get_collection()
@@ -668,6 +693,8 @@ class MongoDb(VectorDb):
                 for doc in cursor
             ]
             log_debug(f"Keyword search completed. Found {len(results)} documents.")
+            if include_embeddings:
+                results = self._add_embeddings(results)
             return results
         except Exception as e:
             logger.error(f"Error during keyword search: {e}")
@@ -678,6 +705,7 @@ class MongoDb(VectorDb):
         query: str,
         limit: int = 5,
         filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """
         Perform a hybrid search combining vector and keyword-based searches using Reciprocal Rank Fusion.
@@ -837,6 +865,8 @@ class MongoDb(VectorDb):
                 docs.append(document)
 
             log_info(f"Hybrid search completed. Found {len(docs)} documents.")
+            if include_embeddings:
+                docs = self._add_embeddings(docs)
             return docs
         except errors.OperationFailure as e:
             logger.error(
@@ -914,9 +944,12 @@ class MongoDb(VectorDb):
         # Return True if collection doesn't exist (nothing to delete)
         return True
 
-    def prepare_doc(self, document: Document, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Prepare a document for insertion or upsertion into MongoDB."""
-        document.embed(embedder=self.embedder)
+    def prepare_doc(
+        self, document: Document, filters: Optional[Dict[str, Any]] = None, embed: bool = True
+    ) -> Dict[str, Any]:
+        """Prepare a document for insertion or upsertion into MongoDB. Set `embed` to False if it is already embedded."""
+        if embed:
+            document.embed(embedder=self.embedder)
         if document.embedding is None:
             raise ValueError(f"Failed to generate embedding for document: {document.id}")
 
@@ -966,11 +999,12 @@ class MongoDb(VectorDb):
         """Insert documents asynchronously."""
         log_debug(f"Inserting {len(documents)} documents asynchronously")
         collection = await self._get_async_collection()
+        await async_embed_documents(documents, self.embedder)
 
         prepared_docs = []
         for document in documents:
             try:
-                doc_data = self.prepare_doc(document, filters)
+                doc_data = self.prepare_doc(document, filters, embed=False)
                 prepared_docs.append(doc_data)
             except ValueError as e:
                 logger.error(f"Error preparing document '{document.name}': {e}")
@@ -990,10 +1024,11 @@ class MongoDb(VectorDb):
         """Upsert documents asynchronously."""
         log_info(f"Upserting {len(documents)} documents asynchronously")
         collection = await self._get_async_collection()
+        await async_embed_documents(documents, self.embedder)
 
         for document in documents:
             try:
-                doc_data = self.prepare_doc(document)
+                doc_data = self.prepare_doc(document, embed=False)
                 await collection.update_one(
                     {"_id": doc_data["_id"]},
                     {"$set": doc_data},
@@ -1004,10 +1039,14 @@ class MongoDb(VectorDb):
                 logger.error(f"Error upserting document '{document.name}' asynchronously: {e}")
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """Search for documents asynchronously."""
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = await self.embedder.aget_embedding(query)
         if query_embedding is None:
             logger.error(f"Failed to generate embedding for query: {query}")
             return []
@@ -1040,7 +1079,8 @@ class MongoDb(VectorDb):
 
                 pipeline.append({"$match": mongo_filters})
 
-            pipeline.append({"$project": {"embedding": 0}})
+            if not include_embeddings:
+                pipeline.append({"$project": {"embedding": 0}})
 
             # With AsyncMongoClient, aggregate() returns a coroutine that resolves to a cursor
             # We need to await it first to get the cursor
@@ -1059,6 +1099,7 @@ class MongoDb(VectorDb):
                     name=doc.get("name"),
                     content=doc["content"],
                     meta_data={**doc.get("meta_data", {}), "score": doc.get("score", 0.0)},
+                    embedding=doc.get("embedding"),
                 )
                 for doc in results
             ]
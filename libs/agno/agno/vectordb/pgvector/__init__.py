@@ -1,6 +1,7 @@
 from agno.vectordb.distance import Distance
 from agno.vectordb.pgvector.index import HNSW, Ivfflat
 from agno.vectordb.pgvector.pgvector import PgVector
+from agno.vectordb.quantization import Quantization
 from agno.vectordb.search import SearchType
 
 __all__ = [
@@ -8,5 +9,6 @@ __all__ = [
     "HNSW",
     "Ivfflat",
     "PgVector",
+    "Quantization",
     "SearchType",
 ]
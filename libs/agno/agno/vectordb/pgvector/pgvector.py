@@ -1,31 +1,50 @@
 import asyncio
+import operator
+import re
 from math import sqrt
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Dict, List, Optional, Set, Union, cast
 
 try:
     from sqlalchemy.dialects import postgresql
     from sqlalchemy.engine import Engine, create_engine
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session, scoped_session, sessionmaker
-    from sqlalchemy.schema import Column, Index, MetaData, Table
-    from sqlalchemy.sql.expression import bindparam, desc, func, select, text
-    from sqlalchemy.types import DateTime, String
+    from sqlalchemy.schema import Column, Computed, Index, MetaData, Table
+    from sqlalchemy.sql.expression import (
+        and_,
+        bindparam,
+        case,
+        desc,
+        false,
+        func,
+        literal,
+        literal_column,
+        or_,
+        select,
+        text,
+        true,
+        union_all,
+    )
+    from sqlalchemy.sql.expression import cast as sql_cast
+    from sqlalchemy.types import DateTime, Float, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install using `pip install sqlalchemy psycopg`")
 
 try:
-    from pgvector.sqlalchemy import Vector
+    from pgvector.sqlalchemy import BIT, HALFVEC, Vector
 except ImportError:
     raise ImportError("`pgvector` not installed. Please install using `pip install pgvector`")
 
-from agno.document import Document
+from agno.document import Document, async_embed_documents
 from agno.embedder import Embedder
 from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, logger
 from agno.utils.string import safe_content_hash
 from agno.vectordb.base import VectorDb
 from agno.vectordb.distance import Distance
+from agno.vectordb.filters import AND, EQ, IN, OR, RANGE, FilterExpr, parse_filters, walk_filters
 from agno.vectordb.pgvector.index import HNSW, Ivfflat
+from agno.vectordb.quantization import Quantization
 from agno.vectordb.search import SearchType
 
 
@@ -50,9 +69,14 @@ class PgVector(VectorDb):
         prefix_match: bool = False,
         vector_score_weight: float = 0.5,
         content_language: str = "english",
-        schema_version: int = 1,
+        schema_version: int = 2,
         auto_upgrade_schema: bool = False,
         reranker: Optional[Reranker] = None,
+        hybrid_candidates: int = 40,
+        rrf_k: int = 60,
+        quantization: Optional[Quantization] = None,
+        rescore_factor: int = 4,
+        filter_index_threshold: Optional[int] = None,
     ):
         """
         Initialize the PgVector instance.
@@ -69,8 +93,20 @@ class PgVector(VectorDb):
             prefix_match (bool): Enable prefix matching for full-text search.
             vector_score_weight (float): Weight for vector similarity in hybrid search.
             content_language (str): Language for full-text search.
-            schema_version (int): Version of the database schema.
+            schema_version (int): Version of the database schema. Version 2 adds a stored tsvector column
+                with a GIN index for full-text search.
             auto_upgrade_schema (bool): Automatically upgrade schema if True.
+            hybrid_candidates (int): Number of candidates taken from each of vector and full-text search
+                in hybrid search.
+            rrf_k (int): Constant of the reciprocal rank fusion in hybrid search. Higher values give
+                lower ranked candidates more weight.
+            quantization (Optional[Quantization]): Index the embeddings as halfvec (Quantization.half) or as bits
+                (Quantization.binary). The table keeps the full precision embeddings, which re-rank the candidates
+                found with the smaller index.
+            rescore_factor (int): With quantization, the number of candidates re-ranked per requested result.
+            filter_index_threshold (Optional[int]): Count the searches filtering on each metadata key, and index the
+                keys filtered on at least this many times in create_filter_indexes() and optimize(). Equality filters
+                use a GIN index on meta_data, numeric and string ranges a btree index on the key.
         """
         if not table_name:
             raise ValueError("Table name must be provided.")
@@ -117,12 +153,32 @@ class PgVector(VectorDb):
         # Weight for the vector similarity score in hybrid search
         self.vector_score_weight: float = vector_score_weight
         # Content language for full-text search
+        if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_.]*", content_language):
+            raise ValueError(f"Invalid content language: {content_language}")
         self.content_language: str = content_language
+        # Number of candidates from each search in hybrid search
+        self.hybrid_candidates: int = hybrid_candidates
+        # Reciprocal rank fusion constant for hybrid search
+        self.rrf_k: int = rrf_k
+        # Quantization of the vector index
+        if quantization == Quantization.int8:
+            raise ValueError("pgvector has no int8 vector type, use Quantization.half or Quantization.binary")
+        self.quantization: Optional[Quantization] = quantization
+        # Number of candidates re-ranked per result with quantization
+        self.rescore_factor: int = rescore_factor
+        # Number of filtered searches after which a metadata key is indexed
+        self.filter_index_threshold: Optional[int] = filter_index_threshold
+        self._filter_key_counts: Dict[str, int] = {}
+        # Whether the range filters on each key compare numbers
+        self._numeric_filter_keys: Dict[str, bool] = {}
+        self._indexed_filter_keys: Set[str] = set()
 
         # Table schema version
         self.schema_version: int = schema_version
         # Automatically upgrade schema if True
         self.auto_upgrade_schema: bool = auto_upgrade_schema
+        # Whether the table has the stored tsvector column. Checked on first use.
+        self._content_tsv_exists: Optional[bool] = None
 
         # Reranker instance
         self.reranker: Optional[Reranker] = reranker
@@ -165,6 +221,28 @@ class PgVector(VectorDb):
 
         return table
 
+    @property
+    def content_tsv_expression(self) -> str:
+        """SQL expression of the stored tsvector column."""
+        return f"to_tsvector('{self.content_language}'::regconfig, coalesce(content, ''))"
+
+    def get_table_v2(self) -> Table:
+        """
+        Get the SQLAlchemy Table object for schema version 2.
+
+        Adds a `content_tsv` column, generated from the content and stored, with a GIN index for full-text search.
+
+        Returns:
+            Table: SQLAlchemy Table object representing the database table.
+        """
+        table = self.get_table_v1()
+        if "content_tsv" not in table.c:
+            table.append_column(
+                Column("content_tsv", postgresql.TSVECTOR, Computed(self.content_tsv_expression, persisted=True))
+            )
+            Index(f"idx_{self.table_name}_content_tsv", table.c.content_tsv, postgresql_using="gin")
+        return table
+
     def get_table(self) -> Table:
         """
         Get the SQLAlchemy Table object based on the current schema version.
@@ -174,6 +252,8 @@ class PgVector(VectorDb):
         """
         if self.schema_version == 1:
             return self.get_table_v1()
+        elif self.schema_version == 2:
+            return self.get_table_v2()
         else:
             raise NotImplementedError(f"Unsupported schema version: {self.schema_version}")
 
@@ -204,6 +284,54 @@ class PgVector(VectorDb):
                     sess.execute(text(f"CREATE SCHEMA IF NOT EXISTS {self.schema};"))
             log_debug(f"Creating table: {self.table_name}")
             self.table.create(self.db_engine)
+            self._content_tsv_exists = self.schema_version >= 2
+        elif self.schema_version >= 2 and not self._has_content_tsv():
+            if self.auto_upgrade_schema:
+                self.upgrade_schema()
+            else:
+                log_info(
+                    f"Table '{self.table.fullname}' has no stored tsvector column, full-text search will tokenize "
+                    "content at query time. Set auto_upgrade_schema=True or call upgrade_schema() to add it."
+                )
+
+    def _has_content_tsv(self) -> bool:
+        """Check if the table has the stored tsvector column of schema version 2."""
+        if self.schema_version < 2:
+            return False
+        if self._content_tsv_exists is None:
+            try:
+                columns = inspect(self.db_engine).get_columns(self.table_name, schema=self.schema)
+                self._content_tsv_exists = any(column["name"] == "content_tsv" for column in columns)
+            except Exception as e:
+                logger.warning(f"Error checking for the tsvector column: {e}")
+                return False
+        return self._content_tsv_exists
+
+    def upgrade_schema(self) -> None:
+        """
+        Upgrade a table created with schema version 1 by adding the stored tsvector column and its GIN index.
+        Postgres rewrites the table to compute the column for existing rows.
+        """
+        index_name = f"idx_{self.table_name}_content_tsv"
+        log_info(f"Adding tsvector column to table '{self.table.fullname}'")
+        with self.Session() as sess, sess.begin():
+            sess.execute(
+                text(
+                    f"ALTER TABLE {self.table.fullname} ADD COLUMN IF NOT EXISTS content_tsv tsvector "
+                    f"GENERATED ALWAYS AS ({self.content_tsv_expression}) STORED;"
+                )
+            )
+            sess.execute(
+                text(f'CREATE INDEX IF NOT EXISTS "{index_name}" ON {self.table.fullname} USING GIN (content_tsv);')
+            )
+        self._content_tsv_exists = True
+
+    def _get_ts_vector(self):
+        """The tsvector of the content: the stored column if the table has it, otherwise computed per row."""
+        if self._has_content_tsv():
+            return self.table.c.content_tsv
+        # Matches the expression of the GIN index created by optimize() for schema version 1
+        return func.to_tsvector(literal_column(f"'{self.content_language}'::regconfig"), self.table.c.content)
 
     async def async_create(self) -> None:
         """Create the table asynchronously by running in a thread."""
@@ -300,6 +428,16 @@ class PgVector(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
             batch_size (int): Number of documents to insert in each batch.
         """
+        self._insert(documents, filters, batch_size)
+
+    def _insert(
+        self,
+        documents: List[Document],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 100,
+        embed: bool = True,
+    ) -> None:
+        """Insert documents in batches, embedding them first unless `embed` is False."""
         try:
             with self.Session() as sess:
                 for i in range(0, len(documents), batch_size):
@@ -310,7 +448,8 @@ class PgVector(VectorDb):
                         batch_records = []
                         for doc in batch_docs:
                             try:
-                                doc.embed(embedder=self.embedder)
+                                if embed:
+                                    doc.embed(embedder=self.embedder)
                                 cleaned_content = self._clean_content(doc.content)
                                 content_hash = safe_content_hash(doc.content)
                                 _id = doc.id or content_hash
@@ -347,8 +486,9 @@ class PgVector(VectorDb):
             raise
 
     async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
-        """Insert documents asynchronously by running in a thread."""
-        await asyncio.to_thread(self.insert, documents, filters)
+        """Embed documents concurrently, then insert them in a thread."""
+        await async_embed_documents(documents, self.embedder)
+        await asyncio.to_thread(self._insert, documents, filters, 100, False)
 
     def upsert_available(self) -> bool:
         """
@@ -373,6 +513,16 @@ class PgVector(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
             batch_size (int): Number of documents to upsert in each batch.
         """
+        self._upsert(documents, filters, batch_size)
+
+    def _upsert(
+        self,
+        documents: List[Document],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 100,
+        embed: bool = True,
+    ) -> None:
+        """Upsert documents in batches, embedding them first unless `embed` is False."""
         try:
             with self.Session() as sess:
                 for i in range(0, len(documents), batch_size):
@@ -383,7 +533,8 @@ class PgVector(VectorDb):
                         batch_records = []
                         for doc in batch_docs:
                             try:
-                                doc.embed(embedder=self.embedder)
+                                if embed:
+                                    doc.embed(embedder=self.embedder)
                                 cleaned_content = self._clean_content(doc.content)
                                 content_hash = safe_content_hash(doc.content)
 
@@ -431,10 +582,17 @@ class PgVector(VectorDb):
             raise
 
     async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
-        """Upsert documents asynchronously by running in a thread."""
-        await asyncio.to_thread(self.upsert, documents, filters)
+        """Embed documents concurrently, then upsert them in a thread."""
+        await async_embed_documents(documents, self.embedder)
+        await asyncio.to_thread(self._upsert, documents, filters, 100, False)
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         """
         Perform a search based on the configured search type.
 
@@ -442,27 +600,108 @@ class PgVector(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            include_embeddings (bool): Whether to select the embedding column and return it on the documents.
 
         Returns:
             List[Document]: List of matching documents.
         """
+        return self._search(query, limit, filters, include_embeddings)
+
+    def _search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+        query_embedding: Optional[List[float]] = None,
+    ) -> List[Document]:
+        """Dispatch to the configured search type. Vector and hybrid search embed the query if it is not given."""
         if self.search_type == SearchType.vector:
-            return self.vector_search(query=query, limit=limit, filters=filters)
+            return self.vector_search(
+                query=query,
+                limit=limit,
+                filters=filters,
+                include_embeddings=include_embeddings,
+                query_embedding=query_embedding,
+            )
         elif self.search_type == SearchType.keyword:
-            return self.keyword_search(query=query, limit=limit, filters=filters)
+            return self.keyword_search(query=query, limit=limit, filters=filters, include_embeddings=include_embeddings)
         elif self.search_type == SearchType.hybrid:
-            return self.hybrid_search(query=query, limit=limit, filters=filters)
+            return self.hybrid_search(
+                query=query,
+                limit=limit,
+                filters=filters,
+                include_embeddings=include_embeddings,
+                query_embedding=query_embedding,
+            )
         else:
             logger.error(f"Invalid search type '{self.search_type}'.")
             return []
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
-        """Search asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.search, query, limit, filters)
+        """Embed the query asynchronously, then search in a thread."""
+        query_embedding = None
+        if self.search_type in (SearchType.vector, SearchType.hybrid):
+            query_embedding = await self.embedder.aget_embedding(query)
+        return await asyncio.to_thread(self._search, query, limit, filters, include_embeddings, query_embedding)
+
+    def _get_search_columns(self, include_embeddings: bool = False) -> List[Any]:
+        """The columns returned by searches. The embedding column is only selected when it is needed,
+        as a large vector is much more expensive to transfer and parse than the rest of the row."""
+        columns = [
+            self.table.c.id,
+            self.table.c.name,
+            self.table.c.meta_data,
+            self.table.c.content,
+            self.table.c.usage,
+        ]
+        if include_embeddings:
+            columns.append(self.table.c.embedding)
+        return columns
+
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """
+        Fetch the stored embeddings of documents by id.
+
+        Args:
+            ids (List[str]): The ids of the documents.
 
-    def vector_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        Returns:
+            Dict[str, List[float]]: The embedding of each document that was found, by id.
+        """
+        if len(ids) == 0:
+            return {}
+        try:
+            stmt = select(self.table.c.id, self.table.c.embedding).where(self.table.c.id.in_(ids))
+            with self.Session() as sess, sess.begin():
+                results = sess.execute(stmt).fetchall()
+            return {
+                result.id: [float(value) for value in result.embedding]
+                for result in results
+                if result.embedding is not None
+            }
+        except Exception as e:
+            logger.error(f"Error fetching embeddings: {e}")
+            return {}
+
+    async def async_get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """Fetch embeddings asynchronously by running in a thread."""
+        return await asyncio.to_thread(self.get_embeddings, ids)
+
+    def vector_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+        query_embedding: Optional[List[float]] = None,
+    ) -> List[Document]:
         """
         Perform a vector similarity search.
 
@@ -470,44 +709,48 @@ class PgVector(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            include_embeddings (bool): Whether to return the embeddings of the documents.
+            query_embedding (Optional[List[float]]): The embedding of the query, computed if not given.
 
         Returns:
             List[Document]: List of matching documents.
         """
         try:
             # Get the embedding for the query string
-            query_embedding = self.embedder.get_embedding(query)
+            if query_embedding is None:
+                query_embedding = self.embedder.get_embedding(query)
             if query_embedding is None:
                 logger.error(f"Error getting embedding for Query: {query}")
                 return []
 
             # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
+            columns = self._get_search_columns(include_embeddings)
 
             # Build the base statement
             stmt = select(*columns)
+            filter_clause = self._get_filter_clause(filters)
 
-            # Apply filters if provided
-            if filters is not None:
-                stmt = stmt.where(self.table.c.meta_data.contains(filters))
-
-            # Order the results based on the distance metric
-            if self.distance == Distance.l2:
-                stmt = stmt.order_by(self.table.c.embedding.l2_distance(query_embedding))
-            elif self.distance == Distance.cosine:
-                stmt = stmt.order_by(self.table.c.embedding.cosine_distance(query_embedding))
-            elif self.distance == Distance.max_inner_product:
-                stmt = stmt.order_by(self.table.c.embedding.max_inner_product(query_embedding))
+            if self.quantization is not None:
+                # Search the quantized index for candidates, ordered by their exact distance
+                candidates = self._get_vector_candidates(query_embedding, limit, filter_clause).subquery("candidates")
+                stmt = stmt.join_from(self.table, candidates, self.table.c.id == candidates.c.id).order_by(
+                    candidates.c.distance
+                )
             else:
-                logger.error(f"Unknown distance metric: {self.distance}")
-                return []
+                # Apply filters if provided
+                if filter_clause is not None:
+                    stmt = stmt.where(filter_clause)
+
+                # Order the results based on the distance metric
+                if self.distance == Distance.l2:
+                    stmt = stmt.order_by(self.table.c.embedding.l2_distance(query_embedding))
+                elif self.distance == Distance.cosine:
+                    stmt = stmt.order_by(self.table.c.embedding.cosine_distance(query_embedding))
+                elif self.distance == Distance.max_inner_product:
+                    stmt = stmt.order_by(self.table.c.embedding.max_inner_product(query_embedding))
+                else:
+                    logger.error(f"Unknown distance metric: {self.distance}")
+                    return []
 
             # Limit the number of results
             stmt = stmt.limit(limit)
@@ -540,7 +783,7 @@ class PgVector(VectorDb):
                         meta_data=result.meta_data,
                         content=result.content,
                         embedder=self.embedder,
-                        embedding=result.embedding,
+                        embedding=result.embedding if include_embeddings else None,
                         usage=result.usage,
                     )
                 )
@@ -569,7 +812,13 @@ class PgVector(VectorDb):
         processed_words = [word + "*" for word in words]
         return " ".join(processed_words)
 
-    def keyword_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def keyword_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         """
         Perform a keyword search on the 'content' column.
 
@@ -577,36 +826,33 @@ class PgVector(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            include_embeddings (bool): Whether to return the embeddings of the documents.
 
         Returns:
             List[Document]: List of matching documents.
         """
         try:
             # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
+            columns = self._get_search_columns(include_embeddings)
 
             # Build the base statement
             stmt = select(*columns)
 
             # Build the text search vector
-            ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
+            ts_vector = self._get_ts_vector()
             # Create the ts_query using websearch_to_tsquery with parameter binding
             processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
             ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
             # Compute the text rank
             text_rank = func.ts_rank_cd(ts_vector, ts_query)
 
+            # Only match documents containing the query, which can use the GIN index
+            stmt = stmt.where(ts_vector.op("@@")(ts_query))
+
             # Apply filters if provided
-            if filters is not None:
-                # Use the contains() method for JSONB columns to check if the filters column contains the specified filters
-                stmt = stmt.where(self.table.c.meta_data.contains(filters))
+            filter_clause = self._get_filter_clause(filters)
+            if filter_clause is not None:
+                stmt = stmt.where(filter_clause)
 
             # Order by the relevance rank
             stmt = stmt.order_by(text_rank.desc())
@@ -637,7 +883,7 @@ class PgVector(VectorDb):
                         meta_data=result.meta_data,
                         content=result.content,
                         embedder=self.embedder,
-                        embedding=result.embedding,
+                        embedding=result.embedding if include_embeddings else None,
                         usage=result.usage,
                     )
                 )
@@ -648,92 +894,242 @@ class PgVector(VectorDb):
             logger.error(f"Error during keyword search: {e}")
             return []
 
+    def _get_vector_distance(self, query_embedding: List[float], embedding: Optional[Any] = None):
+        """The distance between each embedding and the query embedding, smaller is closer."""
+        if embedding is None:
+            embedding = self.table.c.embedding
+        if self.distance == Distance.l2:
+            return embedding.l2_distance(query_embedding)
+        elif self.distance == Distance.cosine:
+            return embedding.cosine_distance(query_embedding)
+        elif self.distance == Distance.max_inner_product:
+            # Negative inner product, so smaller is closer
+            return embedding.max_inner_product(query_embedding)
+        raise ValueError(f"Unknown distance metric: {self.distance}")
+
+    def _get_quantized_embedding(self, embedding: Any):
+        """The expression of an embedding in the quantized vector index."""
+        if self.quantization == Quantization.half:
+            return sql_cast(embedding, HALFVEC(self.dimensions))
+        if self.quantization == Quantization.binary:
+            return sql_cast(func.binary_quantize(embedding), BIT(self.dimensions))
+        raise ValueError(f"Unsupported quantization: {self.quantization}")
+
+    def _get_vector_candidates(self, query_embedding: List[float], limit: int, filter_clause: Optional[Any]):
+        """
+        Select the ids of the `limit` documents closest to the query embedding, with their distance.
+
+        With quantization, the quantized index returns `limit * rescore_factor` candidates,
+        which are re-ranked by the distance between their full precision embedding and the query embedding.
+        """
+        if self.quantization is None:
+            distance = self._get_vector_distance(query_embedding)
+            stmt = select(self.table.c.id, distance.label("distance"))
+            if filter_clause is not None:
+                stmt = stmt.where(filter_clause)
+            return stmt.order_by(distance).limit(limit)
+
+        quantized_embedding = self._get_quantized_embedding(self.table.c.embedding)
+        if self.quantization == Quantization.binary:
+            query = self._get_quantized_embedding(literal(query_embedding, Vector(self.dimensions)))
+            quantized_distance = quantized_embedding.hamming_distance(query)
+        else:
+            quantized_distance = self._get_vector_distance(query_embedding, quantized_embedding)
+        stmt = select(self.table.c.id, self.table.c.embedding)
+        if filter_clause is not None:
+            stmt = stmt.where(filter_clause)
+        quantized_candidates = (
+            stmt.order_by(quantized_distance)
+            .limit(limit * max(self.rescore_factor, 1))
+            .subquery("quantized_candidates")
+        )
+        distance = self._get_vector_distance(query_embedding, quantized_candidates.c.embedding)
+        return select(quantized_candidates.c.id, distance.label("distance")).order_by(distance).limit(limit)
+
+    def _get_filter_clause(self, filters: Optional[Union[Dict[str, Any], FilterExpr]]) -> Optional[Any]:
+        """
+        Compile filters to a SQL clause on the meta_data column.
+
+        Equality is checked with JSONB containment, which can use the GIN index on meta_data,
+        and ranges compare the value of the key, as a number if all bounds are numbers.
+
+        Args:
+            filters (Optional[Union[Dict[str, Any], FilterExpr]]): Filters as a dict or a filter expression.
+
+        Returns:
+            Optional[Any]: The SQL clause, None if there are no filters.
+        """
+        expression = parse_filters(filters)
+        if expression is None:
+            return None
+        if self.filter_index_threshold is not None:
+            self._track_filter_usage(expression)
+        return self._compile_filter(expression)
+
+    def _compile_filter(self, expression: FilterExpr) -> Any:
+        meta_data = self.table.c.meta_data
+        if isinstance(expression, EQ):
+            return meta_data.contains({expression.key: expression.value})
+        if isinstance(expression, IN):
+            if not expression.values:
+                return false()
+            return or_(*[meta_data.contains({expression.key: value}) for value in expression.values])
+        if isinstance(expression, RANGE):
+            bounds = expression.bounds
+            if _is_numeric(bounds):
+                # Values that are not numbers are left out rather than failing the cast
+                value = case(
+                    (
+                        func.jsonb_typeof(meta_data.op("->")(expression.key)) == "number",
+                        meta_data[expression.key].as_float(),
+                    )
+                )
+            else:
+                value = meta_data[expression.key].as_string()
+            comparisons = {"gt": operator.gt, "gte": operator.ge, "lt": operator.lt, "lte": operator.le}
+            return and_(true(), *[comparisons[name](value, bound) for name, bound in bounds.items()])
+        if isinstance(expression, AND):
+            # Equality on different keys is checked with a single containment
+            contained: Dict[str, Any] = {}
+            clauses = []
+            for nested in expression.expressions:
+                if isinstance(nested, EQ) and nested.key not in contained:
+                    contained[nested.key] = nested.value
+                else:
+                    clauses.append(self._compile_filter(nested))
+            if contained:
+                clauses.insert(0, meta_data.contains(contained))
+            return and_(true(), *clauses)
+        if isinstance(expression, OR):
+            return or_(false(), *[self._compile_filter(nested) for nested in expression.expressions])
+        raise ValueError(f"Unsupported filter expression: {expression}")
+
+    def _track_filter_usage(self, expression: FilterExpr) -> None:
+        """Count the searches filtering on each key. The keys are indexed by create_filter_indexes()."""
+        ranges: Dict[str, bool] = {}
+        keys: Set[str] = set()
+        for nested in walk_filters(expression):
+            if isinstance(nested, RANGE):
+                ranges[nested.key] = _is_numeric(nested.bounds)
+            elif isinstance(nested, (EQ, IN)):
+                keys.add(nested.key)
+
+        for key, numeric in ranges.items():
+            index_key = f"range:{key}"
+            self._filter_key_counts[index_key] = self._filter_key_counts.get(index_key, 0) + 1
+            self._numeric_filter_keys[key] = numeric
+        for key in keys:
+            self._filter_key_counts[key] = self._filter_key_counts.get(key, 0) + 1
+
+    def create_filter_indexes(self) -> None:
+        """
+        Index the metadata keys that searches filtered on at least filter_index_threshold times.
+
+        Searches only count the keys they filter on. The indexes are built here, outside of searches, with
+        CREATE INDEX CONCURRENTLY, so writes to the table are not blocked while they are built.
+        """
+        if self.filter_index_threshold is None:
+            return
+        for index_key, count in list(self._filter_key_counts.items()):
+            if count < self.filter_index_threshold:
+                continue
+            if index_key.startswith("range:"):
+                key = index_key[len("range:") :]
+                if index_key not in self._indexed_filter_keys and self._create_metadata_range_index(
+                    key, self._numeric_filter_keys.get(key, False), concurrently=True
+                ):
+                    self._indexed_filter_keys.add(index_key)
+            # One GIN index serves equality filters on every key
+            elif "meta_data" not in self._indexed_filter_keys and self._create_metadata_index(concurrently=True):
+                self._indexed_filter_keys.add("meta_data")
+
     def hybrid_search(
         self,
         query: str,
         limit: int = 5,
         filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Document]:
         """
         Perform a hybrid search combining vector similarity and full-text search.
 
+        The top `hybrid_candidates` documents are taken from vector search (using the vector index) and from
+        full-text search (using the GIN index), and fused with weighted reciprocal rank fusion:
+        score = vector_score_weight / (rrf_k + vector rank) + (1 - vector_score_weight) / (rrf_k + text rank).
+        Each stage only reads its top candidates, so latency does not grow with the size of the table.
+
         Args:
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            include_embeddings (bool): Whether to return the embeddings of the documents.
+            query_embedding (Optional[List[float]]): The embedding of the query, computed if not given.
 
         Returns:
             List[Document]: List of matching documents.
         """
         try:
             # Get the embedding for the query string
-            query_embedding = self.embedder.get_embedding(query)
+            if query_embedding is None:
+                query_embedding = self.embedder.get_embedding(query)
             if query_embedding is None:
                 logger.error(f"Error getting embedding for Query: {query}")
                 return []
 
-            # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
-
-            # Build the text search vector
-            ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
-            # Create the ts_query using websearch_to_tsquery with parameter binding
-            processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
-            ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
-            # Compute the text rank
-            text_rank = func.ts_rank_cd(ts_vector, ts_query)
-
-            # Compute the vector similarity score
-            if self.distance == Distance.l2:
-                # For L2 distance, smaller distances are better
-                vector_distance = self.table.c.embedding.l2_distance(query_embedding)
-                # Invert and normalize the distance to get a similarity score between 0 and 1
-                vector_score = 1 / (1 + vector_distance)
-            elif self.distance == Distance.cosine:
-                # For cosine distance, smaller distances are better
-                vector_distance = self.table.c.embedding.cosine_distance(query_embedding)
-                vector_score = 1 / (1 + vector_distance)
-            elif self.distance == Distance.max_inner_product:
-                # For inner product, higher values are better
-                # Assume embeddings are normalized, so inner product ranges from -1 to 1
-                raw_vector_score = self.table.c.embedding.max_inner_product(query_embedding)
-                # Normalize to range [0, 1]
-                vector_score = (raw_vector_score + 1) / 2
-            else:
-                logger.error(f"Unknown distance metric: {self.distance}")
-                return []
-
-            # Apply weights to control the influence of each score
             # Validate the vector_weight parameter
             if not 0 <= self.vector_score_weight <= 1:
                 raise ValueError("vector_score_weight must be between 0 and 1")
             text_rank_weight = 1 - self.vector_score_weight  # weight for text rank
+            num_candidates = max(self.hybrid_candidates, limit)
+            filter_clause = self._get_filter_clause(filters)
 
-            # Combine the scores into a hybrid score
-            hybrid_score = (self.vector_score_weight * vector_score) + (text_rank_weight * text_rank)
-
-            # Build the base statement, including the hybrid score
-            stmt = select(*columns, hybrid_score.label("hybrid_score"))
-
-            # Add the full-text search condition
-            # stmt = stmt.where(ts_vector.op("@@")(ts_query))
-
-            # Apply filters if provided
-            if filters is not None:
-                stmt = stmt.where(self.table.c.meta_data.contains(filters))
+            # Vector search candidates, in order of distance
+            vector_candidates = self._get_vector_candidates(query_embedding, num_candidates, filter_clause).subquery(
+                "vector_candidates"
+            )
 
-            # Order the results by the hybrid score in descending order
-            stmt = stmt.order_by(desc("hybrid_score"))
+            # Full-text search candidates, in order of text rank
+            ts_vector = self._get_ts_vector()
+            processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
+            ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
+            text_rank = func.ts_rank_cd(ts_vector, ts_query)
+            text_stmt = select(self.table.c.id, text_rank.label("text_rank")).where(ts_vector.op("@@")(ts_query))
+            if filter_clause is not None:
+                text_stmt = text_stmt.where(filter_clause)
+            text_candidates = text_stmt.order_by(text_rank.desc()).limit(num_candidates).subquery("text_candidates")
+
+            # Reciprocal rank fusion of both candidate lists
+            rrf_k = literal(self.rrf_k, Float)
+            vector_ranked = select(
+                vector_candidates.c.id,
+                (
+                    literal(self.vector_score_weight, Float)
+                    / (rrf_k + func.row_number().over(order_by=vector_candidates.c.distance))
+                ).label("score"),
+            )
+            text_ranked = select(
+                text_candidates.c.id,
+                (
+                    literal(text_rank_weight, Float)
+                    / (rrf_k + func.row_number().over(order_by=text_candidates.c.text_rank.desc()))
+                ).label("score"),
+            )
+            fused = union_all(vector_ranked, text_ranked).subquery("fused")
+            hybrid_scores = (
+                select(fused.c.id, func.sum(fused.c.score).label("hybrid_score"))
+                .group_by(fused.c.id)
+                .subquery("hybrid_scores")
+            )
 
-            # Limit the number of results
-            stmt = stmt.limit(limit)
+            # Define the columns to select
+            columns = self._get_search_columns(include_embeddings)
+            stmt = (
+                select(*columns, hybrid_scores.c.hybrid_score)
+                .join_from(self.table, hybrid_scores, self.table.c.id == hybrid_scores.c.id)
+                .order_by(desc("hybrid_score"))
+                .limit(limit)
+            )
 
             # Log the query for debugging
             log_debug(f"Hybrid search query: {stmt}")
@@ -761,7 +1157,7 @@ class PgVector(VectorDb):
                         meta_data=result.meta_data,
                         content=result.content,
                         embedder=self.embedder,
-                        embedding=result.embedding,
+                        embedding=result.embedding if include_embeddings else None,
                         usage=result.usage,
                     )
                 )
@@ -830,6 +1226,9 @@ class PgVector(VectorDb):
         log_debug("==== Optimizing Vector DB ====")
         self._create_vector_index(force_recreate=force_recreate)
         self._create_gin_index(force_recreate=force_recreate)
+        if self._create_metadata_index(force_recreate=force_recreate):
+            self._indexed_filter_keys.add("meta_data")
+        self.create_filter_indexes()
         log_debug("==== Optimized Vector DB ====")
 
     def _index_exists(self, index_name: str) -> bool:
@@ -875,14 +1274,20 @@ class PgVector(VectorDb):
         # Generate index name if not provided
         if self.vector_index.name is None:
             index_type = "ivfflat" if isinstance(self.vector_index, Ivfflat) else "hnsw"
+            if self.quantization is not None:
+                index_type = f"{index_type}_{self.quantization.value}"
             self.vector_index.name = f"{self.table_name}_{index_type}_index"
 
         # Determine index distance operator
-        index_distance = {
-            Distance.l2: "vector_l2_ops",
-            Distance.max_inner_product: "vector_ip_ops",
-            Distance.cosine: "vector_cosine_ops",
-        }.get(self.distance, "vector_cosine_ops")
+        if self.quantization == Quantization.binary:
+            index_distance = "bit_hamming_ops"
+        else:
+            vector_type = "halfvec" if self.quantization == Quantization.half else "vector"
+            index_distance = {
+                Distance.l2: f"{vector_type}_l2_ops",
+                Distance.max_inner_product: f"{vector_type}_ip_ops",
+                Distance.cosine: f"{vector_type}_cosine_ops",
+            }.get(self.distance, f"{vector_type}_cosine_ops")
 
         # Get the fully qualified table name
         table_fullname = self.table.fullname  # includes schema if any
@@ -919,6 +1324,15 @@ class PgVector(VectorDb):
             logger.error(f"Error creating vector index '{self.vector_index.name}': {e}")
             raise
 
+    @property
+    def _index_expression(self) -> str:
+        """The indexed expression, which matches the quantized embedding that searches order by."""
+        if self.quantization == Quantization.half:
+            return f"(embedding::halfvec({self.dimensions}))"
+        if self.quantization == Quantization.binary:
+            return f"(binary_quantize(embedding)::bit({self.dimensions}))"
+        return "embedding"
+
     def _create_ivfflat_index(self, sess: Session, table_fullname: str, index_distance: str) -> None:
         """
         Create an IVFFlat index.
@@ -953,7 +1367,7 @@ class PgVector(VectorDb):
         # Create index
         create_index_sql = text(
             f'CREATE INDEX "{self.vector_index.name}" ON {table_fullname} '
-            f"USING ivfflat (embedding {index_distance}) "
+            f"USING ivfflat ({self._index_expression} {index_distance}) "
             f"WITH (lists = :num_lists);"
         )
         sess.execute(create_index_sql, {"num_lists": num_lists})
@@ -979,7 +1393,7 @@ class PgVector(VectorDb):
         # Create index
         create_index_sql = text(
             f'CREATE INDEX "{self.vector_index.name}" ON {table_fullname} '
-            f"USING hnsw (embedding {index_distance}) "
+            f"USING hnsw ({self._index_expression} {index_distance}) "
             f"WITH (m = :m, ef_construction = :ef_construction);"
         )
         sess.execute(create_index_sql, {"m": self.vector_index.m, "ef_construction": self.vector_index.ef_construction})
@@ -991,6 +1405,20 @@ class PgVector(VectorDb):
         Args:
             force_recreate (bool): If True, existing index will be dropped and recreated.
         """
+        if self._has_content_tsv():
+            # The index on the stored tsvector column is created with the table or by upgrade_schema()
+            gin_index_name = f"idx_{self.table_name}_content_tsv"
+            if force_recreate and self._index_exists(gin_index_name):
+                log_info(f"Force recreating GIN index '{gin_index_name}'. Dropping existing index.")
+                self._drop_index(gin_index_name)
+            with self.Session() as sess, sess.begin():
+                sess.execute(
+                    text(
+                        f'CREATE INDEX IF NOT EXISTS "{gin_index_name}" ON {self.table.fullname} USING GIN (content_tsv);'
+                    )
+                )
+            return
+
         gin_index_name = f"{self.table_name}_content_gin_index"
 
         gin_index_exists = self._index_exists(gin_index_name)
@@ -1011,13 +1439,76 @@ class PgVector(VectorDb):
                 # Create index
                 create_gin_index_sql = text(
                     f'CREATE INDEX "{gin_index_name}" ON {self.table.fullname} '
-                    f"USING GIN (to_tsvector({self.content_language}, content));"
+                    f"USING GIN (to_tsvector('{self.content_language}'::regconfig, content));"
                 )
                 sess.execute(create_gin_index_sql)
         except Exception as e:
             logger.error(f"Error creating GIN index '{gin_index_name}': {e}")
             raise
 
+    def _create_metadata_index(self, force_recreate: bool = False, concurrently: bool = False) -> bool:
+        """
+        Create or recreate the GIN index on meta_data, which is used by equality filters.
+
+        Args:
+            force_recreate (bool): If True, existing index will be dropped and recreated.
+            concurrently (bool): Build the index without blocking writes to the table.
+
+        Returns:
+            bool: True if the index was created or already exists, False otherwise.
+        """
+        index_name = f"{self.table_name}_meta_data_gin_index"
+        try:
+            if force_recreate:
+                self._drop_index(index_name)
+            log_debug(f"Creating GIN index '{index_name}' on table '{self.table.fullname}'.")
+            self._execute_create_index(
+                f'"{index_name}" ON {self.table.fullname} USING GIN (meta_data jsonb_path_ops)', concurrently
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error creating GIN index '{index_name}': {e}")
+            return False
+
+    def _create_metadata_range_index(self, key: str, numeric: bool, concurrently: bool = False) -> bool:
+        """
+        Create a btree index on the value of a metadata key, which is used by range filters.
+
+        Args:
+            key (str): The metadata key.
+            numeric (bool): Index the value as a number, otherwise as text.
+            concurrently (bool): Build the index without blocking writes to the table.
+
+        Returns:
+            bool: True if the index was created or already exists, False otherwise.
+        """
+        index_name = f"{self.table_name}_meta_data_{re.sub(r'[^A-Za-z0-9_]', '_', key)}_index"
+        quoted_key = "'{}'".format(key.replace("'", "''"))
+        value = f"meta_data ->> {quoted_key}"
+        # Same expression as numeric range filters, so rows whose value is not a number do not fail the index build
+        expression = (
+            f"((CASE WHEN jsonb_typeof(meta_data -> {quoted_key}) = 'number' THEN ({value})::float END))"
+            if numeric
+            else f"(({value}))"
+        )
+        try:
+            log_debug(f"Creating index '{index_name}' on metadata key '{key}'.")
+            self._execute_create_index(f'"{index_name}" ON {self.table.fullname} ({expression})', concurrently)
+            return True
+        except Exception as e:
+            logger.error(f"Error creating index '{index_name}': {e}")
+            return False
+
+    def _execute_create_index(self, index_definition: str, concurrently: bool = False) -> None:
+        """Run CREATE INDEX IF NOT EXISTS with the given definition, concurrently outside of a transaction."""
+        if concurrently:
+            # CREATE INDEX CONCURRENTLY can not run inside a transaction block
+            with self.db_engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+                connection.execute(text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_definition};"))
+        else:
+            with self.Session() as sess, sess.begin():
+                sess.execute(text(f"CREATE INDEX IF NOT EXISTS {index_definition};"))
+
     def delete(self) -> bool:
         """
         Delete all records from the table.
@@ -1070,3 +1561,7 @@ class PgVector(VectorDb):
         copied_obj.table = copied_obj.get_table()
 
         return copied_obj
+
+
+def _is_numeric(bounds: Dict[str, Any]) -> bool:
+    return all(isinstance(bound, (int, float)) and not isinstance(bound, bool) for bound in bounds.values())
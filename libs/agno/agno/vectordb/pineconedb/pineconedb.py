@@ -22,7 +22,7 @@ except ImportError:
     raise ImportError("The `pinecone` package is not installed, please install using `pip install pinecone`.")
 
 
-from agno.document import Document
+from agno.document import Document, async_embed_documents
 from agno.embedder import Embedder
 from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, logger
@@ -283,8 +283,11 @@ class PineconeDb(VectorDb):
         if not documents:
             return
 
+        # Embed all documents concurrently with the embedder's async client
+        await async_embed_documents(documents, self.embedder)
+
         # Pinecone has its own batching mechanism, but we'll add an additional layer
-        # to process document embedding in parallel
+        # to prepare the vectors (and sparse encodings) in parallel
         _batch_size = batch_size or 100
 
         # Split documents into batches
@@ -293,7 +296,7 @@ class PineconeDb(VectorDb):
 
         # Process each batch in parallel
         async def process_batch(batch_docs):
-            return await asyncio.to_thread(self._prepare_vectors, batch_docs)
+            return await asyncio.to_thread(self._prepare_vectors, batch_docs, False)
 
         # Run all batches in parallel
         batch_vectors = await asyncio.gather(*[process_batch(batch) for batch in batches])
@@ -308,11 +311,12 @@ class PineconeDb(VectorDb):
 
         log_debug(f"Finished async upsert of {len(documents)} documents")
 
-    def _prepare_vectors(self, documents):
-        """Prepare vectors for upsert."""
+    def _prepare_vectors(self, documents, embed: bool = True):
+        """Prepare vectors for upsert. Set `embed` to False if the documents are already embedded."""
         vectors = []
         for doc in documents:
-            doc.embed(embedder=self.embedder)
+            if embed:
+                doc.embed(embedder=self.embedder)
             doc.meta_data["text"] = doc.content
             data_to_upsert = {
                 "id": doc.id,
@@ -386,6 +390,7 @@ class PineconeDb(VectorDb):
         filters: Optional[Dict[str, Union[str, float, int, bool, List, dict]]] = None,
         namespace: Optional[str] = None,
         include_values: Optional[bool] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """Search for similar documents in the index.
 
@@ -394,7 +399,8 @@ class PineconeDb(VectorDb):
             limit (int, optional): The maximum number of results to return. Defaults to 5.
             filters (Optional[Dict[str, Union[str, float, int, bool, List, dict]]], optional): The filter for the search. Defaults to None.
             namespace (Optional[str], optional): The namespace to search in. Defaults to None.
-            include_values (Optional[bool], optional): Whether to include values in the search results. Defaults to None.
+            include_values (Optional[bool], optional): Overrides include_embeddings when set. Defaults to None.
+            include_embeddings (bool, optional): Whether to include the vector values in the search results. Defaults to False.
             include_metadata (Optional[bool], optional): Whether to include metadata in the search results. Defaults to None.
 
         Returns:
@@ -402,6 +408,21 @@ class PineconeDb(VectorDb):
 
         """
         dense_embedding = self.embedder.get_embedding(query)
+        return self._search(query, dense_embedding, limit, filters, namespace, include_values, include_embeddings)
+
+    def _search(
+        self,
+        query: str,
+        dense_embedding: Optional[List[float]],
+        limit: int = 5,
+        filters: Optional[Dict[str, Union[str, float, int, bool, List, dict]]] = None,
+        namespace: Optional[str] = None,
+        include_values: Optional[bool] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
+        """Search the index with an embedded query."""
+        if include_values is None:
+            include_values = include_embeddings
 
         if self.use_hybrid_search:
             sparse_embedding = self.sparse_encoder.encode_queries(query)
@@ -435,7 +456,7 @@ class PineconeDb(VectorDb):
             Document(
                 content=(result.metadata.get("text", "") if result.metadata is not None else ""),
                 id=result.id,
-                embedding=result.values,
+                embedding=result.values if include_values else None,
                 meta_data=result.metadata,
             )
             for result in response.matches
@@ -452,9 +473,13 @@ class PineconeDb(VectorDb):
         filters: Optional[Dict[str, Union[str, float, int, bool, List, dict]]] = None,
         namespace: Optional[str] = None,
         include_values: Optional[bool] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
-        """Search for similar documents in the index asynchronously."""
-        return await asyncio.to_thread(self.search, query, limit, filters, namespace, include_values)
+        """Embed the query asynchronously, then search the index in a thread."""
+        dense_embedding = await self.embedder.aget_embedding(query)
+        return await asyncio.to_thread(
+            self._search, query, dense_embedding, limit, filters, namespace, include_values, include_embeddings
+        )
 
     def optimize(self) -> None:
         """Optimize the index.
@@ -464,6 +489,21 @@ class PineconeDb(VectorDb):
         """
         pass
 
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """Fetch the vector values of documents by id.
+
+        Args:
+            ids (List[str]): The ids of the documents.
+
+        Returns:
+            Dict[str, List[float]]: The vector values of each document that was found, by id.
+
+        """
+        if len(ids) == 0:
+            return {}
+        response = self.index.fetch(ids=ids, namespace=self.namespace)
+        return {id_: list(vector.values) for id_, vector in response.vectors.items()}
+
     def delete(self, namespace: Optional[str] = None) -> bool:
         """Clear the index.
 
@@ -1,5 +1,5 @@
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Union
 
 try:
     from qdrant_client import AsyncQdrantClient, QdrantClient  # noqa: F401
@@ -9,12 +9,13 @@ except ImportError:
         "The `qdrant-client` package is not installed. Please install it via `pip install qdrant-client`."
     )
 
-from agno.document import Document
+from agno.document import Document, async_embed_documents
 from agno.embedder import Embedder
 from agno.reranker.base import Reranker
-from agno.utils.log import log_debug, log_info
+from agno.utils.log import log_debug, log_info, log_warning
 from agno.vectordb.base import VectorDb
 from agno.vectordb.distance import Distance
+from agno.vectordb.filters import AND, EQ, IN, OR, RANGE, FilterExpr, parse_filters, walk_filters
 from agno.vectordb.search import SearchType
 
 DEFAULT_DENSE_VECTOR_NAME = "dense"
@@ -47,6 +48,7 @@ class Qdrant(VectorDb):
         sparse_vector_name: str = DEFAULT_SPARSE_VECTOR_NAME,
         hybrid_fusion_strategy: models.Fusion = models.Fusion.RRF,
         fastembed_kwargs: Optional[dict] = None,
+        filter_index_threshold: Optional[int] = None,
         **kwargs,
     ):
         """
@@ -71,6 +73,9 @@ class Qdrant(VectorDb):
             sparse_vector_name (str): Sparse vector name.
             hybrid_fusion_strategy (models.Fusion): Strategy for hybrid fusion.
             fastembed_kwargs (Optional[dict]): Keyword args for `fastembed.SparseTextEmbedding.__init__()`.
+            filter_index_threshold (Optional[int]): Count the searches filtering on each metadata key, and create
+                payload indexes on the keys filtered on at least this many times in create_filter_indexes() and
+                optimize().
             **kwargs: Keyword args for `qdrant_client.QdrantClient.__init__()`.
         """
         # Collection attributes
@@ -114,6 +119,13 @@ class Qdrant(VectorDb):
         # Qdrant client kwargs
         self.kwargs = kwargs
 
+        # Number of filtered searches after which a payload index is created for a key
+        self.filter_index_threshold: Optional[int] = filter_index_threshold
+        self._filter_key_counts: Dict[str, int] = {}
+        # A value filtered on for each key, which gives the type of its payload index
+        self._filter_key_values: Dict[str, Any] = {}
+        self._indexed_filter_keys: Set[str] = set()
+
         self.search_type = search_type
         self.dense_vector_name = dense_vector_name
         self.sparse_vector_name = sparse_vector_name
@@ -374,19 +386,20 @@ class Qdrant(VectorDb):
         """
         log_debug(f"Inserting {len(documents)} documents asynchronously")
 
+        if self.search_type in [SearchType.vector, SearchType.hybrid]:
+            await async_embed_documents(documents, self.embedder)
+
         async def process_document(document):
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
 
             if self.search_type == SearchType.vector:
                 # For vector search, maintain backward compatibility with unnamed vectors
-                document.embed(embedder=self.embedder)
                 vector = document.embedding
             else:
                 # For other search types, use named vectors
                 vector = {}
                 if self.search_type in [SearchType.hybrid]:
-                    document.embed(embedder=self.embedder)
                     vector[self.dense_vector_name] = document.embedding
 
                 if self.search_type in [SearchType.keyword, SearchType.hybrid]:
@@ -442,7 +455,13 @@ class Qdrant(VectorDb):
         log_debug("Redirecting the async request to async_insert")
         await self.async_insert(documents, filters)
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         """
         Search for documents in the collection.
 
@@ -450,39 +469,51 @@ class Qdrant(VectorDb):
             query (str): Query to search for
             limit (int): Number of search results to return
             filters (Optional[Dict[str, Any]]): Filters to apply while searching
+            include_embeddings (bool): Whether to return the vectors of the points
         """
+        self._track_filter_usage(filters)
         filters = self._format_filters(filters or {})  # type: ignore
         if self.search_type == SearchType.vector:
-            results = self._run_vector_search_sync(query, limit, filters)
+            results = self._run_vector_search_sync(query, limit, filters, include_embeddings)
         elif self.search_type == SearchType.keyword:
-            results = self._run_keyword_search_sync(query, limit, filters)
+            results = self._run_keyword_search_sync(query, limit, filters, include_embeddings)
         elif self.search_type == SearchType.hybrid:
-            results = self._run_hybrid_search_sync(query, limit, filters)
+            results = self._run_hybrid_search_sync(query, limit, filters, include_embeddings)
         else:
             raise ValueError(f"Unsupported search type: {self.search_type}")
 
         return self._build_search_results(results, query)
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
+        self._track_filter_usage(filters)
         filters = self._format_filters(filters or {})  # type: ignore
         if self.search_type == SearchType.vector:
-            results = await self._run_vector_search_async(query, limit, filters)
+            results = await self._run_vector_search_async(query, limit, filters, include_embeddings)
         elif self.search_type == SearchType.keyword:
-            results = await self._run_keyword_search_async(query, limit, filters)
+            results = await self._run_keyword_search_async(query, limit, filters, include_embeddings)
         elif self.search_type == SearchType.hybrid:
-            results = await self._run_hybrid_search_async(query, limit, filters)
+            results = await self._run_hybrid_search_async(query, limit, filters, include_embeddings)
         else:
             raise ValueError(f"Unsupported search type: {self.search_type}")
 
-        return self._build_search_results(results, query)
+        search_results = self._build_search_results(results, query, rerank=False)
+        if self.reranker:
+            search_results = await self.reranker.arerank(query=query, documents=search_results)
+        log_info(f"Found {len(search_results)} documents")
+        return search_results
 
     def _run_hybrid_search_sync(
         self,
         query: str,
         limit: int,
         filters: Optional[Dict[str, Any]],
+        with_vectors: bool = False,
     ) -> List[models.ScoredPoint]:
         dense_embedding = self.embedder.get_embedding(query)
         sparse_embedding = next(self.sparse_encoder.embed([query])).as_object()
@@ -497,7 +528,7 @@ class Qdrant(VectorDb):
                 models.Prefetch(query=dense_embedding, limit=limit, using=self.dense_vector_name),
             ],
             query=models.FusionQuery(fusion=self.hybrid_fusion_strategy),
-            with_vectors=True,
+            with_vectors=with_vectors,
             with_payload=True,
             limit=limit,
             query_filter=filters,
@@ -509,6 +540,7 @@ class Qdrant(VectorDb):
         query: str,
         limit: int,
         filters: Optional[Dict[str, Any]],
+        with_vectors: bool = False,
     ) -> List[models.ScoredPoint]:
         dense_embedding = self.embedder.get_embedding(query)
 
@@ -517,7 +549,7 @@ class Qdrant(VectorDb):
             call = self.client.query_points(
                 collection_name=self.collection,
                 query=dense_embedding,
-                with_vectors=True,
+                with_vectors=with_vectors,
                 with_payload=True,
                 limit=limit,
                 query_filter=filters,
@@ -528,7 +560,7 @@ class Qdrant(VectorDb):
             call = self.client.query_points(
                 collection_name=self.collection,
                 query=dense_embedding,
-                with_vectors=True,
+                with_vectors=with_vectors,
                 with_payload=True,
                 limit=limit,
                 query_filter=filters,
@@ -540,12 +572,13 @@ class Qdrant(VectorDb):
         query: str,
         limit: int,
         filters: Optional[Dict[str, Any]],
+        with_vectors: bool = False,
     ) -> List[models.ScoredPoint]:
         sparse_embedding = next(self.sparse_encoder.embed([query])).as_object()
         call = self.client.query_points(
             collection_name=self.collection,
             query=models.SparseVector(**sparse_embedding),
-            with_vectors=True,
+            with_vectors=with_vectors,
             with_payload=True,
             limit=limit,
             using=self.sparse_vector_name,
@@ -558,15 +591,16 @@ class Qdrant(VectorDb):
         query: str,
         limit: int,
         filters: Optional[Dict[str, Any]],
+        with_vectors: bool = False,
     ) -> List[models.ScoredPoint]:
-        dense_embedding = self.embedder.get_embedding(query)
+        dense_embedding = await self.embedder.aget_embedding(query)
 
         # TODO(v2.0.0): Remove this conditional and always use named vectors
         if self.use_named_vectors:
             call = await self.async_client.query_points(
                 collection_name=self.collection,
                 query=dense_embedding,
-                with_vectors=True,
+                with_vectors=with_vectors,
                 with_payload=True,
                 limit=limit,
                 query_filter=filters,
@@ -577,7 +611,7 @@ class Qdrant(VectorDb):
             call = await self.async_client.query_points(
                 collection_name=self.collection,
                 query=dense_embedding,
-                with_vectors=True,
+                with_vectors=with_vectors,
                 with_payload=True,
                 limit=limit,
                 query_filter=filters,
@@ -589,12 +623,13 @@ class Qdrant(VectorDb):
         query: str,
         limit: int,
         filters: Optional[Dict[str, Any]],
+        with_vectors: bool = False,
     ) -> List[models.ScoredPoint]:
         sparse_embedding = next(self.sparse_encoder.embed([query])).as_object()
         call = await self.async_client.query_points(
             collection_name=self.collection,
             query=models.SparseVector(**sparse_embedding),
-            with_vectors=True,
+            with_vectors=with_vectors,
             with_payload=True,
             limit=limit,
             using=self.sparse_vector_name,
@@ -607,8 +642,9 @@ class Qdrant(VectorDb):
         query: str,
         limit: int,
         filters: Optional[Dict[str, Any]],
+        with_vectors: bool = False,
     ) -> List[models.ScoredPoint]:
-        dense_embedding = self.embedder.get_embedding(query)
+        dense_embedding = await self.embedder.aget_embedding(query)
         sparse_embedding = next(self.sparse_encoder.embed([query])).as_object()
         call = await self.async_client.query_points(
             collection_name=self.collection,
@@ -621,14 +657,14 @@ class Qdrant(VectorDb):
                 models.Prefetch(query=dense_embedding, limit=limit, using=self.dense_vector_name),
             ],
             query=models.FusionQuery(fusion=self.hybrid_fusion_strategy),
-            with_vectors=True,
+            with_vectors=with_vectors,
             with_payload=True,
             limit=limit,
             query_filter=filters,
         )
         return call.points
 
-    def _build_search_results(self, results, query: str) -> List[Document]:
+    def _build_search_results(self, results, query: str, rerank: bool = True) -> List[Document]:
         search_results: List[Document] = []
 
         for result in results:
@@ -636,45 +672,155 @@ class Qdrant(VectorDb):
                 continue
             search_results.append(
                 Document(
+                    id=str(result.id),
                     name=result.payload["name"],
                     meta_data=result.payload["meta_data"],
                     content=result.payload["content"],
                     embedder=self.embedder,
-                    embedding=result.vector,  # type: ignore
+                    embedding=self._get_dense_vector(result.vector),
                     usage=result.payload["usage"],
                 )
             )
 
+        if not rerank:
+            return search_results
+
         if self.reranker:
             search_results = self.reranker.rerank(query=query, documents=search_results)
 
         log_info(f"Found {len(search_results)} documents")
         return search_results
 
-    def _format_filters(self, filters: Optional[Dict[str, Any]]) -> Optional[models.Filter]:
-        if filters:
-            filter_conditions = []
-            for key, value in filters.items():
-                # If key contains a dot already, assume it's in the correct format
-                # Otherwise, assume it's a metadata field and add the prefix
-                if "." not in key and not key.startswith("meta_data."):
-                    # This is a simple field name, assume it's metadata
-                    key = f"meta_data.{key}"
-
-                if isinstance(value, dict):
-                    # Handle nested dictionaries
-                    for sub_key, sub_value in value.items():
-                        filter_conditions.append(
-                            models.FieldCondition(key=f"{key}.{sub_key}", match=models.MatchValue(value=sub_value))
-                        )
+    def _get_dense_vector(self, vector: Any) -> Optional[List[float]]:
+        """The dense vector of a point, which is named when the collection also has sparse vectors."""
+        if isinstance(vector, dict):
+            return vector.get(self.dense_vector_name)  # type: ignore
+        return vector
+
+    def _get_embeddings_from_points(self, points: List[models.Record]) -> Dict[str, List[float]]:
+        embeddings: Dict[str, List[float]] = {}
+        for point in points:
+            vector = self._get_dense_vector(point.vector)
+            if vector is not None:
+                embeddings[str(point.id)] = vector
+        return embeddings
+
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """Fetch the dense vectors of points by id, e.g. the ids of documents returned by search."""
+        if len(ids) == 0:
+            return {}
+        points = self.client.retrieve(collection_name=self.collection, ids=ids, with_vectors=True, with_payload=False)
+        return self._get_embeddings_from_points(points)
+
+    async def async_get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        if len(ids) == 0:
+            return {}
+        points = await self.async_client.retrieve(
+            collection_name=self.collection, ids=ids, with_vectors=True, with_payload=False
+        )
+        return self._get_embeddings_from_points(points)
+
+    def _format_filters(self, filters: Optional[Union[Dict[str, Any], FilterExpr]]) -> Optional[models.Filter]:
+        expression = parse_filters(filters or None)
+        if expression is None:
+            return None
+        condition = self._compile_filter(expression)
+        if isinstance(condition, models.Filter):
+            return condition
+        return models.Filter(must=[condition])
+
+    def _compile_filter(self, expression: FilterExpr) -> Any:
+        """Compile a filter expression to a Qdrant condition. Logical operators become nested filters."""
+        if isinstance(expression, AND):
+            must: List[Any] = []
+            for nested in expression.expressions:
+                condition = self._compile_filter(nested)
+                if isinstance(condition, models.Filter) and condition.should is None and condition.must_not is None:
+                    must.extend(condition.must or [])  # type: ignore
                 else:
-                    # Handle direct key-value pairs
-                    filter_conditions.append(models.FieldCondition(key=key, match=models.MatchValue(value=value)))
-
-            if filter_conditions:
-                return models.Filter(must=filter_conditions)
+                    must.append(condition)
+            return models.Filter(must=must)
+        if isinstance(expression, OR):
+            return models.Filter(should=[self._compile_filter(nested) for nested in expression.expressions])
+
+        key = self._get_payload_key(expression.key)  # type: ignore
+        if isinstance(expression, EQ) and isinstance(expression.value, list):
+            # A list value in dict filters matches any of its items
+            expression = IN(expression.key, expression.value)
+        if isinstance(expression, EQ):
+            if isinstance(expression.value, dict):
+                # Handle nested dictionaries
+                return models.Filter(
+                    must=[
+                        models.FieldCondition(key=f"{key}.{sub_key}", match=models.MatchValue(value=sub_value))
+                        for sub_key, sub_value in expression.value.items()
+                    ]
+                )
+            return models.FieldCondition(key=key, match=models.MatchValue(value=expression.value))
+        if isinstance(expression, IN):
+            return models.FieldCondition(key=key, match=models.MatchAny(any=list(expression.values)))
+        if isinstance(expression, RANGE):
+            return models.FieldCondition(key=key, range=models.Range(**expression.bounds))
+        raise ValueError(f"Unsupported filter expression: {expression}")
+
+    def _get_payload_key(self, key: str) -> str:
+        # If key contains a dot already, assume it's in the correct format
+        # Otherwise, assume it's a metadata field and add the prefix
+        if "." not in key and not key.startswith("meta_data."):
+            return f"meta_data.{key}"
+        return key
+
+    def _track_filter_usage(self, filters: Optional[Union[Dict[str, Any], FilterExpr]]) -> None:
+        """Count the searches filtering on each key. The keys are indexed by create_filter_indexes()."""
+        if self.filter_index_threshold is None:
+            return
+        values: Dict[str, Any] = {}
+        for expression in walk_filters(parse_filters(filters or None)):
+            if isinstance(expression, EQ) and isinstance(expression.value, list):
+                if expression.value:
+                    values[expression.key] = expression.value[0]
+            elif isinstance(expression, EQ) and not isinstance(expression.value, dict):
+                values[expression.key] = expression.value
+            elif isinstance(expression, IN) and expression.values:
+                values[expression.key] = expression.values[0]
+            elif isinstance(expression, RANGE) and expression.bounds:
+                values[expression.key] = next(iter(expression.bounds.values()))
+
+        for key, value in values.items():
+            self._filter_key_counts[key] = self._filter_key_counts.get(key, 0) + 1
+            self._filter_key_values[key] = value
+
+    def create_filter_indexes(self) -> None:
+        """
+        Create payload indexes on the metadata keys that searches filtered on at least filter_index_threshold times.
 
-        return None
+        Searches only count the keys they filter on, the indexes are created here, outside of searches.
+        A key whose index can not be created is logged and tried again on the next call.
+        """
+        if self.filter_index_threshold is None:
+            return
+        for key, count in list(self._filter_key_counts.items()):
+            if count < self.filter_index_threshold or key in self._indexed_filter_keys:
+                continue
+            value = self._filter_key_values.get(key)
+            if isinstance(value, bool):
+                field_schema = models.PayloadSchemaType.BOOL
+            elif isinstance(value, int):
+                field_schema = models.PayloadSchemaType.INTEGER
+            elif isinstance(value, float):
+                field_schema = models.PayloadSchemaType.FLOAT
+            else:
+                field_schema = models.PayloadSchemaType.KEYWORD
+            field_name = self._get_payload_key(key)
+            try:
+                log_debug(f"Creating {field_schema.value} payload index on {field_name}")
+                self.client.create_payload_index(
+                    collection_name=self.collection, field_name=field_name, field_schema=field_schema
+                )
+            except Exception as e:
+                log_warning(f"Error creating payload index on {field_name}: {e}")
+                continue
+            self._indexed_filter_keys.add(key)
 
     def drop(self) -> None:
         if self.exists():
@@ -700,7 +846,7 @@ class Qdrant(VectorDb):
         return count_result.count
 
     def optimize(self) -> None:
-        pass
+        self.create_filter_indexes()
 
     def delete(self) -> bool:
         return self.client.delete_collection(collection_name=self.collection)
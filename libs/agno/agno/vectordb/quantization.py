@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class Quantization(str, Enum):
+    # 16-bit floats, halves the size of the vectors
+    half = "half"
+    # 8-bit integer scalar quantization, a quarter of the size of the vectors
+    int8 = "int8"
+    # 1 bit per dimension, 1/32 of the size of the vectors
+    binary = "binary"
@@ -253,7 +253,13 @@ class SingleStore(VectorDb):
             sess.commit()
             log_debug(f"Committed {counter} documents")
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         """
         Search for documents based on a query and optional filters.
 
@@ -261,6 +267,7 @@ class SingleStore(VectorDb):
             query (str): The search query.
             limit (int): The maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Optional filters for the search.
+            include_embeddings (bool): Whether to select the embedding column and return it on the documents.
 
         Returns:
             List[Document]: List of documents that match the query.
@@ -271,12 +278,14 @@ class SingleStore(VectorDb):
             return []
 
         columns = [
+            self.table.c.id,
             self.table.c.name,
             self.table.c.meta_data,
             self.table.c.content,
-            self.table.c.embedding,
             self.table.c.usage,
         ]
+        if include_embeddings:
+            columns.append(self.table.c.embedding)
 
         stmt = select(*columns)
 
@@ -321,8 +330,8 @@ class SingleStore(VectorDb):
             usage_dict = json.loads(neighbor.usage) if neighbor.usage else {}
 
             # Convert SingleStore VECTOR type to list
-            embedding_list = []
-            if neighbor.embedding:
+            embedding_list = None
+            if include_embeddings and neighbor.embedding:
                 try:
                     embedding_list = json.loads(neighbor.embedding)
                 except Exception as e:
@@ -331,6 +340,7 @@ class SingleStore(VectorDb):
 
             search_results.append(
                 Document(
+                    id=neighbor.id,
                     name=neighbor.name,
                     meta_data=meta_data_dict,
                     content=neighbor.content,
@@ -345,6 +355,27 @@ class SingleStore(VectorDb):
 
         return search_results
 
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """
+        Fetch the stored embeddings of documents by id.
+
+        Args:
+            ids (List[str]): The ids of the documents.
+
+        Returns:
+            Dict[str, List[float]]: The embedding of each document that was found, by id.
+        """
+        if len(ids) == 0:
+            return {}
+        stmt = select(self.table.c.id, self.table.c.embedding).where(self.table.c.id.in_(ids))
+        embeddings: Dict[str, List[float]] = {}
+        with self.Session.begin() as sess:
+            sess.execute(text("SET vector_type_project_format = JSON"))
+            for row in sess.execute(stmt).fetchall():
+                if row.embedding:
+                    embeddings[row.id] = json.loads(row.embedding)
+        return embeddings
+
     def drop(self) -> None:
         """
         Delete the table.
@@ -406,7 +437,11 @@ class SingleStore(VectorDb):
         raise NotImplementedError(f"Async not supported on {self.__class__.__name__}.")
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         raise NotImplementedError(f"Async not supported on {self.__class__.__name__}.")
 
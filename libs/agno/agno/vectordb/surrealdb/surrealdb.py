@@ -11,7 +11,7 @@ except ImportError as e:
     msg = "The `surrealdb` package is not installed. Please install it via `pip install surrealdb`."
     raise ImportError(msg) from e
 
-from agno.document import Document
+from agno.document import Document, async_embed_documents
 from agno.embedder import Embedder
 from agno.utils.log import log_debug, log_error, log_info
 from agno.vectordb.base import VectorDb
@@ -58,7 +58,7 @@ class SurrealDb(VectorDb):
     SEARCH_QUERY: Final[str] = """
         SELECT
             content,
-            meta_data,
+            meta_data,{embedding_field}
             vector::distance::knn() as distance
         FROM {collection}
         WHERE embedding <|{limit}, {search_ef}|> $query_embedding
@@ -246,13 +246,20 @@ class SurrealDb(VectorDb):
             thing = f"{self.collection}:{doc.id}" if doc.id else self.collection
             self.client.query(self.UPSERT_QUERY.format(thing=thing), data)
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         """Search for similar documents.
 
         Args:
             query: The query to search for.
             limit: The maximum number of documents to return.
             filters: A dictionary of filters to apply to the query.
+            include_embeddings: Whether to return the embeddings of the documents.
 
         Returns:
             A list of documents that are similar to the query.
@@ -271,6 +278,7 @@ class SurrealDb(VectorDb):
             search_ef=self.search_ef,
             filter_condition=filter_condition,
             distance=self.distance,
+            embedding_field="\n            embedding," if include_embeddings else "",
         )
         log_debug(f"Search query: {search_query}")
         response = self.client.query(
@@ -284,7 +292,7 @@ class SurrealDb(VectorDb):
             if isinstance(item, dict):
                 doc = Document(
                     content=item.get("content", ""),
-                    embedding=item.get("embedding", []),
+                    embedding=item.get("embedding"),
                     meta_data=item.get("meta_data", {}),
                     embedder=self.embedder,
                 )
@@ -388,8 +396,8 @@ class SurrealDb(VectorDb):
             filters: A dictionary of filters to apply to the query.
 
         """
+        await async_embed_documents(documents, self.embedder)
         for doc in documents:
-            doc.embed(embedder=self.embedder)
             meta_data: Dict[str, Any] = doc.meta_data if isinstance(doc.meta_data, dict) else {}
             data: Dict[str, Any] = {"content": doc.content, "embedding": doc.embedding, "meta_data": meta_data}
             if filters:
@@ -405,8 +413,8 @@ class SurrealDb(VectorDb):
             filters: A dictionary of filters to apply to the query.
 
         """
+        await async_embed_documents(documents, self.embedder)
         for doc in documents:
-            doc.embed(embedder=self.embedder)
             meta_data: Dict[str, Any] = doc.meta_data if isinstance(doc.meta_data, dict) else {}
             data: Dict[str, Any] = {"content": doc.content, "embedding": doc.embedding, "meta_data": meta_data}
             if filters:
@@ -420,6 +428,7 @@ class SurrealDb(VectorDb):
         query: str,
         limit: int = 5,
         filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """Search for similar documents asynchronously.
 
@@ -427,12 +436,13 @@ class SurrealDb(VectorDb):
             query: The query to search for.
             limit: The maximum number of documents to return.
             filters: A dictionary of filters to apply to the query.
+            include_embeddings: Whether to return the embeddings of the documents.
 
         Returns:
             A list of documents that are similar to the query.
 
         """
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = await self.embedder.aget_embedding(query)
         if query_embedding is None:
             log_error(f"Error getting embedding for Query: {query}")
             return []
@@ -444,6 +454,7 @@ class SurrealDb(VectorDb):
             search_ef=self.search_ef,
             filter_condition=filter_condition,
             distance=self.distance,
+            embedding_field="\n            embedding," if include_embeddings else "",
         )
         response = await self.async_client.query(
             search_query,
@@ -455,7 +466,7 @@ class SurrealDb(VectorDb):
             if isinstance(item, dict):
                 doc = Document(
                     content=item.get("content", ""),
-                    embedding=item.get("embedding", []),
+                    embedding=item.get("embedding"),
                     meta_data=item.get("meta_data", {}),
                     embedder=self.embedder,
                 )
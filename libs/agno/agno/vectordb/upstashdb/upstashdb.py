@@ -243,6 +243,7 @@ class UpstashVectorDb(VectorDb):
         limit: int = 5,
         filters: Optional[Dict[str, Any]] = None,
         namespace: Optional[str] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """Search for documents in the index.
         Args:
@@ -250,6 +251,7 @@ class UpstashVectorDb(VectorDb):
             limit (int, optional): Maximum number of results to return. Defaults to 5.
             filters (Optional[Dict[str, Any]], optional): Metadata filters for the search.
             namespace (Optional[str], optional): The namespace to search in. Defaults to None, which uses the instance namespace.
+            include_embeddings (bool, optional): Whether to return the vectors of the documents. Defaults to False.
         Returns:
             List[Document]: List of matching documents.
         """
@@ -271,7 +273,7 @@ class UpstashVectorDb(VectorDb):
                 # filter=filter_str,
                 include_data=True,
                 include_metadata=True,
-                include_vectors=True,
+                include_vectors=include_embeddings,
             )
         else:
             response = self.index.query(
@@ -281,7 +283,7 @@ class UpstashVectorDb(VectorDb):
                 # filter=filter_str,
                 include_data=True,
                 include_metadata=True,
-                include_vectors=True,
+                include_vectors=include_embeddings,
             )
 
         if response is None:
@@ -290,13 +292,13 @@ class UpstashVectorDb(VectorDb):
 
         search_results = []
         for result in response:
-            if result.data is not None and result.id is not None and result.vector is not None:
+            if result.data is not None and result.id is not None:
                 search_results.append(
                     Document(
                         content=result.data,
                         id=result.id,
                         meta_data=result.metadata or {},
-                        embedding=result.vector,
+                        embedding=result.vector if include_embeddings else None,
                     )
                 )
 
@@ -305,6 +307,18 @@ class UpstashVectorDb(VectorDb):
 
         return search_results
 
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """Fetch the vectors of documents by id.
+        Args:
+            ids (List[str]): The ids of the documents.
+        Returns:
+            Dict[str, List[float]]: The vector of each document that was found, by id.
+        """
+        if len(ids) == 0:
+            return {}
+        response = self.index.fetch(ids=ids, include_vectors=True, namespace=self.namespace)
+        return {result.id: result.vector for result in response if result is not None and result.vector is not None}
+
     def delete(self, namespace: Optional[str] = None, delete_all: bool = False) -> bool:
         """Clear the index.
         Args:
@@ -17,7 +17,7 @@ try:
 except ImportError:
     raise ImportError("Weaviate is not installed. Install using 'pip install weaviate-client'.")
 
-from agno.document import Document
+from agno.document import Document, async_embed_documents
 from agno.embedder import Embedder
 from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, logger
@@ -291,6 +291,8 @@ class Weaviate(VectorDb):
         if not documents:
             return
 
+        await async_embed_documents(documents, self.embedder)
+
         client = await self.get_async_client()
         try:
             collection = client.collections.get(self.collection)
@@ -298,8 +300,6 @@ class Weaviate(VectorDb):
             # Process documents first
             for document in documents:
                 try:
-                    # Embed document
-                    document.embed(embedder=self.embedder)
                     if document.embedding is None:
                         logger.error(f"Document embedding is None: {document.name}")
                         continue
@@ -355,12 +355,13 @@ class Weaviate(VectorDb):
 
         log_debug(f"Upserting {len(documents)} documents into Weaviate asynchronously.")
 
+        await async_embed_documents(documents, self.embedder)
+
         client = await self.get_async_client()
         try:
             collection = client.collections.get(self.collection)
 
             for document in documents:
-                document.embed(embedder=self.embedder)
                 if document.embedding is None:
                     logger.error(f"Document embedding is None: {document.name}")
                     continue
@@ -384,7 +385,13 @@ class Weaviate(VectorDb):
         finally:
             await client.close()
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         """
         Perform a search based on the configured search type.
 
@@ -392,22 +399,27 @@ class Weaviate(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            include_embeddings (bool): Whether to return the vectors of the objects.
 
         Returns:
             List[Document]: List of matching documents.
         """
         if self.search_type == SearchType.vector:
-            return self.vector_search(query, limit, filters)
+            return self.vector_search(query, limit, filters, include_embeddings)
         elif self.search_type == SearchType.keyword:
-            return self.keyword_search(query, limit, filters)
+            return self.keyword_search(query, limit, filters, include_embeddings)
         elif self.search_type == SearchType.hybrid:
-            return self.hybrid_search(query, limit, filters)
+            return self.hybrid_search(query, limit, filters, include_embeddings)
         else:
             logger.error(f"Invalid search type '{self.search_type}'.")
             return []
 
     async def async_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """
         Perform a search based on the configured search type asynchronously.
@@ -416,21 +428,28 @@ class Weaviate(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            include_embeddings (bool): Whether to return the vectors of the objects.
 
         Returns:
             List[Document]: List of matching documents.
         """
         if self.search_type == SearchType.vector:
-            return await self.async_vector_search(query, limit, filters)
+            return await self.async_vector_search(query, limit, filters, include_embeddings)
         elif self.search_type == SearchType.keyword:
-            return await self.async_keyword_search(query, limit, filters)
+            return await self.async_keyword_search(query, limit, filters, include_embeddings)
         elif self.search_type == SearchType.hybrid:
-            return await self.async_hybrid_search(query, limit, filters)
+            return await self.async_hybrid_search(query, limit, filters, include_embeddings)
         else:
             logger.error(f"Invalid search type '{self.search_type}'.")
             return []
 
-    def vector_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def vector_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         try:
             query_embedding = self.embedder.get_embedding(query)
             if query_embedding is None:
@@ -444,7 +463,7 @@ class Weaviate(VectorDb):
                 near_vector=query_embedding,
                 limit=limit,
                 return_properties=["name", "content", "meta_data"],
-                include_vector=True,
+                include_vector=include_embeddings,
                 filters=filter_expr,
             )
 
@@ -465,7 +484,11 @@ class Weaviate(VectorDb):
             self.get_client().close()
 
     async def async_vector_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """
         Perform a vector search in Weaviate asynchronously.
@@ -477,7 +500,7 @@ class Weaviate(VectorDb):
         Returns:
             List[Document]: List of matching documents.
         """
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = await self.embedder.aget_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for query: {query}")
             return []
@@ -492,14 +515,14 @@ class Weaviate(VectorDb):
                 near_vector=query_embedding,
                 limit=limit,
                 return_properties=["name", "content", "meta_data"],
-                include_vector=True,
+                include_vector=include_embeddings,
                 filters=filter_expr,
             )
 
             search_results = self.get_search_results(response)
 
             if self.reranker:
-                search_results = self.reranker.rerank(query=query, documents=search_results)
+                search_results = await self.reranker.arerank(query=query, documents=search_results)
 
             log_info(f"Found {len(search_results)} documents")
 
@@ -510,7 +533,13 @@ class Weaviate(VectorDb):
             logger.error(f"Error searching for documents: {e}")
             return []
 
-    def keyword_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def keyword_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         try:
             collection = self.get_client().collections.get(self.collection)
             filter_expr = self._build_filter_expression(filters)
@@ -520,7 +549,7 @@ class Weaviate(VectorDb):
                 query_properties=["content"],
                 limit=limit,
                 return_properties=["name", "content", "meta_data"],
-                include_vector=True,
+                include_vector=include_embeddings,
                 filters=filter_expr,
             )
 
@@ -541,7 +570,11 @@ class Weaviate(VectorDb):
             self.get_client().close()
 
     async def async_keyword_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """
         Perform a keyword search in Weaviate asynchronously.
@@ -564,14 +597,14 @@ class Weaviate(VectorDb):
                 query_properties=["content"],
                 limit=limit,
                 return_properties=["name", "content", "meta_data"],
-                include_vector=True,
+                include_vector=include_embeddings,
                 filters=filter_expr,
             )
 
             search_results = self.get_search_results(response)
 
             if self.reranker:
-                search_results = self.reranker.rerank(query=query, documents=search_results)
+                search_results = await self.reranker.arerank(query=query, documents=search_results)
 
             log_info(f"Found {len(search_results)} documents")
 
@@ -582,7 +615,13 @@ class Weaviate(VectorDb):
             logger.error(f"Error searching for documents: {e}")
             return []
 
-    def hybrid_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def hybrid_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
+    ) -> List[Document]:
         try:
             query_embedding = self.embedder.get_embedding(query)
             if query_embedding is None:
@@ -597,7 +636,7 @@ class Weaviate(VectorDb):
                 vector=query_embedding,
                 limit=limit,
                 return_properties=["name", "content", "meta_data"],
-                include_vector=True,
+                include_vector=include_embeddings,
                 query_properties=["content"],
                 alpha=self.hybrid_search_alpha,
                 filters=filter_expr,
@@ -620,7 +659,11 @@ class Weaviate(VectorDb):
             self.get_client().close()
 
     async def async_hybrid_search(
-        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: bool = False,
     ) -> List[Document]:
         """
         Perform a hybrid search combining vector and keyword search in Weaviate asynchronously.
@@ -632,7 +675,7 @@ class Weaviate(VectorDb):
         Returns:
             List[Document]: List of matching documents.
         """
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = await self.embedder.aget_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for query: {query}")
             return []
@@ -648,7 +691,7 @@ class Weaviate(VectorDb):
                 vector=query_embedding,
                 limit=limit,
                 return_properties=["name", "content", "meta_data"],
-                include_vector=True,
+                include_vector=include_embeddings,
                 query_properties=["content"],
                 alpha=self.hybrid_search_alpha,
                 filters=filter_expr,
@@ -657,7 +700,7 @@ class Weaviate(VectorDb):
             search_results = self.get_search_results(response)
 
             if self.reranker:
-                search_results = self.reranker.rerank(query=query, documents=search_results)
+                search_results = await self.reranker.arerank(query=query, documents=search_results)
 
             log_info(f"Found {len(search_results)} documents")
 
@@ -742,10 +785,12 @@ class Weaviate(VectorDb):
         for obj in response.objects:
             properties = obj.properties
             meta_data = json.loads(properties["meta_data"]) if properties.get("meta_data") else None
-            embedding = obj.vector["default"] if isinstance(obj.vector, dict) else obj.vector
+            # The vector is an empty dict when it was not requested
+            embedding = obj.vector.get("default") if isinstance(obj.vector, dict) else obj.vector
 
             search_results.append(
                 Document(
+                    id=str(obj.uuid),
                     name=properties["name"],
                     meta_data=meta_data if meta_data else {},
                     content=properties["content"],
@@ -757,6 +802,38 @@ class Weaviate(VectorDb):
 
         return search_results
 
+    def get_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """
+        Fetch the stored vectors of objects by uuid, e.g. the ids of documents returned by search.
+
+        Args:
+            ids (List[str]): The uuids of the objects.
+
+        Returns:
+            Dict[str, List[float]]: The vector of each object that was found, by uuid.
+        """
+        if len(ids) == 0:
+            return {}
+        try:
+            collection = self.get_client().collections.get(self.collection)
+            response = collection.query.fetch_objects(
+                filters=Filter.by_id().contains_any(ids),
+                limit=len(ids),
+                return_properties=[],
+                include_vector=True,
+            )
+            embeddings: Dict[str, List[float]] = {}
+            for obj in response.objects:
+                embedding = obj.vector.get("default") if isinstance(obj.vector, dict) else obj.vector
+                if embedding is not None:
+                    embeddings[str(obj.uuid)] = embedding
+            return embeddings
+        except Exception as e:
+            logger.error(f"Error fetching embeddings: {e}")
+            return {}
+        finally:
+            self.get_client().close()
+
     def upsert_available(self) -> bool:
         """Indicate that upsert functionality is available."""
         return True
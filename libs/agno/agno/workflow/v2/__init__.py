@@ -1,5 +1,6 @@
 from agno.workflow.v2.condition import Condition
 from agno.workflow.v2.loop import Loop
+from agno.workflow.v2.map import Map
 from agno.workflow.v2.parallel import Parallel
 from agno.workflow.v2.router import Router
 from agno.workflow.v2.step import Step
@@ -12,6 +13,7 @@ __all__ = [
     "Steps",
     "Step",
     "Loop",
+    "Map",
     "Parallel",
     "Condition",
     "Router",
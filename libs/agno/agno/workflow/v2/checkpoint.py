@@ -0,0 +1,62 @@
+import json
+from dataclasses import dataclass, field
+from hashlib import sha256
+from time import time
+from typing import Any, Dict, List, Union
+
+from agno.workflow.v2.types import StepInput, StepOutput
+
+
+@dataclass
+class StepCheckpoint:
+    """The output of a completed workflow step, stored with the run so the run can be resumed"""
+
+    run_id: str
+    # Position and name of the step in the workflow, e.g. "2:Research"
+    step_path: str
+    # Hash of the step input, see get_step_input_hash
+    input_hash: str
+    output: Union[StepOutput, List[StepOutput]]
+    created_at: int = field(default_factory=lambda: int(time()))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "step_path": self.step_path,
+            "input_hash": self.input_hash,
+            "output": [output.to_dict() for output in self.output]
+            if isinstance(self.output, list)
+            else self.output.to_dict(),
+            "created_at": self.created_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StepCheckpoint":
+        output_data = data["output"]
+        return cls(
+            run_id=data["run_id"],
+            step_path=data["step_path"],
+            input_hash=data["input_hash"],
+            output=[StepOutput.from_dict(output) for output in output_data]
+            if isinstance(output_data, list)
+            else StepOutput.from_dict(output_data),
+            created_at=data.get("created_at", int(time())),
+        )
+
+
+def get_step_path(index: int, step: Any) -> str:
+    """The position and name of a workflow step"""
+    return f"{index}:{getattr(step, 'name', None) or f'step_{index + 1}'}"
+
+
+def get_step_input_hash(step_input: StepInput) -> str:
+    """Hash the message, data, media and previous step contents of a step input.
+
+    Responses and metrics of the previous steps are left out, so the same inputs hash the same in every run.
+    """
+    data = step_input.to_dict()
+    data.pop("previous_step_content", None)
+    data["previous_step_outputs"] = {
+        step_name: output.get("content") for step_name, output in (data.get("previous_step_outputs") or {}).items()
+    }
+    return sha256(json.dumps(data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
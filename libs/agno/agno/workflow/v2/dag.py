@@ -0,0 +1,270 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from queue import Queue
+from threading import Event
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from agno.utils.fanout import FanOutEvent
+
+T = TypeVar("T")
+
+
+def get_step_dependencies(steps: List[Any]) -> Optional[List[List[int]]]:
+    """Resolve the `depends_on` step names of the workflow steps to the positions of the steps they depend on.
+
+    A step without `depends_on` depends on all previous steps, and `depends_on=[]` only depends on the workflow input.
+    Steps can only depend on steps declared before them, so the steps always form a DAG.
+
+    Returns:
+        Optional[List[List[int]]]: The dependencies of each step, None if no step declares `depends_on`.
+    """
+    if all(getattr(step, "depends_on", None) is None for step in steps):
+        return None
+
+    step_positions: Dict[str, int] = {}
+    for i, step in enumerate(steps):
+        name = getattr(step, "name", None)
+        if name is not None and name not in step_positions:
+            step_positions[name] = i
+
+    dependencies: List[List[int]] = []
+    for i, step in enumerate(steps):
+        depends_on = getattr(step, "depends_on", None)
+        if depends_on is None:
+            dependencies.append(list(range(i)))
+            continue
+
+        step_dependencies: Set[int] = set()
+        for name in depends_on:
+            if name not in step_positions:
+                raise ValueError(f"Step '{getattr(step, 'name', None)}' depends on unknown step '{name}'")
+            if step_positions[name] >= i:
+                raise ValueError(
+                    f"Step '{getattr(step, 'name', None)}' depends on step '{name}', which must be declared before it"
+                )
+            step_dependencies.add(step_positions[name])
+        dependencies.append(sorted(step_dependencies))
+    return dependencies
+
+
+class _StepGraphState:
+    """Tracks which steps can start and which events can be yielded, in workflow order."""
+
+    def __init__(self, dependencies: List[List[int]], is_stop: Optional[Callable[[Any], bool]]):
+        self.dependencies = dependencies
+        self.is_stop = is_stop
+        # Steps after a step that failed or requested a stop are not started, like in a sequential run
+        self.last_step = len(dependencies) - 1
+        self.started: Set[int] = set()
+        self.succeeded: Set[int] = set()
+        # Events of each step not yielded yet
+        self.pending: Dict[int, List[FanOutEvent]] = {i: [] for i in range(len(dependencies))}
+        # Step whose events are yielded as they arrive
+        self.head = 0
+
+    def get_ready_steps(self) -> List[int]:
+        """Mark the steps whose dependencies succeeded as started and return them."""
+        ready = [
+            i
+            for i in range(self.last_step + 1)
+            if i not in self.started and all(dependency in self.succeeded for dependency in self.dependencies[i])
+        ]
+        self.started.update(ready)
+        return ready
+
+    def add(self, event: FanOutEvent) -> List[FanOutEvent]:
+        """Return the events to yield after receiving an event."""
+        if event.done:
+            if event.error is None:
+                self.succeeded.add(event.index)
+            else:
+                self.last_step = min(self.last_step, event.index)
+        elif self.is_stop is not None and self.is_stop(event.item):
+            self.last_step = min(self.last_step, event.index)
+        self.pending[event.index].append(event)
+
+        ready: List[FanOutEvent] = []
+        while not self.finished and self.pending[self.head]:
+            head_events = self.pending[self.head]
+            self.pending[self.head] = []
+            ready.extend(head_events)
+            if head_events[-1].done:
+                if head_events[-1].error is not None:
+                    # Nothing is yielded after a failed step
+                    self.head = len(self.dependencies)
+                    break
+                self.head += 1
+        return ready
+
+    @property
+    def finished(self) -> bool:
+        return self.head > self.last_step
+
+
+def run_step_graph(
+    dependencies: List[List[int]],
+    run_step: Callable[[int], Iterable[T]],
+    max_concurrency: Optional[int] = None,
+    is_stop: Optional[Callable[[T], bool]] = None,
+) -> Iterator[FanOutEvent[T]]:
+    """Run steps in threads as soon as the steps they depend on succeeded, and yield their items in workflow order.
+
+    The items of the first unfinished step are yielded as they are produced, the items of later steps are held back
+    until all steps before them are done, so the events are in the same order as in a sequential run.
+    The items of each step are followed by a done event with the error of the step, if any.
+    Steps after a step that failed, or yielded an item for which `is_stop` is true, are not started.
+    Closing the iterator stops the running steps at their next item and waits for them to finish.
+
+    Args:
+        dependencies: Positions of the steps each step depends on, from get_step_dependencies.
+        run_step: Function returning the items of the step at a position.
+        max_concurrency: Maximum number of steps run at the same time. None runs all ready steps at once.
+        is_stop: Returns True for items that request to stop the workflow.
+    """
+    if len(dependencies) == 0:
+        return
+
+    events: "Queue[FanOutEvent[T]]" = Queue()
+    stopped = Event()
+    state = _StepGraphState(dependencies, is_stop)
+
+    def run(index: int) -> None:
+        iterator = None
+        try:
+            iterator = iter(run_step(index))
+            for item in iterator:
+                if stopped.is_set():
+                    return
+                events.put(FanOutEvent(index=index, item=item))
+        except Exception as e:
+            events.put(FanOutEvent(index=index, done=True, error=e))
+            return
+        finally:
+            close = getattr(iterator, "close", None)
+            if stopped.is_set() and close is not None:
+                close()
+        events.put(FanOutEvent(index=index, done=True))
+
+    executor = ThreadPoolExecutor(max_workers=max_concurrency or len(dependencies), thread_name_prefix="workflow-step")
+    try:
+        for index in state.get_ready_steps():
+            executor.submit(run, index)
+        while not state.finished:
+            event = events.get()
+            ready = state.add(event)
+            if event.done:
+                for index in state.get_ready_steps():
+                    executor.submit(run, index)
+            yield from ready
+    finally:
+        stopped.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def arun_step_graph(
+    dependencies: List[List[int]],
+    run_step: Callable[[int], AsyncIterable[T]],
+    max_concurrency: Optional[int] = None,
+    is_stop: Optional[Callable[[T], bool]] = None,
+) -> AsyncIterator[FanOutEvent[T]]:
+    """Async version of run_step_graph. Closing the iterator cancels the running steps."""
+    if len(dependencies) == 0:
+        return
+
+    events: "asyncio.Queue[FanOutEvent[T]]" = asyncio.Queue()
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+    state = _StepGraphState(dependencies, is_stop)
+    runners: List["asyncio.Future[None]"] = []
+
+    async def run(index: int) -> None:
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            async for item in run_step(index):
+                await events.put(FanOutEvent(index=index, item=item))
+        except Exception as e:
+            await events.put(FanOutEvent(index=index, done=True, error=e))
+        else:
+            await events.put(FanOutEvent(index=index, done=True))
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    try:
+        runners.extend(asyncio.ensure_future(run(index)) for index in state.get_ready_steps())
+        while not state.finished:
+            event = await events.get()
+            ready = state.add(event)
+            if event.done:
+                runners.extend(asyncio.ensure_future(run(index)) for index in state.get_ready_steps())
+            for ready_event in ready:
+                yield ready_event
+    finally:
+        for runner in runners:
+            runner.cancel()
+
+
+def _get_step_items(events: Iterable[FanOutEvent[T]]) -> Iterator[T]:
+    for event in events:
+        if event.error is not None:
+            raise event.error
+        if not event.done:
+            yield event.item  # type: ignore
+
+
+def group_by_step(events: Iterable[FanOutEvent[T]]) -> Iterator[Tuple[int, Iterator[T]]]:
+    """Group the events of run_step_graph by step, the items of a failed step end with its error."""
+    for index, step_events in groupby(events, key=lambda event: event.index):
+        yield index, _get_step_items(step_events)
+
+
+async def agroup_by_step(events: AsyncIterable[FanOutEvent[T]]) -> AsyncIterator[Tuple[int, AsyncIterator[T]]]:
+    """Async version of group_by_step."""
+    iterator = events.__aiter__()
+    # Event read past the end of a step
+    lookahead: List[FanOutEvent[T]] = []
+
+    async def next_event() -> Optional[FanOutEvent[T]]:
+        if lookahead:
+            return lookahead.pop()
+        try:
+            return await iterator.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    async def get_step_items(index: int) -> AsyncIterator[T]:
+        while True:
+            event = await next_event()
+            if event is None:
+                return
+            if event.index != index:
+                lookahead.append(event)
+                return
+            if event.error is not None:
+                raise event.error
+            if not event.done:
+                yield event.item  # type: ignore
+
+    while True:
+        event = await next_event()
+        if event is None:
+            return
+        lookahead.append(event)
+        yield event.index, get_step_items(event.index)
+        # Skip the items the caller did not read
+        async for _ in get_step_items(event.index):
+            pass
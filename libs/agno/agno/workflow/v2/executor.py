@@ -0,0 +1,149 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass
+from threading import Event, Lock
+from time import perf_counter
+from typing import Awaitable, Callable, Generic, List, Optional, TypeVar
+from weakref import WeakKeyDictionary
+
+T = TypeVar("T")
+
+# The semaphore the current async task holds a slot of, released while the task waits for nested Parallel steps
+_held_semaphore: ContextVar[Optional[asyncio.Semaphore]] = ContextVar("agno_parallel_held_semaphore", default=None)
+
+
+@dataclass
+class ParallelTaskResult(Generic[T]):
+    """The result of a task run by the ParallelExecutor"""
+
+    value: Optional[T] = None
+    error: Optional[BaseException] = None
+    # Seconds between submitting the task and the task starting
+    queue_wait_time: float = 0.0
+    # Seconds the task ran for
+    execution_time: float = 0.0
+
+
+class _Task(Generic[T]):
+    """A task that runs once, either in a worker thread or in the thread waiting for it"""
+
+    def __init__(self, function: Callable[[], T]):
+        self.function = function
+        self.submitted_at = perf_counter()
+        self.result: ParallelTaskResult[T] = ParallelTaskResult()
+        self.done = Event()
+        self._claimed = False
+        self._lock = Lock()
+
+    def run(self) -> None:
+        with self._lock:
+            if self._claimed:
+                return
+            self._claimed = True
+
+        started_at = perf_counter()
+        try:
+            self.result.value = self.function()
+        except Exception as e:
+            self.result.error = e
+        finally:
+            self.result.queue_wait_time = started_at - self.submitted_at
+            self.result.execution_time = perf_counter() - started_at
+            self.done.set()
+
+
+class ParallelExecutor:
+    """Runs the steps of Parallel blocks in a pool of worker threads shared by all Parallel steps of a workflow.
+
+    The thread waiting for a Parallel step runs the steps no worker has started yet, so nested Parallel steps
+    always make progress, even when all workers are busy. Async runs are limited by a semaphore with the same number
+    of slots, and a step gives up its slot while it waits for the steps of a nested Parallel.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        # Maximum number of worker threads, and of concurrent tasks in async runs. None uses the
+        # ThreadPoolExecutor default for threads and does not limit async tasks.
+        self.max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = Lock()
+        # Semaphores are bound to an event loop
+        self._semaphores: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = WeakKeyDictionary()
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="workflow-parallel")
+            return self._pool
+
+    def _get_semaphore(self) -> Optional[asyncio.Semaphore]:
+        if self.max_workers is None:
+            return None
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_workers)
+        return self._semaphores[loop]
+
+    def run(self, functions: List[Callable[[], T]]) -> List[ParallelTaskResult[T]]:
+        """Run the functions concurrently and return their results in order"""
+        tasks = [_Task(function) for function in functions]
+        pool = self._get_pool()
+        for task in tasks[1:]:
+            pool.submit(task.run)
+        # Run the tasks no worker picked up yet in this thread
+        for task in tasks:
+            task.run()
+        for task in tasks:
+            task.done.wait()
+        return [task.result for task in tasks]
+
+    async def arun(self, functions: List[Callable[[], Awaitable[T]]]) -> List[ParallelTaskResult[T]]:
+        """Run the async functions concurrently and return their results in order"""
+        semaphore = self._get_semaphore()
+
+        async def run(function: Callable[[], Awaitable[T]]) -> ParallelTaskResult[T]:
+            result: ParallelTaskResult[T] = ParallelTaskResult()
+            submitted_at = perf_counter()
+            if semaphore is not None:
+                await semaphore.acquire()
+                _held_semaphore.set(semaphore)
+            started_at = perf_counter()
+            try:
+                result.value = await function()
+            except Exception as e:
+                result.error = e
+            finally:
+                if semaphore is not None:
+                    semaphore.release()
+            result.queue_wait_time = started_at - submitted_at
+            result.execution_time = perf_counter() - started_at
+            return result
+
+        held_semaphore = _held_semaphore.get()
+        if held_semaphore is not None:
+            held_semaphore.release()
+        try:
+            return list(await asyncio.gather(*(run(function) for function in functions)))
+        finally:
+            if held_semaphore is not None:
+                await held_semaphore.acquire()
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once they finished their tasks"""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False)
+                self._pool = None
+
+
+_default_executor: Optional[ParallelExecutor] = None
+_default_executor_lock = Lock()
+
+
+def get_default_parallel_executor() -> ParallelExecutor:
+    """The executor of Parallel steps that are not part of a workflow with its own executor"""
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = ParallelExecutor()
+        return _default_executor
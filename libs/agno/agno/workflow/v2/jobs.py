@@ -0,0 +1,447 @@
+import asyncio
+import os
+import socket
+from copy import copy
+from dataclasses import asdict, dataclass, field
+from time import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from uuid import uuid4
+
+from agno.run.base import RunStatus
+from agno.run.v2.workflow import WorkflowRunResponse
+from agno.utils.log import log_debug, logger
+
+try:
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.schema import Column, Index, MetaData, Table
+    from sqlalchemy.sql import and_, or_, text
+    from sqlalchemy.sql.expression import select, update
+    from sqlalchemy.types import JSON, Boolean, Float, Integer, String
+except ImportError:
+    raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
+
+if TYPE_CHECKING:
+    from agno.storage.base import Storage
+    from agno.workflow.v2.workflow import Workflow
+
+
+@dataclass
+class WorkflowJob:
+    """A background workflow run waiting in, or leased from, a JobQueue"""
+
+    # The id of the job is the id of the workflow run
+    job_id: str
+    workflow_id: str
+    session_id: str
+    user_id: Optional[str] = None
+    status: str = RunStatus.pending.value
+    # Extra arguments of the run, must be JSON serializable
+    run_kwargs: Optional[Dict[str, Any]] = None
+
+    attempts: int = 0
+    max_attempts: int = 3
+    # The job is not claimed before this time, used to delay retries
+    available_at: float = field(default_factory=time)
+
+    # The worker running the job and until when it may run it without a heartbeat
+    lease_owner: Optional[str] = None
+    lease_expires_at: Optional[float] = None
+    cancel_requested: bool = False
+
+    # The WorkflowRunResponse of the finished run
+    run: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    created_at: float = field(default_factory=time)
+    updated_at: float = field(default_factory=time)
+
+    def to_run_response(self) -> WorkflowRunResponse:
+        """The run of the job, with the status of the job"""
+        if self.run is not None:
+            run_response = WorkflowRunResponse.from_dict(self.run)
+        else:
+            run_response = WorkflowRunResponse(
+                run_id=self.job_id,
+                session_id=self.session_id,
+                workflow_id=self.workflow_id,
+                created_at=int(self.created_at),
+            )
+        run_response.status = RunStatus(self.status)
+        if self.error is not None and run_response.content is None:
+            run_response.content = self.error
+        return run_response
+
+
+class JobQueue:
+    """A durable queue of background workflow runs, stored in a table of a SQLite or Postgres database.
+
+    Workers claim jobs with a lease they extend with heartbeats. A job whose lease expired, because its worker
+    stopped, is claimed again by another worker, up to `max_attempts` times.
+    """
+
+    def __init__(
+        self,
+        db_engine: Engine,
+        table_name: str = "workflow_jobs",
+        schema: Optional[str] = None,
+    ):
+        """
+        Args:
+            db_engine: The SQLAlchemy database engine to use.
+            table_name: The name of the table to store the jobs in.
+            schema: The schema of the table, for databases that support schemas.
+        """
+        self.db_engine: Engine = db_engine
+        self.table_name: str = table_name
+        self.schema: Optional[str] = schema
+        self.metadata: MetaData = MetaData(schema=schema)
+        self.table: Table = self.get_table()
+        self._table_created: bool = False
+
+    @classmethod
+    def from_storage(cls, storage: "Storage", table_name: str = "workflow_jobs") -> "JobQueue":
+        """Create a JobQueue in the database of a SqliteStorage or PostgresStorage"""
+        db_engine = getattr(storage, "db_engine", None)
+        if db_engine is None:
+            raise ValueError(
+                f"{type(storage).__name__} does not use a SQL database, create the JobQueue with an engine"
+            )
+        return cls(db_engine=db_engine, table_name=table_name, schema=getattr(storage, "schema", None))
+
+    def get_table(self) -> Table:
+        return Table(
+            self.table_name,
+            self.metadata,
+            Column("job_id", String, primary_key=True),
+            Column("workflow_id", String, nullable=False),
+            Column("session_id", String, index=True),
+            Column("user_id", String, index=True),
+            Column("status", String, nullable=False),
+            Column("run_kwargs", JSON),
+            Column("attempts", Integer, nullable=False, default=0),
+            Column("max_attempts", Integer, nullable=False, default=3),
+            Column("available_at", Float, nullable=False),
+            Column("lease_owner", String),
+            Column("lease_expires_at", Float),
+            Column("cancel_requested", Boolean, nullable=False, default=False),
+            Column("run", JSON),
+            Column("error", String),
+            Column("created_at", Float, nullable=False),
+            Column("updated_at", Float, nullable=False),
+            # Used to find the next job to claim
+            Index(f"idx_{self.table_name}_claim", "workflow_id", "status", "available_at"),
+            extend_existing=True,
+        )
+
+    def create(self) -> None:
+        """Create the table if it does not exist"""
+        if self._table_created:
+            return
+        if self.schema is not None and self.db_engine.dialect.name == "postgresql":
+            with self.db_engine.begin() as conn:
+                conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {self.schema};"))
+        log_debug(f"Creating table: {self.table_name}")
+        self.table.create(self.db_engine, checkfirst=True)
+        self._table_created = True
+
+    def drop(self) -> None:
+        """Drop the table"""
+        self.table.drop(self.db_engine, checkfirst=True)
+        self._table_created = False
+
+    def _to_job(self, row: Any) -> WorkflowJob:
+        return WorkflowJob(**dict(row._mapping))
+
+    def enqueue(self, job: WorkflowJob) -> WorkflowJob:
+        """Add a job to the queue"""
+        self.create()
+        job.status = RunStatus.pending.value
+        job.updated_at = time()
+        with self.db_engine.begin() as conn:
+            conn.execute(self.table.insert().values(**asdict(job)))
+        log_debug(f"Queued workflow run: {job.job_id}")
+        return job
+
+    def get(self, job_id: str) -> Optional[WorkflowJob]:
+        """Get a job by its id"""
+        self.create()
+        with self.db_engine.connect() as conn:
+            row = conn.execute(select(self.table).where(self.table.c.job_id == job_id)).first()
+        return self._to_job(row) if row is not None else None
+
+    def get_jobs(self, workflow_id: Optional[str] = None, status: Optional[RunStatus] = None) -> List[WorkflowJob]:
+        """Get the jobs of a workflow and/or with a status, oldest first"""
+        self.create()
+        stmt = select(self.table).order_by(self.table.c.created_at)
+        if workflow_id is not None:
+            stmt = stmt.where(self.table.c.workflow_id == workflow_id)
+        if status is not None:
+            stmt = stmt.where(self.table.c.status == status.value)
+        with self.db_engine.connect() as conn:
+            return [self._to_job(row) for row in conn.execute(stmt)]
+
+    def claim(self, workflow_id: str, worker_id: str, lease_seconds: float) -> Optional[WorkflowJob]:
+        """Lease the oldest job of the workflow that is ready to run, or whose lease expired"""
+        self.create()
+        now = time()
+        t = self.table
+        claimable = and_(
+            t.c.workflow_id == workflow_id,
+            or_(
+                and_(t.c.status == RunStatus.pending.value, t.c.available_at <= now),
+                and_(t.c.status == RunStatus.running.value, t.c.lease_expires_at < now),
+            ),
+        )
+        with self.db_engine.begin() as conn:
+            candidates = conn.execute(select(t.c.job_id).where(claimable).order_by(t.c.available_at).limit(10))
+            for job_id in candidates.scalars().all():
+                # Only one worker updates the job when several try to claim it at the same time
+                result = conn.execute(
+                    update(t)
+                    .where(t.c.job_id == job_id, claimable)
+                    .values(
+                        status=RunStatus.running.value,
+                        lease_owner=worker_id,
+                        lease_expires_at=now + lease_seconds,
+                        attempts=t.c.attempts + 1,
+                        updated_at=now,
+                    )
+                )
+                if result.rowcount == 1:
+                    row = conn.execute(select(t).where(t.c.job_id == job_id)).first()
+                    return self._to_job(row)
+        return None
+
+    def heartbeat(self, job_id: str, worker_id: str, lease_seconds: float) -> Optional[WorkflowJob]:
+        """Extend the lease of a running job. Returns None if the worker lost the lease."""
+        now = time()
+        t = self.table
+        with self.db_engine.begin() as conn:
+            result = conn.execute(
+                update(t)
+                .where(t.c.job_id == job_id, t.c.lease_owner == worker_id, t.c.status == RunStatus.running.value)
+                .values(lease_expires_at=now + lease_seconds, updated_at=now)
+            )
+            if result.rowcount != 1:
+                return None
+            row = conn.execute(select(t).where(t.c.job_id == job_id)).first()
+        return self._to_job(row)
+
+    def finish(
+        self,
+        job_id: str,
+        worker_id: str,
+        status: RunStatus,
+        run: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> bool:
+        """Store the result of a job leased by the worker. Returns False if the worker lost the lease."""
+        t = self.table
+        with self.db_engine.begin() as conn:
+            result = conn.execute(
+                update(t)
+                .where(t.c.job_id == job_id, t.c.lease_owner == worker_id)
+                .values(status=status.value, run=run, error=error, lease_expires_at=None, updated_at=time())
+            )
+        return result.rowcount == 1
+
+    def retry(self, job_id: str, worker_id: str, error: Optional[str] = None, delay: float = 0) -> bool:
+        """Put a job leased by the worker back in the queue, to run after `delay` seconds"""
+        now = time()
+        t = self.table
+        with self.db_engine.begin() as conn:
+            result = conn.execute(
+                update(t)
+                .where(t.c.job_id == job_id, t.c.lease_owner == worker_id)
+                .values(
+                    status=RunStatus.pending.value,
+                    available_at=now + delay,
+                    lease_owner=None,
+                    lease_expires_at=None,
+                    error=error,
+                    updated_at=now,
+                )
+            )
+        return result.rowcount == 1
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a job. A queued job is cancelled at once, a running job when its worker sends its next heartbeat.
+
+        Returns False if the job does not exist or already finished.
+        """
+        self.create()
+        now = time()
+        t = self.table
+        with self.db_engine.begin() as conn:
+            result = conn.execute(
+                update(t)
+                .where(t.c.job_id == job_id, t.c.status == RunStatus.pending.value)
+                .values(status=RunStatus.cancelled.value, updated_at=now)
+            )
+            if result.rowcount == 1:
+                return True
+            result = conn.execute(
+                update(t)
+                .where(t.c.job_id == job_id, t.c.status == RunStatus.running.value)
+                .values(cancel_requested=True, updated_at=now)
+            )
+            return result.rowcount == 1
+
+
+class WorkflowWorkerPool:
+    """Runs the queued background runs of a workflow, with a fixed number of concurrent runs in this process.
+
+    Each worker claims a job, runs it on a copy of the workflow and sends heartbeats while it runs. A run that fails is
+    queued again after `retry_delay` seconds until the job has no attempts left. Runs are resumed, so steps that
+    completed in an earlier attempt are not run again when the workflow checkpoints its steps.
+
+    Heartbeats are sent from the event loop, so `lease_seconds` must be longer than the longest blocking step.
+    """
+
+    def __init__(
+        self,
+        workflow: "Workflow",
+        job_queue: Optional[JobQueue] = None,
+        num_workers: int = 4,
+        lease_seconds: float = 60.0,
+        heartbeat_interval: Optional[float] = None,
+        poll_interval: float = 1.0,
+        retry_delay: float = 5.0,
+    ):
+        """
+        Args:
+            workflow: The workflow to run the jobs of.
+            job_queue: The queue to claim jobs from, defaults to the job queue of the workflow.
+            num_workers: Number of runs of this pool running at the same time.
+            lease_seconds: Seconds a worker may run a job without sending a heartbeat.
+            heartbeat_interval: Seconds between heartbeats, defaults to a third of lease_seconds.
+            poll_interval: Seconds an idle worker waits before checking the queue again.
+            retry_delay: Seconds a failed run waits in the queue before it is run again.
+        """
+        job_queue = job_queue or workflow.job_queue
+        if job_queue is None:
+            raise ValueError("WorkflowWorkerPool needs a job_queue, or a workflow with a job_queue")
+        if workflow.storage is None:
+            raise ValueError("Workflows run by a WorkflowWorkerPool need storage")
+
+        self.workflow = workflow
+        self.job_queue: JobQueue = job_queue
+        self.num_workers = num_workers
+        self.lease_seconds = lease_seconds
+        self.heartbeat_interval = heartbeat_interval or lease_seconds / 3
+        self.poll_interval = poll_interval
+        self.retry_delay = retry_delay
+        self.pool_id = f"{socket.gethostname()}-{os.getpid()}-{uuid4().hex[:8]}"
+        self._workers: List["asyncio.Task[None]"] = []
+        self._stopping = False
+
+    @property
+    def workflow_id(self) -> str:
+        if self.workflow.workflow_id is None:
+            self.workflow.initialize_workflow()
+        return self.workflow.workflow_id  # type: ignore[return-value]
+
+    def start(self) -> None:
+        """Start the workers in the running event loop"""
+        if self._workers:
+            return
+        self._stopping = False
+        self._workers = [
+            asyncio.ensure_future(self._run_worker(f"{self.pool_id}-{i}")) for i in range(self.num_workers)
+        ]
+        log_debug(f"Started {self.num_workers} workers for workflow {self.workflow_id}")
+
+    async def stop(self, wait: bool = True) -> None:
+        """Stop claiming jobs. With `wait`, finish the running jobs, otherwise cancel them so they are run again."""
+        self._stopping = True
+        if not wait:
+            for worker in self._workers:
+                worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def __aenter__(self) -> "WorkflowWorkerPool":
+        self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.stop()
+
+    async def _run_worker(self, worker_id: str) -> None:
+        while not self._stopping:
+            try:
+                job = self.job_queue.claim(self.workflow_id, worker_id, self.lease_seconds)
+            except Exception as e:
+                logger.error(f"Worker {worker_id} could not claim a job: {e}")
+                job = None
+            if job is None:
+                await asyncio.sleep(self.poll_interval)
+                continue
+            await self.run_job(job, worker_id)
+
+    def _get_job_workflow(self, job: WorkflowJob) -> "Workflow":
+        """A copy of the workflow for the session of the job, so jobs of different sessions can run at once"""
+        workflow = copy(self.workflow)
+        workflow.session_id = job.session_id
+        workflow.user_id = job.user_id
+        workflow.workflow_session = None
+        workflow.workflow_session_state = copy(self.workflow.workflow_session_state)
+        workflow.run_id = None
+        workflow.run_response = None
+        return workflow
+
+    async def run_job(self, job: WorkflowJob, worker_id: str) -> None:
+        """Run a claimed job, sending heartbeats until it finishes"""
+        if job.attempts > job.max_attempts:
+            # The lease of the last attempt expired
+            self.job_queue.finish(job.job_id, worker_id, RunStatus.error, error=job.error or "Run timed out")
+            return
+
+        log_debug(f"Worker {worker_id} running job {job.job_id} (attempt {job.attempts}/{job.max_attempts})")
+        workflow = self._get_job_workflow(job)
+        task = asyncio.ensure_future(workflow.arun(resume=True, run_id=job.job_id, **(job.run_kwargs or {})))
+        try:
+            while not task.done():
+                await asyncio.wait({task}, timeout=self.heartbeat_interval)
+                if task.done():
+                    break
+                heartbeat = self.job_queue.heartbeat(job.job_id, worker_id, self.lease_seconds)
+                if heartbeat is None:
+                    logger.warning(f"Worker {worker_id} lost the lease of job {job.job_id}")
+                    task.cancel()
+                    return
+                if heartbeat.cancel_requested:
+                    task.cancel()
+                    await asyncio.gather(task, return_exceptions=True)
+                    if workflow.run_response is not None:
+                        workflow.run_response.status = RunStatus.cancelled
+                        workflow._save_run_to_storage(workflow.run_response)
+                    self.job_queue.finish(job.job_id, worker_id, RunStatus.cancelled)
+                    log_debug(f"Cancelled job {job.job_id}")
+                    return
+        except asyncio.CancelledError:
+            # The pool was stopped without waiting, the job runs again when its lease expires
+            task.cancel()
+            raise
+
+        run_response: Optional[WorkflowRunResponse] = None
+        try:
+            run_response = task.result()
+            error = run_response.content if run_response.status == RunStatus.error else None
+        except Exception as e:
+            logger.error(f"Job {job.job_id} failed: {e}")
+            error = str(e)
+
+        if run_response is not None and run_response.status == RunStatus.completed:
+            self.job_queue.finish(job.job_id, worker_id, RunStatus.completed, run=run_response.to_dict())
+        elif job.attempts < job.max_attempts:
+            log_debug(f"Retrying job {job.job_id} in {self.retry_delay}s")
+            self.job_queue.retry(job.job_id, worker_id, error=str(error), delay=self.retry_delay)
+        else:
+            self.job_queue.finish(
+                job.job_id,
+                worker_id,
+                RunStatus.error,
+                run=run_response.to_dict() if run_response is not None else None,
+                error=str(error),
+            )
@@ -27,6 +27,7 @@ WorkflowSteps = List[
         "Parallel",  # type: ignore # noqa: F821
         "Condition",  # type: ignore # noqa: F821
         "Router",  # type: ignore # noqa: F821
+        "Map",  # type: ignore # noqa: F821
     ]
 ]
 
@@ -43,6 +44,9 @@ class Loop:
     max_iterations: int = 3  # Default to 3
     end_condition: Optional[Callable[[List[StepOutput]], bool]] = None
 
+    # Names of the workflow steps whose outputs this step reads, None depends on all previous steps
+    depends_on: Optional[List[str]] = None
+
     def __init__(
         self,
         steps: WorkflowSteps,
@@ -50,18 +54,21 @@ class Loop:
         description: Optional[str] = None,
         max_iterations: int = 3,
         end_condition: Optional[Callable[[List[StepOutput]], bool]] = None,
+        depends_on: Optional[List[str]] = None,
     ):
         self.steps = steps
         self.name = name
         self.description = description
         self.max_iterations = max_iterations
         self.end_condition = end_condition
+        self.depends_on = depends_on
 
     def _prepare_steps(self):
         """Prepare the steps for execution - mirrors workflow logic"""
         from agno.agent.agent import Agent
         from agno.team.team import Team
         from agno.workflow.v2.condition import Condition
+        from agno.workflow.v2.map import Map
         from agno.workflow.v2.parallel import Parallel
         from agno.workflow.v2.router import Router
         from agno.workflow.v2.step import Step
@@ -75,7 +82,7 @@ class Loop:
                 prepared_steps.append(Step(name=step.name, description=step.description, agent=step))
             elif isinstance(step, Team):
                 prepared_steps.append(Step(name=step.name, description=step.description, team=step))
-            elif isinstance(step, (Step, Steps, Loop, Parallel, Condition, Router)):
+            elif isinstance(step, (Step, Steps, Loop, Parallel, Condition, Router, Map)):
                 prepared_steps.append(step)
             else:
                 raise ValueError(f"Invalid step type: {type(step).__name__}")
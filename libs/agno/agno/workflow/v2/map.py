@@ -0,0 +1,523 @@
+import inspect
+from copy import copy
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Union
+
+from agno.run.response import RunResponseEvent
+from agno.run.team import TeamRunResponseEvent
+from agno.run.v2.workflow import (
+    MapBatchCompletedEvent,
+    MapExecutionCompletedEvent,
+    MapExecutionStartedEvent,
+    WorkflowRunResponse,
+    WorkflowRunResponseEvent,
+)
+from agno.utils.fanout import FanOutEvent, afan_out, fan_out
+from agno.utils.log import log_debug, logger
+from agno.workflow.v2.step import Step
+from agno.workflow.v2.types import StepInput, StepOutput
+
+MapStep = Union[
+    Callable[[StepInput], Union[StepOutput, Awaitable[StepOutput], Iterator[StepOutput], AsyncIterator[StepOutput]]],
+    Step,
+    "Steps",  # type: ignore # noqa: F821
+    "Loop",  # type: ignore # noqa: F821
+    "Parallel",  # type: ignore # noqa: F821
+    "Condition",  # type: ignore # noqa: F821
+    "Router",  # type: ignore # noqa: F821
+    "Map",  # type: ignore # noqa: F821
+]
+
+
+@dataclass
+class Map:
+    """A step that runs for each item of a list, with a limited number of items running at the same time.
+
+    The step gets a StepInput with the item as message, or the list of items of the batch when `batch_size` is more
+    than 1, and the other inputs of the map step. The outputs of all batches are combined in item order by `reduce`.
+    """
+
+    step: MapStep
+    # Returns the items to run the step for, from the input of the map step
+    items: Callable[[StepInput], Union[List[Any], Awaitable[List[Any]]]]
+
+    name: Optional[str] = None
+    description: Optional[str] = None
+
+    # Number of items passed to each run of the step
+    batch_size: int = 1
+    # Maximum number of batches run at the same time. None runs all batches at once, each with its own thread and copy
+    # of the step.
+    max_concurrency: Optional[int] = 8
+    # Combines the outputs of all batches, in item order, into the output of the map step.
+    # Returning something other than a StepOutput uses it as the content. By default the content is the list of the
+    # contents of all outputs.
+    reduce: Optional[Callable[[List[StepOutput]], Union[StepOutput, Any, Awaitable[Union[StepOutput, Any]]]]] = None
+
+    # Names of the workflow steps whose outputs this step reads, None depends on all previous steps
+    depends_on: Optional[List[str]] = None
+
+    def __init__(
+        self,
+        step: MapStep,
+        items: Callable[[StepInput], Union[List[Any], Awaitable[List[Any]]]],
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        batch_size: int = 1,
+        max_concurrency: Optional[int] = 8,
+        reduce: Optional[
+            Callable[[List[StepOutput]], Union[StepOutput, Any, Awaitable[Union[StepOutput, Any]]]]
+        ] = None,
+        depends_on: Optional[List[str]] = None,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.step = step
+        self.items = items
+        self.name = name
+        self.description = description
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.reduce = reduce
+        self.depends_on = depends_on
+
+    def _prepare_step(self):
+        """Prepare the step for execution - mirrors workflow logic"""
+        from agno.agent.agent import Agent
+        from agno.team.team import Team
+        from agno.workflow.v2.condition import Condition
+        from agno.workflow.v2.loop import Loop
+        from agno.workflow.v2.parallel import Parallel
+        from agno.workflow.v2.router import Router
+        from agno.workflow.v2.steps import Steps
+
+        step = self.step
+        if callable(step) and hasattr(step, "__name__"):
+            self.step = Step(name=step.__name__, description="User-defined callable step", executor=step)
+        elif isinstance(step, Agent):
+            self.step = Step(name=step.name, description=step.description, agent=step)
+        elif isinstance(step, Team):
+            self.step = Step(name=step.name, description=step.description, team=step)
+        elif not isinstance(step, (Step, Steps, Loop, Parallel, Condition, Router, Map)):
+            raise ValueError(f"Invalid step type: {type(step).__name__}")
+
+        if self.max_concurrency != 1 and self._has_team(self.step):
+            raise ValueError("Teams cannot be copied for each batch, use max_concurrency=1 to map a step with a team")
+
+    def _has_team(self, step: Any) -> bool:
+        from agno.team.team import Team
+        from agno.workflow.v2.condition import Condition
+        from agno.workflow.v2.loop import Loop
+        from agno.workflow.v2.parallel import Parallel
+        from agno.workflow.v2.router import Router
+        from agno.workflow.v2.steps import Steps
+
+        if isinstance(step, Team):
+            return True
+        if isinstance(step, Step):
+            return step.team is not None
+        if isinstance(step, Map):
+            return self._has_team(step.step)
+        if isinstance(step, Router):
+            return any(self._has_team(choice) for choice in step.choices)
+        if isinstance(step, (Steps, Loop, Parallel, Condition)):
+            return any(self._has_team(child) for child in step.steps)
+        return False
+
+    def _copy_step(self, step: Any) -> Any:
+        """Copy a step and all the agents it runs. Functions are shared, teams are only shared by sequential batches."""
+        from agno.agent.agent import Agent
+        from agno.workflow.v2.condition import Condition
+        from agno.workflow.v2.loop import Loop
+        from agno.workflow.v2.parallel import Parallel
+        from agno.workflow.v2.router import Router
+        from agno.workflow.v2.steps import Steps
+
+        if isinstance(step, Agent):
+            return step.deep_copy()
+        if isinstance(step, Step):
+            if step.agent is None:
+                return step
+            step_copy = copy(step)
+            step_copy.agent = step.agent.deep_copy()
+            step_copy._set_active_executor()
+            return step_copy
+        if isinstance(step, Map):
+            map_copy = copy(step)
+            map_copy.step = self._copy_step(step.step)
+            return map_copy
+        if isinstance(step, Router):
+            router_copy = copy(step)
+            router_copy.choices = [self._copy_step(choice) for choice in step.choices]
+            return router_copy
+        if isinstance(step, (Steps, Loop, Parallel, Condition)):
+            step_copy = copy(step)
+            step_copy.steps = [self._copy_step(child) for child in step.steps]
+            return step_copy
+        return step
+
+    def _get_batch_step(self) -> Any:
+        """The step to run a batch with. Agents keep state while they run, so each batch gets its own copy."""
+        return self._copy_step(self.step)
+
+    def _get_batches(self, items: List[Any]) -> List[List[Any]]:
+        return [items[i : i + self.batch_size] for i in range(0, len(items), self.batch_size)]
+
+    def _create_batch_input(self, step_input: StepInput, batch: List[Any]) -> StepInput:
+        return StepInput(
+            message=batch[0] if self.batch_size == 1 else batch,
+            previous_step_content=step_input.previous_step_content,
+            previous_step_outputs=step_input.previous_step_outputs,
+            additional_data=step_input.additional_data,
+            images=step_input.images,
+            videos=step_input.videos,
+            audio=step_input.audio,
+        )
+
+    def _get_batch_step_index(self, step_index: Optional[Union[int, tuple]], batch_index: int) -> tuple:
+        if step_index is None or isinstance(step_index, int):
+            # Map is a main step - batches get sequential sub-indices: 1.1, 1.2, 1.3
+            return (step_index if step_index is not None else 0, batch_index)
+        # Map is a nested step - extend the tuple
+        return step_index + (batch_index,)
+
+    def _get_failed_output(self, batch_index: int, error: BaseException) -> StepOutput:
+        step_name = getattr(self.step, "name", None) or f"{self.name or 'Map'} batch {batch_index + 1}"
+        logger.error(f"Map step {self.name} failed for batch {batch_index + 1}: {error}")
+        return StepOutput(
+            step_name=step_name, content=f"Step {step_name} failed: {error}", success=False, error=str(error)
+        )
+
+    def _get_batch_outputs(self, event: FanOutEvent, batch_outputs: Dict[int, List[StepOutput]]) -> List[StepOutput]:
+        """Record the end of a batch and return its outputs"""
+        if event.error is not None:
+            batch_outputs[event.index] = [self._get_failed_output(event.index, event.error)]
+        return batch_outputs.setdefault(event.index, [])
+
+    def _build_output(self, step_outputs: List[StepOutput], reduced: Any) -> StepOutput:
+        """Build the output of the map step from the outputs of all batches and the result of reduce"""
+        if isinstance(reduced, StepOutput):
+            if reduced.step_name is None:
+                reduced.step_name = self.name or "Map"
+            if reduced.metrics is None:
+                reduced.metrics = self._extract_metrics(step_outputs)
+            return reduced
+
+        all_images = [image for output in step_outputs for image in output.images or []]
+        all_videos = [video for output in step_outputs for video in output.videos or []]
+        all_audio = [audio for output in step_outputs for audio in output.audio or []]
+        failed_outputs = [output for output in step_outputs if output.success is False]
+
+        return StepOutput(
+            step_name=self.name or "Map",
+            content=[output.content for output in step_outputs] if self.reduce is None else reduced,
+            images=all_images or None,
+            videos=all_videos or None,
+            audio=all_audio or None,
+            metrics=self._extract_metrics(step_outputs),
+            success=not failed_outputs,
+            error="; ".join(output.error for output in failed_outputs if output.error) or None,
+            stop=any(output.stop for output in step_outputs),
+        )
+
+    def _extract_metrics(self, step_outputs: List[StepOutput]) -> Optional[Dict[str, Any]]:
+        """Collect the metrics of the outputs of all batches, in item order"""
+        if not step_outputs:
+            return None
+
+        map_step_metrics = {}
+        for i, output in enumerate(step_outputs):
+            metrics = output.metrics
+            if isinstance(metrics, dict) and "metrics" in metrics:
+                metrics = metrics.get("metrics")
+            map_step_metrics[f"{output.step_name or 'step'} [{i + 1}]"] = {
+                "step_name": output.step_name,
+                "executor_type": output.executor_type or "unknown",
+                "executor_name": output.executor_name or "unknown",
+                "metrics": metrics,
+            }
+
+        return {
+            "step_name": self.name or "Map",
+            "executor_type": "map",
+            "executor_name": self.name or "Map",
+            "parallel_steps": map_step_metrics,
+        }
+
+    def _check_sync_functions(self) -> None:
+        if inspect.iscoroutinefunction(self.items) or inspect.iscoroutinefunction(self.reduce):
+            raise ValueError("Cannot use async items or reduce function with synchronous execution")
+
+    def _check_not_awaitable(self, result: Any) -> None:
+        if inspect.isawaitable(result):
+            if inspect.iscoroutine(result):
+                result.close()
+            raise ValueError("Cannot use async items or reduce function with synchronous execution")
+
+    def _get_items(self, step_input: StepInput) -> List[Any]:
+        items = self.items(step_input)
+        self._check_not_awaitable(items)
+        return list(items)  # type: ignore[arg-type]
+
+    def _reduce(self, step_outputs: List[StepOutput]) -> StepOutput:
+        if self.reduce is None:
+            return self._build_output(step_outputs, None)
+        reduced = self.reduce(step_outputs)
+        self._check_not_awaitable(reduced)
+        return self._build_output(step_outputs, reduced)
+
+    async def _areduce(self, step_outputs: List[StepOutput]) -> StepOutput:
+        if self.reduce is None:
+            return self._build_output(step_outputs, None)
+        reduced = self.reduce(step_outputs)
+        if inspect.isawaitable(reduced):
+            reduced = await reduced
+        return self._build_output(step_outputs, reduced)
+
+    def execute(
+        self,
+        step_input: StepInput,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> StepOutput:
+        """Execute the step for each batch of items and return the reduced result"""
+        self._prepare_step()
+        self._check_sync_functions()
+
+        batches = self._get_batches(self._get_items(step_input))
+        log_debug(f"Map Start: {self.name} ({len(batches)} batches)", center=True, symbol="=")
+
+        def run_batch(batch: List[Any]) -> List[Union[StepOutput, List[StepOutput]]]:
+            return [
+                self._get_batch_step().execute(
+                    self._create_batch_input(step_input, batch), session_id=session_id, user_id=user_id
+                )
+            ]
+
+        batch_outputs: Dict[int, List[StepOutput]] = {}
+        for event in fan_out(
+            [lambda batch=batch: run_batch(batch) for batch in batches], max_workers=self.max_concurrency
+        ):
+            if event.done:
+                self._get_batch_outputs(event, batch_outputs)
+            else:
+                result = event.item
+                batch_outputs.setdefault(event.index, []).extend(result if isinstance(result, list) else [result])
+
+        step_outputs = [output for i in range(len(batches)) for output in batch_outputs.get(i, [])]
+
+        log_debug(f"Map End: {self.name} ({len(batches)} batches)", center=True, symbol="=")
+        return self._reduce(step_outputs)
+
+    def execute_stream(
+        self,
+        step_input: StepInput,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        stream_intermediate_steps: bool = False,
+        workflow_run_response: Optional[WorkflowRunResponse] = None,
+        step_index: Optional[Union[int, tuple]] = None,
+    ) -> Iterator[Union[WorkflowRunResponseEvent, StepOutput]]:
+        """Execute the step for each batch of items with streaming support.
+
+        The events of the batches are yielded as they are produced, so the events of different batches interleave.
+        """
+        self._prepare_step()
+        self._check_sync_functions()
+
+        items = self._get_items(step_input)
+        batches = self._get_batches(items)
+        log_debug(f"Map Start: {self.name} ({len(batches)} batches)", center=True, symbol="=")
+
+        if stream_intermediate_steps and workflow_run_response:
+            # Yield map started event
+            yield MapExecutionStartedEvent(
+                run_id=workflow_run_response.run_id or "",
+                workflow_name=workflow_run_response.workflow_name or "",
+                workflow_id=workflow_run_response.workflow_id or "",
+                session_id=workflow_run_response.session_id or "",
+                step_name=self.name,
+                step_index=step_index,
+                item_count=len(items),
+                batch_count=len(batches),
+            )
+
+        def run_batch(batch_index: int, batch: List[Any]) -> Iterator[Any]:
+            return self._get_batch_step().execute_stream(
+                self._create_batch_input(step_input, batch),
+                session_id=session_id,
+                user_id=user_id,
+                stream_intermediate_steps=stream_intermediate_steps,
+                workflow_run_response=workflow_run_response,
+                step_index=self._get_batch_step_index(step_index, batch_index),
+            )
+
+        batch_outputs: Dict[int, List[StepOutput]] = {}
+        for event in fan_out(
+            [lambda i=i, batch=batch: run_batch(i, batch) for i, batch in enumerate(batches)],
+            max_workers=self.max_concurrency,
+        ):
+            if event.done:
+                outputs = self._get_batch_outputs(event, batch_outputs)
+                if stream_intermediate_steps and workflow_run_response:
+                    # Yield batch completed event
+                    yield MapBatchCompletedEvent(
+                        run_id=workflow_run_response.run_id or "",
+                        workflow_name=workflow_run_response.workflow_name or "",
+                        workflow_id=workflow_run_response.workflow_id or "",
+                        session_id=workflow_run_response.session_id or "",
+                        step_name=self.name,
+                        step_index=step_index,
+                        batch_index=event.index,
+                        batch_count=len(batches),
+                        items=batches[event.index],
+                        step_results=outputs,
+                    )
+            elif isinstance(event.item, StepOutput):
+                batch_outputs.setdefault(event.index, []).append(event.item)
+            else:
+                # Yield other events (streaming content, step events, etc.)
+                yield event.item
+
+        step_outputs = [output for i in range(len(batches)) for output in batch_outputs.get(i, [])]
+        log_debug(f"Map End: {self.name} ({len(batches)} batches)", center=True, symbol="=")
+
+        if stream_intermediate_steps and workflow_run_response:
+            # Yield map completed event
+            yield MapExecutionCompletedEvent(
+                run_id=workflow_run_response.run_id or "",
+                workflow_name=workflow_run_response.workflow_name or "",
+                workflow_id=workflow_run_response.workflow_id or "",
+                session_id=workflow_run_response.session_id or "",
+                step_name=self.name,
+                step_index=step_index,
+                item_count=len(items),
+                batch_count=len(batches),
+                step_results=step_outputs,
+            )
+
+        yield self._reduce(step_outputs)
+
+    async def _aget_items(self, step_input: StepInput) -> List[Any]:
+        items = self.items(step_input)
+        if inspect.isawaitable(items):
+            items = await items
+        return list(items)  # type: ignore[arg-type]
+
+    async def aexecute(
+        self,
+        step_input: StepInput,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> StepOutput:
+        """Execute the step for each batch of items asynchronously and return the reduced result"""
+        self._prepare_step()
+
+        batches = self._get_batches(await self._aget_items(step_input))
+        log_debug(f"Async Map Start: {self.name} ({len(batches)} batches)", center=True, symbol="=")
+
+        async def run_batch(batch: List[Any]) -> AsyncIterator[Union[StepOutput, List[StepOutput]]]:
+            yield await self._get_batch_step().aexecute(
+                self._create_batch_input(step_input, batch), session_id=session_id, user_id=user_id
+            )
+
+        batch_outputs: Dict[int, List[StepOutput]] = {}
+        async for event in afan_out(
+            [lambda batch=batch: run_batch(batch) for batch in batches], max_concurrency=self.max_concurrency
+        ):
+            if event.done:
+                self._get_batch_outputs(event, batch_outputs)
+            else:
+                result = event.item
+                batch_outputs.setdefault(event.index, []).extend(result if isinstance(result, list) else [result])
+
+        step_outputs = [output for i in range(len(batches)) for output in batch_outputs.get(i, [])]
+
+        log_debug(f"Async Map End: {self.name} ({len(batches)} batches)", center=True, symbol="=")
+        return await self._areduce(step_outputs)
+
+    async def aexecute_stream(
+        self,
+        step_input: StepInput,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        stream_intermediate_steps: bool = False,
+        workflow_run_response: Optional[WorkflowRunResponse] = None,
+        step_index: Optional[Union[int, tuple]] = None,
+    ) -> AsyncIterator[Union[WorkflowRunResponseEvent, TeamRunResponseEvent, RunResponseEvent, StepOutput]]:
+        """Execute the step for each batch of items with async streaming support"""
+        self._prepare_step()
+
+        items = await self._aget_items(step_input)
+        batches = self._get_batches(items)
+        log_debug(f"Async Map Start: {self.name} ({len(batches)} batches)", center=True, symbol="=")
+
+        if stream_intermediate_steps and workflow_run_response:
+            # Yield map started event
+            yield MapExecutionStartedEvent(
+                run_id=workflow_run_response.run_id or "",
+                workflow_name=workflow_run_response.workflow_name or "",
+                workflow_id=workflow_run_response.workflow_id or "",
+                session_id=workflow_run_response.session_id or "",
+                step_name=self.name,
+                step_index=step_index,
+                item_count=len(items),
+                batch_count=len(batches),
+            )
+
+        def run_batch(batch_index: int, batch: List[Any]) -> AsyncIterator[Any]:
+            return self._get_batch_step().aexecute_stream(
+                self._create_batch_input(step_input, batch),
+                session_id=session_id,
+                user_id=user_id,
+                stream_intermediate_steps=stream_intermediate_steps,
+                workflow_run_response=workflow_run_response,
+                step_index=self._get_batch_step_index(step_index, batch_index),
+            )
+
+        batch_outputs: Dict[int, List[StepOutput]] = {}
+        async for event in afan_out(
+            [lambda i=i, batch=batch: run_batch(i, batch) for i, batch in enumerate(batches)],
+            max_concurrency=self.max_concurrency,
+        ):
+            if event.done:
+                outputs = self._get_batch_outputs(event, batch_outputs)
+                if stream_intermediate_steps and workflow_run_response:
+                    # Yield batch completed event
+                    yield MapBatchCompletedEvent(
+                        run_id=workflow_run_response.run_id or "",
+                        workflow_name=workflow_run_response.workflow_name or "",
+                        workflow_id=workflow_run_response.workflow_id or "",
+                        session_id=workflow_run_response.session_id or "",
+                        step_name=self.name,
+                        step_index=step_index,
+                        batch_index=event.index,
+                        batch_count=len(batches),
+                        items=batches[event.index],
+                        step_results=outputs,
+                    )
+            elif isinstance(event.item, StepOutput):
+                batch_outputs.setdefault(event.index, []).append(event.item)
+            else:
+                # Yield other events (streaming content, step events, etc.)
+                yield event.item
+
+        step_outputs = [output for i in range(len(batches)) for output in batch_outputs.get(i, [])]
+        log_debug(f"Async Map End: {self.name} ({len(batches)} batches)", center=True, symbol="=")
+
+        if stream_intermediate_steps and workflow_run_response:
+            # Yield map completed event
+            yield MapExecutionCompletedEvent(
+                run_id=workflow_run_response.run_id or "",
+                workflow_name=workflow_run_response.workflow_name or "",
+                workflow_id=workflow_run_response.workflow_id or "",
+                session_id=workflow_run_response.session_id or "",
+                step_name=self.name,
+                step_index=step_index,
+                item_count=len(items),
+                batch_count=len(batches),
+                step_results=step_outputs,
+            )
+
+        yield await self._areduce(step_outputs)
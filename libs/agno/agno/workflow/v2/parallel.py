@@ -1,6 +1,5 @@
-import asyncio
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import partial
 from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Union
 
 from agno.run.response import RunResponseEvent
@@ -13,6 +12,7 @@ from agno.run.v2.workflow import (
 )
 from agno.utils.log import log_debug, logger
 from agno.workflow.v2.condition import Condition
+from agno.workflow.v2.executor import ParallelExecutor, ParallelTaskResult, get_default_parallel_executor
 from agno.workflow.v2.step import Step
 from agno.workflow.v2.steps import Steps
 from agno.workflow.v2.types import StepInput, StepOutput
@@ -28,6 +28,7 @@ WorkflowSteps = List[
         "Parallel",  # type: ignore # noqa: F821
         "Condition",  # type: ignore # noqa: F821
         "Router",  # type: ignore # noqa: F821
+        "Map",  # type: ignore # noqa: F821
     ]
 ]
 
@@ -41,21 +42,43 @@ class Parallel:
     name: Optional[str] = None
     description: Optional[str] = None
 
+    # Names of the workflow steps whose outputs this step reads, None depends on all previous steps
+    depends_on: Optional[List[str]] = None
+
     def __init__(
         self,
         *steps: WorkflowSteps,
         name: Optional[str] = None,
         description: Optional[str] = None,
+        depends_on: Optional[List[str]] = None,
     ):
         self.steps = list(steps)
         self.name = name
         self.description = description
+        self.depends_on = depends_on
+        # Set by the workflow, Parallel steps outside a workflow use the default executor
+        self.parallel_executor: Optional[ParallelExecutor] = None
+
+    def _get_executor(self) -> ParallelExecutor:
+        return self.parallel_executor or get_default_parallel_executor()
+
+    def _add_step_timings(
+        self,
+        step_timings: Dict[str, ParallelTaskResult],
+        result: Union[StepOutput, List[StepOutput]],
+        task_result: ParallelTaskResult,
+    ) -> None:
+        """Record the queue wait and execution time of a parallel step for each of its outputs"""
+        for output in result if isinstance(result, list) else [result]:
+            if isinstance(output, StepOutput) and output.step_name:
+                step_timings[output.step_name] = task_result
 
     def _prepare_steps(self):
         """Prepare the steps for execution - mirrors workflow logic"""
         from agno.agent.agent import Agent
         from agno.team.team import Team
         from agno.workflow.v2.loop import Loop
+        from agno.workflow.v2.map import Map
         from agno.workflow.v2.router import Router
         from agno.workflow.v2.step import Step
         from agno.workflow.v2.steps import Steps
@@ -68,14 +91,16 @@ class Parallel:
                 prepared_steps.append(Step(name=step.name, description=step.description, agent=step))
             elif isinstance(step, Team):
                 prepared_steps.append(Step(name=step.name, description=step.description, team=step))
-            elif isinstance(step, (Step, Steps, Loop, Parallel, Condition, Router)):
+            elif isinstance(step, (Step, Steps, Loop, Parallel, Condition, Router, Map)):
                 prepared_steps.append(step)
             else:
                 raise ValueError(f"Invalid step type: {type(step).__name__}")
 
         self.steps = prepared_steps
 
-    def _aggregate_results(self, step_outputs: List[StepOutput]) -> StepOutput:
+    def _aggregate_results(
+        self, step_outputs: List[StepOutput], step_timings: Optional[Dict[str, ParallelTaskResult]] = None
+    ) -> StepOutput:
         """Aggregate multiple step outputs into a single StepOutput"""
         if not step_outputs:
             return StepOutput(step_name=self.name or "Parallel", content="No parallel steps executed")
@@ -88,7 +113,7 @@ class Parallel:
             single_result = step_outputs[0]
 
             # Extract metrics using the dedicated method
-            aggregated_metrics = self._extract_metrics_from_response(step_outputs)
+            aggregated_metrics = self._extract_metrics_from_response(step_outputs, step_timings)
 
             return StepOutput(
                 step_name=self.name or "Parallel",
@@ -123,7 +148,7 @@ class Parallel:
                 has_any_failure = True
 
         # Extract metrics using the dedicated method
-        aggregated_metrics = self._extract_metrics_from_response(step_outputs)
+        aggregated_metrics = self._extract_metrics_from_response(step_outputs, step_timings)
 
         return StepOutput(
             step_name=self.name or "Parallel",
@@ -137,7 +162,9 @@ class Parallel:
             metrics=aggregated_metrics,
         )
 
-    def _extract_metrics_from_response(self, step_outputs: List[StepOutput]) -> Optional[Dict[str, Any]]:
+    def _extract_metrics_from_response(
+        self, step_outputs: List[StepOutput], step_timings: Optional[Dict[str, ParallelTaskResult]] = None
+    ) -> Optional[Dict[str, Any]]:
         """Extract and aggregate metrics from parallel step outputs"""
         if not step_outputs:
             return None
@@ -174,6 +201,11 @@ class Parallel:
                     "metrics": None,
                 }
 
+            # Time spent waiting for a worker of the shared executor vs running the step
+            if step_timings and step_name in step_timings:
+                parallel_step_metrics[step_name]["queue_wait_time"] = step_timings[step_name].queue_wait_time
+                parallel_step_metrics[step_name]["execution_time"] = step_timings[step_name].execution_time
+
         # Create aggregated metrics structure for parallel execution
         if parallel_step_metrics:
             return {
@@ -238,36 +270,29 @@ class Parallel:
         # Use index to preserve order
         indexed_steps = list(enumerate(self.steps))
 
-        with ThreadPoolExecutor(max_workers=len(self.steps)) as executor:
-            # Submit all tasks with their original indices
-            future_to_index = {
-                executor.submit(execute_step_with_index, indexed_step): indexed_step[0]
-                for indexed_step in indexed_steps
-            }
+        # Run the steps with the executor shared by all Parallel steps of the workflow
+        task_results = self._get_executor().run(
+            [partial(execute_step_with_index, indexed_step) for indexed_step in indexed_steps]
+        )
 
-            # Collect results
-            results_with_indices = []
-            for future in as_completed(future_to_index):
-                try:
-                    index, result = future.result()
-                    results_with_indices.append((index, result))
-                    step_name = getattr(self.steps[index], "name", f"step_{index}")
-                    log_debug(f"Parallel step {step_name} completed")
-                except Exception as e:
-                    index = future_to_index[future]
-                    step_name = getattr(self.steps[index], "name", f"step_{index}")
-                    logger.error(f"Parallel step {step_name} failed: {e}")
-                    results_with_indices.append(
-                        (
-                            index,
-                            StepOutput(
-                                step_name=step_name,
-                                content=f"Step {step_name} failed: {str(e)}",
-                                success=False,
-                                error=str(e),
-                            ),
-                        )
-                    )
+        # Collect results
+        results_with_indices = []
+        step_timings: Dict[str, ParallelTaskResult] = {}
+        for (index, step), task_result in zip(indexed_steps, task_results):
+            step_name = getattr(step, "name", f"step_{index}")
+            if task_result.error is not None:
+                logger.error(f"Parallel step {step_name} failed: {task_result.error}")
+                result = StepOutput(
+                    step_name=step_name,
+                    content=f"Step {step_name} failed: {str(task_result.error)}",
+                    success=False,
+                    error=str(task_result.error),
+                )
+            else:
+                _, result = task_result.value  # type: ignore[misc]
+                log_debug(f"Parallel step {step_name} completed")
+            results_with_indices.append((index, result))
+            self._add_step_timings(step_timings, result, task_result)
 
         # Sort by original index to preserve order
         results_with_indices.sort(key=lambda x: x[0])
@@ -282,7 +307,7 @@ class Parallel:
                 flattened_results.append(result)
 
         # Aggregate all results into a single StepOutput
-        aggregated_result = self._aggregate_results(flattened_results)
+        aggregated_result = self._aggregate_results(flattened_results, step_timings)
 
         # Use workflow logger for parallel completion
         log_debug(f"Parallel End: {self.name} ({len(self.steps)} steps)", center=True, symbol="=")
@@ -360,39 +385,39 @@ class Parallel:
         indexed_steps = list(enumerate(self.steps))
         all_events_with_indices = []
         step_results = []
+        step_timings: Dict[str, ParallelTaskResult] = {}
 
-        with ThreadPoolExecutor(max_workers=len(self.steps)) as executor:
-            # Submit all tasks with their original indices
-            future_to_index = {
-                executor.submit(execute_step_stream_with_index, indexed_step): indexed_step[0]
-                for indexed_step in indexed_steps
-            }
+        # Run the steps with the executor shared by all Parallel steps of the workflow
+        task_results = self._get_executor().run(
+            [partial(execute_step_stream_with_index, indexed_step) for indexed_step in indexed_steps]
+        )
 
-            # Collect results as they complete
-            for future in as_completed(future_to_index):
-                try:
-                    index, events = future.result()
-                    all_events_with_indices.append((index, events))
-
-                    # Extract StepOutput from events for the final result
-                    step_outputs = [event for event in events if isinstance(event, StepOutput)]
-                    if step_outputs:
-                        step_results.extend(step_outputs)
-
-                    step_name = getattr(self.steps[index], "name", f"step_{index}")
-                    log_debug(f"Parallel step {step_name} streaming completed")
-                except Exception as e:
-                    index = future_to_index[future]
-                    step_name = getattr(self.steps[index], "name", f"step_{index}")
-                    logger.error(f"Parallel step {step_name} streaming failed: {e}")
-                    error_event = StepOutput(
-                        step_name=step_name,
-                        content=f"Step {step_name} failed: {str(e)}",
-                        success=False,
-                        error=str(e),
-                    )
-                    all_events_with_indices.append((index, [error_event]))
-                    step_results.append(error_event)
+        # Collect results
+        for (index, step), task_result in zip(indexed_steps, task_results):
+            step_name = getattr(step, "name", f"step_{index}")
+            if task_result.error is not None:
+                logger.error(f"Parallel step {step_name} streaming failed: {task_result.error}")
+                error_event = StepOutput(
+                    step_name=step_name,
+                    content=f"Step {step_name} failed: {str(task_result.error)}",
+                    success=False,
+                    error=str(task_result.error),
+                )
+                all_events_with_indices.append((index, [error_event]))
+                step_results.append(error_event)
+                self._add_step_timings(step_timings, error_event, task_result)
+                continue
+
+            _, events = task_result.value  # type: ignore[misc]
+            all_events_with_indices.append((index, events))
+
+            # Extract StepOutput from events for the final result
+            step_outputs = [event for event in events if isinstance(event, StepOutput)]
+            if step_outputs:
+                step_results.extend(step_outputs)
+                self._add_step_timings(step_timings, step_outputs, task_result)
+
+            log_debug(f"Parallel step {step_name} streaming completed")
 
         # Sort events by original index to preserve order
         all_events_with_indices.sort(key=lambda x: x[0])
@@ -413,7 +438,7 @@ class Parallel:
                 flattened_step_results.append(result)
 
         # Create aggregated result from all step outputs
-        aggregated_result = self._aggregate_results(flattened_step_results)
+        aggregated_result = self._aggregate_results(flattened_step_results, step_timings)
 
         # Yield the final aggregated StepOutput
         yield aggregated_result
@@ -467,34 +492,29 @@ class Parallel:
         # Use index to preserve order
         indexed_steps = list(enumerate(self.steps))
 
-        # Create tasks for all steps with their indices
-        tasks = [execute_step_async_with_index(indexed_step) for indexed_step in indexed_steps]
-
-        # Execute all tasks concurrently
-        results_with_indices = await asyncio.gather(*tasks, return_exceptions=True)
+        # Execute all steps concurrently, limited by the semaphore of the workflow's shared executor
+        task_results = await self._get_executor().arun(
+            [partial(execute_step_async_with_index, indexed_step) for indexed_step in indexed_steps]
+        )
 
         # Process results and handle exceptions, preserving order
         processed_results_with_indices = []
-        for i, result in enumerate(results_with_indices):
-            if isinstance(result, Exception):
-                step_name = getattr(self.steps[i], "name", f"step_{i}")
-                logger.error(f"Parallel step {step_name} failed: {result}")
-                processed_results_with_indices.append(
-                    (
-                        i,
-                        StepOutput(
-                            step_name=step_name,
-                            content=f"Step {step_name} failed: {str(result)}",
-                            success=False,
-                            error=str(result),
-                        ),
-                    )
+        step_timings: Dict[str, ParallelTaskResult] = {}
+        for (index, step), task_result in zip(indexed_steps, task_results):
+            step_name = getattr(step, "name", f"step_{index}")
+            if task_result.error is not None:
+                logger.error(f"Parallel step {step_name} failed: {task_result.error}")
+                step_result = StepOutput(
+                    step_name=step_name,
+                    content=f"Step {step_name} failed: {str(task_result.error)}",
+                    success=False,
+                    error=str(task_result.error),
                 )
             else:
-                index, step_result = result  # type: ignore[misc]
-                processed_results_with_indices.append((index, step_result))
-                step_name = getattr(self.steps[index], "name", f"step_{index}")
+                _, step_result = task_result.value  # type: ignore[misc]
                 log_debug(f"Parallel step {step_name} completed")
+            processed_results_with_indices.append((index, step_result))
+            self._add_step_timings(step_timings, step_result, task_result)
 
         # Sort by original index to preserve order
         processed_results_with_indices.sort(key=lambda x: x[0])
@@ -509,7 +529,7 @@ class Parallel:
                 flattened_results.append(result)
 
         # Aggregate all results into a single StepOutput
-        aggregated_result = self._aggregate_results(flattened_results)
+        aggregated_result = self._aggregate_results(flattened_results, step_timings)
 
         # Use workflow logger for async parallel completion
         log_debug(f"Parallel End: {self.name} ({len(self.steps)} steps)", center=True, symbol="=")
@@ -587,37 +607,39 @@ class Parallel:
         indexed_steps = list(enumerate(self.steps))
         all_events_with_indices = []
         step_results = []
+        step_timings: Dict[str, ParallelTaskResult] = {}
 
-        # Create tasks for all steps with their indices
-        tasks = [execute_step_stream_async_with_index(indexed_step) for indexed_step in indexed_steps]
-
-        # Execute all tasks concurrently
-        results_with_indices = await asyncio.gather(*tasks, return_exceptions=True)
+        # Execute all steps concurrently, limited by the semaphore of the workflow's shared executor
+        task_results = await self._get_executor().arun(
+            [partial(execute_step_stream_async_with_index, indexed_step) for indexed_step in indexed_steps]
+        )
 
         # Process results and handle exceptions, preserving order
-        for i, result in enumerate(results_with_indices):
-            if isinstance(result, Exception):
-                step_name = getattr(self.steps[i], "name", f"step_{i}")
-                logger.error(f"Parallel step {step_name} async streaming failed: {result}")
+        for (index, step), task_result in zip(indexed_steps, task_results):
+            step_name = getattr(step, "name", f"step_{index}")
+            if task_result.error is not None:
+                logger.error(f"Parallel step {step_name} async streaming failed: {task_result.error}")
                 error_event = StepOutput(
                     step_name=step_name,
-                    content=f"Step {step_name} failed: {str(result)}",
+                    content=f"Step {step_name} failed: {str(task_result.error)}",
                     success=False,
-                    error=str(result),
+                    error=str(task_result.error),
                 )
-                all_events_with_indices.append((i, [error_event]))
+                all_events_with_indices.append((index, [error_event]))
                 step_results.append(error_event)
-            else:
-                index, events = result  # type: ignore[misc]
-                all_events_with_indices.append((index, events))
+                self._add_step_timings(step_timings, error_event, task_result)
+                continue
+
+            _, events = task_result.value  # type: ignore[misc]
+            all_events_with_indices.append((index, events))
 
-                # Extract StepOutput from events for the final result
-                step_outputs = [event for event in events if isinstance(event, StepOutput)]
-                if step_outputs:
-                    step_results.extend(step_outputs)
+            # Extract StepOutput from events for the final result
+            step_outputs = [event for event in events if isinstance(event, StepOutput)]
+            if step_outputs:
+                step_results.extend(step_outputs)
+                self._add_step_timings(step_timings, step_outputs, task_result)
 
-                step_name = getattr(self.steps[index], "name", f"step_{index}")
-                log_debug(f"Parallel step {step_name} async streaming completed")
+            log_debug(f"Parallel step {step_name} async streaming completed")
 
         # Sort events by original index to preserve order
         all_events_with_indices.sort(key=lambda x: x[0])
@@ -638,7 +660,7 @@ class Parallel:
                 flattened_step_results.append(result)
 
         # Create aggregated result from all step outputs
-        aggregated_result = self._aggregate_results(flattened_step_results)
+        aggregated_result = self._aggregate_results(flattened_step_results, step_timings)
 
         # Yield the final aggregated StepOutput
         yield aggregated_result
@@ -0,0 +1,205 @@
+import asyncio
+from queue import Queue
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from agno.run.response import RunResponseContentEvent
+from agno.run.team import RunResponseContentEvent as TeamRunResponseContentEvent
+from agno.utils.fanout import FanOutEvent, afan_out, fan_out
+from agno.workflow.v2.types import StepOutput
+
+# Marks the end of the content of a step
+_END = object()
+
+
+class ContentChannel:
+    """Hands the content chunks of a running step to the next step, read as `previous_step_content_stream`"""
+
+    def __init__(self):
+        self._queue: "Queue[Any]" = Queue()
+
+    @classmethod
+    def from_content(cls, content: Any) -> "ContentChannel":
+        """A channel with the content of a step that already finished"""
+        channel = cls()
+        if content is not None:
+            channel.put(content)
+        channel.close()
+        return channel
+
+    def put(self, chunk: Any) -> None:
+        self._queue.put(chunk)
+
+    def close(self) -> None:
+        self._queue.put(_END)
+
+    def __iter__(self) -> Iterator[Any]:
+        while True:
+            chunk = self._queue.get()
+            if chunk is _END:
+                # Let other readers see the end as well
+                self._queue.put(_END)
+                return
+            yield chunk
+
+
+class AsyncContentChannel:
+    """Async version of ContentChannel"""
+
+    def __init__(self):
+        self._queue: "asyncio.Queue[Any]" = asyncio.Queue()
+
+    @classmethod
+    def from_content(cls, content: Any) -> "AsyncContentChannel":
+        """A channel with the content of a step that already finished"""
+        channel = cls()
+        if content is not None:
+            channel.put(content)
+        channel.close()
+        return channel
+
+    def put(self, chunk: Any) -> None:
+        self._queue.put_nowait(chunk)
+
+    def close(self) -> None:
+        self._queue.put_nowait(_END)
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        while True:
+            chunk = await self._queue.get()
+            if chunk is _END:
+                self._queue.put_nowait(_END)
+                return
+            yield chunk
+
+
+def get_content_chunk(event: Any) -> Optional[Any]:
+    """The content chunk of a streamed event: content events of agents and teams, and strings yielded by functions"""
+    if isinstance(event, str):
+        return event
+    if isinstance(event, (RunResponseContentEvent, TeamRunResponseContentEvent)) and event.content is not None:
+        return event.content
+    return None
+
+
+def pipe_content(events: Iterable[Any], channel: ContentChannel) -> Iterator[Any]:
+    """Yield the events of a step and put its content chunks in the channel.
+
+    A step that does not stream its content puts the content of its output in the channel at once.
+    """
+    streamed = False
+    try:
+        for event in events:
+            chunk = get_content_chunk(event)
+            if chunk is not None:
+                channel.put(chunk)
+                streamed = True
+            elif isinstance(event, StepOutput) and not streamed and event.content is not None:
+                channel.put(event.content)
+            yield event
+    finally:
+        channel.close()
+
+
+async def apipe_content(events: AsyncIterable[Any], channel: AsyncContentChannel) -> AsyncIterator[Any]:
+    """Async version of pipe_content"""
+    streamed = False
+    try:
+        async for event in events:
+            chunk = get_content_chunk(event)
+            if chunk is not None:
+                channel.put(chunk)
+                streamed = True
+            elif isinstance(event, StepOutput) and not streamed and event.content is not None:
+                channel.put(event.content)
+            yield event
+    finally:
+        channel.close()
+
+
+class _PipelineGrouper:
+    """Splits the merged events of the steps of a pipeline into the events of each step, in step order.
+
+    The group of a step yields the events of later steps as they arrive, so their streamed content is not held back,
+    but holds back their outputs until the group of their own step.
+    """
+
+    def __init__(self):
+        # Outputs of later steps, yielded with the group of their step
+        self.held_outputs: Dict[int, List[StepOutput]] = {}
+        # Later steps that are done, with their error if any
+        self.done: Dict[int, Optional[BaseException]] = {}
+
+    def start(self, index: int) -> Tuple[List[StepOutput], bool]:
+        """The held outputs of the step and whether it is already done"""
+        outputs = self.held_outputs.pop(index, [])
+        if index in self.done:
+            error = self.done.pop(index)
+            if error is not None:
+                raise error
+            return outputs, True
+        return outputs, False
+
+    def add(self, index: int, event: FanOutEvent) -> Tuple[List[Any], bool]:
+        """The items to yield in the group of the step, and whether the group ended"""
+        if event.done:
+            if event.index == index:
+                if event.error is not None:
+                    raise event.error
+                return [], True
+            self.done[event.index] = event.error
+            return [], False
+        if isinstance(event.item, StepOutput) and event.index != index:
+            self.held_outputs.setdefault(event.index, []).append(event.item)
+            return [], False
+        return [event.item], False
+
+
+def run_pipeline(tasks: List[Callable[[], Iterable[Any]]]) -> Iterator[Tuple[int, Iterator[Any]]]:
+    """Run the steps of a pipeline at the same time and yield the events of each step, in step order.
+
+    Each group must be read before the next one.
+    """
+    events = fan_out(tasks)
+    grouper = _PipelineGrouper()
+
+    def get_step_events(index: int) -> Iterator[Any]:
+        outputs, done = grouper.start(index)
+        yield from outputs
+        if done:
+            return
+        for event in events:
+            items, done = grouper.add(index, event)
+            yield from items
+            if done:
+                return
+
+    try:
+        for index in range(len(tasks)):
+            yield index, get_step_events(index)
+    finally:
+        events.close()  # type: ignore[attr-defined]
+
+
+async def arun_pipeline(tasks: List[Callable[[], AsyncIterable[Any]]]) -> AsyncIterator[Tuple[int, AsyncIterator[Any]]]:
+    """Async version of run_pipeline"""
+    events = afan_out(tasks)
+    grouper = _PipelineGrouper()
+
+    async def get_step_events(index: int) -> AsyncIterator[Any]:
+        outputs, done = grouper.start(index)
+        for output in outputs:
+            yield output
+        if done:
+            return
+        async for event in events:
+            items, done = grouper.add(index, event)
+            for item in items:
+                yield item
+            if done:
+                return
+
+    try:
+        for index in range(len(tasks)):
+            yield index, get_step_events(index)
+    finally:
+        await events.aclose()  # type: ignore[attr-defined]
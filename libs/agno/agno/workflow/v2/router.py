@@ -25,6 +25,7 @@ WorkflowSteps = List[
         "Parallel",  # type: ignore # noqa: F821
         "Condition",  # type: ignore # noqa: F821
         "Router",  # type: ignore # noqa: F821
+        "Map",  # type: ignore # noqa: F821
     ]
 ]
 
@@ -43,12 +44,16 @@ class Router:
     name: Optional[str] = None
     description: Optional[str] = None
 
+    # Names of the workflow steps whose outputs this step reads, None depends on all previous steps
+    depends_on: Optional[List[str]] = None
+
     def _prepare_steps(self):
         """Prepare the steps for execution - mirrors workflow logic"""
         from agno.agent.agent import Agent
         from agno.team.team import Team
         from agno.workflow.v2.condition import Condition
         from agno.workflow.v2.loop import Loop
+        from agno.workflow.v2.map import Map
         from agno.workflow.v2.parallel import Parallel
         from agno.workflow.v2.step import Step
         from agno.workflow.v2.steps import Steps
@@ -61,7 +66,7 @@ class Router:
                 prepared_steps.append(Step(name=step.name, description=step.description, agent=step))
             elif isinstance(step, Team):
                 prepared_steps.append(Step(name=step.name, description=step.description, team=step))
-            elif isinstance(step, (Step, Steps, Loop, Parallel, Condition, Router)):
+            elif isinstance(step, (Step, Steps, Loop, Parallel, Condition, Router, Map)):
                 prepared_steps.append(step)
             else:
                 raise ValueError(f"Invalid step type: {type(step).__name__}")
@@ -16,6 +16,7 @@ from agno.run.v2.workflow import (
 )
 from agno.team import Team
 from agno.utils.log import log_debug, logger, use_agent_logger, use_team_logger, use_workflow_logger
+from agno.workflow.v2.pipeline import AsyncContentChannel, ContentChannel
 from agno.workflow.v2.types import StepInput, StepOutput
 
 StepExecutor = Callable[
@@ -56,6 +57,13 @@ class Step:
     # If False, only warn about missing inputs
     strict_input_validation: bool = False
 
+    # Names of the workflow steps whose outputs this step reads, None depends on all previous steps
+    depends_on: Optional[List[str]] = None
+
+    # Start the step while the previous step is still streaming, reading its content chunks from
+    # step_input.previous_step_content_stream. Only for function executors.
+    stream_input: bool = False
+
     _retry_count: int = 0
 
     def __init__(
@@ -70,6 +78,8 @@ class Step:
         timeout_seconds: Optional[int] = None,
         skip_on_failure: bool = False,
         strict_input_validation: bool = False,
+        depends_on: Optional[List[str]] = None,
+        stream_input: bool = False,
     ):
         # Auto-detect name for function executors if not provided
         if name is None and executor is not None:
@@ -89,10 +99,15 @@ class Step:
         self.timeout_seconds = timeout_seconds
         self.skip_on_failure = skip_on_failure
         self.strict_input_validation = strict_input_validation
+        self.depends_on = depends_on
+        self.stream_input = stream_input
 
         # Set the active executor
         self._set_active_executor()
 
+        if self.stream_input and self._executor_type != "function":
+            raise ValueError(f"Step '{self.name}' can only use stream_input with a function executor")
+
     @property
     def executor_name(self) -> str:
         """Get the name of the current executor"""
@@ -167,8 +182,13 @@ class Step:
         """Execute the step with StepInput, returning final StepOutput (non-streaming)"""
         log_debug(f"Executing step: {self.name}")
 
-        if step_input.previous_step_outputs:
+        # A step pipelined with the previous step reads its content from the stream
+        if step_input.previous_step_outputs and step_input.previous_step_content_stream is None:
             step_input.previous_step_content = step_input.get_last_step_content()
+        if self.stream_input and step_input.previous_step_content_stream is None:
+            step_input.previous_step_content_stream = iter(
+                ContentChannel.from_content(step_input.previous_step_content)
+            )
 
         # Execute with retries
         for attempt in range(self.max_retries + 1):
@@ -278,8 +298,13 @@ class Step:
     ) -> Iterator[Union[WorkflowRunResponseEvent, StepOutput]]:
         """Execute the step with event-driven streaming support"""
 
-        if step_input.previous_step_outputs:
+        # A step pipelined with the previous step reads its content from the stream
+        if step_input.previous_step_outputs and step_input.previous_step_content_stream is None:
             step_input.previous_step_content = step_input.get_last_step_content()
+        if self.stream_input and step_input.previous_step_content_stream is None:
+            step_input.previous_step_content_stream = iter(
+                ContentChannel.from_content(step_input.previous_step_content)
+            )
 
         # Emit StepStartedEvent
         if stream_intermediate_steps and workflow_run_response:
@@ -426,8 +451,13 @@ class Step:
         logger.info(f"Executing async step (non-streaming): {self.name}")
         log_debug(f"Executor type: {self._executor_type}")
 
-        if step_input.previous_step_outputs:
+        # A step pipelined with the previous step reads its content from the stream
+        if step_input.previous_step_outputs and step_input.previous_step_content_stream is None:
             step_input.previous_step_content = step_input.get_last_step_content()
+        if self.stream_input and step_input.previous_step_content_stream is None:
+            step_input.previous_step_content_stream = AsyncContentChannel.from_content(
+                step_input.previous_step_content
+            ).__aiter__()
 
         # Execute with retries
         for attempt in range(self.max_retries + 1):
@@ -553,8 +583,13 @@ class Step:
     ) -> AsyncIterator[Union[WorkflowRunResponseEvent, StepOutput]]:
         """Execute the step with event-driven streaming support"""
 
-        if step_input.previous_step_outputs:
+        # A step pipelined with the previous step reads its content from the stream
+        if step_input.previous_step_outputs and step_input.previous_step_content_stream is None:
             step_input.previous_step_content = step_input.get_last_step_content()
+        if self.stream_input and step_input.previous_step_content_stream is None:
+            step_input.previous_step_content_stream = AsyncContentChannel.from_content(
+                step_input.previous_step_content
+            ).__aiter__()
 
         if stream_intermediate_steps and workflow_run_response:
             # Emit StepStartedEvent
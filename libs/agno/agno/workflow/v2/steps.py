@@ -23,6 +23,7 @@ WorkflowSteps = List[
         "Parallel",  # type: ignore # noqa: F821
         "Condition",  # type: ignore # noqa: F821
         "Router",  # type: ignore # noqa: F821
+        "Map",  # type: ignore # noqa: F821
     ]
 ]
 
@@ -38,12 +39,20 @@ class Steps:
     name: Optional[str] = None
     description: Optional[str] = None
 
+    # Names of the workflow steps whose outputs this step reads, None depends on all previous steps
+    depends_on: Optional[List[str]] = None
+
     def __init__(
-        self, name: Optional[str] = None, description: Optional[str] = None, steps: Optional[List[Any]] = None
-    ):  # Change to List[Any]
+        self,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        steps: Optional[List[Any]] = None,  # Change to List[Any]
+        depends_on: Optional[List[str]] = None,
+    ):
         self.name = name
         self.description = description
         self.steps = steps if steps else []
+        self.depends_on = depends_on
 
     def _prepare_steps(self):
         """Prepare the steps for execution - mirrors workflow logic"""
@@ -51,6 +60,7 @@ class Steps:
         from agno.team.team import Team
         from agno.workflow.v2.condition import Condition
         from agno.workflow.v2.loop import Loop
+        from agno.workflow.v2.map import Map
         from agno.workflow.v2.parallel import Parallel
         from agno.workflow.v2.router import Router
         from agno.workflow.v2.step import Step
@@ -63,7 +73,7 @@ class Steps:
                 prepared_steps.append(Step(name=step.name, description=step.description, agent=step))
             elif isinstance(step, Team):
                 prepared_steps.append(Step(name=step.name, description=step.description, team=step))
-            elif isinstance(step, (Step, Steps, Loop, Parallel, Condition, Router)):
+            elif isinstance(step, (Step, Steps, Loop, Parallel, Condition, Router, Map)):
                 prepared_steps.append(step)
             else:
                 raise ValueError(f"Invalid step type: {type(step).__name__}")
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
 
 from pydantic import BaseModel
 
@@ -56,6 +56,17 @@ class WorkflowExecutionInput:
             "audio": [aud.to_dict() for aud in self.audio] if self.audio else None,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WorkflowExecutionInput":
+        """Create WorkflowExecutionInput from dictionary"""
+        return cls(
+            message=data.get("message"),
+            additional_data=data.get("additional_data"),
+            images=[ImageArtifact.model_validate(img) for img in data["images"]] if data.get("images") else None,
+            videos=[VideoArtifact.model_validate(vid) for vid in data["videos"]] if data.get("videos") else None,
+            audio=[AudioArtifact.model_validate(aud) for aud in data["audio"]] if data.get("audio") else None,
+        )
+
 
 @dataclass
 class StepInput:
@@ -65,6 +76,9 @@ class StepInput:
 
     previous_step_content: Optional[Any] = None
     previous_step_outputs: Optional[Dict[str, "StepOutput"]] = None
+    # Content chunks of the previous step, for steps with stream_input. An Iterator in sync runs and an
+    # AsyncIterator in async runs, yielding the chunks while the previous step is still running in streaming runs.
+    previous_step_content_stream: Optional[Union[Iterator[Any], AsyncIterator[Any]]] = None
 
     additional_data: Optional[Dict[str, Any]] = None
 
@@ -220,7 +234,14 @@ class StepOutput:
                 content_dict = str(self.content)
 
         return {
+            "step_name": self.step_name,
+            "step_id": self.step_id,
+            "executor_type": self.executor_type,
+            "executor_name": self.executor_name,
             "content": content_dict,
+            "parallel_step_outputs": {name: output.to_dict() for name, output in self.parallel_step_outputs.items()}
+            if self.parallel_step_outputs
+            else None,
             "response": self.response.to_dict() if self.response else None,
             "images": [img.to_dict() for img in self.images] if self.images else None,
             "videos": [vid.to_dict() for vid in self.videos] if self.videos else None,
@@ -260,8 +281,17 @@ class StepOutput:
         if audio:
             audio = [AudioArtifact.model_validate(aud) for aud in audio]
 
+        parallel_step_outputs = data.get("parallel_step_outputs")
+        if parallel_step_outputs:
+            parallel_step_outputs = {name: cls.from_dict(output) for name, output in parallel_step_outputs.items()}
+
         return cls(
+            step_name=data.get("step_name"),
+            step_id=data.get("step_id"),
+            executor_type=data.get("executor_type"),
+            executor_name=data.get("executor_name"),
             content=data.get("content"),
+            parallel_step_outputs=parallel_step_outputs,
             response=response,
             images=images,
             videos=videos,
@@ -287,6 +317,10 @@ class StepMetrics:
     # For parallel steps: nested step metrics
     parallel_steps: Optional[Dict[str, "StepMetrics"]] = None
 
+    # For steps of a parallel step: seconds waiting for a worker of the shared executor and seconds running
+    queue_wait_time: Optional[float] = None
+    execution_time: Optional[float] = None
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary - only include relevant fields"""
         result = {
@@ -302,6 +336,11 @@ class StepMetrics:
             # For non-parallel steps, include metrics (even if None)
             result["metrics"] = self.metrics  # type: ignore[assignment]
 
+        if self.queue_wait_time is not None:
+            result["queue_wait_time"] = self.queue_wait_time  # type: ignore[assignment]
+        if self.execution_time is not None:
+            result["execution_time"] = self.execution_time  # type: ignore[assignment]
+
         return result
 
     @classmethod
@@ -319,6 +358,8 @@ class StepMetrics:
             executor_name=data["executor_name"],
             metrics=data.get("metrics") if data.get("executor_type") != "parallel" else None,
             parallel_steps=parallel_steps,
+            queue_wait_time=data.get("queue_wait_time"),
+            execution_time=data.get("execution_time"),
         )
 
 
@@ -2,16 +2,21 @@ import asyncio
 from dataclasses import dataclass
 from datetime import datetime
 from os import getenv
+from threading import Lock
 from typing import (
+    TYPE_CHECKING,
     Any,
+    AsyncIterable,
     AsyncIterator,
     Awaitable,
     Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
     Literal,
     Optional,
+    Tuple,
     Union,
     overload,
 )
@@ -54,9 +59,21 @@ from agno.utils.log import (
     set_log_level_to_info,
     use_workflow_logger,
 )
+from agno.workflow.v2.checkpoint import StepCheckpoint, get_step_input_hash, get_step_path
 from agno.workflow.v2.condition import Condition
+from agno.workflow.v2.dag import agroup_by_step, arun_step_graph, get_step_dependencies, group_by_step, run_step_graph
+from agno.workflow.v2.executor import ParallelExecutor, get_default_parallel_executor
 from agno.workflow.v2.loop import Loop
+from agno.workflow.v2.map import Map
 from agno.workflow.v2.parallel import Parallel
+from agno.workflow.v2.pipeline import (
+    AsyncContentChannel,
+    ContentChannel,
+    apipe_content,
+    arun_pipeline,
+    pipe_content,
+    run_pipeline,
+)
 from agno.workflow.v2.router import Router
 from agno.workflow.v2.step import Step
 from agno.workflow.v2.steps import Steps
@@ -68,6 +85,9 @@ from agno.workflow.v2.types import (
     WorkflowMetrics,
 )
 
+if TYPE_CHECKING:
+    from agno.workflow.v2.jobs import JobQueue
+
 WorkflowSteps = Union[
     Callable[
         ["Workflow", WorkflowExecutionInput],
@@ -85,11 +105,19 @@ WorkflowSteps = Union[
             Parallel,
             Condition,
             Router,
+            Map,
         ]
     ],
 ]
 
 
+def _is_stop_output(item: Any) -> bool:
+    """Whether a step output, or an event of a streaming step, requests to stop the workflow"""
+    if isinstance(item, list):
+        return any(output.stop for output in item)
+    return isinstance(item, StepOutput) and item.stop
+
+
 @dataclass
 class Workflow:
     """Pipeline-based workflow execution"""
@@ -101,8 +129,20 @@ class Workflow:
 
     # Workflow configuration
     steps: Optional[WorkflowSteps] = None
+    # Maximum number of steps run at the same time, when steps declare their dependencies with `depends_on`
+    max_concurrency: Optional[int] = None
+    # Maximum number of worker threads shared by all Parallel steps, and of concurrent Parallel step tasks in async runs
+    # None uses a process-wide executor with the ThreadPoolExecutor default number of threads
+    max_parallel_workers: Optional[int] = None
+    # Store the output of each step with the run, so a run that did not complete can be resumed
+    checkpoint_steps: bool = False
+    # Reuse the output of a step from an earlier run of the session when the step gets the same input
+    # Implies checkpoint_steps
+    memoize_steps: bool = False
 
     storage: Optional[Storage] = None
+    # Queue background runs in a durable job queue, run by a WorkflowWorkerPool, instead of in a task of this process
+    job_queue: Optional["JobQueue"] = None
 
     # Session management
     session_id: Optional[str] = None
@@ -144,6 +184,11 @@ class Workflow:
         stream_intermediate_steps: bool = False,
         store_events: bool = False,
         events_to_skip: Optional[List[WorkflowRunEvent]] = None,
+        max_concurrency: Optional[int] = None,
+        max_parallel_workers: Optional[int] = None,
+        checkpoint_steps: bool = False,
+        memoize_steps: bool = False,
+        job_queue: Optional["JobQueue"] = None,
     ):
         self.workflow_id = workflow_id
         self.name = name
@@ -159,6 +204,14 @@ class Workflow:
         self.events_to_skip = events_to_skip or []
         self.stream = stream
         self.stream_intermediate_steps = stream_intermediate_steps
+        self.max_concurrency = max_concurrency
+        self.max_parallel_workers = max_parallel_workers
+        self._parallel_executor: Optional[ParallelExecutor] = None
+        self.checkpoint_steps = checkpoint_steps
+        self.memoize_steps = memoize_steps
+        self.job_queue = job_queue
+        # Steps running at the same time save their checkpoints to the same run
+        self._checkpoint_lock = Lock()
 
     @property
     def run_parameters(self) -> Dict[str, Any]:
@@ -319,6 +372,33 @@ class Workflow:
                     for nested_step in attr_value:
                         self._propagate_debug_to_step(nested_step)
 
+        # Handle the step of a Map
+        if isinstance(step, Map):
+            self._propagate_debug_to_step(step.step)
+
+    def _get_parallel_executor(self) -> ParallelExecutor:
+        """Get the executor shared by all Parallel steps of the workflow"""
+        if self.max_parallel_workers is None:
+            return get_default_parallel_executor()
+        if self._parallel_executor is None or self._parallel_executor.max_workers != self.max_parallel_workers:
+            self._parallel_executor = ParallelExecutor(max_workers=self.max_parallel_workers)
+        return self._parallel_executor
+
+    def _propagate_parallel_executor_to_step(self, step, parallel_executor: ParallelExecutor):
+        """Recursively set the shared executor on Parallel steps, including nested ones"""
+        if isinstance(step, Parallel):
+            step.parallel_executor = parallel_executor
+
+        for attr_name in ["steps", "choices"]:
+            if hasattr(step, attr_name):
+                attr_value = getattr(step, attr_name)
+                if attr_value and isinstance(attr_value, list):
+                    for nested_step in attr_value:
+                        self._propagate_parallel_executor_to_step(nested_step, parallel_executor)
+
+        if isinstance(step, Map):
+            self._propagate_parallel_executor_to_step(step.step, parallel_executor)
+
     def _create_step_input(
         self,
         execution_input: WorkflowExecutionInput,
@@ -345,6 +425,556 @@ class Workflow:
             audio=shared_audio or [],
         )
 
+    def _create_dependent_step_input(
+        self,
+        execution_input: WorkflowExecutionInput,
+        dependencies: List[int],
+        step_outputs: Dict[int, List[StepOutput]],
+    ) -> StepInput:
+        """Create the StepInput of a step from the outputs and media of the steps it depends on"""
+        previous_step_outputs: Dict[str, StepOutput] = {}
+        shared_images: List[ImageArtifact] = list(execution_input.images or [])
+        shared_videos: List[VideoArtifact] = list(execution_input.videos or [])
+        shared_audio: List[AudioArtifact] = list(execution_input.audio or [])
+
+        for dependency in dependencies:
+            outputs = step_outputs.get(dependency) or []
+            if outputs:
+                dependency_step = self.steps[dependency]  # type: ignore[index]
+                previous_step_outputs[getattr(dependency_step, "name", f"step_{dependency + 1}")] = outputs[-1]
+            for output in outputs:
+                shared_images.extend(output.images or [])
+                shared_videos.extend(output.videos or [])
+                shared_audio.extend(output.audio or [])
+
+        return self._create_step_input(
+            execution_input=execution_input,
+            previous_step_outputs=previous_step_outputs,
+            shared_images=shared_images,
+            shared_videos=shared_videos,
+            shared_audio=shared_audio,
+        )
+
+    @property
+    def _checkpoints_enabled(self) -> bool:
+        return self.checkpoint_steps or self.memoize_steps
+
+    def _get_step_checkpoint(
+        self, workflow_run_response: WorkflowRunResponse, step_path: str, input_hash: str
+    ) -> Optional[StepCheckpoint]:
+        """Find the output of the step for the same input, in this run or with memoize_steps in earlier runs"""
+        runs: List[WorkflowRunResponse] = [workflow_run_response]
+        if self.memoize_steps and self.workflow_session is not None and self.workflow_session.runs:
+            runs.extend(
+                run for run in reversed(self.workflow_session.runs) if run.run_id != workflow_run_response.run_id
+            )
+
+        for run in runs:
+            for checkpoint in run.step_checkpoints or []:
+                if checkpoint.step_path == step_path and checkpoint.input_hash == input_hash:
+                    return checkpoint
+        return None
+
+    def _save_step_checkpoint(
+        self,
+        workflow_run_response: WorkflowRunResponse,
+        step_path: str,
+        input_hash: str,
+        step_output: Union[StepOutput, List[StepOutput]],
+    ) -> None:
+        """Store the output of a completed step with the run and save the run"""
+        step_outputs = step_output if isinstance(step_output, list) else [step_output]
+        # Failed steps are run again when the run is resumed
+        if any(not output.success for output in step_outputs):
+            return
+
+        with self._checkpoint_lock:
+            step_checkpoints = [
+                checkpoint
+                for checkpoint in workflow_run_response.step_checkpoints or []
+                if checkpoint.step_path != step_path
+            ]
+            step_checkpoints.append(
+                StepCheckpoint(
+                    run_id=workflow_run_response.run_id,  # type: ignore[arg-type]
+                    step_path=step_path,
+                    input_hash=input_hash,
+                    output=step_output,
+                )
+            )
+            workflow_run_response.step_checkpoints = step_checkpoints
+            self._save_run_to_storage(workflow_run_response)
+
+    def _restore_step_checkpoint(
+        self, index: int, step: Any, step_input: StepInput, workflow_run_response: WorkflowRunResponse
+    ) -> Tuple[str, str, Optional[Union[StepOutput, List[StepOutput]]]]:
+        """Get the path and input hash of a step, and its output if it has a checkpoint"""
+        step_path = get_step_path(index, step)
+        input_hash = get_step_input_hash(step_input)
+        checkpoint = self._get_step_checkpoint(workflow_run_response, step_path, input_hash)
+        if checkpoint is None:
+            return step_path, input_hash, None
+
+        log_debug(f"Restored step {step_path} from the checkpoint of run {checkpoint.run_id}")
+        if checkpoint.run_id != workflow_run_response.run_id:
+            self._save_step_checkpoint(workflow_run_response, step_path, input_hash, checkpoint.output)
+        return step_path, input_hash, checkpoint.output
+
+    def _execute_step(
+        self, index: int, step: Any, step_input: StepInput, workflow_run_response: WorkflowRunResponse
+    ) -> Union[StepOutput, List[StepOutput]]:
+        """Execute a step, or restore its output from a checkpoint"""
+        if not self._checkpoints_enabled:
+            return step.execute(step_input, session_id=self.session_id, user_id=self.user_id)
+
+        step_path, input_hash, step_output = self._restore_step_checkpoint(
+            index, step, step_input, workflow_run_response
+        )
+        if step_output is None:
+            step_output = step.execute(step_input, session_id=self.session_id, user_id=self.user_id)
+            self._save_step_checkpoint(workflow_run_response, step_path, input_hash, step_output)
+        return step_output
+
+    def _execute_step_stream(
+        self,
+        index: int,
+        step: Any,
+        step_input: StepInput,
+        workflow_run_response: WorkflowRunResponse,
+        stream_intermediate_steps: bool = False,
+    ) -> Iterator[Any]:
+        """Execute a step with streaming, or yield its outputs from a checkpoint"""
+        step_path, input_hash, restored_output = None, None, None
+        if self._checkpoints_enabled:
+            step_path, input_hash, restored_output = self._restore_step_checkpoint(
+                index, step, step_input, workflow_run_response
+            )
+        if restored_output is not None:
+            yield from restored_output if isinstance(restored_output, list) else [restored_output]
+            return
+
+        step_outputs: List[StepOutput] = []
+        for event in step.execute_stream(
+            step_input,
+            session_id=self.session_id,
+            user_id=self.user_id,
+            stream_intermediate_steps=stream_intermediate_steps,
+            workflow_run_response=workflow_run_response,
+            step_index=index,
+        ):
+            if isinstance(event, StepOutput):
+                step_outputs.append(event)
+            yield event
+
+        if step_path is not None and input_hash is not None and step_outputs:
+            self._save_step_checkpoint(
+                workflow_run_response,
+                step_path,
+                input_hash,
+                step_outputs[0] if len(step_outputs) == 1 else step_outputs,
+            )
+
+    async def _aexecute_step(
+        self, index: int, step: Any, step_input: StepInput, workflow_run_response: WorkflowRunResponse
+    ) -> Union[StepOutput, List[StepOutput]]:
+        """Async version of _execute_step"""
+        if not self._checkpoints_enabled:
+            return await step.aexecute(step_input, session_id=self.session_id, user_id=self.user_id)
+
+        step_path, input_hash, step_output = self._restore_step_checkpoint(
+            index, step, step_input, workflow_run_response
+        )
+        if step_output is None:
+            step_output = await step.aexecute(step_input, session_id=self.session_id, user_id=self.user_id)
+            self._save_step_checkpoint(workflow_run_response, step_path, input_hash, step_output)
+        return step_output
+
+    async def _aexecute_step_stream(
+        self,
+        index: int,
+        step: Any,
+        step_input: StepInput,
+        workflow_run_response: WorkflowRunResponse,
+        stream_intermediate_steps: bool = False,
+    ) -> AsyncIterator[Any]:
+        """Async version of _execute_step_stream"""
+        step_path, input_hash, restored_output = None, None, None
+        if self._checkpoints_enabled:
+            step_path, input_hash, restored_output = self._restore_step_checkpoint(
+                index, step, step_input, workflow_run_response
+            )
+        if restored_output is not None:
+            for step_output in restored_output if isinstance(restored_output, list) else [restored_output]:
+                yield step_output
+            return
+
+        step_outputs: List[StepOutput] = []
+        async for event in step.aexecute_stream(
+            step_input,
+            session_id=self.session_id,
+            user_id=self.user_id,
+            stream_intermediate_steps=stream_intermediate_steps,
+            workflow_run_response=workflow_run_response,
+            step_index=index,
+        ):
+            if isinstance(event, StepOutput):
+                step_outputs.append(event)
+            yield event
+
+        if step_path is not None and input_hash is not None and step_outputs:
+            self._save_step_checkpoint(
+                workflow_run_response,
+                step_path,
+                input_hash,
+                step_outputs[0] if len(step_outputs) == 1 else step_outputs,
+            )
+
+    def _execute_steps(
+        self,
+        execution_input: WorkflowExecutionInput,
+        previous_step_outputs: Dict[str, StepOutput],
+        shared_images: List[ImageArtifact],
+        shared_videos: List[VideoArtifact],
+        shared_audio: List[AudioArtifact],
+        workflow_run_response: WorkflowRunResponse,
+    ) -> Iterator[Tuple[int, Any, Union[StepOutput, List[StepOutput]]]]:
+        """Execute the steps and yield their outputs in workflow order.
+
+        Without `depends_on`, each step runs after the caller handled the output of the previous step, with the
+        outputs and media the caller collected. When steps declare `depends_on`, each step runs as soon as the steps
+        it depends on are done, with their outputs and media, up to `max_concurrency` steps at the same time.
+        """
+        steps: List[Any] = self.steps  # type: ignore[assignment]
+        step_dependencies = get_step_dependencies(steps)
+        if step_dependencies is None:
+            for i, step in enumerate(steps):
+                log_debug(f"Executing step {i + 1}/{self._get_step_count()}: {getattr(step, 'name', f'step_{i + 1}')}")
+                step_input = self._create_step_input(
+                    execution_input=execution_input,
+                    previous_step_outputs=previous_step_outputs,
+                    shared_images=shared_images,
+                    shared_videos=shared_videos,
+                    shared_audio=shared_audio,
+                )
+                yield i, step, self._execute_step(i, step, step_input, workflow_run_response)
+            return
+
+        step_outputs: Dict[int, List[StepOutput]] = {}
+
+        def run_step(index: int) -> List[Union[StepOutput, List[StepOutput]]]:
+            step = steps[index]
+            log_debug(f"Executing step {index + 1}/{len(steps)}: {getattr(step, 'name', f'step_{index + 1}')}")
+            step_input = self._create_dependent_step_input(execution_input, step_dependencies[index], step_outputs)
+            step_output = self._execute_step(index, step, step_input, workflow_run_response)
+            step_outputs[index] = step_output if isinstance(step_output, list) else [step_output]
+            return [step_output]
+
+        events = run_step_graph(step_dependencies, run_step, self.max_concurrency, is_stop=_is_stop_output)
+        for index, items in group_by_step(events):
+            for step_output in items:
+                yield index, steps[index], step_output
+
+    def _execute_steps_stream(
+        self,
+        execution_input: WorkflowExecutionInput,
+        previous_step_outputs: Dict[str, StepOutput],
+        shared_images: List[ImageArtifact],
+        shared_videos: List[VideoArtifact],
+        shared_audio: List[AudioArtifact],
+        workflow_run_response: WorkflowRunResponse,
+        stream_intermediate_steps: bool = False,
+    ) -> Iterator[Tuple[int, Any, Iterator[Any]]]:
+        """Execute the steps with streaming and yield the events of each step in workflow order, see _execute_steps"""
+        steps: List[Any] = self.steps  # type: ignore[assignment]
+        step_dependencies = get_step_dependencies(steps)
+        if step_dependencies is None:
+            pipeline_end = -1
+            for i, step in enumerate(steps):
+                if i <= pipeline_end:
+                    continue
+                pipeline_end = self._get_pipeline_end(i)
+                if pipeline_end > i:
+                    yield from self._execute_pipeline_stream(
+                        i,
+                        pipeline_end,
+                        execution_input,
+                        previous_step_outputs,
+                        shared_images,
+                        shared_videos,
+                        shared_audio,
+                        workflow_run_response,
+                        stream_intermediate_steps=stream_intermediate_steps,
+                    )
+                    continue
+
+                log_debug(f"Streaming step {i + 1}/{self._get_step_count()}: {getattr(step, 'name', f'step_{i + 1}')}")
+                step_input = self._create_step_input(
+                    execution_input=execution_input,
+                    previous_step_outputs=previous_step_outputs,
+                    shared_images=shared_images,
+                    shared_videos=shared_videos,
+                    shared_audio=shared_audio,
+                )
+                yield (
+                    i,
+                    step,
+                    self._execute_step_stream(
+                        i, step, step_input, workflow_run_response, stream_intermediate_steps=stream_intermediate_steps
+                    ),
+                )
+            return
+
+        step_outputs: Dict[int, List[StepOutput]] = {}
+
+        def run_step(index: int) -> Iterator[Any]:
+            step = steps[index]
+            log_debug(f"Streaming step {index + 1}/{len(steps)}: {getattr(step, 'name', f'step_{index + 1}')}")
+            step_input = self._create_dependent_step_input(execution_input, step_dependencies[index], step_outputs)
+            step_outputs[index] = []
+            for event in self._execute_step_stream(
+                index, step, step_input, workflow_run_response, stream_intermediate_steps=stream_intermediate_steps
+            ):
+                if isinstance(event, StepOutput):
+                    step_outputs[index].append(event)
+                yield event
+
+        events = run_step_graph(step_dependencies, run_step, self.max_concurrency, is_stop=_is_stop_output)
+        for index, items in group_by_step(events):
+            yield index, steps[index], items
+
+    async def _aexecute_steps(
+        self,
+        execution_input: WorkflowExecutionInput,
+        previous_step_outputs: Dict[str, StepOutput],
+        shared_images: List[ImageArtifact],
+        shared_videos: List[VideoArtifact],
+        shared_audio: List[AudioArtifact],
+        workflow_run_response: WorkflowRunResponse,
+    ) -> AsyncIterator[Tuple[int, Any, Union[StepOutput, List[StepOutput]]]]:
+        """Async version of _execute_steps, steps declaring `depends_on` run as concurrent tasks"""
+        steps: List[Any] = self.steps  # type: ignore[assignment]
+        step_dependencies = get_step_dependencies(steps)
+        if step_dependencies is None:
+            for i, step in enumerate(steps):
+                log_debug(
+                    f"Async Executing step {i + 1}/{self._get_step_count()}: {getattr(step, 'name', f'step_{i + 1}')}"
+                )
+                step_input = self._create_step_input(
+                    execution_input=execution_input,
+                    previous_step_outputs=previous_step_outputs,
+                    shared_images=shared_images,
+                    shared_videos=shared_videos,
+                    shared_audio=shared_audio,
+                )
+                yield i, step, await self._aexecute_step(i, step, step_input, workflow_run_response)
+            return
+
+        step_outputs: Dict[int, List[StepOutput]] = {}
+
+        async def run_step(index: int) -> AsyncIterator[Union[StepOutput, List[StepOutput]]]:
+            step = steps[index]
+            log_debug(f"Async Executing step {index + 1}/{len(steps)}: {getattr(step, 'name', f'step_{index + 1}')}")
+            step_input = self._create_dependent_step_input(execution_input, step_dependencies[index], step_outputs)
+            step_output = await self._aexecute_step(index, step, step_input, workflow_run_response)
+            step_outputs[index] = step_output if isinstance(step_output, list) else [step_output]
+            yield step_output
+
+        events = arun_step_graph(step_dependencies, run_step, self.max_concurrency, is_stop=_is_stop_output)
+        async for index, items in agroup_by_step(events):
+            async for step_output in items:
+                yield index, steps[index], step_output
+
+    async def _aexecute_steps_stream(
+        self,
+        execution_input: WorkflowExecutionInput,
+        previous_step_outputs: Dict[str, StepOutput],
+        shared_images: List[ImageArtifact],
+        shared_videos: List[VideoArtifact],
+        shared_audio: List[AudioArtifact],
+        workflow_run_response: WorkflowRunResponse,
+        stream_intermediate_steps: bool = False,
+    ) -> AsyncIterator[Tuple[int, Any, AsyncIterator[Any]]]:
+        """Async version of _execute_steps_stream"""
+        steps: List[Any] = self.steps  # type: ignore[assignment]
+        step_dependencies = get_step_dependencies(steps)
+        if step_dependencies is None:
+            pipeline_end = -1
+            for i, step in enumerate(steps):
+                if i <= pipeline_end:
+                    continue
+                pipeline_end = self._get_pipeline_end(i)
+                if pipeline_end > i:
+                    async for pipeline_step in self._aexecute_pipeline_stream(
+                        i,
+                        pipeline_end,
+                        execution_input,
+                        previous_step_outputs,
+                        shared_images,
+                        shared_videos,
+                        shared_audio,
+                        workflow_run_response,
+                        stream_intermediate_steps=stream_intermediate_steps,
+                    ):
+                        yield pipeline_step
+                    continue
+
+                log_debug(
+                    f"Async streaming step {i + 1}/{self._get_step_count()}: {getattr(step, 'name', f'step_{i + 1}')}"
+                )
+                step_input = self._create_step_input(
+                    execution_input=execution_input,
+                    previous_step_outputs=previous_step_outputs,
+                    shared_images=shared_images,
+                    shared_videos=shared_videos,
+                    shared_audio=shared_audio,
+                )
+                yield (
+                    i,
+                    step,
+                    self._aexecute_step_stream(
+                        i, step, step_input, workflow_run_response, stream_intermediate_steps=stream_intermediate_steps
+                    ),
+                )
+            return
+
+        step_outputs: Dict[int, List[StepOutput]] = {}
+
+        async def run_step(index: int) -> AsyncIterator[Any]:
+            step = steps[index]
+            log_debug(f"Async streaming step {index + 1}/{len(steps)}: {getattr(step, 'name', f'step_{index + 1}')}")
+            step_input = self._create_dependent_step_input(execution_input, step_dependencies[index], step_outputs)
+            step_outputs[index] = []
+            async for event in self._aexecute_step_stream(
+                index, step, step_input, workflow_run_response, stream_intermediate_steps=stream_intermediate_steps
+            ):
+                if isinstance(event, StepOutput):
+                    step_outputs[index].append(event)
+                yield event
+
+        events = arun_step_graph(step_dependencies, run_step, self.max_concurrency, is_stop=_is_stop_output)
+        async for index, items in agroup_by_step(events):
+            yield index, steps[index], items
+
+    def _get_pipeline_end(self, start: int) -> int:
+        """The index of the last step of the pipeline starting at `start`.
+
+        The steps after the first step of a pipeline set `stream_input`, and start while the previous step streams.
+        Steps are not pipelined when checkpoints are enabled, as the input of a pipelined step is not known upfront.
+        """
+        steps: List[Any] = self.steps  # type: ignore[assignment]
+        end = start
+        if self._checkpoints_enabled:
+            return end
+        while end + 1 < len(steps) and isinstance(steps[end + 1], Step) and steps[end + 1].stream_input:
+            end += 1
+        return end
+
+    def _create_pipeline_step_inputs(
+        self,
+        start: int,
+        end: int,
+        execution_input: WorkflowExecutionInput,
+        previous_step_outputs: Dict[str, StepOutput],
+        shared_images: List[ImageArtifact],
+        shared_videos: List[VideoArtifact],
+        shared_audio: List[AudioArtifact],
+    ) -> List[StepInput]:
+        """Create the inputs of the steps of a pipeline, from the outputs completed before the pipeline"""
+        step_inputs = []
+        for index in range(start, end + 1):
+            log_debug(
+                f"Streaming step {index + 1}/{self._get_step_count()} in a pipeline: "
+                f"{getattr(self.steps[index], 'name', f'step_{index + 1}')}"  # type: ignore[index]
+            )
+            step_input = self._create_step_input(
+                execution_input=execution_input,
+                previous_step_outputs=dict(previous_step_outputs),
+                shared_images=list(shared_images),
+                shared_videos=list(shared_videos),
+                shared_audio=list(shared_audio),
+            )
+            if index > start:
+                # Read from the stream of the previous step instead
+                step_input.previous_step_content = None
+            step_inputs.append(step_input)
+        return step_inputs
+
+    def _execute_pipeline_stream(
+        self,
+        start: int,
+        end: int,
+        execution_input: WorkflowExecutionInput,
+        previous_step_outputs: Dict[str, StepOutput],
+        shared_images: List[ImageArtifact],
+        shared_videos: List[VideoArtifact],
+        shared_audio: List[AudioArtifact],
+        workflow_run_response: WorkflowRunResponse,
+        stream_intermediate_steps: bool = False,
+    ) -> Iterator[Tuple[int, Any, Iterator[Any]]]:
+        """Run the steps `start` to `end` at the same time, each reading the content chunks of the previous step.
+
+        Yields the events of each step in workflow order. The events of later steps are yielded as they arrive,
+        their outputs with their own step.
+        """
+        steps: List[Any] = self.steps  # type: ignore[assignment]
+        step_inputs = self._create_pipeline_step_inputs(
+            start, end, execution_input, previous_step_outputs, shared_images, shared_videos, shared_audio
+        )
+        channels = [ContentChannel() for _ in range(start, end)]
+        tasks: List[Callable[[], Iterable[Any]]] = []
+        for position, step_input in enumerate(step_inputs):
+            if position > 0:
+                step_input.previous_step_content_stream = iter(channels[position - 1])
+            events: Iterable[Any] = self._execute_step_stream(
+                start + position,
+                steps[start + position],
+                step_input,
+                workflow_run_response,
+                stream_intermediate_steps=stream_intermediate_steps,
+            )
+            if position < len(channels):
+                events = pipe_content(events, channels[position])
+            tasks.append(lambda events=events: events)  # type: ignore[misc]
+
+        for position, items in run_pipeline(tasks):
+            yield start + position, steps[start + position], items
+
+    async def _aexecute_pipeline_stream(
+        self,
+        start: int,
+        end: int,
+        execution_input: WorkflowExecutionInput,
+        previous_step_outputs: Dict[str, StepOutput],
+        shared_images: List[ImageArtifact],
+        shared_videos: List[VideoArtifact],
+        shared_audio: List[AudioArtifact],
+        workflow_run_response: WorkflowRunResponse,
+        stream_intermediate_steps: bool = False,
+    ) -> AsyncIterator[Tuple[int, Any, AsyncIterator[Any]]]:
+        """Async version of _execute_pipeline_stream, the steps run as concurrent tasks"""
+        steps: List[Any] = self.steps  # type: ignore[assignment]
+        step_inputs = self._create_pipeline_step_inputs(
+            start, end, execution_input, previous_step_outputs, shared_images, shared_videos, shared_audio
+        )
+        channels = [AsyncContentChannel() for _ in range(start, end)]
+        tasks: List[Callable[[], AsyncIterable[Any]]] = []
+        for position, step_input in enumerate(step_inputs):
+            if position > 0:
+                step_input.previous_step_content_stream = channels[position - 1].__aiter__()
+            events: AsyncIterable[Any] = self._aexecute_step_stream(
+                start + position,
+                steps[start + position],
+                step_input,
+                workflow_run_response,
+                stream_intermediate_steps=stream_intermediate_steps,
+            )
+            if position < len(channels):
+                events = apipe_content(events, channels[position])
+            tasks.append(lambda events=events: events)  # type: ignore[misc]
+
+        async for position, items in arun_pipeline(tasks):
+            yield start + position, steps[start + position], items
+
     def _get_step_count(self) -> int:
         """Get the number of steps in the workflow"""
         if self.steps is None:
@@ -474,20 +1104,15 @@ class Workflow:
                 shared_audio: List[AudioArtifact] = execution_input.audio or []
                 output_audio: List[AudioArtifact] = (execution_input.audio or []).copy()  # Start with input audio
 
-                for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+                for i, step, step_output in self._execute_steps(
+                    execution_input=execution_input,
+                    previous_step_outputs=previous_step_outputs,
+                    shared_images=shared_images,
+                    shared_videos=shared_videos,
+                    shared_audio=shared_audio,
+                    workflow_run_response=workflow_run_response,
+                ):
                     step_name = getattr(step, "name", f"step_{i + 1}")
-                    log_debug(f"Executing step {i + 1}/{self._get_step_count()}: {step_name}")
-
-                    # Create enhanced StepInput
-                    step_input = self._create_step_input(
-                        execution_input=execution_input,
-                        previous_step_outputs=previous_step_outputs,
-                        shared_images=shared_images,
-                        shared_videos=shared_videos,
-                        shared_audio=shared_audio,
-                    )
-
-                    step_output = step.execute(step_input, session_id=self.session_id, user_id=self.user_id)  # type: ignore[union-attr]
 
                     # Update the workflow-level previous_step_outputs dictionary
                     if isinstance(step_output, list):
@@ -611,28 +1236,19 @@ class Workflow:
 
                 early_termination = False
 
-                for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+                for i, step, step_events in self._execute_steps_stream(
+                    execution_input=execution_input,
+                    previous_step_outputs=previous_step_outputs,
+                    shared_images=shared_images,
+                    shared_videos=shared_videos,
+                    shared_audio=shared_audio,
+                    workflow_run_response=workflow_run_response,
+                    stream_intermediate_steps=stream_intermediate_steps,
+                ):
                     step_name = getattr(step, "name", f"step_{i + 1}")
-                    log_debug(f"Streaming step {i + 1}/{self._get_step_count()}: {step_name}")
-
-                    # Create enhanced StepInput
-                    step_input = self._create_step_input(
-                        execution_input=execution_input,
-                        previous_step_outputs=previous_step_outputs,
-                        shared_images=shared_images,
-                        shared_videos=shared_videos,
-                        shared_audio=shared_audio,
-                    )
 
                     # Execute step with streaming and yield all events
-                    for event in step.execute_stream(  # type: ignore[union-attr]
-                        step_input,
-                        session_id=self.session_id,
-                        user_id=self.user_id,
-                        stream_intermediate_steps=stream_intermediate_steps,
-                        workflow_run_response=workflow_run_response,
-                        step_index=i,
-                    ):
+                    for event in step_events:
                         # Handle events
                         if isinstance(event, StepOutput):
                             step_output = event
@@ -837,20 +1453,15 @@ class Workflow:
                 shared_audio: List[AudioArtifact] = execution_input.audio or []
                 output_audio: List[AudioArtifact] = (execution_input.audio or []).copy()  # Start with input audio
 
-                for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+                async for i, step, step_output in self._aexecute_steps(
+                    execution_input=execution_input,
+                    previous_step_outputs=previous_step_outputs,
+                    shared_images=shared_images,
+                    shared_videos=shared_videos,
+                    shared_audio=shared_audio,
+                    workflow_run_response=workflow_run_response,
+                ):
                     step_name = getattr(step, "name", f"step_{i + 1}")
-                    log_debug(f"Async Executing step {i + 1}/{self._get_step_count()}: {step_name}")
-
-                    # Create enhanced StepInput
-                    step_input = self._create_step_input(
-                        execution_input=execution_input,
-                        previous_step_outputs=previous_step_outputs,
-                        shared_images=shared_images,
-                        shared_videos=shared_videos,
-                        shared_audio=shared_audio,
-                    )
-
-                    step_output = await step.aexecute(step_input, session_id=self.session_id, user_id=self.user_id)  # type: ignore[union-attr]
 
                     # Update the workflow-level previous_step_outputs dictionary
                     if isinstance(step_output, list):
@@ -979,28 +1590,19 @@ class Workflow:
 
                 early_termination = False
 
-                for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+                async for i, step, step_events in self._aexecute_steps_stream(
+                    execution_input=execution_input,
+                    previous_step_outputs=previous_step_outputs,
+                    shared_images=shared_images,
+                    shared_videos=shared_videos,
+                    shared_audio=shared_audio,
+                    workflow_run_response=workflow_run_response,
+                    stream_intermediate_steps=stream_intermediate_steps,
+                ):
                     step_name = getattr(step, "name", f"step_{i + 1}")
-                    log_debug(f"Async streaming step {i + 1}/{self._get_step_count()}: {step_name}")
-
-                    # Create enhanced StepInput
-                    step_input = self._create_step_input(
-                        execution_input=execution_input,
-                        previous_step_outputs=previous_step_outputs,
-                        shared_images=shared_images,
-                        shared_videos=shared_videos,
-                        shared_audio=shared_audio,
-                    )
 
                     # Execute step with streaming and yield all events
-                    async for event in step.aexecute_stream(  # type: ignore[union-attr]
-                        step_input,
-                        session_id=self.session_id,
-                        user_id=self.user_id,
-                        stream_intermediate_steps=stream_intermediate_steps,
-                        workflow_run_response=workflow_run_response,
-                        step_index=i,
-                    ):
+                    async for event in step_events:
                         if isinstance(event, StepOutput):
                             step_output = event
                             collected_step_outputs.append(step_output)
@@ -1136,7 +1738,7 @@ class Workflow:
         videos: Optional[List[Video]] = None,
         **kwargs: Any,
     ) -> WorkflowRunResponse:
-        """Execute workflow in background using asyncio.create_task()"""
+        """Execute workflow in background using asyncio.create_task(), or queue it in the job queue"""
 
         if user_id is not None:
             self.user_id = user_id
@@ -1146,6 +1748,16 @@ class Workflow:
         if self.session_id is None:
             self.session_id = str(uuid4())
 
+        if self.job_queue is not None:
+            return self._enqueue_run(
+                message=message,
+                additional_data=additional_data,
+                audio=audio,
+                images=images,
+                videos=videos,
+                **kwargs,
+            )
+
         if self.run_id is None:
             self.run_id = str(uuid4())
 
@@ -1182,7 +1794,7 @@ class Workflow:
             try:
                 # Update status to RUNNING and save
                 workflow_run_response.status = RunStatus.running
-                self._save_run_to_storage(workflow_run_response)
+                self._save_run_to_storage(workflow_run_response, status_only=True)
 
                 await self._aexecute(execution_input=inputs, workflow_run_response=workflow_run_response, **kwargs)
 
@@ -1203,8 +1815,68 @@ class Workflow:
         # Return SAME object that will be updated by background execution
         return workflow_run_response
 
+    def _enqueue_run(
+        self,
+        message: Optional[Union[str, Dict[str, Any], List[Any], BaseModel]] = None,
+        additional_data: Optional[Dict[str, Any]] = None,
+        audio: Optional[List[Audio]] = None,
+        images: Optional[List[Image]] = None,
+        videos: Optional[List[Video]] = None,
+        **kwargs: Any,
+    ) -> WorkflowRunResponse:
+        """Store a PENDING run with its input and add it to the job queue"""
+        from agno.workflow.v2.jobs import WorkflowJob
+
+        if self.storage is None:
+            raise ValueError("Queued background runs need storage, to store the run input")
+
+        self.run_id = str(uuid4())
+        self.initialize_workflow()
+        self.load_session()
+
+        inputs = WorkflowExecutionInput(
+            message=message,
+            additional_data=additional_data,
+            audio=audio,  # type: ignore
+            images=images,  # type: ignore
+            videos=videos,  # type: ignore
+        )
+        workflow_run_response = WorkflowRunResponse(
+            run_id=self.run_id,
+            session_id=self.session_id,
+            workflow_id=self.workflow_id,
+            workflow_name=self.name,
+            created_at=int(datetime.now().timestamp()),
+            status=RunStatus.pending,
+            workflow_input=inputs.to_dict(),
+        )
+        self._save_run_to_storage(workflow_run_response)
+
+        self.job_queue.enqueue(  # type: ignore[union-attr]
+            WorkflowJob(
+                job_id=self.run_id,
+                workflow_id=self.workflow_id,  # type: ignore[arg-type]
+                session_id=self.session_id,  # type: ignore[arg-type]
+                user_id=self.user_id,
+                run_kwargs=kwargs or None,
+            )
+        )
+        return workflow_run_response
+
+    def cancel_run(self, run_id: str) -> bool:
+        """Cancel a queued background run, see JobQueue.cancel"""
+        if self.job_queue is None:
+            raise ValueError("Only runs queued in a job_queue can be cancelled")
+        return self.job_queue.cancel(run_id)
+
     def get_run(self, run_id: str) -> Optional[WorkflowRunResponse]:
         """Get the status and details of a background workflow run - SIMPLIFIED"""
+        if self.job_queue is not None:
+            # Runs in the job queue are looked up by id, without reading the session
+            job = self.job_queue.get(run_id)
+            if job is not None:
+                return job.to_run_response()
+
         if self.storage is not None and self.session_id is not None:
             session = self.storage.read(session_id=self.session_id)
             if session and isinstance(session, WorkflowSessionV2) and session.runs:
@@ -1228,6 +1900,8 @@ class Workflow:
         stream: Literal[False] = False,
         stream_intermediate_steps: Optional[bool] = None,
         background: Optional[bool] = False,
+        resume: bool = False,
+        run_id: Optional[str] = None,
     ) -> WorkflowRunResponse: ...
 
     @overload
@@ -1243,6 +1917,8 @@ class Workflow:
         stream: Literal[True] = True,
         stream_intermediate_steps: Optional[bool] = None,
         background: Optional[bool] = False,
+        resume: bool = False,
+        run_id: Optional[str] = None,
     ) -> Iterator[WorkflowRunResponseEvent]: ...
 
     def run(
@@ -1257,9 +1933,15 @@ class Workflow:
         stream: bool = False,
         stream_intermediate_steps: Optional[bool] = None,
         background: Optional[bool] = False,
+        resume: bool = False,
+        run_id: Optional[str] = None,
         **kwargs: Any,
     ) -> Union[WorkflowRunResponse, Iterator[WorkflowRunResponseEvent]]:
-        """Execute the workflow synchronously with optional streaming"""
+        """Execute the workflow synchronously with optional streaming
+
+        With `resume`, the run `run_id` or the last run of the session that did not complete is run again under the
+        same run id. Steps with a checkpoint for the same input are not run again, see `checkpoint_steps`.
+        """
 
         if background:
             raise RuntimeError("Background execution is not supported for sync run()")
@@ -1299,6 +1981,11 @@ class Workflow:
         # Prepare steps
         self._prepare_steps()
 
+        resumed_run = self._get_run_to_resume(run_id) if resume else None
+        if resumed_run is not None:
+            self.run_id = resumed_run.run_id
+            log_debug(f"Resuming run: {self.run_id}")
+
         # Create workflow run response that will be updated by reference
         workflow_run_response = WorkflowRunResponse(
             run_id=self.run_id,
@@ -1306,16 +1993,23 @@ class Workflow:
             workflow_id=self.workflow_id,
             workflow_name=self.name,
             created_at=int(datetime.now().timestamp()),
+            step_checkpoints=list(resumed_run.step_checkpoints or []) if resumed_run is not None else None,
         )
         self.run_response = workflow_run_response
 
-        inputs = WorkflowExecutionInput(
-            message=message,
-            additional_data=additional_data,
-            audio=audio,  # type: ignore
-            images=images,  # type: ignore
-            videos=videos,  # type: ignore
-        )
+        if resumed_run is not None and message is None and resumed_run.workflow_input is not None:
+            # Run again with the input of the resumed run
+            inputs = WorkflowExecutionInput.from_dict(resumed_run.workflow_input)
+        else:
+            inputs = WorkflowExecutionInput(
+                message=message,
+                additional_data=additional_data,
+                audio=audio,  # type: ignore
+                images=images,  # type: ignore
+                videos=videos,  # type: ignore
+            )
+        if self._checkpoints_enabled or resumed_run is not None:
+            workflow_run_response.workflow_input = inputs.to_dict()
         log_debug(
             f"Created pipeline input with session state keys: {list(self.workflow_session_state.keys()) if self.workflow_session_state else 'None'}"
         )
@@ -1345,6 +2039,8 @@ class Workflow:
         stream: Literal[False] = False,
         stream_intermediate_steps: Optional[bool] = None,
         background: Optional[bool] = False,
+        resume: bool = False,
+        run_id: Optional[str] = None,
     ) -> WorkflowRunResponse: ...
 
     @overload
@@ -1360,6 +2056,8 @@ class Workflow:
         stream: Literal[True] = True,
         stream_intermediate_steps: Optional[bool] = None,
         background: Optional[bool] = False,
+        resume: bool = False,
+        run_id: Optional[str] = None,
     ) -> AsyncIterator[WorkflowRunResponseEvent]: ...
 
     async def arun(
@@ -1374,9 +2072,11 @@ class Workflow:
         stream: bool = False,
         stream_intermediate_steps: Optional[bool] = False,
         background: Optional[bool] = False,
+        resume: bool = False,
+        run_id: Optional[str] = None,
         **kwargs: Any,
     ) -> Union[WorkflowRunResponse, AsyncIterator[WorkflowRunResponseEvent]]:
-        """Execute the workflow synchronously with optional streaming"""
+        """Execute the workflow asynchronously with optional streaming, see run() for `resume`"""
         if background:
             return await self._arun_background(
                 message=message,
@@ -1424,6 +2124,11 @@ class Workflow:
         # Prepare steps
         self._prepare_steps()
 
+        resumed_run = self._get_run_to_resume(run_id) if resume else None
+        if resumed_run is not None:
+            self.run_id = resumed_run.run_id
+            log_debug(f"Resuming run: {self.run_id}")
+
         # Create workflow run response that will be updated by reference
         workflow_run_response = WorkflowRunResponse(
             run_id=self.run_id,
@@ -1431,16 +2136,23 @@ class Workflow:
             workflow_id=self.workflow_id,
             workflow_name=self.name,
             created_at=int(datetime.now().timestamp()),
+            step_checkpoints=list(resumed_run.step_checkpoints or []) if resumed_run is not None else None,
         )
         self.run_response = workflow_run_response
 
-        inputs = WorkflowExecutionInput(
-            message=message,
-            additional_data=additional_data,
-            audio=audio,  # type: ignore
-            images=images,  # type: ignore
-            videos=videos,  # type: ignore
-        )
+        if resumed_run is not None and message is None and resumed_run.workflow_input is not None:
+            # Run again with the input of the resumed run
+            inputs = WorkflowExecutionInput.from_dict(resumed_run.workflow_input)
+        else:
+            inputs = WorkflowExecutionInput(
+                message=message,
+                additional_data=additional_data,
+                audio=audio,  # type: ignore
+                images=images,  # type: ignore
+                videos=videos,  # type: ignore
+            )
+        if self._checkpoints_enabled or resumed_run is not None:
+            workflow_run_response.workflow_input = inputs.to_dict()
         log_debug(
             f"Created async pipeline input with session state keys: {list(self.workflow_session_state.keys()) if self.workflow_session_state else 'None'}"
         )
@@ -1457,10 +2169,41 @@ class Workflow:
         else:
             return await self._aexecute(execution_input=inputs, workflow_run_response=workflow_run_response, **kwargs)
 
+    def _get_run_to_resume(self, run_id: Optional[str] = None) -> Optional[WorkflowRunResponse]:
+        """Get the run with the given id, or the last run of the session that did not complete"""
+        if not self._checkpoints_enabled:
+            logger.warning(
+                "Resuming a run without checkpoint_steps: its step outputs were not stored, so every step runs again"
+            )
+        runs = self.workflow_session.runs if self.workflow_session is not None and self.workflow_session.runs else []
+        if run_id is not None:
+            for run in runs:
+                if run.run_id == run_id:
+                    return run
+            raise ValueError(f"Run {run_id} not found in session {self.session_id}")
+
+        for run in reversed(runs):
+            if run.status != RunStatus.completed:
+                return run
+        log_debug("No run to resume, starting a new run")
+        return None
+
+    def resume(
+        self, run_id: Optional[str] = None, **kwargs: Any
+    ) -> Union[WorkflowRunResponse, Iterator[WorkflowRunResponseEvent]]:
+        """Resume a run that did not complete, skipping the steps it completed. Takes the arguments of run()"""
+        return self.run(resume=True, run_id=run_id, **kwargs)
+
+    async def aresume(
+        self, run_id: Optional[str] = None, **kwargs: Any
+    ) -> Union[WorkflowRunResponse, AsyncIterator[WorkflowRunResponseEvent]]:
+        """Async version of resume()"""
+        return await self.arun(resume=True, run_id=run_id, **kwargs)
+
     def _prepare_steps(self):
         """Prepare the steps for execution"""
         if not callable(self.steps) and self.steps is not None:
-            prepared_steps: List[Union[Step, Steps, Loop, Parallel, Condition, Router]] = []
+            prepared_steps: List[Union[Step, Steps, Loop, Parallel, Condition, Router, Map]] = []
             for i, step in enumerate(self.steps):  # type: ignore
                 if callable(step) and hasattr(step, "__name__"):
                     step_name = step.__name__
@@ -1474,7 +2217,7 @@ class Workflow:
                     step_name = step.name or f"step_{i + 1}"
                     log_debug(f"Step {i + 1}: Team '{step_name}' with {len(step.members)} members")
                     prepared_steps.append(Step(name=step_name, description=step.description, team=step))
-                elif isinstance(step, (Step, Steps, Loop, Parallel, Condition, Router)):
+                elif isinstance(step, (Step, Steps, Loop, Parallel, Condition, Router, Map)):
                     step_type = type(step).__name__
                     step_name = getattr(step, "name", f"unnamed_{step_type.lower()}")
                     log_debug(f"Step {i + 1}: {step_type} '{step_name}'")
@@ -1483,6 +2226,10 @@ class Workflow:
                     raise ValueError(f"Invalid step type: {type(step).__name__}")
 
             self.steps = prepared_steps  # type: ignore
+
+            parallel_executor = self._get_parallel_executor()
+            for step in prepared_steps:
+                self._propagate_parallel_executor_to_step(step, parallel_executor)
             log_debug("Step preparation completed")
 
     def get_workflow_session(self) -> WorkflowSessionV2:
@@ -3222,10 +3969,21 @@ class Workflow:
             # Update session_state with workflow_session_state
             executor.workflow_session_state = self.workflow_session_state
 
-    def _save_run_to_storage(self, workflow_run_response: WorkflowRunResponse) -> None:
-        """Helper method to save workflow run response to storage"""
+    def _save_run_to_storage(self, workflow_run_response: WorkflowRunResponse, status_only: bool = False) -> None:
+        """Helper method to save workflow run response to storage.
+
+        Storages that keep each run in its own row only write this run, or only its status when `status_only` is set.
+        Other storages write the session with all its runs.
+        """
         if self.workflow_session:
             self.workflow_session.upsert_run(workflow_run_response)
+            if self.storage is not None and self.session_id is not None:
+                run_id = workflow_run_response.run_id
+                status = workflow_run_response.status.value
+                if status_only and run_id and self.storage.update_workflow_run_status(self.session_id, run_id, status):
+                    return
+                if self.storage.upsert_workflow_run(self.session_id, workflow_run_response):
+                    return
             self.write_to_storage()
 
     def update_agents_and_teams_session_info(self):
@@ -0,0 +1,165 @@
+"""Integration tests for step checkpoints and resuming workflow runs."""
+
+from unittest.mock import patch
+
+import pytest
+
+from agno.run.base import RunStatus
+from agno.run.v2.workflow import WorkflowRunResponse
+from agno.workflow.v2 import Workflow
+from agno.workflow.v2.checkpoint import StepCheckpoint
+from agno.workflow.v2.step import Step
+from agno.workflow.v2.types import StepInput, StepOutput
+
+
+class FlakySteps:
+    """Step executors counting their calls, the review step fails until fixed."""
+
+    def __init__(self):
+        self.calls = {"research": 0, "write": 0, "review": 0}
+        self.fail_review = True
+
+    def get_steps(self):
+        def research(step_input: StepInput) -> StepOutput:
+            self.calls["research"] += 1
+            return StepOutput(content=f"research on {step_input.message}")
+
+        def write(step_input: StepInput) -> StepOutput:
+            self.calls["write"] += 1
+            return StepOutput(content=f"article from {step_input.previous_step_content}")
+
+        def review(step_input: StepInput) -> StepOutput:
+            self.calls["review"] += 1
+            if self.fail_review:
+                raise RuntimeError("review failed")
+            return StepOutput(content=f"reviewed {step_input.previous_step_content}")
+
+        return [
+            Step(name="research", executor=research),
+            Step(name="write", executor=write),
+            Step(name="review", executor=review, max_retries=0),
+        ]
+
+
+def test_step_checkpoint_round_trip():
+    """Test serializing a checkpoint with nested step outputs."""
+    checkpoint = StepCheckpoint(
+        run_id="run",
+        step_path="0:parallel",
+        input_hash="hash",
+        output=StepOutput(
+            step_name="parallel",
+            content="combined",
+            parallel_step_outputs={"a": StepOutput(step_name="a", content="a done")},
+        ),
+    )
+
+    restored = StepCheckpoint.from_dict(checkpoint.to_dict())
+
+    assert restored.step_path == "0:parallel"
+    assert restored.output.step_name == "parallel"
+    assert restored.output.parallel_step_outputs["a"].content == "a done"
+
+
+def test_resume_skips_completed_steps(workflow_storage):
+    """Test resuming a failed run only runs the steps that did not complete."""
+    flaky = FlakySteps()
+    workflow = Workflow(
+        name="Checkpoint Workflow", storage=workflow_storage, steps=flaky.get_steps(), checkpoint_steps=True
+    )
+
+    failed = workflow.run(message="AI")
+    assert failed.status == RunStatus.error
+    assert [checkpoint.step_path for checkpoint in failed.step_checkpoints] == ["0:research", "1:write"]
+
+    flaky.fail_review = False
+    response = workflow.resume()
+
+    assert isinstance(response, WorkflowRunResponse)
+    assert response.run_id == failed.run_id
+    assert response.status == RunStatus.completed
+    assert response.content == "reviewed article from research on AI"
+    assert flaky.calls == {"research": 1, "write": 1, "review": 2}
+    # The resumed run replaces the failed run in the session
+    assert len(workflow.workflow_session.runs) == 1
+
+
+def test_resume_from_storage(workflow_storage):
+    """Test resuming a run with a new workflow instance, using the input and checkpoints stored with the run."""
+    flaky = FlakySteps()
+    workflow = Workflow(
+        name="Checkpoint Workflow", storage=workflow_storage, steps=flaky.get_steps(), checkpoint_steps=True
+    )
+    failed = workflow.run(message="AI")
+
+    flaky.fail_review = False
+    workflow = Workflow(
+        name="Checkpoint Workflow",
+        storage=workflow_storage,
+        steps=flaky.get_steps(),
+        session_id=workflow.session_id,
+        checkpoint_steps=True,
+    )
+    events = list(workflow.resume(run_id=failed.run_id, stream=True))
+
+    assert events[-1].content == "reviewed article from research on AI"
+    assert flaky.calls == {"research": 1, "write": 1, "review": 2}
+
+
+def test_resume_without_checkpoints_warns(workflow_storage):
+    """Test resuming without checkpoint_steps warns that every step runs again."""
+    flaky = FlakySteps()
+    workflow = Workflow(name="Checkpoint Workflow", storage=workflow_storage, steps=flaky.get_steps())
+    workflow.run(message="AI")
+
+    flaky.fail_review = False
+    with patch("agno.workflow.v2.workflow.logger.warning") as mock_warning:
+        response = workflow.resume()
+
+    assert response.status == RunStatus.completed
+    assert flaky.calls == {"research": 2, "write": 2, "review": 2}
+    mock_warning.assert_called_once()
+    assert "checkpoint_steps" in mock_warning.call_args.args[0]
+
+
+def test_resume_unknown_run(workflow_storage):
+    """Test resuming a run that is not in the session."""
+    workflow = Workflow(name="Checkpoint Workflow", storage=workflow_storage, steps=FlakySteps().get_steps())
+
+    with pytest.raises(ValueError, match="not found"):
+        workflow.resume(run_id="missing")
+
+
+def test_memoize_steps(workflow_storage):
+    """Test steps with the same input reuse the output of an earlier run."""
+    flaky = FlakySteps()
+    flaky.fail_review = False
+    workflow = Workflow(name="Memoized Workflow", storage=workflow_storage, steps=flaky.get_steps(), memoize_steps=True)
+
+    workflow.run(message="AI")
+    response = workflow.run(message="AI")
+    assert response.content == "reviewed article from research on AI"
+    assert flaky.calls == {"research": 1, "write": 1, "review": 1}
+
+    # A different input runs the steps again
+    workflow.run(message="ML")
+    assert flaky.calls == {"research": 2, "write": 2, "review": 2}
+
+
+@pytest.mark.asyncio
+async def test_async_resume_skips_completed_steps(workflow_storage):
+    """Test resuming a failed async run."""
+    flaky = FlakySteps()
+    workflow = Workflow(
+        name="Async Checkpoint Workflow", storage=workflow_storage, steps=flaky.get_steps(), checkpoint_steps=True
+    )
+
+    failed = await workflow.arun(message="AI")
+    assert failed.status == RunStatus.error
+
+    flaky.fail_review = False
+    response = await workflow.aresume()
+
+    assert response.run_id == failed.run_id
+    assert response.content == "reviewed article from research on AI"
+    assert flaky.calls == {"research": 1, "write": 1, "review": 2}
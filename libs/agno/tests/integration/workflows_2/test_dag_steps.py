@@ -0,0 +1,217 @@
+"""Integration tests for steps declaring their dependencies with depends_on."""
+
+import asyncio
+import time
+
+import pytest
+
+from agno.run.v2.workflow import StepCompletedEvent, StepStartedEvent, WorkflowCompletedEvent, WorkflowRunResponse
+from agno.workflow.v2 import Workflow
+from agno.workflow.v2.dag import get_step_dependencies
+from agno.workflow.v2.step import Step
+from agno.workflow.v2.types import StepInput, StepOutput
+
+
+def slow_step(name: str, delay: float = 0.3) -> Step:
+    def executor(step_input: StepInput) -> StepOutput:
+        time.sleep(delay)
+        return StepOutput(content=f"{name} done")
+
+    return Step(name=name, executor=executor, depends_on=[])
+
+
+def async_slow_step(name: str, delay: float = 0.3) -> Step:
+    async def executor(step_input: StepInput) -> StepOutput:
+        await asyncio.sleep(delay)
+        return StepOutput(content=f"{name} done")
+
+    return Step(name=name, executor=executor, depends_on=[])
+
+
+def combine(step_input: StepInput) -> StepOutput:
+    """Combine the outputs of the steps this step depends on."""
+    return StepOutput(content=" | ".join(sorted(step_input.previous_step_outputs or {})))
+
+
+def test_step_dependencies():
+    """Test resolving depends_on names to step positions."""
+    steps = [slow_step("a"), slow_step("b"), Step(name="c", executor=combine, depends_on=["a"])]
+    assert get_step_dependencies(steps) == [[], [], [0]]
+
+    # Steps without depends_on depend on all previous steps
+    steps.append(Step(name="d", executor=combine))
+    assert get_step_dependencies(steps)[3] == [0, 1, 2]
+
+    # No step declares depends_on
+    assert get_step_dependencies([Step(name="a", executor=combine)]) is None
+
+    with pytest.raises(ValueError, match="unknown step"):
+        get_step_dependencies([Step(name="a", executor=combine, depends_on=["missing"])])
+    with pytest.raises(ValueError, match="declared before"):
+        get_step_dependencies(
+            [Step(name="a", executor=combine, depends_on=["b"]), Step(name="b", executor=combine, depends_on=[])]
+        )
+
+
+def test_independent_steps_run_concurrently(workflow_storage):
+    """Test steps without shared dependencies run at the same time."""
+    workflow = Workflow(
+        name="DAG Workflow",
+        storage=workflow_storage,
+        steps=[
+            slow_step("research"),
+            slow_step("outline"),
+            Step(name="write", executor=combine, depends_on=["research", "outline"]),
+        ],
+    )
+
+    start = time.time()
+    response = workflow.run(message="test")
+    elapsed = time.time() - start
+
+    assert isinstance(response, WorkflowRunResponse)
+    assert elapsed < 0.55
+    assert [output.content for output in response.step_responses] == [
+        "research done",
+        "outline done",
+        "outline | research",
+    ]
+    assert response.content == "outline | research"
+
+
+def test_max_concurrency(workflow_storage):
+    """Test max_concurrency limits the number of steps run at the same time."""
+    workflow = Workflow(
+        name="Limited DAG Workflow",
+        storage=workflow_storage,
+        steps=[slow_step("a", 0.2), slow_step("b", 0.2), slow_step("c", 0.2)],
+        max_concurrency=1,
+    )
+
+    start = time.time()
+    response = workflow.run(message="test")
+
+    assert time.time() - start >= 0.6
+    assert [output.content for output in response.step_responses] == ["a done", "b done", "c done"]
+
+
+def test_dependent_step_only_sees_its_dependencies(workflow_storage):
+    """Test a step reads the outputs of the steps it depends on, and steps without depends_on see all of them."""
+    workflow = Workflow(
+        name="Inputs DAG Workflow",
+        storage=workflow_storage,
+        steps=[
+            slow_step("a", 0),
+            slow_step("b", 0),
+            Step(name="only_a", executor=combine, depends_on=["a"]),
+            Step(name="all", executor=combine),
+        ],
+    )
+
+    response = workflow.run(message="test")
+
+    assert response.step_responses[2].content == "a"
+    assert response.step_responses[3].content == "a | b | only_a"
+
+
+def test_dag_streaming_keeps_step_order(workflow_storage):
+    """Test the events of concurrent steps are streamed in workflow order."""
+    workflow = Workflow(
+        name="Streaming DAG Workflow",
+        storage=workflow_storage,
+        steps=[slow_step("slow", 0.3), slow_step("fast", 0), Step(name="final", executor=combine)],
+    )
+
+    events = list(workflow.run(message="test", stream=True, stream_intermediate_steps=True))
+
+    started = [event.step_name for event in events if isinstance(event, StepStartedEvent)]
+    completed = [event.step_name for event in events if isinstance(event, StepCompletedEvent)]
+    assert started == ["slow", "fast", "final"]
+    assert completed == ["slow", "fast", "final"]
+    # The events of a step are not interleaved with the events of other steps
+    step_events = [event.step_name for event in events if isinstance(event, (StepStartedEvent, StepCompletedEvent))]
+    assert step_events == ["slow", "slow", "fast", "fast", "final", "final"]
+
+    completed_events = [event for event in events if isinstance(event, WorkflowCompletedEvent)]
+    assert completed_events[0].content == "fast | slow"
+
+
+def test_dag_early_termination(workflow_storage):
+    """Test steps after a step requesting a stop are not run."""
+
+    def stop(step_input: StepInput) -> StepOutput:
+        return StepOutput(content="stopped", stop=True)
+
+    workflow = Workflow(
+        name="Stopping DAG Workflow",
+        storage=workflow_storage,
+        steps=[
+            slow_step("slow", 0.2),
+            Step(name="stop", executor=stop, depends_on=[]),
+            slow_step("after", 0),
+        ],
+    )
+
+    response = workflow.run(message="test")
+
+    assert [output.content for output in response.step_responses] == ["slow done"]
+
+
+def test_dag_step_error(workflow_storage):
+    """Test the error of a step fails the workflow."""
+
+    def failing(step_input: StepInput) -> StepOutput:
+        raise RuntimeError("step failed")
+
+    workflow = Workflow(
+        name="Failing DAG Workflow",
+        storage=workflow_storage,
+        steps=[
+            Step(name="failing", executor=failing, depends_on=[], max_retries=0),
+            Step(name="after", executor=combine, depends_on=["failing"]),
+        ],
+    )
+
+    response = workflow.run(message="test")
+
+    assert response.status == "ERROR"
+    assert "step failed" in response.content
+
+
+@pytest.mark.asyncio
+async def test_async_independent_steps_run_concurrently(workflow_storage):
+    """Test async steps without shared dependencies run at the same time."""
+    workflow = Workflow(
+        name="Async DAG Workflow",
+        storage=workflow_storage,
+        steps=[
+            async_slow_step("research"),
+            async_slow_step("outline"),
+            Step(name="write", executor=combine, depends_on=["research", "outline"]),
+        ],
+    )
+
+    start = time.time()
+    response = await workflow.arun(message="test")
+
+    assert time.time() - start < 0.55
+    assert response.content == "outline | research"
+
+
+@pytest.mark.asyncio
+async def test_async_dag_streaming_keeps_step_order(workflow_storage):
+    """Test the events of concurrent async steps are streamed in workflow order."""
+    workflow = Workflow(
+        name="Async Streaming DAG Workflow",
+        storage=workflow_storage,
+        steps=[async_slow_step("slow", 0.3), async_slow_step("fast", 0), Step(name="final", executor=combine)],
+    )
+
+    events = []
+    async for event in await workflow.arun(message="test", stream=True, stream_intermediate_steps=True):
+        events.append(event)
+
+    step_events = [event.step_name for event in events if isinstance(event, (StepStartedEvent, StepCompletedEvent))]
+    assert step_events == ["slow", "slow", "fast", "fast", "final", "final"]
+    completed_events = [event for event in events if isinstance(event, WorkflowCompletedEvent)]
+    assert completed_events[0].content == "fast | slow"
@@ -0,0 +1,139 @@
+"""Integration tests for background runs queued in a JobQueue and run by a WorkflowWorkerPool."""
+
+import asyncio
+import time
+
+import pytest
+
+from agno.run.base import RunStatus
+from agno.workflow.v2 import Workflow
+from agno.workflow.v2.jobs import JobQueue, WorkflowJob, WorkflowWorkerPool
+from agno.workflow.v2.step import Step
+from agno.workflow.v2.types import StepInput, StepOutput
+
+
+@pytest.fixture
+def job_queue(workflow_storage):
+    return JobQueue.from_storage(workflow_storage)
+
+
+async def wait_for_run(workflow: Workflow, run_id: str, timeout: float = 5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        run = workflow.get_run(run_id)
+        if run is not None and run.status in (RunStatus.completed, RunStatus.error, RunStatus.cancelled):
+            return run
+        await asyncio.sleep(0.05)
+    raise TimeoutError(f"Run {run_id} did not finish")
+
+
+def test_claim_lease_and_cancel(job_queue):
+    """Test claiming jobs, reclaiming jobs whose lease expired, and cancelling queued jobs."""
+    job_queue.enqueue(WorkflowJob(job_id="run-1", workflow_id="wf", session_id="session"))
+    job_queue.enqueue(WorkflowJob(job_id="run-2", workflow_id="wf", session_id="session"))
+
+    job = job_queue.claim("wf", "worker-a", lease_seconds=0.1)
+    assert job.job_id == "run-1"
+    assert job.status == RunStatus.running.value
+    assert job.attempts == 1
+    assert job_queue.heartbeat("run-1", "worker-a", lease_seconds=0.1) is not None
+    assert job_queue.claim("other-workflow", "worker-b", lease_seconds=10) is None
+
+    assert job_queue.cancel("run-2") is True
+    assert job_queue.get("run-2").status == RunStatus.cancelled.value
+
+    # The lease of worker-a expires and worker-b takes the job over
+    time.sleep(0.15)
+    job = job_queue.claim("wf", "worker-b", lease_seconds=10)
+    assert job.job_id == "run-1"
+    assert job.attempts == 2
+    assert job_queue.heartbeat("run-1", "worker-a", lease_seconds=10) is None
+    assert job_queue.finish("run-1", "worker-a", RunStatus.completed) is False
+    assert job_queue.finish("run-1", "worker-b", RunStatus.completed) is True
+    assert job_queue.get("run-1").status == RunStatus.completed.value
+
+
+@pytest.mark.asyncio
+async def test_queued_background_runs(workflow_storage, job_queue):
+    """Test background runs are queued and run by a fixed number of workers."""
+    running = 0
+    max_running = 0
+
+    async def tracked(step_input: StepInput) -> StepOutput:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.1)
+        running -= 1
+        return StepOutput(content=f"done {step_input.message}")
+
+    workflow = Workflow(
+        name="Queued Workflow",
+        storage=workflow_storage,
+        steps=[Step(name="tracked", executor=tracked)],
+        job_queue=job_queue,
+    )
+
+    responses = [await workflow.arun(message=f"job {i}", background=True) for i in range(4)]
+    assert all(response.status == RunStatus.pending for response in responses)
+    assert workflow.get_run(responses[0].run_id).status == RunStatus.pending
+
+    async with WorkflowWorkerPool(workflow, num_workers=2, poll_interval=0.01):
+        runs = [await wait_for_run(workflow, response.run_id) for response in responses]
+
+    assert [run.status for run in runs] == [RunStatus.completed] * 4
+    assert [run.content for run in runs] == [f"done job {i}" for i in range(4)]
+    assert max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_run_is_retried(workflow_storage, job_queue):
+    """Test a failed run is queued again and resumed until it succeeds."""
+    attempts = 0
+
+    def flaky(step_input: StepInput) -> StepOutput:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise RuntimeError("temporary failure")
+        return StepOutput(content="recovered")
+
+    workflow = Workflow(
+        name="Retried Workflow",
+        storage=workflow_storage,
+        steps=[Step(name="flaky", executor=flaky, max_retries=0)],
+        job_queue=job_queue,
+    )
+    response = await workflow.arun(message="retry", background=True)
+
+    async with WorkflowWorkerPool(workflow, num_workers=1, poll_interval=0.01, retry_delay=0):
+        run = await wait_for_run(workflow, response.run_id)
+
+    assert run.status == RunStatus.completed
+    assert run.content == "recovered"
+    assert job_queue.get(response.run_id).attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_cancel_running_run(workflow_storage, job_queue):
+    """Test cancelling a run stops it at the next heartbeat."""
+
+    async def slow(step_input: StepInput) -> StepOutput:
+        await asyncio.sleep(5)
+        return StepOutput(content="too late")
+
+    workflow = Workflow(
+        name="Cancelled Workflow",
+        storage=workflow_storage,
+        steps=[Step(name="slow", executor=slow)],
+        job_queue=job_queue,
+    )
+    response = await workflow.arun(message="cancel", background=True)
+
+    async with WorkflowWorkerPool(workflow, num_workers=1, poll_interval=0.01, heartbeat_interval=0.05):
+        while workflow.get_run(response.run_id).status != RunStatus.running:
+            await asyncio.sleep(0.01)
+        assert workflow.cancel_run(response.run_id) is True
+        run = await wait_for_run(workflow, response.run_id)
+
+    assert run.status == RunStatus.cancelled
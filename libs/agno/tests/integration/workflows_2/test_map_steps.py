@@ -0,0 +1,242 @@
+"""Integration tests for Map steps."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from agno.agent import Agent
+from agno.run.v2.workflow import (
+    MapBatchCompletedEvent,
+    MapExecutionCompletedEvent,
+    MapExecutionStartedEvent,
+    WorkflowCompletedEvent,
+    WorkflowRunResponse,
+)
+from agno.team import Team
+from agno.workflow.v2 import Map, Steps, Workflow
+from agno.workflow.v2.step import Step
+from agno.workflow.v2.types import StepInput, StepOutput
+
+
+def get_documents(step_input: StepInput):
+    return [f"doc{i}" for i in range(step_input.additional_data["count"])]
+
+
+def summarize(step_input: StepInput) -> StepOutput:
+    time.sleep(0.1)
+    return StepOutput(content=f"summary of {step_input.message}")
+
+
+async def async_summarize(step_input: StepInput) -> StepOutput:
+    await asyncio.sleep(0.1)
+    return StepOutput(content=f"summary of {step_input.message}")
+
+
+def summarize_batch(step_input: StepInput) -> StepOutput:
+    return StepOutput(content=" + ".join(step_input.message))
+
+
+def test_map_keeps_item_order(workflow_storage):
+    """Test items run concurrently and their outputs keep the item order."""
+    workflow = Workflow(
+        name="Map Workflow",
+        storage=workflow_storage,
+        steps=[Map(name="summaries", step=Step(name="summarize", executor=summarize), items=get_documents)],
+    )
+
+    start = time.time()
+    response = workflow.run(message="summarize", additional_data={"count": 5})
+
+    assert isinstance(response, WorkflowRunResponse)
+    assert time.time() - start < 0.3
+    assert response.content == [f"summary of doc{i}" for i in range(5)]
+    assert response.step_responses[0].step_name == "summaries"
+
+
+def test_map_batches_and_concurrency(workflow_storage):
+    """Test batch_size groups items and max_concurrency limits the batches run at the same time."""
+    workflow = Workflow(
+        name="Batched Map Workflow",
+        storage=workflow_storage,
+        steps=[
+            Map(step=summarize_batch, items=get_documents, batch_size=2),
+            Map(step=summarize, items=lambda step_input: ["a", "b", "c"], max_concurrency=1),
+        ],
+    )
+
+    start = time.time()
+    response = workflow.run(message="summarize", additional_data={"count": 5})
+
+    assert response.step_responses[0].content == ["doc0 + doc1", "doc2 + doc3", "doc4"]
+    assert time.time() - start >= 0.3
+
+
+def test_map_limits_concurrency_by_default():
+    """Test a map over many items runs at most 8 batches at the same time by default."""
+    running, peak = [], []
+    lock = threading.Lock()
+
+    def track(step_input: StepInput) -> StepOutput:
+        with lock:
+            running.append(step_input.message)
+            peak.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(step_input.message)
+        return StepOutput(content=step_input.message)
+
+    output = Map(step=track, items=lambda step_input: list(range(20))).execute(StepInput())
+
+    assert output.content == list(range(20))
+    assert max(peak) == 8
+
+
+def test_map_reduce(workflow_storage):
+    """Test the reduce hook combines the outputs of all items."""
+    workflow = Workflow(
+        name="Reduced Map Workflow",
+        storage=workflow_storage,
+        steps=[
+            Map(
+                step=summarize_batch,
+                items=lambda step_input: [["a"], ["b"], ["c"]],
+                reduce=lambda outputs: "\n".join(output.content for output in outputs),
+            )
+        ],
+    )
+
+    response = workflow.run(message="summarize")
+
+    assert response.content == "a\nb\nc"
+
+
+def test_map_item_failure(workflow_storage):
+    """Test a failing item does not stop the other items."""
+
+    def fail_on_b(step_input: StepInput) -> StepOutput:
+        if step_input.message == "b":
+            raise RuntimeError("bad item")
+        return StepOutput(content=step_input.message)
+
+    workflow = Workflow(
+        name="Failing Map Workflow",
+        storage=workflow_storage,
+        steps=[Map(step=Step(name="check", executor=fail_on_b, max_retries=0), items=lambda step_input: ["a", "b"])],
+    )
+
+    response = workflow.run(message="check")
+
+    map_output = response.step_responses[0]
+    assert map_output.success is False
+    assert map_output.content[0] == "a"
+    assert "bad item" in map_output.error
+
+
+def test_map_async_functions_on_sync_run():
+    """Test async items and reduce functions are rejected by the synchronous run."""
+
+    async def get_items(step_input: StepInput):
+        return ["x"]
+
+    async def count(outputs):
+        return len(outputs)
+
+    with pytest.raises(ValueError, match="synchronous execution"):
+        Map(step=summarize, items=get_items).execute(StepInput(message="summarize"))
+    with pytest.raises(ValueError, match="synchronous execution"):
+        list(Map(step=summarize, items=lambda step_input: ["x"], reduce=count).execute_stream(StepInput()))
+    with pytest.raises(ValueError, match="synchronous execution"):
+        Map(step=summarize, items=lambda step_input: get_items(step_input)).execute(StepInput())
+
+
+def test_map_copies_nested_agents():
+    """Test each batch runs its own copy of the agents of nested steps."""
+    agent = Agent(name="Summarizer")
+    map_step = Map(step=Steps(steps=[Step(name="summarize", agent=agent), summarize]), items=get_documents)
+    map_step._prepare_step()
+
+    first, second = map_step._get_batch_step(), map_step._get_batch_step()
+
+    assert first.steps[0].agent is not agent
+    assert first.steps[0].agent is not second.steps[0].agent
+    assert first.steps[0].active_executor is first.steps[0].agent
+    assert first.steps[1] is summarize
+    assert map_step.step.steps[0].agent is agent
+
+
+def test_map_team_requires_sequential_batches():
+    """Test a team, which cannot be copied for each batch, is only mapped one batch at a time."""
+    team = Team(name="Summarizers", members=[])
+
+    with pytest.raises(ValueError, match="max_concurrency=1"):
+        Map(step=Steps(steps=[team]), items=get_documents)._prepare_step()
+    Map(step=team, items=get_documents, max_concurrency=1)._prepare_step()
+
+
+def test_map_streaming_events(workflow_storage):
+    """Test streaming yields an event for each batch and the aggregated output."""
+    workflow = Workflow(
+        name="Streaming Map Workflow",
+        storage=workflow_storage,
+        steps=[Map(name="summaries", step=summarize, items=get_documents)],
+    )
+
+    events = list(
+        workflow.run(message="summarize", additional_data={"count": 3}, stream=True, stream_intermediate_steps=True)
+    )
+
+    assert len([event for event in events if isinstance(event, MapExecutionStartedEvent)]) == 1
+    batch_events = [event for event in events if isinstance(event, MapBatchCompletedEvent)]
+    assert sorted(event.batch_index for event in batch_events) == [0, 1, 2]
+    assert batch_events[0].step_results[0].content == f"summary of {batch_events[0].items[0]}"
+
+    completed = [event for event in events if isinstance(event, MapExecutionCompletedEvent)][0]
+    assert [output.content for output in completed.step_results] == [f"summary of doc{i}" for i in range(3)]
+    workflow_completed = [event for event in events if isinstance(event, WorkflowCompletedEvent)][0]
+    assert workflow_completed.content == [f"summary of doc{i}" for i in range(3)]
+
+
+@pytest.mark.asyncio
+async def test_async_map(workflow_storage):
+    """Test async items run concurrently with an async items extractor and reduce hook."""
+
+    async def get_items(step_input: StepInput):
+        return ["x", "y", "z"]
+
+    async def count(outputs):
+        return StepOutput(content=len(outputs))
+
+    workflow = Workflow(
+        name="Async Map Workflow",
+        storage=workflow_storage,
+        steps=[Map(name="summaries", step=async_summarize, items=get_items, reduce=count)],
+    )
+
+    start = time.time()
+    response = await workflow.arun(message="summarize")
+
+    assert time.time() - start < 0.25
+    assert response.content == 3
+    assert response.step_responses[0].step_name == "summaries"
+
+
+@pytest.mark.asyncio
+async def test_async_map_streaming(workflow_storage):
+    """Test async streaming keeps the item order of the aggregated output."""
+    workflow = Workflow(
+        name="Async Streaming Map Workflow",
+        storage=workflow_storage,
+        steps=[Map(step=async_summarize, items=get_documents, max_concurrency=2)],
+    )
+
+    events = []
+    async for event in await workflow.arun(
+        message="summarize", additional_data={"count": 4}, stream=True, stream_intermediate_steps=True
+    ):
+        events.append(event)
+
+    assert len([event for event in events if isinstance(event, MapBatchCompletedEvent)]) == 4
+    workflow_completed = [event for event in events if isinstance(event, WorkflowCompletedEvent)][0]
+    assert workflow_completed.content == [f"summary of doc{i}" for i in range(4)]
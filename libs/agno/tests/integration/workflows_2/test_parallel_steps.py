@@ -188,3 +188,105 @@ async def test_async_parallel_streaming(workflow_storage):
     completed_events = [e for e in events if isinstance(e, WorkflowCompletedEvent)]
     assert len(completed_events) == 1
     assert completed_events[0].content is not None
+
+
+def test_parallel_steps_share_workflow_executor(workflow_storage):
+    """Test Parallel steps of a workflow run with its executor and report queue wait and execution time."""
+    import threading
+    import time
+
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def tracked_step(step_input: StepInput) -> StepOutput:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.1)
+        with lock:
+            running -= 1
+        return StepOutput(content="tracked")
+
+    workflow = Workflow(
+        name="Bounded Parallel",
+        storage=workflow_storage,
+        steps=[
+            Parallel(
+                Step(name="a", executor=tracked_step),
+                Step(name="b", executor=tracked_step),
+                Step(name="c", executor=tracked_step),
+                Step(name="d", executor=tracked_step),
+                name="Parallel Phase",
+            )
+        ],
+        max_parallel_workers=1,
+    )
+
+    response = workflow.run(message="test")
+
+    # One worker thread plus the thread waiting for the Parallel step
+    assert max_running == 2
+    assert workflow.steps[0].parallel_executor is workflow._get_parallel_executor()
+    parallel_metrics = response.workflow_metrics.steps["Parallel Phase"].parallel_steps
+    assert set(parallel_metrics) == {"a", "b", "c", "d"}
+    assert all(metrics.execution_time >= 0.1 for metrics in parallel_metrics.values())
+    assert max(metrics.queue_wait_time for metrics in parallel_metrics.values()) >= 0.1
+
+
+def test_nested_parallel_with_single_worker(workflow_storage):
+    """Test nested Parallel steps complete when all workers of the shared executor are busy."""
+    workflow = Workflow(
+        name="Nested Parallel",
+        storage=workflow_storage,
+        steps=[
+            Parallel(
+                Parallel(step_a, step_b, name="Inner 1"),
+                Parallel(step_a, step_b, name="Inner 2"),
+                name="Outer",
+            ),
+        ],
+        max_parallel_workers=1,
+    )
+
+    response = workflow.run(message="test")
+    assert "Output A" in response.content
+    assert "Output B" in response.content
+
+
+@pytest.mark.asyncio
+async def test_async_parallel_max_workers(workflow_storage):
+    """Test async Parallel steps are limited by the semaphore of the shared executor."""
+    import asyncio
+
+    running = 0
+    max_running = 0
+
+    async def tracked_step(step_input: StepInput) -> StepOutput:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        return StepOutput(content="tracked")
+
+    workflow = Workflow(
+        name="Async Bounded Parallel",
+        storage=workflow_storage,
+        steps=[
+            Parallel(
+                Step(name="a", executor=tracked_step),
+                Step(name="b", executor=tracked_step),
+                Step(name="c", executor=tracked_step),
+                Parallel(Step(name="d", executor=tracked_step), Step(name="e", executor=tracked_step), name="Inner"),
+                name="Parallel Phase",
+            )
+        ],
+        max_parallel_workers=2,
+    )
+
+    response = await workflow.arun(message="test")
+
+    assert max_running == 2
+    assert response.content is not None
@@ -0,0 +1,116 @@
+"""Integration tests for steps that read the content of the previous step while it streams."""
+
+import asyncio
+import time
+
+import pytest
+
+from agno.agent import Agent
+from agno.run.v2.workflow import WorkflowCompletedEvent, WorkflowRunResponse
+from agno.workflow.v2 import Workflow
+from agno.workflow.v2.step import Step
+from agno.workflow.v2.types import StepInput
+
+
+def write(step_input: StepInput):
+    for i in range(5):
+        time.sleep(0.1)
+        yield f"word{i} "
+
+
+async def async_write(step_input: StepInput):
+    for i in range(5):
+        await asyncio.sleep(0.1)
+        yield f"word{i} "
+
+
+def test_pipelined_steps_stream(workflow_storage):
+    """Test a step with stream_input reads the chunks of the previous step before it finishes."""
+    chunk_times = []
+
+    def shout(step_input: StepInput):
+        for chunk in step_input.previous_step_content_stream:
+            chunk_times.append(time.time())
+            yield chunk.upper()
+
+    workflow = Workflow(
+        name="Pipelined Workflow",
+        storage=workflow_storage,
+        steps=[Step(name="write", executor=write), Step(name="shout", executor=shout, stream_input=True)],
+    )
+
+    start = time.time()
+    events = list(workflow.run(message="write", stream=True))
+
+    assert chunk_times[0] - start < 0.3
+    chunks = [event for event in events if isinstance(event, str)]
+    assert chunks.index("WORD0 ") < chunks.index("word4 ")
+
+    completed_events = [event for event in events if isinstance(event, WorkflowCompletedEvent)]
+    assert len(completed_events) == 1
+    assert completed_events[0].content == "WORD0 WORD1 WORD2 WORD3 WORD4 "
+    assert [output.content for output in completed_events[0].step_responses] == [
+        "word0 word1 word2 word3 word4 ",
+        "WORD0 WORD1 WORD2 WORD3 WORD4 ",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_pipelined_steps_stream(workflow_storage):
+    """Test async steps with stream_input form a pipeline of concurrent tasks."""
+    chunk_times = []
+
+    async def shout(step_input: StepInput):
+        async for chunk in step_input.previous_step_content_stream:
+            chunk_times.append(time.time())
+            yield chunk.upper()
+
+    async def count(step_input: StepInput):
+        chunks = [chunk async for chunk in step_input.previous_step_content_stream]
+        yield f"{len(chunks)} chunks"
+
+    workflow = Workflow(
+        name="Async Pipelined Workflow",
+        storage=workflow_storage,
+        steps=[
+            Step(name="write", executor=async_write),
+            Step(name="shout", executor=shout, stream_input=True),
+            Step(name="count", executor=count, stream_input=True),
+        ],
+    )
+
+    start = time.time()
+    events = [event async for event in await workflow.arun(message="write", stream=True)]
+
+    assert chunk_times[0] - start < 0.3
+    completed_events = [event for event in events if isinstance(event, WorkflowCompletedEvent)]
+    assert completed_events[0].content == "5 chunks"
+    assert [output.content for output in completed_events[0].step_responses] == [
+        "word0 word1 word2 word3 word4 ",
+        "WORD0 WORD1 WORD2 WORD3 WORD4 ",
+        "5 chunks",
+    ]
+
+
+def test_stream_input_without_streaming(workflow_storage):
+    """Test a step with stream_input reads the content of the previous step as one chunk in non-streaming runs."""
+
+    def shout(step_input: StepInput):
+        return " | ".join(chunk.upper() for chunk in step_input.previous_step_content_stream)
+
+    workflow = Workflow(
+        name="Non Streaming Workflow",
+        storage=workflow_storage,
+        steps=[Step(name="write", executor=write), Step(name="shout", executor=shout, stream_input=True)],
+    )
+
+    response = workflow.run(message="write")
+
+    assert isinstance(response, WorkflowRunResponse)
+    assert response.content == "WORD0 WORD1 WORD2 WORD3 WORD4 "
+
+
+def test_stream_input_requires_function_executor():
+    """Test stream_input is rejected for agent steps."""
+    with pytest.raises(ValueError, match="stream_input"):
+        Step(name="agent", agent=Agent(), stream_input=True)
@@ -0,0 +1,99 @@
+"""Integration tests for workflows storing each run in its own row."""
+
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import text
+
+from agno.run.base import RunStatus
+from agno.storage.sqlite import SqliteStorage
+from agno.workflow.v2 import Workflow
+from agno.workflow.v2.step import Step
+from agno.workflow.v2.types import StepInput, StepOutput
+
+
+@pytest.fixture
+def runs_table_storage(tmp_path):
+    storage = SqliteStorage(
+        table_name="workflow_v2",
+        db_file=str(tmp_path / "test_workflow_v2_runs.db"),
+        mode="workflow_v2",
+        runs_table_name="workflow_v2_runs",
+    )
+    storage.create()
+    return storage
+
+
+def echo(step_input: StepInput) -> StepOutput:
+    return StepOutput(content=f"echo: {step_input.message}")
+
+
+def test_runs_stored_in_own_rows(runs_table_storage):
+    """Test each run of a workflow is stored in the runs table, not in the session row."""
+    workflow = Workflow(
+        name="Runs Table Workflow", storage=runs_table_storage, steps=[Step(name="echo", executor=echo)]
+    )
+
+    first = workflow.run(message="first")
+    second = workflow.run(message="second")
+
+    session = runs_table_storage.read(workflow.session_id)
+    assert [run.run_id for run in session.runs] == [first.run_id, second.run_id]
+    assert [run.content for run in session.runs] == ["echo: first", "echo: second"]
+    assert all(run.status == RunStatus.completed for run in session.runs)
+
+    with runs_table_storage.SqlSession() as sess:
+        assert sess.execute(runs_table_storage.table.select()).fetchone().runs is None
+
+    assert workflow.get_run(first.run_id).content == "echo: first"
+
+
+def test_runs_stored_with_session_when_runs_table_fails(runs_table_storage):
+    """Test runs that cannot be stored in the runs table are stored in the session row instead."""
+    with runs_table_storage.SqlSession() as sess, sess.begin():
+        sess.execute(
+            text(
+                "CREATE TRIGGER reject_runs BEFORE INSERT ON workflow_v2_runs "
+                "BEGIN SELECT RAISE(ABORT, 'runs are rejected'); END"
+            )
+        )
+    workflow = Workflow(
+        name="Runs Table Workflow", storage=runs_table_storage, steps=[Step(name="echo", executor=echo)]
+    )
+
+    first = workflow.run(message="first")
+    second = workflow.run(message="second")
+
+    session = runs_table_storage.read(workflow.session_id)
+    assert [run.run_id for run in session.runs] == [first.run_id, second.run_id]
+    assert [run.content for run in session.runs] == ["echo: first", "echo: second"]
+    with runs_table_storage.SqlSession() as sess:
+        assert sess.execute(runs_table_storage.runs_table.select()).fetchall() == []
+
+
+@pytest.mark.asyncio
+async def test_background_run_status_updates(runs_table_storage):
+    """Test the RUNNING status of a background run only updates the status of its row."""
+    statuses = []
+
+    async def slow_echo(step_input: StepInput) -> StepOutput:
+        statuses.append(runs_table_storage.read(workflow.session_id).runs[-1].status)
+        await asyncio.sleep(0.1)
+        return StepOutput(content=f"echo: {step_input.message}")
+
+    workflow = Workflow(
+        name="Background Runs Table Workflow",
+        storage=runs_table_storage,
+        steps=[Step(name="slow_echo", executor=slow_echo)],
+    )
+
+    response = await workflow.arun(message="background", background=True)
+
+    deadline = time.time() + 5
+    while workflow.get_run(response.run_id).status != RunStatus.completed:
+        assert time.time() < deadline
+        await asyncio.sleep(0.05)
+
+    assert statuses == [RunStatus.running]
+    assert workflow.get_run(response.run_id).content == "echo: background"
@@ -0,0 +1,132 @@
+import time
+
+from agno.agent import Agent
+from agno.models.openai import OpenAIChat
+from agno.run.response import RunResponse
+
+
+def _agent(retriever, **kwargs) -> Agent:
+    class MockKnowledge:
+        num_documents = 5
+        vector_db = None
+
+        def validate_filters(self, filters):
+            return filters or {}, []
+
+    agent = Agent(
+        model=OpenAIChat(id="gpt-4o", api_key="test"),
+        knowledge=MockKnowledge(),
+        retriever=retriever,
+        add_references=True,
+        **kwargs,
+    )
+    agent.run_response = RunResponse()
+    return agent
+
+
+def test_parallel_retrieval_adds_references():
+    def retriever(agent, query, num_documents, **kwargs):
+        return [{"content": f"document about {query}"}]
+
+    agent = _agent(retriever, parallel_retrieval=True)
+    run_messages = agent.get_run_messages(message="agno", session_id="session_1")
+
+    assert "document about agno" in run_messages.user_message.get_content_string()
+    assert run_messages.knowledge_retrieval_time is not None
+    assert agent.run_response.extra_data.references[0].query == "agno"
+
+    metrics = {}
+    agent._add_retrieval_metrics(metrics, run_messages)
+    assert metrics["knowledge_retrieval_time"] == [run_messages.knowledge_retrieval_time]
+
+
+def test_parallel_retrieval_deadline():
+    def slow_retriever(agent, query, num_documents, **kwargs):
+        time.sleep(1)
+        return [{"content": "late document"}]
+
+    agent = _agent(slow_retriever, parallel_retrieval=True, retrieval_timeout=0.05)
+    start = time.perf_counter()
+    run_messages = agent.get_run_messages(message="agno", session_id="session_1")
+
+    assert time.perf_counter() - start < 0.5
+    assert "late document" not in run_messages.user_message.get_content_string()
+    assert run_messages.knowledge_retrieval_time is None
+
+
+def test_sequential_retrieval_records_time():
+    def retriever(agent, query, num_documents, **kwargs):
+        return [{"content": "document"}]
+
+    agent = _agent(retriever)
+    run_messages = agent.get_run_messages(message="agno", session_id="session_1")
+
+    assert "document" in run_messages.user_message.get_content_string()
+    assert run_messages.knowledge_retrieval_time is not None
+
+
+def test_parallel_memory_retrieval():
+    from agno.memory.v2.memory import Memory
+    from agno.memory.v2.schema import UserMemory
+
+    memory = Memory()
+    memory.add_user_memory(UserMemory(memory="The user likes tea"), user_id="user_1")
+
+    agent = Agent(
+        model=OpenAIChat(id="gpt-4o", api_key="test"),
+        memory=memory,
+        add_memory_references=True,
+        parallel_retrieval=True,
+    )
+    agent.run_response = RunResponse()
+    run_messages = agent.get_run_messages(message="Hello", session_id="session_1", user_id="user_1")
+
+    assert "The user likes tea" in run_messages.system_message.get_content_string()
+    assert run_messages.memory_retrieval_time is not None
+
+
+async def test_async_parallel_retrieval_runs_concurrently():
+    import asyncio
+
+    from agno.memory.v2.memory import Memory
+    from agno.memory.v2.schema import UserMemory
+
+    async def retriever(agent, query, num_documents, **kwargs):
+        await asyncio.sleep(0.3)
+        return [{"content": f"document about {query}"}]
+
+    class SlowMemory(Memory):
+        def get_user_memories(self, user_id=None):
+            time.sleep(0.3)
+            return super().get_user_memories(user_id=user_id)
+
+    memory = SlowMemory()
+    memory.add_user_memory(UserMemory(memory="The user likes tea"), user_id="user_1")
+    agent = _agent(retriever, memory=memory, add_memory_references=True, parallel_retrieval=True)
+
+    start = time.perf_counter()
+    retrieval = await agent.aget_parallel_retrieval(message="agno", user_id="user_1")
+    assert time.perf_counter() - start < 0.5
+
+    run_messages = agent.get_run_messages(message="agno", session_id="session_1", user_id="user_1", retrieval=retrieval)
+    assert "document about agno" in run_messages.user_message.get_content_string()
+    assert "The user likes tea" in run_messages.system_message.get_content_string()
+    assert run_messages.knowledge_retrieval_time is not None
+    assert run_messages.memory_retrieval_time is not None
+
+
+async def test_async_parallel_retrieval_deadline():
+    import asyncio
+
+    async def slow_retriever(agent, query, num_documents, **kwargs):
+        await asyncio.sleep(1)
+        return [{"content": "late document"}]
+
+    agent = _agent(slow_retriever, parallel_retrieval=True, retrieval_timeout=0.05)
+    start = time.perf_counter()
+    retrieval = await agent.aget_parallel_retrieval(message="agno")
+    run_messages = agent.get_run_messages(message="agno", session_id="session_1", retrieval=retrieval)
+
+    assert time.perf_counter() - start < 0.5
+    assert "late document" not in run_messages.user_message.get_content_string()
+    assert run_messages.knowledge_retrieval_time is None
@@ -0,0 +1,99 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from agno.document import Document, async_embed_documents
+from agno.embedder.base import Embedder
+from agno.embedder.openai import OpenAIEmbedder
+
+
+@dataclass
+class LengthEmbedder(Embedder):
+    """Embeds text as its length, without an async client"""
+
+    dimensions: Optional[int] = 1
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [float(len(text))]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), {"total_tokens": len(text)}
+
+
+@dataclass
+class SlowAsyncEmbedder(LengthEmbedder):
+    """Records how many requests are in flight at once"""
+
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+    async def aget_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return self.get_embedding_and_usage(text)
+
+
+@pytest.mark.asyncio
+async def test_default_async_methods_use_sync_embedding():
+    embedder = LengthEmbedder()
+    assert await embedder.aget_embedding("abc") == [3.0]
+    assert await embedder.aget_embeddings_batch(["a", "abcd"]) == [[1.0], [4.0]]
+
+
+@pytest.mark.asyncio
+async def test_batch_is_bounded_by_max_concurrency():
+    embedder = SlowAsyncEmbedder(max_concurrency=3)
+    texts = ["a" * n for n in range(1, 11)]
+
+    results = await embedder.aget_embeddings_batch_and_usage(texts)
+
+    assert embedder.max_in_flight == 3
+    assert [embedding for embedding, _ in results] == [[float(n)] for n in range(1, 11)]
+
+
+@pytest.mark.asyncio
+async def test_async_embed_documents():
+    documents = [Document(content="soup"), Document(content="curry")]
+
+    await async_embed_documents(documents, SlowAsyncEmbedder())
+
+    assert [document.embedding for document in documents] == [[4.0], [5.0]]
+    assert [document.usage for document in documents] == [{"total_tokens": 4}, {"total_tokens": 5}]
+
+
+@pytest.mark.asyncio
+async def test_async_embed_documents_skips_failed_documents():
+    class FailingEmbedder(SlowAsyncEmbedder):
+        async def aget_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+            if text == "curry":
+                raise RuntimeError("rate limited")
+            return await super().aget_embedding_and_usage(text)
+
+    documents = [Document(content="soup"), Document(content="curry"), Document(content="rice")]
+
+    await async_embed_documents(documents, FailingEmbedder())
+
+    assert [document.embedding for document in documents] == [[4.0], None, [4.0]]
+
+
+@pytest.mark.asyncio
+async def test_openai_embedder_uses_async_client():
+    response = MagicMock()
+    response.data = [MagicMock(embedding=[0.1, 0.2])]
+    response.usage.model_dump.return_value = {"total_tokens": 2}
+    async_client = MagicMock()
+    async_client.embeddings.create = AsyncMock(return_value=response)
+    embedder = OpenAIEmbedder(openai_client=MagicMock(), async_client=async_client)
+
+    embedding, usage = await embedder.aget_embedding_and_usage("soup")
+
+    assert embedding == [0.1, 0.2]
+    assert usage == {"total_tokens": 2}
+    async_client.embeddings.create.assert_awaited_once()
+    assert async_client.embeddings.create.call_args.kwargs["input"] == "soup"
+    embedder.openai_client.embeddings.create.assert_not_called()
@@ -0,0 +1,155 @@
+import asyncio
+import time
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.document import Document
+from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.cache import SearchCache
+from agno.knowledge.combined import CombinedKnowledgeBase, reciprocal_rank_fusion
+from agno.reranker.base import Reranker
+from agno.vectordb.base import VectorDb
+
+
+class StaticKnowledge(AgentKnowledge):
+    """Returns fixed results after an optional delay"""
+
+    results: List[str] = []
+    delay: float = 0.0
+
+    def search(self, query, num_documents=None, filters=None, include_embeddings=False):
+        time.sleep(self.delay)
+        return [Document(content=content) for content in self.results]
+
+    async def async_search(self, query, num_documents=None, filters=None, include_embeddings=False):
+        await asyncio.sleep(self.delay)
+        return [Document(content=content) for content in self.results]
+
+
+class FailingKnowledge(AgentKnowledge):
+    """Raises on every search, like a source whose database is unreachable"""
+
+    def search(self, query, num_documents=None, filters=None, include_embeddings=False):
+        raise ConnectionError("database unreachable")
+
+    async def async_search(self, query, num_documents=None, filters=None, include_embeddings=False):
+        raise ConnectionError("database unreachable")
+
+
+class ReverseReranker(Reranker):
+    def rerank(self, query, documents):
+        return list(reversed(documents))
+
+
+def _source(results: List[str], delay: float = 0.0) -> StaticKnowledge:
+    return StaticKnowledge(vector_db=MagicMock(spec=VectorDb), results=results, delay=delay)
+
+
+def test_reciprocal_rank_fusion_merges_duplicates():
+    fused = reciprocal_rank_fusion(
+        [
+            ([Document(content="a"), Document(content="b")], 1.0),
+            ([Document(content="c"), Document(content="b")], 1.0),
+        ]
+    )
+
+    assert [document.content for document in fused] == ["b", "a", "c"]
+
+
+def test_reciprocal_rank_fusion_uses_weights():
+    fused = reciprocal_rank_fusion([([Document(content="a")], 1.0), ([Document(content="b")], 2.0)])
+
+    assert [document.content for document in fused] == ["b", "a"]
+
+
+def test_federated_search_fuses_sources():
+    knowledge_base = CombinedKnowledgeBase(
+        sources=[_source(["a", "b"]), _source(["b", "c"]), StaticKnowledge(results=["ignored"])],
+        federated_search=True,
+        num_documents=2,
+    )
+
+    documents = knowledge_base.search("query")
+
+    assert [document.content for document in documents] == ["b", "a"]
+
+
+def test_federated_search_skips_slow_sources():
+    knowledge_base = CombinedKnowledgeBase(
+        sources=[_source(["fast"]), _source(["slow"], delay=0.5)],
+        federated_search=True,
+        source_timeout=0.1,
+    )
+
+    start = time.monotonic()
+    documents = knowledge_base.search("query")
+
+    assert time.monotonic() - start < 0.4
+    assert [document.content for document in documents] == ["fast"]
+
+
+def test_federated_search_requires_a_weight_per_source():
+    knowledge_base = CombinedKnowledgeBase(
+        sources=[_source(["a"]), _source(["b"])], federated_search=True, source_weights=[1.0]
+    )
+
+    with pytest.raises(ValueError):
+        knowledge_base.search("query")
+
+
+@pytest.mark.asyncio
+async def test_async_federated_search_runs_sources_concurrently():
+    knowledge_base = CombinedKnowledgeBase(
+        sources=[_source(["a"], delay=0.2), _source(["b"], delay=0.2), _source(["c"], delay=1.0)],
+        federated_search=True,
+        source_timeout=0.4,
+        source_weights=[1.0, 2.0, 1.0],
+        reranker=ReverseReranker(),
+    )
+
+    start = time.monotonic()
+    documents = await knowledge_base.async_search("query")
+
+    assert time.monotonic() - start < 0.6
+    assert [document.content for document in documents] == ["a", "b"]
+
+
+def test_federated_search_skips_failing_sources():
+    knowledge_base = CombinedKnowledgeBase(
+        sources=[_source(["a"]), FailingKnowledge(vector_db=MagicMock(spec=VectorDb))], federated_search=True
+    )
+
+    documents = knowledge_base.search("query")
+
+    assert [document.content for document in documents] == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_async_federated_search_skips_failing_sources():
+    knowledge_base = CombinedKnowledgeBase(
+        sources=[FailingKnowledge(vector_db=MagicMock(spec=VectorDb)), _source(["a"])], federated_search=True
+    )
+
+    documents = await knowledge_base.async_search("query")
+
+    assert [document.content for document in documents] == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_federated_search_uses_the_search_cache():
+    cache = SearchCache()
+    knowledge_base = CombinedKnowledgeBase(
+        sources=[_source(["a"]), _source(["b"])], federated_search=True, search_cache=cache
+    )
+
+    assert [document.content for document in knowledge_base.search("query")] == ["a", "b"]
+    assert [document.content for document in await knowledge_base.async_search("query")] == ["a", "b"]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Results missing a failed source are not cached
+    knowledge_base.sources.append(FailingKnowledge(vector_db=MagicMock(spec=VectorDb)))
+    knowledge_base.search("other query")
+    knowledge_base.search("other query")
+    assert cache.hits == 1
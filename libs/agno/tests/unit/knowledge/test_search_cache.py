@@ -0,0 +1,87 @@
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from agno.document import Document
+from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.cache import SearchCache
+from agno.vectordb.base import VectorDb
+
+
+@pytest.fixture
+def vector_db():
+    vector_db = MagicMock(spec=VectorDb)
+    vector_db.search.side_effect = lambda query, limit, filters: [Document(content=f"about {query}")]
+    vector_db.async_search = AsyncMock(side_effect=lambda query, limit, filters: [Document(content=f"about {query}")])
+    vector_db.upsert_available.return_value = True
+    vector_db.delete.return_value = True
+    return vector_db
+
+
+def test_search_is_cached_by_normalized_query(vector_db):
+    knowledge = AgentKnowledge(vector_db=vector_db, search_cache=SearchCache())
+
+    first = knowledge.search("What is Agno?")
+    second = knowledge.search("  what is   agno? ")
+
+    assert [document.content for document in second] == [document.content for document in first]
+    assert vector_db.search.call_count == 1
+    assert knowledge.search_cache.hits == 1
+
+
+def test_cached_documents_are_copies(vector_db):
+    knowledge = AgentKnowledge(vector_db=vector_db, search_cache=SearchCache())
+
+    knowledge.search("agno")[0].reranking_score = 1.0
+
+    assert knowledge.search("agno")[0].reranking_score is None
+
+
+def test_filters_and_num_documents_are_part_of_the_key(vector_db):
+    knowledge = AgentKnowledge(vector_db=vector_db, search_cache=SearchCache())
+
+    knowledge.search("agno", filters={"user": "a"})
+    knowledge.search("agno", filters={"user": "b"})
+    knowledge.search("agno", num_documents=10, filters={"user": "a"})
+
+    assert vector_db.search.call_count == 3
+
+
+def test_writes_invalidate_the_cache(vector_db):
+    knowledge = AgentKnowledge(vector_db=vector_db, search_cache=SearchCache())
+
+    knowledge.search("agno")
+    knowledge.load_documents([Document(content="new")], upsert=True)
+    knowledge.search("agno")
+    knowledge.delete()
+    knowledge.search("agno")
+
+    assert vector_db.search.call_count == 3
+    assert knowledge.search_cache.version == 2
+
+
+def test_expired_and_evicted_entries_are_missed(vector_db):
+    knowledge = AgentKnowledge(vector_db=vector_db, search_cache=SearchCache(ttl=0, max_size=1))
+
+    knowledge.search("agno")
+    time.sleep(0.01)
+    knowledge.search("agno")
+    assert vector_db.search.call_count == 2
+
+    knowledge.search_cache.ttl = None
+    knowledge.search("other")
+    knowledge.search("agno")
+    assert vector_db.search.call_count == 4
+    assert len(knowledge.search_cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_search_is_cached(vector_db):
+    knowledge = AgentKnowledge(vector_db=vector_db, search_cache=SearchCache())
+
+    await knowledge.async_search("agno")
+    documents = await knowledge.async_search("agno")
+
+    assert documents[0].content == "about agno"
+    assert vector_db.async_search.await_count == 1
@@ -0,0 +1,109 @@
+import time
+from types import SimpleNamespace
+
+from agno.memory.v2.memory import TeamMemberInteraction
+from agno.memory.v2.team_context import TeamContextManager, estimate_text_tokens, get_member_interactions_str
+from agno.run.response import RunResponse
+
+
+def make_interactions(count: int, response_length: int = 400):
+    return [
+        TeamMemberInteraction(
+            member_name=f"member-{i}",
+            task=f"task {i}",
+            response=RunResponse(content=f"response {i} " + "x" * response_length),
+        )
+        for i in range(count)
+    ]
+
+
+class SummaryModel:
+    """Stands in for a model, writing the summary after a delay."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def response(self, messages):
+        self.calls += 1
+        time.sleep(self.delay)
+        return SimpleNamespace(content=f"summary {self.calls}")
+
+
+def test_window_and_summary_without_model():
+    manager = TeamContextManager(window_size=2, max_tokens=None)
+    interactions = make_interactions(5)
+
+    interactions_str, tokens_saved = manager.get_member_interactions_str("session", interactions)
+
+    # The last 2 interactions are sent in full, the older ones as snippets
+    assert interactions_str.count("x" * 400) == 2
+    assert "Member: member-0 Task: task 0 Response: response 0" in interactions_str
+    assert tokens_saved > 0
+    assert tokens_saved == estimate_text_tokens(get_member_interactions_str(interactions)) - estimate_text_tokens(
+        interactions_str
+    )
+
+
+def test_max_tokens_is_a_hard_budget():
+    manager = TeamContextManager(window_size=10, max_tokens=150)
+    interactions = make_interactions(10)
+
+    interactions_str, _ = manager.get_member_interactions_str("session", interactions)
+
+    assert estimate_text_tokens(interactions_str) <= 150
+    assert "member-9" in interactions_str
+    assert "member-0" not in interactions_str
+    assert "earlier interactions left out" in interactions_str
+
+
+def test_summary_is_updated_in_the_background():
+    model = SummaryModel(delay=0.2)
+    manager = TeamContextManager(window_size=1, max_tokens=None, model=model)
+    interactions = make_interactions(3)
+
+    # The older interactions are sent in full until the summary is written
+    interactions_str, _ = manager.get_member_interactions_str("session", interactions)
+    assert interactions_str.count("x" * 400) == 3
+
+    time.sleep(0.4)
+    interactions_str, _ = manager.get_member_interactions_str("session", interactions)
+    assert "<summary>\nsummary 1\n</summary>" in interactions_str
+    assert interactions_str.count("x" * 400) == 1
+
+    # The summary is only extended with the interactions that left the window since
+    manager.get_member_interactions_str("session", interactions)
+    assert model.calls == 1
+
+    # The thread updating the summary stops once no update is running
+    assert manager._executor is None
+
+
+def test_summary_is_reset_when_interactions_are_cleared():
+    manager = TeamContextManager(window_size=1, max_tokens=None)
+    interactions = make_interactions(4)
+    interactions[2].member_name = "old-member"
+    interactions_str, _ = manager.get_member_interactions_str("session", interactions)
+    assert "old-member" in interactions_str
+
+    # The interactions of the session were cleared and new ones were added
+    interactions_str, _ = manager.get_member_interactions_str("session", make_interactions(2))
+
+    assert "old-member" not in interactions_str
+    assert "Member: member-0 Task: task 0 Response: response 0" in interactions_str
+    assert interactions_str.count("x" * 400) == 1
+
+
+def test_team_context_is_cut_to_max_tokens():
+    manager = TeamContextManager(max_tokens=50)
+    team_context_str = "<team context>\n" + "note " * 200 + "\n</team context>\n"
+
+    compacted_str, tokens_saved = manager.get_team_context_str(team_context_str)
+
+    assert estimate_text_tokens(compacted_str) <= 50
+    assert compacted_str.startswith("<team context>") and compacted_str.endswith("</team context>\n")
+    assert tokens_saved == estimate_text_tokens(team_context_str) - estimate_text_tokens(compacted_str)
+    assert manager.get_team_context_str("<team context>\nshort\n</team context>\n")[1] == 0
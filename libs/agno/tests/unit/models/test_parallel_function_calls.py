@@ -0,0 +1,132 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Iterator, List
+
+import pytest
+
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.response import ModelResponse, ModelResponseEvent
+from agno.tools.function import Function, FunctionCall
+
+
+@dataclass
+class MockModel(Model):
+    id: str = "mock-model"
+
+    def invoke(self, *args, **kwargs) -> Any:
+        return None
+
+    async def ainvoke(self, *args, **kwargs) -> Any:
+        return None
+
+    def invoke_stream(self, *args, **kwargs) -> Iterator[Any]:
+        yield from []
+
+    async def ainvoke_stream(self, *args, **kwargs):
+        for chunk in self.invoke_stream():
+            yield chunk
+
+    def parse_provider_response(self, response: Any, **kwargs) -> ModelResponse:
+        return ModelResponse(role="assistant", content=response)
+
+    def parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return ModelResponse(content=response)
+
+
+def _function_call(entrypoint, name: str, parallel: bool = True, show_result: bool = False) -> FunctionCall:
+    function = Function.from_callable(entrypoint, name=name)
+    function.parallel = parallel
+    function.show_result = show_result
+    return FunctionCall(function=function, arguments={"label": name}, call_id=f"call_{name}")
+
+
+def _completed_tool_names(events: List[Any]) -> List[str]:
+    return [
+        event.tool_executions[0].tool_name
+        for event in events
+        if isinstance(event, ModelResponse) and event.event == ModelResponseEvent.tool_call_completed.value
+    ]
+
+
+def work(label: str) -> Iterator[str]:
+    for i in range(3):
+        time.sleep(0.1)
+        yield f"{label}{i} "
+
+
+def test_parallel_function_calls_run_at_the_same_time():
+    model = MockModel()
+    function_calls = [_function_call(work, "a"), _function_call(work, "b"), _function_call(work, "c", parallel=False)]
+    function_call_results: List[Message] = []
+
+    start = time.time()
+    events = list(model.run_function_calls(function_calls, function_call_results))
+    elapsed = time.time() - start
+
+    # a and b run together, c runs after them
+    assert elapsed < 0.8
+    assert _completed_tool_names(events)[-1] == "c"
+    assert [result.tool_name for result in function_call_results] == ["a", "b", "c"]
+    assert [result.content for result in function_call_results] == ["a0 a1 a2 ", "b0 b1 b2 ", "c0 c1 c2 "]
+
+
+def test_shown_results_of_parallel_function_calls_are_not_interleaved():
+    model = MockModel()
+    function_calls = [_function_call(work, "a", show_result=True), _function_call(work, "b", show_result=True)]
+
+    events = list(model.run_function_calls(function_calls, []))
+
+    shown = [
+        event.content
+        for event in events
+        if isinstance(event, ModelResponse) and event.event == ModelResponseEvent.assistant_response.value
+    ]
+    assert "".join(shown) in ("a0 a1 a2 b0 b1 b2 ", "b0 b1 b2 a0 a1 a2 ")
+
+
+@pytest.mark.asyncio
+async def test_async_parallel_function_calls_run_at_the_same_time():
+    async def awork(label: str):
+        for i in range(3):
+            await asyncio.sleep(0.1)
+            yield f"{label}{i} "
+
+    model = MockModel()
+    function_calls = [_function_call(awork, "a"), _function_call(awork, "b"), _function_call(awork, "c")]
+    function_call_results: List[Message] = []
+
+    start = time.time()
+    events = [event async for event in model.arun_function_calls(function_calls, function_call_results)]
+    elapsed = time.time() - start
+
+    assert elapsed < 0.6
+    assert len(_completed_tool_names(events)) == 3
+    assert [result.tool_name for result in function_call_results] == ["a", "b", "c"]
+    assert [result.content for result in function_call_results] == ["a0 a1 a2 ", "b0 b1 b2 ", "c0 c1 c2 "]
+
+
+def test_failed_parallel_function_call_waits_for_the_other_calls(monkeypatch):
+    model = MockModel()
+    finished = []
+
+    def slow(label: str) -> str:
+        time.sleep(0.2)
+        finished.append(label)
+        return label
+
+    run_function_call = model.run_function_call
+
+    def fail_or_run(function_call, *args, **kwargs):
+        if function_call.function.name == "fail":
+            raise RuntimeError("tool crashed")
+        yield from run_function_call(function_call, *args, **kwargs)
+
+    monkeypatch.setattr(model, "run_function_call", fail_or_run)
+    function_calls = [_function_call(slow, "a"), _function_call(slow, "fail"), _function_call(slow, "b")]
+
+    with pytest.raises(RuntimeError, match="tool crashed"):
+        list(model.run_function_calls(function_calls, []))
+    # The error is only raised once the other calls have ended
+    assert sorted(finished) == ["a", "b"]
@@ -0,0 +1,118 @@
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import pytest
+
+from agno.exceptions import ModelRateLimitError
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.rate_limit import RateLimiter, get_rate_limiter, get_retry_after, get_retry_delay
+from agno.models.response import ModelResponse
+
+
+class MockResponse:
+    def __init__(self, headers):
+        self.headers = headers
+
+
+class MockProviderError(Exception):
+    def __init__(self, headers):
+        super().__init__("rate limited")
+        self.response = MockResponse(headers)
+
+
+@dataclass
+class RateLimitedModel(Model):
+    id: str = "rate-limited-model"
+    retry_after: Optional[str] = None
+
+    def invoke(self, *args, **kwargs) -> Any:
+        try:
+            raise MockProviderError({"retry-after": self.retry_after})
+        except MockProviderError as e:
+            raise ModelRateLimitError(message=str(e), model_name=self.name, model_id=self.id) from e
+
+    async def ainvoke(self, *args, **kwargs) -> Any:
+        return self.invoke()
+
+    def invoke_stream(self, *args, **kwargs):
+        yield self.invoke()
+
+    async def ainvoke_stream(self, *args, **kwargs):
+        yield self.invoke()
+
+    def parse_provider_response(self, response: Any, **kwargs) -> ModelResponse:
+        return ModelResponse(role="assistant", content=response)
+
+    def parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return ModelResponse(content=response)
+
+
+def test_requests_per_minute_spaces_out_requests():
+    limiter = RateLimiter(requests_per_minute=60)
+    for _ in range(60):
+        assert limiter._reserve(0) == 0
+
+    # The bucket is empty, so each following request waits about one second longer than the previous one
+    assert limiter._reserve(0) == pytest.approx(1, abs=0.1)
+    assert limiter._reserve(0) == pytest.approx(2, abs=0.1)
+
+
+def test_tokens_per_minute_and_usage_correction():
+    limiter = RateLimiter(tokens_per_minute=600)
+    assert limiter._reserve(600) == 0
+    assert limiter._reserve(60) == pytest.approx(6, abs=0.1)
+
+    # The request used fewer tokens than estimated
+    limiter.record_usage(estimated_tokens=660, actual_tokens=60)
+    assert limiter._reserve(60) == 0
+
+
+def test_rate_limiter_is_shared_per_provider_model_and_key():
+    limiter = get_rate_limiter("provider", "model", api_key="key-1")
+    assert get_rate_limiter("provider", "model", api_key="key-1") is limiter
+    assert get_rate_limiter("provider", "model", api_key="key-2") is not limiter
+    assert get_rate_limiter("provider", "other-model", api_key="key-1") is not limiter
+
+
+def test_get_retry_after():
+    assert get_retry_after(MockProviderError({"retry-after": "3"})) == 3
+    assert get_retry_after(MockProviderError({"retry-after-ms": "1500"})) == 1.5
+    assert get_retry_after(MockProviderError({})) is None
+    assert get_retry_after(ValueError()) is None
+
+    # The provider error is found through the exception chain
+    try:
+        try:
+            raise MockProviderError({"retry-after": "5"})
+        except MockProviderError as e:
+            raise ModelRateLimitError("rate limited") from e
+    except ModelRateLimitError as e:
+        assert get_retry_after(e) == 5
+
+
+def test_get_retry_delay():
+    assert 1 <= get_retry_delay(0, delay_between_retries=1) <= 1.25
+    assert 4 <= get_retry_delay(2, delay_between_retries=1, exponential_backoff=True) <= 5
+    assert 10 <= get_retry_delay(0, delay_between_retries=1, exc=MockProviderError({"retry-after": "10"})) <= 12.5
+
+
+def test_rate_limit_error_blocks_shared_limiter():
+    model = RateLimitedModel(retry_after="30")
+    with pytest.raises(ModelRateLimitError):
+        model.response(messages=[Message(role="user", content="Hello")])
+
+    limiter = model._get_rate_limiter()
+    assert limiter.blocked_until - time.monotonic() == pytest.approx(30, abs=1)
+    # Other models with the same provider, id and key are held back as well
+    assert RateLimitedModel()._get_rate_limiter()._reserve(0) == pytest.approx(30, abs=1)
+    limiter.blocked_until = 0
+
+
+async def test_aacquire_waits_without_blocking():
+    limiter = RateLimiter()
+    limiter.block(0.05)
+    start = time.monotonic()
+    await limiter.aacquire()
+    assert time.monotonic() - start >= 0.05
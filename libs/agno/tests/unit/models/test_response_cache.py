@@ -0,0 +1,233 @@
+from dataclasses import dataclass
+from threading import Thread
+from typing import Any, Iterator, List, Optional
+
+import pytest
+
+from agno.models.base import Model
+from agno.models.cache import InMemoryResponseCache
+from agno.models.cache.sqlite import SqliteResponseCache
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+
+
+@dataclass
+class MockModel(Model):
+    id: str = "mock-model"
+    temperature: Optional[float] = 0
+    calls: int = 0
+
+    def invoke(self, *args, **kwargs) -> Any:
+        self.calls += 1
+        return f"response {self.calls}"
+
+    async def ainvoke(self, *args, **kwargs) -> Any:
+        return self.invoke()
+
+    def invoke_stream(self, *args, **kwargs) -> Iterator[Any]:
+        self.calls += 1
+        yield from ["Hello", " ", "world"]
+
+    async def ainvoke_stream(self, *args, **kwargs):
+        for chunk in self.invoke_stream():
+            yield chunk
+
+    def parse_provider_response(self, response: Any, **kwargs) -> ModelResponse:
+        return ModelResponse(role="assistant", content=response)
+
+    def parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return ModelResponse(content=response)
+
+
+class MockEmbedder:
+    def get_embedding(self, text: str) -> List[float]:
+        text = text.lower().strip(" ?!.")
+        return [float(text.count(c)) for c in "abcdefghijklmnopqrstuvwxyz"]
+
+
+class AsyncOnlyEmbedder(MockEmbedder):
+    """Fails on the blocking call, so async lookups must use aget_embedding"""
+
+    def get_embedding(self, text: str) -> List[float]:
+        raise AssertionError("blocking embedding call")
+
+    async def aget_embedding(self, text: str) -> List[float]:
+        return MockEmbedder.get_embedding(self, text)
+
+
+def _messages(content: str = "What is the capital of France?") -> List[Message]:
+    return [Message(role="system", content="You are helpful."), Message(role="user", content=content)]
+
+
+@pytest.fixture(params=["in_memory", "sqlite"])
+def cache(request):
+    if request.param == "in_memory":
+        return InMemoryResponseCache()
+    return SqliteResponseCache()
+
+
+def test_response_is_cached(cache):
+    model = MockModel(response_cache=cache)
+
+    first = model.response(messages=_messages())
+    second = model.response(messages=_messages())
+
+    assert first.content == second.content == "response 1"
+    assert model.calls == 1
+    assert cache.hits == 1 and cache.misses == 1
+
+
+def test_different_messages_are_not_cached(cache):
+    model = MockModel(response_cache=cache)
+
+    model.response(messages=_messages("Hello"))
+    model.response(messages=_messages("Goodbye"))
+
+    assert model.calls == 2
+
+
+async def test_aresponse_is_cached(cache):
+    model = MockModel(response_cache=cache)
+
+    await model.aresponse(messages=_messages())
+    response = await model.aresponse(messages=_messages())
+
+    assert response.content == "response 1"
+    assert model.calls == 1
+
+
+def test_stream_is_replayed(cache):
+    model = MockModel(response_cache=cache)
+
+    first = [r.content for r in model.response_stream(messages=_messages())]
+    messages = _messages()
+    second = [r.content for r in model.response_stream(messages=messages)]
+
+    assert first == second == ["Hello", " ", "world"]
+    assert messages[-1].content == "Hello world"
+    assert model.calls == 1
+
+
+def test_temperature_bypasses_cache():
+    cache = InMemoryResponseCache()
+    model = MockModel(temperature=0.7, response_cache=cache)
+
+    model.response(messages=_messages())
+    model.response(messages=_messages())
+    assert model.calls == 2
+
+    cache.force = True
+    model.response(messages=_messages())
+    model.response(messages=_messages())
+    assert model.calls == 3
+
+
+def test_ttl_expires_entries(mocker):
+    cache = InMemoryResponseCache(ttl=10)
+    model = MockModel(response_cache=cache)
+
+    model.response(messages=_messages())
+    mocker.patch("agno.models.cache.base.time", return_value=9999999999)
+    model.response(messages=_messages())
+
+    assert model.calls == 2
+
+
+def test_max_size_evicts_least_recently_used(cache):
+    cache.max_size = 2
+    model = MockModel(response_cache=cache)
+
+    model.response(messages=_messages("one"))
+    model.response(messages=_messages("two"))
+    model.response(messages=_messages("one"))
+    model.response(messages=_messages("three"))
+    assert model.calls == 3
+
+    # "two" was evicted, "one" was not
+    model.response(messages=_messages("one"))
+    assert model.calls == 3
+    model.response(messages=_messages("two"))
+    assert model.calls == 4
+
+
+def test_semantic_match(cache):
+    cache.embedder = MockEmbedder()
+    model = MockModel(response_cache=cache)
+
+    model.response(messages=_messages("What is the capital of France?"))
+    response = model.response(messages=_messages("what is the capital of france"))
+
+    assert response.content == "response 1"
+    assert model.calls == 1
+
+    model.response(messages=_messages("Tell me a joke"))
+    assert model.calls == 2
+
+
+def test_in_memory_sqlite_cache_is_shared_between_threads():
+    cache = SqliteResponseCache()
+    model = MockModel(response_cache=cache)
+
+    responses = []
+    thread = Thread(target=lambda: responses.append(model.response(messages=_messages())))
+    thread.start()
+    thread.join()
+    responses.append(model.response(messages=_messages()))
+
+    assert [response.content for response in responses] == ["response 1", "response 1"]
+    assert model.calls == 1
+    assert cache.hits == 1
+
+
+async def test_async_semantic_match_does_not_block(cache):
+    cache.embedder = AsyncOnlyEmbedder()
+    model = MockModel(response_cache=cache)
+
+    await model.aresponse(messages=_messages("What is the capital of France?"))
+    response = await model.aresponse(messages=_messages("what is the capital of france"))
+
+    assert response.content == "response 1"
+    assert model.calls == 1
+
+
+def test_cache_hit_does_not_count_tokens(cache, mocker):
+    model = MockModel(response_cache=cache)
+    mocker.patch.object(
+        model,
+        "parse_provider_response",
+        side_effect=lambda response, **kwargs: ModelResponse(
+            role="assistant", content=response, response_usage={"input_tokens": 10, "output_tokens": 5}
+        ),
+    )
+
+    first_messages, second_messages = _messages(), _messages()
+    model.response(messages=first_messages)
+    model.response(messages=second_messages)
+
+    assert first_messages[-1].metrics.input_tokens == 10
+    assert first_messages[-1].metrics.additional_metrics is None
+    assert second_messages[-1].content == "response 1"
+    assert second_messages[-1].metrics.input_tokens == 0 and second_messages[-1].metrics.output_tokens == 0
+    assert second_messages[-1].metrics.additional_metrics == {"response_cache_hit": True}
+
+
+def test_sqlite_cache_is_used_from_many_threads():
+    cache = SqliteResponseCache()
+    model = MockModel(response_cache=cache)
+    errors = []
+
+    def run(thread_index: int) -> None:
+        try:
+            for i in range(20):
+                model.response(messages=_messages(f"Question {i % 5} from {thread_index % 2}"))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [Thread(target=run, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert cache.hits + cache.misses == 160
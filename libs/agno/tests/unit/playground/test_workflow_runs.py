@@ -0,0 +1,30 @@
+"""
+Unit tests for playground workflow runs.
+"""
+
+from typing import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from agno.playground import Playground
+from agno.run.response import RunResponse
+from agno.workflow import Workflow
+
+
+class EchoWorkflow(Workflow):
+    def run(self, topic: str) -> Iterator[RunResponse]:  # type: ignore
+        yield RunResponse(run_id=self.run_id, content=f"echo: {topic}")
+
+
+@pytest.mark.parametrize("use_async", [True, False])
+def test_streamed_workflow_run_without_event_encoder(use_async):
+    """Test streamed workflow runs use the default event encoder when the playground has none."""
+    workflow = EchoWorkflow(name="Echo Workflow", workflow_id="echo-workflow")
+    client = TestClient(Playground(workflows=[workflow]).get_app(use_async=use_async))
+
+    response = client.post("/v1/playground/workflows/echo-workflow/runs", json={"input": {"topic": "hello"}})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert '"content":"echo: hello"' in response.text
@@ -0,0 +1,52 @@
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from agno.document import Document
+from agno.reranker import sentence_transformer
+from agno.reranker.sentence_transformer import SentenceTransformerReranker, clear_cross_encoder_cache
+
+
+@pytest.fixture
+def mock_cross_encoder():
+    """Patch CrossEncoder with a mock that scores documents by their length"""
+    clear_cross_encoder_cache()
+    cross_encoder = MagicMock()
+    cross_encoder.predict.side_effect = lambda pairs, **kwargs: np.array([float(len(doc)) for _, doc in pairs])
+    with patch.object(sentence_transformer, "CrossEncoder", return_value=cross_encoder) as cross_encoder_cls:
+        yield cross_encoder_cls
+    clear_cross_encoder_cache()
+
+
+@pytest.fixture
+def documents():
+    return [Document(content="a" * n) for n in (3, 5, 1, 4)]
+
+
+def test_model_is_loaded_once(mock_cross_encoder, documents):
+    SentenceTransformerReranker().rerank("query", documents)
+    SentenceTransformerReranker().rerank("query", documents)
+    assert mock_cross_encoder.call_count == 1
+
+    SentenceTransformerReranker(model_kwargs={"torch_dtype": "float16"}).rerank("query", documents)
+    assert mock_cross_encoder.call_count == 2
+
+
+def test_rerank_batches_and_sorts(mock_cross_encoder, documents):
+    reranker = SentenceTransformerReranker(batch_size=2, top_n=3)
+    results = reranker.rerank("query", documents)
+
+    assert [len(doc.content) for doc in results] == [5, 4, 3]
+    assert mock_cross_encoder.return_value.predict.call_args.kwargs["batch_size"] == 2
+
+
+def test_rerank_score_threshold(mock_cross_encoder, documents):
+    results = SentenceTransformerReranker(score_threshold=3.5).rerank("query", documents)
+    assert [doc.reranking_score for doc in results] == [5.0, 4.0]
+
+
+@pytest.mark.asyncio
+async def test_arerank(mock_cross_encoder, documents):
+    results = await SentenceTransformerReranker(top_n=1).arerank("query", documents)
+    assert [len(doc.content) for doc in results] == [5]
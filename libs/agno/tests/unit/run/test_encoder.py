@@ -0,0 +1,59 @@
+import json
+
+from agno.run.encoder import EventEncoder, acoalesce_content_events, coalesce_content_events, event_to_dict
+from agno.run.response import RunResponseCompletedEvent, RunResponseContentEvent, RunResponseStartedEvent
+
+
+def _content_events(tokens, run_id="run_1"):
+    return [
+        RunResponseContentEvent(content=token, run_id=run_id, agent_id="agent_1", session_id="session_1")
+        for token in tokens
+    ]
+
+
+def test_event_to_dict_matches_to_dict():
+    event = _content_events(["Hello"])[0]
+    assert event_to_dict(event) == event.to_dict()
+
+
+def test_encode_is_compact_json():
+    event = _content_events(["Hello"])[0]
+    encoded = EventEncoder().encode(event)
+    assert "\n" not in encoded
+    assert json.loads(encoded) == event.to_dict()
+
+
+def test_delta_encoding_only_sends_changed_fields():
+    events = [RunResponseStartedEvent(run_id="run_1")] + _content_events(["Hello", " world"])
+    encoded = [json.loads(e) for e in EventEncoder(delta=True).encode_stream(iter(events))]
+
+    assert encoded[0] == events[0].to_dict()
+    assert encoded[1] == events[1].to_dict()
+    assert "run_id" not in encoded[2]
+    assert encoded[2]["content"] == " world"
+    assert encoded[2]["event"] == "RunResponseContent"
+
+
+def test_coalesce_content_events():
+    events = _content_events(["Hello", ",", " world"]) + [RunResponseCompletedEvent(run_id="run_1")]
+    coalesced = list(coalesce_content_events(iter(events), interval_ms=60_000))
+
+    assert len(coalesced) == 2
+    assert coalesced[0].content == "Hello, world"
+    assert isinstance(coalesced[1], RunResponseCompletedEvent)
+
+
+def test_coalesce_does_not_merge_across_runs():
+    events = _content_events(["a", "b"], run_id="run_1") + _content_events(["c"], run_id="run_2")
+    coalesced = list(coalesce_content_events(iter(events), interval_ms=60_000))
+
+    assert [e.content for e in coalesced] == ["ab", "c"]
+
+
+async def test_acoalesce_content_events():
+    async def stream():
+        for event in _content_events(["Hello", " world"]):
+            yield event
+
+    coalesced = [e async for e in acoalesce_content_events(stream(), interval_ms=60_000)]
+    assert [e.content for e in coalesced] == ["Hello world"]
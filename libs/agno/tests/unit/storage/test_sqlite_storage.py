@@ -5,7 +5,10 @@ from typing import Generator
 
 import pytest
 
+from agno.run.base import RunStatus
+from agno.run.v2.workflow import WorkflowRunResponse
 from agno.storage.session.agent import AgentSession
+from agno.storage.session.v2.workflow import WorkflowSession as WorkflowSessionV2
 from agno.storage.session.workflow import WorkflowSession
 from agno.storage.sqlite import SqliteStorage
 
@@ -29,6 +32,16 @@ def workflow_storage(temp_db_path: Path) -> SqliteStorage:
     return SqliteStorage(table_name="workflow_sessions", db_file=str(temp_db_path), mode="workflow")
 
 
+@pytest.fixture
+def workflow_v2_storage(temp_db_path: Path) -> SqliteStorage:
+    return SqliteStorage(
+        table_name="workflow_v2_sessions",
+        db_file=str(temp_db_path),
+        mode="workflow_v2",
+        runs_table_name="workflow_v2_runs",
+    )
+
+
 def test_agent_storage_crud(agent_storage: SqliteStorage):
     # Test create
     agent_storage.create()
@@ -193,3 +206,66 @@ def test_workflow_storage_filtering(workflow_storage: SqliteStorage):
 
     empty_sessions = workflow_storage.get_all_sessions(entity_id="non-existent")
     assert len(empty_sessions) == 0
+
+
+def test_workflow_v2_runs_table(workflow_v2_storage: SqliteStorage):
+    workflow_v2_storage.create()
+    session = WorkflowSessionV2(session_id="test-session", workflow_id="test-workflow", user_id="test-user")
+    assert workflow_v2_storage.upsert(session) is not None
+
+    # Test each run is stored in its own row
+    run = WorkflowRunResponse(run_id="run-1", session_id="test-session", content="first", status=RunStatus.pending)
+    assert workflow_v2_storage.upsert_workflow_run("test-session", run)
+    assert workflow_v2_storage.upsert_workflow_run(
+        "test-session", WorkflowRunResponse(run_id="run-2", session_id="test-session", content="second")
+    )
+
+    # Test status updates do not rewrite the run
+    assert workflow_v2_storage.update_workflow_run_status("test-session", "run-1", RunStatus.running.value)
+    assert not workflow_v2_storage.update_workflow_run_status("test-session", "unknown-run", RunStatus.running.value)
+
+    read_session = workflow_v2_storage.read("test-session")
+    assert read_session is not None
+    assert [run.run_id for run in read_session.runs] == ["run-1", "run-2"]
+    assert read_session.runs[0].status == RunStatus.running
+    assert read_session.runs[0].content == "first"
+
+    # Test the session row does not hold the runs
+    with workflow_v2_storage.SqlSession() as sess:
+        row = sess.execute(workflow_v2_storage.table.select()).fetchone()
+        assert row.runs is None
+
+    assert len(workflow_v2_storage.get_all_sessions()[0].runs) == 2
+
+    # Test delete removes the runs
+    workflow_v2_storage.delete_session("test-session")
+    assert workflow_v2_storage.read("test-session") is None
+    with workflow_v2_storage.SqlSession() as sess:
+        assert sess.execute(workflow_v2_storage.runs_table.select()).fetchall() == []
+
+
+def test_workflow_v2_runs_table_reads_runs_column(temp_db_path: Path):
+    storage = SqliteStorage(table_name="workflow_v2_sessions", db_file=str(temp_db_path), mode="workflow_v2")
+    assert not storage.upsert_workflow_run("test-session", WorkflowRunResponse(run_id="run-1"))
+    storage.upsert(
+        WorkflowSessionV2(
+            session_id="test-session",
+            runs=[WorkflowRunResponse(run_id="run-1", content="old"), WorkflowRunResponse(run_id="run-2")],
+        )
+    )
+
+    # Test runs stored before the runs table was used are still read
+    runs_storage = SqliteStorage(
+        table_name="workflow_v2_sessions",
+        db_file=str(temp_db_path),
+        mode="workflow_v2",
+        runs_table_name="workflow_v2_runs",
+    )
+    runs_storage.create()
+    runs_storage.upsert_workflow_run("test-session", WorkflowRunResponse(run_id="run-1", content="new"))
+    runs_storage.upsert_workflow_run("test-session", WorkflowRunResponse(run_id="run-3"))
+
+    read_session = runs_storage.read("test-session")
+    assert read_session is not None
+    assert [run.run_id for run in read_session.runs] == ["run-2", "run-1", "run-3"]
+    assert read_session.runs[1].content == "new"
@@ -1,9 +1,18 @@
+import json
+import time
 import uuid
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Tuple
 
 import pytest
 
 from agno.agent import Agent
+from agno.memory.team import TeamMemory
+from agno.models.base import Model
 from agno.models.openai import OpenAIChat
+from agno.models.response import ModelResponse
+from agno.run.response import RunResponse
+from agno.run.team import TeamRunResponse
 from agno.team.team import Team
 from agno.tools.duckduckgo import DuckDuckGoTools
 from agno.tools.yfinance import YFinanceTools
@@ -147,3 +156,177 @@ def test_get_relevant_docs_from_knowledge_num_documents():
     result = team.get_relevant_docs_from_knowledge("query", num_documents=3)
     assert called["num_documents"] == 3
     assert result == [{"content": "doc"}]
+
+
+def _collaborate_team(**kwargs):
+    members = [Agent(name=f"Agent {i}", model=OpenAIChat("gpt-4o")) for i in range(3)]
+
+    def slow_run(member):
+        def run(*args, **run_kwargs):
+            time.sleep(0.2)
+            if member.name == "Agent 1":
+                raise ValueError("member failed")
+            member.run_response = RunResponse(content=f"{member.name} done", agent_id=member.agent_id)
+            return member.run_response
+
+        return run
+
+    for member in members:
+        member.run = slow_run(member)
+    team = Team(name="Collaborate Team", mode="collaborate", model=OpenAIChat("gpt-4o"), members=members, **kwargs)
+    team.memory = TeamMemory()
+    team.run_response = TeamRunResponse()
+    return team
+
+
+def test_collaborate_members_run_concurrently():
+    team = _collaborate_team()
+    function = team.get_run_member_agents_function(session_id="test-session")
+
+    start = time.perf_counter()
+    responses = list(function.entrypoint(task_description="Write a haiku"))
+    assert time.perf_counter() - start < 0.5
+
+    assert sorted(responses) == [
+        "Agent Agent 0: Agent 0 done",
+        "Agent Agent 1: Error - member failed",
+        "Agent Agent 2: Agent 2 done",
+    ]
+    assert len(team.run_response.member_responses) == 2
+
+
+def test_collaborate_member_timeout():
+    team = _collaborate_team(member_timeout=0.05)
+    function = team.get_run_member_agents_function(session_id="test-session")
+
+    responses = list(function.entrypoint(task_description="Write a haiku"))
+    assert sorted(responses) == [f"Agent Agent {i}: Error - Timed out after 0.05s" for i in range(3)]
+    assert team.run_response.member_responses == []
+
+
+def test_team_context_manager_reports_tokens_saved():
+    from agno.memory.v2.memory import Memory
+    from agno.memory.v2.team_context import TeamContextManager
+
+    member = Agent(name="Writer", model=OpenAIChat("gpt-4o"))
+    team = Team(
+        members=[member],
+        model=OpenAIChat("gpt-4o"),
+        memory=Memory(),
+        share_member_interactions=True,
+        team_context_manager=TeamContextManager(window_size=1, max_tokens=200),
+    )
+    for i in range(5):
+        team.memory.add_interaction_to_team_context(
+            session_id="test-session",
+            member_name="Writer",
+            task=f"Write part {i}",
+            run_response=RunResponse(content=f"Part {i} " + "text " * 200),
+        )
+
+    _, member_interactions_str = team._determine_team_context("test-session", [], [], [])
+
+    assert "Write part 4" in member_interactions_str
+    assert len(member_interactions_str) < len(team.memory.get_team_member_interactions_str(session_id="test-session"))
+    tokens_saved = team._aggregate_metrics_from_messages([])["member_context_tokens_saved"]
+    assert isinstance(tokens_saved, int) and tokens_saved > 0
+
+
+def test_team_context_manager_compacts_agentic_context():
+    from agno.memory.v2.memory import Memory
+    from agno.memory.v2.team_context import TeamContextManager, estimate_text_tokens
+
+    team = Team(
+        members=[Agent(name="Writer", model=OpenAIChat("gpt-4o"))],
+        model=OpenAIChat("gpt-4o"),
+        memory=Memory(),
+        enable_agentic_context=True,
+        team_context_manager=TeamContextManager(max_tokens=100),
+    )
+    team.memory.set_team_context_text(session_id="test-session", text="Plan: " + "step " * 200 + "Latest: done")
+
+    team_context_str, _ = team._determine_team_context("test-session", [], [], [])
+
+    assert estimate_text_tokens(team_context_str) <= 100
+    assert team_context_str.startswith("<team context>") and team_context_str.endswith("</team context>\n")
+    assert "Latest: done" in team_context_str
+    assert team._aggregate_metrics_from_messages([])["member_context_tokens_saved"] > 0
+
+
+@dataclass
+class TransferModel(Model):
+    """Transfers the given tasks to members in its first turn, then answers."""
+
+    id: str = "transfer-model"
+    transfers: List[Tuple[str, str]] = field(default_factory=list)
+
+    def invoke(self, messages, *args, **kwargs) -> Any:
+        if any(message.role == "tool" for message in messages):
+            return "done"
+        return [
+            {
+                "id": f"call_{i}",
+                "type": "function",
+                "function": {
+                    "name": "transfer_task_to_member",
+                    "arguments": json.dumps({"member_id": member_id, "task_description": task, "expected_output": ""}),
+                },
+            }
+            for i, (member_id, task) in enumerate(self.transfers)
+        ]
+
+    async def ainvoke(self, *args, **kwargs) -> Any:
+        return self.invoke(*args, **kwargs)
+
+    def invoke_stream(self, *args, **kwargs) -> Iterator[Any]:
+        yield self.invoke(*args, **kwargs)
+
+    async def ainvoke_stream(self, *args, **kwargs):
+        yield self.invoke(*args, **kwargs)
+
+    def parse_provider_response(self, response: Any, **kwargs) -> ModelResponse:
+        if isinstance(response, list):
+            return ModelResponse(role="assistant", tool_calls=response)
+        return ModelResponse(role="assistant", content=response)
+
+    def parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return self.parse_provider_response(response)
+
+
+def test_coordinate_transfers_of_one_turn_run_concurrently():
+    members = [Agent(name=f"Agent {i}", model=OpenAIChat("gpt-4o")) for i in range(2)]
+    runs: List[Tuple[str, float, float]] = []
+
+    def timed_run(member):
+        def run(*args, **kwargs):
+            start = time.perf_counter()
+            time.sleep(0.2)
+            runs.append((member.name, start, time.perf_counter()))
+            member.run_response = RunResponse(content=f"{member.name} done", agent_id=member.agent_id)
+            return member.run_response
+
+        return run
+
+    for member in members:
+        member.run = timed_run(member)
+    model = TransferModel(transfers=[("agent-0", "Task A"), ("agent-1", "Task B"), ("agent-0", "Task C")])
+    team = Team(name="Coordinate Team", mode="coordinate", model=model, members=members)
+
+    response = team.run("Do the tasks", session_id="test-session")
+
+    assert response.content == "done"
+    agent_0_runs = sorted((start, end) for name, start, end in runs if name == "Agent 0")
+    agent_1_runs = [(start, end) for name, start, end in runs if name == "Agent 1"]
+    # Different members run at the same time
+    assert agent_0_runs[0][0] < agent_1_runs[0][1] and agent_1_runs[0][0] < agent_0_runs[0][1]
+    # Transfers to the same member wait for each other
+    assert agent_0_runs[1][0] >= agent_0_runs[0][1]
+
+    # Each member run is added to the team once
+    assert sorted(member_response.content for member_response in response.member_responses) == [
+        "Agent 0 done",
+        "Agent 0 done",
+        "Agent 1 done",
+    ]
+    interactions = team.memory.team_context["test-session"].member_interactions
+    assert sorted(interaction.task for interaction in interactions) == ["Task A", "Task B", "Task C"]
@@ -4,7 +4,7 @@ import pytest
 from pydantic import ValidationError
 
 from agno.tools.decorator import tool
-from agno.tools.function import Function, FunctionCall
+from agno.tools.function import Function, FunctionCall, clear_tool_schema_cache, get_callable_schema, get_tool_schema
 
 
 def test_function_initialization():
@@ -708,3 +708,75 @@ def test_tool_decorator_with_complex_types():
     assert complex_types_func.parameters["properties"]["param2"]["type"] == "object"
     assert complex_types_func.parameters["properties"]["param3"]["type"] == "boolean"
     assert "param3" not in complex_types_func.parameters["required"]
+
+
+def _search(query: str, limit: int = 10) -> str:
+    """Search for something.
+
+    Args:
+        query: The search query.
+        limit: Maximum number of results.
+    """
+    return query
+
+
+class _SearchTools:
+    def search(self, query: str) -> str:
+        """Search for something."""
+        return f"{id(self)}:{query}"
+
+
+def test_tool_schema_is_cached():
+    """Test that tool schemas are compiled once and shared between Functions."""
+    clear_tool_schema_cache()
+
+    assert get_callable_schema(_search) is get_callable_schema(_search)
+    assert get_callable_schema(_search, strict=True) is not get_callable_schema(_search)
+    assert get_tool_schema(_search) is get_tool_schema(_search)
+
+    func_1 = Function.from_callable(_search)
+    func_2 = Function.from_callable(_search)
+    assert func_1.parameters == func_2.parameters
+    assert func_1.parameters["required"] == ["query"]
+
+    # Each Function gets its own copy of the parameters
+    func_1.parameters["required"].append("limit")
+    assert func_2.parameters["required"] == ["query"]
+
+
+def test_tool_schema_cache_for_bound_methods():
+    """Test that bound methods of different instances share a schema and a validator, but keep their instance."""
+    clear_tool_schema_cache()
+    tools_1, tools_2 = _SearchTools(), _SearchTools()
+
+    func_1 = Function(name="search", entrypoint=tools_1.search)
+    func_2 = Function(name="search", entrypoint=tools_2.search)
+    func_1.process_entrypoint()
+    func_2.process_entrypoint()
+
+    assert get_tool_schema(tools_1.search) is get_tool_schema(tools_2.search)
+    assert func_1.parameters == func_2.parameters
+    assert func_1.entrypoint.__func__ is func_2.entrypoint.__func__
+    assert func_1.entrypoint("a") == f"{id(tools_1)}:a"
+    assert func_2.entrypoint("b") == f"{id(tools_2)}:b"
+    with pytest.raises(ValidationError):
+        func_1.entrypoint(query={"not": "a string"})
+
+    # Processing again (e.g. when tools are rebuilt) keeps the same schema
+    func_1.process_entrypoint()
+    assert func_1.parameters["properties"] == func_2.parameters["properties"]
+    assert func_1.parameters["required"] == ["query"]
+
+
+def test_tool_schema_cache_respects_docstring():
+    """Test that functions with the same name but a different docstring do not share a schema."""
+
+    def make_tool(doc: str):
+        def dynamic_tool(query: str) -> str:
+            return query
+
+        dynamic_tool.__doc__ = doc
+        return dynamic_tool
+
+    assert Function.from_callable(make_tool("First tool")).description == "First tool"
+    assert Function.from_callable(make_tool("Second tool")).description == "Second tool"
@@ -0,0 +1,102 @@
+import asyncio
+import time
+
+import pytest
+
+from agno.utils.fanout import afan_out, agroup_exclusive_items, fan_out, group_exclusive_items
+
+
+def _slow_items(name: str, count: int, delay: float):
+    def task():
+        for i in range(count):
+            time.sleep(delay)
+            yield f"{name}{i}"
+
+    return task
+
+
+def test_fan_out_runs_tasks_concurrently():
+    start = time.perf_counter()
+    events = list(fan_out([_slow_items("a", 3, 0.05), _slow_items("b", 3, 0.05)]))
+    assert time.perf_counter() - start < 0.25
+
+    assert [event.item for event in events if event.index == 0 and not event.done] == ["a0", "a1", "a2"]
+    assert [event.item for event in events if event.index == 1 and not event.done] == ["b0", "b1", "b2"]
+    assert [(event.index, event.error) for event in events if event.done] in (
+        [(0, None), (1, None)],
+        [(1, None), (0, None)],
+    )
+
+
+def test_fan_out_returns_partial_results():
+    def failing():
+        yield "partial"
+        raise ValueError("boom")
+
+    events = list(fan_out([failing, _slow_items("slow", 10, 0.1), lambda: ["ok"]], timeout=0.15))
+    done = {event.index: event.error for event in events if event.done}
+    assert isinstance(done[0], ValueError)
+    assert isinstance(done[1], TimeoutError)
+    assert done[2] is None
+    assert sorted(event.item for event in events if not event.done and event.index != 1) == ["ok", "partial"]
+    # Items of a task are never yielded after it timed out
+    timed_out_at = next(i for i, event in enumerate(events) if event.index == 1 and event.done)
+    assert all(event.index != 1 for event in events[timed_out_at + 1 :])
+
+
+def test_fan_out_limits_workers():
+    start = time.perf_counter()
+    list(fan_out([_slow_items(str(i), 1, 0.05) for i in range(4)], max_workers=2))
+    assert time.perf_counter() - start >= 0.1
+
+
+def test_group_exclusive_items_keeps_tasks_together():
+    def task(name: str, delay: float):
+        def run():
+            yield f"tool:{name}"
+            for i in range(3):
+                time.sleep(delay)
+                yield f"content:{name}{i}"
+
+        return run
+
+    events = list(
+        group_exclusive_items(fan_out([task("a", 0.02), task("b", 0.03)]), lambda item: item.startswith("content"))
+    )
+    contents = [event.item for event in events if not event.done and event.item.startswith("content")]
+    assert contents in (
+        ["content:a0", "content:a1", "content:a2", "content:b0", "content:b1", "content:b2"],
+        ["content:b0", "content:b1", "content:b2", "content:a0", "content:a1", "content:a2"],
+    )
+    # Each task still ends with its done event
+    for index in (0, 1):
+        assert [event for event in events if event.index == index][-1].done
+
+
+@pytest.mark.asyncio
+async def test_afan_out_streams_concurrently_with_timeout():
+    async def items(name: str, count: int, delay: float):
+        for i in range(count):
+            await asyncio.sleep(delay)
+            yield f"content:{name}{i}"
+
+    start = time.perf_counter()
+    events = [
+        event
+        async for event in agroup_exclusive_items(
+            afan_out(
+                [lambda: items("a", 3, 0.03), lambda: items("b", 3, 0.03), lambda: items("c", 10, 0.1)], timeout=0.2
+            ),
+            lambda item: True,
+        )
+    ]
+    assert time.perf_counter() - start < 0.3
+
+    done = {event.index: event.error for event in events if event.done}
+    assert done[0] is None and done[1] is None
+    assert isinstance(done[2], TimeoutError)
+    contents = [event.item for event in events if not event.done]
+    assert contents[:6] in (
+        ["content:a0", "content:a1", "content:a2", "content:b0", "content:b1", "content:b2"],
+        ["content:b0", "content:b1", "content:b2", "content:a0", "content:a1", "content:a2"],
+    )
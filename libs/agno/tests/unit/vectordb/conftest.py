@@ -1,5 +1,5 @@
 from typing import Any, Dict, List
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -22,4 +22,12 @@ def mock_embedder():
     mock_usage: Dict[str, Any] = {"prompt_tokens": 10, "total_tokens": 10}
     mock.get_embedding_and_usage.return_value = (mock_embedding, mock_usage)
 
+    # Mock the async embedding methods
+    mock.max_concurrency = 8
+    mock.aget_embedding = AsyncMock(return_value=mock_embedding)
+    mock.aget_embedding_and_usage = AsyncMock(return_value=(mock_embedding, mock_usage))
+    mock.aget_embeddings_batch_and_usage = AsyncMock(
+        side_effect=lambda texts: [(mock_embedding, mock_usage) for _ in texts]
+    )
+
     return mock
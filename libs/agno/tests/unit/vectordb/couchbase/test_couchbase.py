@@ -90,6 +90,10 @@ def mock_embedder():
         openai_embedder = Mock(spec=OpenAIEmbedder)
         openai_embedder.get_embedding_and_usage.return_value = ([0.1, 0.2, 0.3], None)
         openai_embedder.get_embedding.return_value = [0.1, 0.2, 0.3]
+        openai_embedder.aget_embedding = AsyncMock(return_value=[0.1, 0.2, 0.3])
+        openai_embedder.aget_embeddings_batch_and_usage = AsyncMock(
+            side_effect=lambda texts: [([0.1, 0.2, 0.3], None) for _ in texts]
+        )
         mock_embedder.return_value = openai_embedder
         return mock_embedder.return_value
 
@@ -737,7 +741,7 @@ async def test_async_insert(couchbase_fts, mock_embedder):
         await couchbase_fts.async_insert(copy.deepcopy(documents))
 
         mock_get_async_collection.assert_called_once()
-        assert mock_embedder.get_embedding_and_usage.call_count == len(documents)
+        mock_embedder.aget_embeddings_batch_and_usage.assert_awaited_once_with([doc.content for doc in documents])
         assert mock_async_collection_instance.insert.call_count == len(documents)
 
         first_call_args = mock_async_collection_instance.insert.call_args_list[0].args
@@ -748,12 +752,12 @@ async def test_async_insert(couchbase_fts, mock_embedder):
         # Reset mocks for the next call
         mock_get_async_collection.reset_mock()
         mock_async_collection_instance.insert.reset_mock()
-        mock_embedder.get_embedding_and_usage.reset_mock()
+        mock_embedder.aget_embeddings_batch_and_usage.reset_mock()
 
-        # Test case 2: with filters - documents already have embeddings, so embedder should not be called again
+        # Test case 2: with filters
         await couchbase_fts.async_insert(copy.deepcopy(documents), filters=filters)
         mock_get_async_collection.assert_called_once()
-        assert mock_embedder.get_embedding_and_usage.call_count == len(documents)
+        mock_embedder.aget_embeddings_batch_and_usage.assert_awaited_once_with([doc.content for doc in documents])
         assert mock_async_collection_instance.insert.call_count == len(documents)
 
         first_call_args_filtered = mock_async_collection_instance.insert.call_args_list[0].args
@@ -778,7 +782,7 @@ async def test_async_upsert(couchbase_fts, mock_embedder):
         await couchbase_fts.async_upsert(copy.deepcopy(documents))
 
         mock_get_async_collection.assert_called_once()
-        assert mock_embedder.get_embedding_and_usage.call_count == len(documents)
+        mock_embedder.aget_embeddings_batch_and_usage.assert_awaited_once_with([doc.content for doc in documents])
         assert mock_async_collection_instance.upsert.call_count == len(documents)
 
         first_call_args = mock_async_collection_instance.upsert.call_args_list[0].args
@@ -789,12 +793,12 @@ async def test_async_upsert(couchbase_fts, mock_embedder):
         # Reset mocks for the next call
         mock_get_async_collection.reset_mock()
         mock_async_collection_instance.upsert.reset_mock()
-        mock_embedder.get_embedding_and_usage.reset_mock()
+        mock_embedder.aget_embeddings_batch_and_usage.reset_mock()
 
-        # Test case 2: with filters - documents already have embeddings, so embedder should not be called again
+        # Test case 2: with filters
         await couchbase_fts.async_upsert(copy.deepcopy(documents), filters=filters)
         mock_get_async_collection.assert_called_once()
-        assert mock_embedder.get_embedding_and_usage.call_count == len(documents)  # Embedder not called again
+        mock_embedder.aget_embeddings_batch_and_usage.assert_awaited_once_with([doc.content for doc in documents])
         assert mock_async_collection_instance.upsert.call_count == len(documents)
 
         first_call_args_filtered = mock_async_collection_instance.upsert.call_args_list[0].args
@@ -844,7 +848,7 @@ async def test_async_search_scope_level(couchbase_fts, mock_embedder):
 
         results = await couchbase_fts.async_search("test query scope kv", limit=5)
 
-        mock_embedder.get_embedding.assert_called_once_with("test query scope kv")
+        mock_embedder.aget_embedding.assert_awaited_once_with("test query scope kv")
         mock_get_async_scope.assert_called_once()  # For the search part
         mock_scope_inst.search.assert_called_once()
         search_args, search_kwargs = mock_scope_inst.search.call_args
@@ -860,7 +864,7 @@ async def test_async_search_scope_level(couchbase_fts, mock_embedder):
         assert results[0].meta_data == {"source": "kv_scope"}
 
         # Reset mocks for filter test
-        mock_embedder.get_embedding.reset_mock()
+        mock_embedder.aget_embedding.reset_mock()
         mock_get_async_scope.reset_mock()
         mock_scope_inst.search.reset_mock()
         mock_get_async_collection_for_kv.reset_mock()
@@ -869,7 +873,7 @@ async def test_async_search_scope_level(couchbase_fts, mock_embedder):
         filters = {"category": "test_scope_kv"}
         results_with_filters = await couchbase_fts.async_search("test query filter scope kv", limit=5, filters=filters)
 
-        mock_embedder.get_embedding.assert_called_once_with("test query filter scope kv")
+        mock_embedder.aget_embedding.assert_awaited_once_with("test query filter scope kv")
         mock_get_async_scope.assert_called_once()
         mock_scope_inst.search.assert_called_once()
         search_args_f, search_kwargs_f = mock_scope_inst.search.call_args
@@ -923,7 +927,7 @@ async def test_async_search_cluster_level(couchbase_fts, mock_embedder):
 
         results = await couchbase_fts.async_search("cluster query kv", limit=3)
 
-        mock_embedder.get_embedding.assert_called_once_with("cluster query kv")
+        mock_embedder.aget_embedding.assert_awaited_once_with("cluster query kv")
         mock_get_async_cluster_for_search.assert_called_once()  # For the search part
         mock_cluster_inst.search.assert_called_once()
         search_args, search_kwargs = mock_cluster_inst.search.call_args
@@ -937,7 +941,7 @@ async def test_async_search_cluster_level(couchbase_fts, mock_embedder):
         assert results[0].name == "cluster test doc from kv"
 
         # Reset mocks for filter test (optional, as new instances are created or mocks are fresh per test)
-        mock_embedder.get_embedding.reset_mock()
+        mock_embedder.aget_embedding.reset_mock()
         mock_get_async_cluster_for_search.reset_mock()
         mock_cluster_inst.search.reset_mock()
         mock_get_async_collection_for_kv.reset_mock()
@@ -946,7 +950,7 @@ async def test_async_search_cluster_level(couchbase_fts, mock_embedder):
         filters = {"type": "cluster_kv"}
         results_with_filters = await couchbase_fts.async_search("cluster query filter kv", limit=3, filters=filters)
 
-        mock_embedder.get_embedding.assert_called_once_with("cluster query filter kv")
+        mock_embedder.aget_embedding.assert_awaited_once_with("cluster query filter kv")
         mock_get_async_cluster_for_search.assert_called_once()
         mock_cluster_inst.search.assert_called_once()
         search_args_f, search_kwargs_f = mock_cluster_inst.search.call_args
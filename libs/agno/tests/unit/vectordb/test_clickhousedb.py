@@ -216,8 +216,8 @@ def test_search(mock_clickhouse, mock_embedder):
     # Mock query results
     query_result = MagicMock()
     query_result.result_rows = [
-        ["test_name_1", {"type": "test"}, "Test content 1", [0.1] * 1024, {}],
-        ["test_name_2", {"type": "test"}, "Test content 2", [0.2] * 1024, {}],
+        ["test_name_1", {"type": "test"}, "Test content 1", {}],
+        ["test_name_2", {"type": "test"}, "Test content 2", {}],
     ]
     mock_clickhouse.client.query.return_value = query_result
 
@@ -429,22 +429,19 @@ async def test_async_search(mock_clickhouse, mock_embedder):
     """Test async_search method."""
     query = "test query"
 
-    # Mock embedder
-    mock_embedder.get_embedding.return_value = [0.1] * 1024
-
     # Mock query results
     query_result = MagicMock()
     query_result.result_rows = [
-        ["test_name_1", {"type": "test"}, "Test content 1", [0.1] * 1024, {}],
-        ["test_name_2", {"type": "test"}, "Test content 2", [0.2] * 1024, {}],
+        ["test_name_1", {"type": "test"}, "Test content 1", {}],
+        ["test_name_2", {"type": "test"}, "Test content 2", {}],
     ]
     mock_clickhouse.async_client.query.return_value = query_result
 
     # Test async_search
     results = await mock_clickhouse.async_search(query, limit=2)
 
-    # Check that embedder.get_embedding was called
-    mock_embedder.get_embedding.assert_called_with(query)
+    # Check that the query was embedded asynchronously
+    mock_embedder.aget_embedding.assert_called_with(query)
 
     # Check that async_client.query was called
     mock_clickhouse.async_client.query.assert_called_once()
@@ -0,0 +1,57 @@
+import pytest
+
+from agno.vectordb.filters import AND, EQ, IN, OR, RANGE, parse_filters, walk_filters
+
+
+def test_parse_simple_filters():
+    assert parse_filters(None) is None
+    assert parse_filters({}) is None
+    assert parse_filters({"type": "soup"}) == EQ("type", "soup")
+    # List values keep the meaning they have in the dict filters of each vector db
+    assert parse_filters({"tags": ["soup", "curry"]}) == EQ("tags", ["soup", "curry"])
+    assert parse_filters({"type": "soup", "cuisine": "Thai"}) == AND([EQ("type", "soup"), EQ("cuisine", "Thai")])
+    # Dicts without operators are compared as values
+    assert parse_filters({"author": {"name": "Jane"}}) == EQ("author", {"name": "Jane"})
+
+
+def test_parse_operators():
+    assert parse_filters({"year": {"$gte": 2020, "$lt": 2024}}) == RANGE("year", gte=2020, lt=2024)
+    assert parse_filters({"type": {"$eq": "soup"}}) == EQ("type", "soup")
+    assert parse_filters({"type": {"$in": ["soup"]}}) == IN("type", ["soup"])
+    assert parse_filters({"$or": [{"type": "soup"}, {"year": {"$gt": 2020}}], "cuisine": "Thai"}) == AND(
+        [OR([EQ("type", "soup"), RANGE("year", gt=2020)]), EQ("cuisine", "Thai")]
+    )
+
+
+@pytest.mark.parametrize("filters", [{"type": {"$ne": "soup"}}, {"$not": {"type": "soup"}}, {"$or": {"type": "soup"}}])
+def test_parse_unsupported_filters(filters):
+    with pytest.raises(ValueError):
+        parse_filters(filters)
+
+
+def test_expressions_round_trip_through_dicts():
+    expression = AND([RANGE("year", gte=2020), OR([EQ("type", "soup"), IN("cuisine", ["Thai", "Lao"])])])
+    assert expression.to_dict() == {
+        "$and": [
+            {"year": {"$gte": 2020}},
+            {"$or": [{"type": {"$eq": "soup"}}, {"cuisine": {"$in": ["Thai", "Lao"]}}]},
+        ]
+    }
+    assert parse_filters(expression.to_dict()) == expression
+    assert parse_filters(expression) is expression
+    assert expression.get_keys() == ["year", "type", "cuisine"]
+    assert len(list(walk_filters(expression))) == 5
+
+
+def test_knowledge_reports_malformed_logical_filters_as_invalid():
+    from agno.knowledge.agent import AgentKnowledge
+
+    knowledge = AgentKnowledge()
+    knowledge.valid_metadata_filters = {"type", "year"}
+
+    valid_filters, invalid_keys = knowledge.validate_filters(
+        {"$or": {"type": "soup"}, "$and": [{"type": "soup"}, {"year": {"$gt": 2020}}], "year": 2024}
+    )
+
+    assert valid_filters == {"$and": [{"type": "soup"}, {"year": {"$gt": 2020}}], "year": 2024}
+    assert invalid_keys == ["$or"]
@@ -0,0 +1,397 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pytest
+
+from agno.document import Document
+from agno.embedder.base import Embedder
+from agno.vectordb.distance import Distance
+from agno.vectordb.filters import AND, EQ, IN
+from agno.vectordb.index import HNSW, Ivfflat
+from agno.vectordb.local import LocalVectorDb
+from agno.vectordb.local.index import HnswIndex, IvfFlatIndex, get_quantized_scores, get_scores, quantize, top_k
+from agno.vectordb.quantization import Quantization
+
+TEST_COLLECTION = "test_collection"
+
+WORDS = ["thai", "soup", "noodles", "curry", "coconut", "spicy", "chicken", "rice"]
+
+
+@dataclass
+class KeywordEmbedder(Embedder):
+    """Embeds text as counts of a fixed list of words, so search results are predictable"""
+
+    dimensions: Optional[int] = len(WORDS)
+
+    def get_embedding(self, text: str) -> List[float]:
+        tokens = text.lower().split()
+        return [float(tokens.count(word)) for word in WORDS]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+
+@pytest.fixture
+def local_db(tmp_path, mock_embedder):
+    """Fixture to create a LocalVectorDb instance in a temporary directory"""
+    db = LocalVectorDb(collection=TEST_COLLECTION, path=str(tmp_path), embedder=mock_embedder)
+    db.create()
+    yield db
+    db.drop()
+
+
+@pytest.fixture
+def keyword_db(tmp_path):
+    db = LocalVectorDb(collection=TEST_COLLECTION, path=str(tmp_path), embedder=KeywordEmbedder())
+    db.create()
+    yield db
+    db.drop()
+
+
+@pytest.fixture
+def sample_documents() -> List[Document]:
+    """Fixture to create sample documents"""
+    return [
+        Document(
+            content="Tom Kha Gai is a thai coconut soup with chicken", meta_data={"cuisine": "Thai", "type": "soup"}
+        ),
+        Document(
+            content="Pad Thai is a stir-fried rice noodles dish", meta_data={"cuisine": "Thai", "type": "noodles"}
+        ),
+        Document(
+            content="Green curry is a spicy thai curry with coconut milk",
+            meta_data={"cuisine": "Thai", "type": "curry"},
+        ),
+    ]
+
+
+def test_create_collection(local_db):
+    assert local_db.exists() is True
+    assert local_db.get_count() == 0
+
+
+def test_insert_documents(local_db, sample_documents):
+    local_db.insert(sample_documents)
+    assert local_db.get_count() == 3
+    assert local_db.doc_exists(sample_documents[0]) is True
+
+    # Inserting the same documents again is a no-op
+    local_db.insert(sample_documents)
+    assert local_db.get_count() == 3
+
+
+def test_name_and_id_exists(local_db):
+    local_db.insert([Document(id="doc_1", name="recipe", content="Tom Kha Gai")])
+    assert local_db.name_exists("recipe") is True
+    assert local_db.name_exists("other") is False
+    assert local_db.id_exists("doc_1") is True
+    assert local_db.id_exists("doc_2") is False
+
+
+def test_search_ranking(keyword_db, sample_documents):
+    keyword_db.insert(sample_documents)
+
+    results = keyword_db.search("spicy curry", limit=2)
+    assert len(results) == 2
+    assert results[0].content == sample_documents[2].content
+    assert results[0].meta_data == {"cuisine": "Thai", "type": "curry"}
+    assert results[0].embedding is None
+
+
+@pytest.mark.parametrize("vector_index", [None, HNSW()])
+def test_search_include_embeddings(tmp_path, sample_documents, vector_index):
+    db = LocalVectorDb(
+        collection=TEST_COLLECTION, path=str(tmp_path), embedder=KeywordEmbedder(), vector_index=vector_index
+    )
+    db.create()
+    db.insert(sample_documents)
+
+    results = db.search("spicy curry", limit=1, include_embeddings=True)
+    assert results[0].embedding == KeywordEmbedder().get_embedding(sample_documents[2].content)
+
+    # Embeddings can be fetched later for documents returned without them
+    results = db.search("spicy curry", limit=2)
+    embeddings = db.get_embeddings([doc.id for doc in results] + ["missing"])
+    assert set(embeddings) == {doc.id for doc in results}
+    assert embeddings[results[0].id] == KeywordEmbedder().get_embedding(sample_documents[2].content)
+
+
+@pytest.mark.parametrize("distance", [Distance.cosine, Distance.l2, Distance.max_inner_product])
+def test_search_distances(tmp_path, sample_documents, distance):
+    db = LocalVectorDb(collection=TEST_COLLECTION, path=str(tmp_path), embedder=KeywordEmbedder(), distance=distance)
+    db.create()
+    db.insert(sample_documents)
+
+    results = db.search("rice noodles", limit=1)
+    assert [doc.content for doc in results] == [sample_documents[1].content]
+
+
+def test_search_with_filters(keyword_db, sample_documents):
+    keyword_db.insert(sample_documents)
+
+    results = keyword_db.search("coconut", limit=5, filters={"type": "curry"})
+    assert [doc.meta_data["type"] for doc in results] == ["curry"]
+
+    results = keyword_db.search("coconut", limit=5, filters={"type": ["soup", "noodles"]})
+    assert {doc.meta_data["type"] for doc in results} == {"soup", "noodles"}
+
+    assert keyword_db.search("coconut", filters={"type": "dessert"}) == []
+
+
+def test_search_with_filter_expressions(keyword_db, sample_documents):
+    for year, document in zip([2019, 2021, 2023], sample_documents):
+        document.meta_data["year"] = year
+    keyword_db.insert(sample_documents)
+
+    results = keyword_db.search("thai", limit=5, filters={"year": {"$gte": 2020, "$lt": 2023}})
+    assert [doc.meta_data["type"] for doc in results] == ["noodles"]
+
+    results = keyword_db.search("thai", limit=5, filters={"$or": [{"type": "soup"}, {"year": {"$gt": 2022}}]})
+    assert {doc.meta_data["type"] for doc in results} == {"soup", "curry"}
+
+    results = keyword_db.search("thai", limit=5, filters=AND([EQ("cuisine", "Thai"), IN("type", ["curry", "dessert"])]))
+    assert [doc.meta_data["type"] for doc in results] == ["curry"]
+
+
+def test_insert_with_filters(keyword_db, sample_documents):
+    keyword_db.insert(sample_documents[:1], filters={"source": "cookbook"})
+    keyword_db.insert(sample_documents[1:])
+
+    results = keyword_db.search("thai", limit=5, filters={"source": "cookbook"})
+    assert len(results) == 1
+    assert results[0].meta_data["source"] == "cookbook"
+
+
+def test_upsert_documents(keyword_db):
+    keyword_db.upsert([Document(id="doc_1", content="thai soup")])
+    keyword_db.upsert([Document(id="doc_1", content="spicy curry")])
+
+    assert keyword_db.get_count() == 1
+    results = keyword_db.search("curry", limit=5)
+    assert [doc.content for doc in results] == ["spicy curry"]
+
+
+def test_delete_documents(keyword_db, sample_documents):
+    keyword_db.insert([Document(id="doc_1", name="soup", content="thai soup")] + sample_documents[1:])
+
+    assert keyword_db.delete_by_id("doc_1") is True
+    assert keyword_db.delete_by_id("doc_1") is False
+    assert keyword_db.delete_by_metadata({"type": "curry"}) is True
+    assert keyword_db.get_count() == 1
+    assert [doc.content for doc in keyword_db.search("thai soup curry noodles", limit=5)] == [
+        sample_documents[1].content
+    ]
+
+
+def test_reopen_collection(tmp_path, sample_documents):
+    db = LocalVectorDb(collection=TEST_COLLECTION, path=str(tmp_path), embedder=KeywordEmbedder())
+    db.create()
+    db.insert(sample_documents)
+
+    reopened = LocalVectorDb(
+        collection=TEST_COLLECTION, path=str(tmp_path), embedder=KeywordEmbedder(), distance=Distance.l2
+    )
+    reopened.create()
+    # The distance the collection was created with is kept
+    assert reopened.distance == Distance.cosine
+    assert reopened.get_count() == 3
+    assert reopened.search("spicy curry", limit=1)[0].content == sample_documents[2].content
+
+
+def test_compaction(tmp_path):
+    db = LocalVectorDb(
+        collection=TEST_COLLECTION,
+        path=str(tmp_path),
+        embedder=KeywordEmbedder(),
+        max_segments=3,
+        compaction_threshold=1,
+    )
+    db.create()
+    for i, word in enumerate(WORDS):
+        db.insert([Document(id=f"doc_{i}", content=word)])
+
+    assert len(db._load_segments()) <= 3
+    assert db.get_count() == len(WORDS)
+    for word in WORDS:
+        assert db.search(word, limit=1)[0].content == word
+
+    db.compact()
+    segment_files = list(db.collection_path.glob("segment_*.npy"))
+    # One file for the vectors and one for the norms
+    assert len(segment_files) == 2
+
+
+def test_compaction_after_deletes(keyword_db, sample_documents):
+    keyword_db.compaction_threshold = 0.5
+    keyword_db.insert(sample_documents)
+    keyword_db.delete_by_metadata({"type": ["soup", "noodles"]})
+
+    segments = keyword_db._load_segments()
+    assert len(segments) == 1
+    assert len(segments[0].row_ids) == 1
+    assert keyword_db.search("curry", limit=5)[0].content == sample_documents[2].content
+
+
+def test_delete_and_drop(local_db, sample_documents):
+    local_db.insert(sample_documents)
+    assert local_db.delete() is True
+    assert local_db.get_count() == 0
+    assert local_db.exists() is True
+
+    local_db.drop()
+    assert local_db.exists() is False
+
+
+@pytest.mark.asyncio
+async def test_async_operations(keyword_db, sample_documents):
+    await keyword_db.async_insert(sample_documents[:2])
+    await keyword_db.async_upsert(sample_documents[2:])
+    assert await keyword_db.async_exists() is True
+    assert await keyword_db.async_doc_exists(sample_documents[2]) is True
+
+    results = await keyword_db.async_search("spicy curry", limit=1)
+    assert results[0].content == sample_documents[2].content
+
+    await keyword_db.async_drop()
+    assert await keyword_db.async_exists() is False
+
+
+@pytest.mark.parametrize(
+    "create_index",
+    [
+        lambda distance: HnswIndex(distance=distance, seed=0),
+        lambda distance: IvfFlatIndex(distance=distance, lists=10, probes=3, dynamic_lists=False, seed=0),
+    ],
+    ids=["hnsw", "ivfflat"],
+)
+@pytest.mark.parametrize("distance", [Distance.cosine, Distance.l2, Distance.max_inner_product])
+def test_vector_index_recall(create_index, distance):
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(10, 16))
+    vectors = (centers[rng.integers(0, 10, 400)] + 0.3 * rng.normal(size=(400, 16))).astype(np.float32)
+    queries = vectors[:20] + 0.1 * rng.normal(size=(20, 16)).astype(np.float32)
+    norms = np.linalg.norm(vectors, axis=1)
+
+    index = create_index(distance)
+    index.add(np.arange(400) + 1, vectors)
+    recall = []
+    for query in queries:
+        expected = top_k(get_scores(vectors, norms, query, float(np.linalg.norm(query)), distance), 10) + 1
+        labels, _ = index.search(query, 10)
+        recall.append(len(set(labels.tolist()) & set(expected.tolist())) / 10)
+    assert np.mean(recall) >= 0.9
+
+
+@pytest.mark.parametrize("index_cls", [HnswIndex, IvfFlatIndex])
+def test_vector_index_remove_filter_and_save(tmp_path, index_cls):
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(200, 8)).astype(np.float32)
+    index = index_cls(seed=0)
+    index.add(np.arange(200), vectors)
+
+    index.remove(np.array([0]))
+    assert 0 not in index.search(vectors[0], 5)[0].tolist()
+
+    labels, _ = index.search(vectors[1], 5, allowed_labels=np.array([1, 2, 3]))
+    assert labels.tolist()[0] == 1
+    assert set(labels.tolist()) <= {1, 2, 3}
+
+    index.save(tmp_path / "index.npz")
+    loaded = index_cls(seed=0)
+    assert loaded.load(tmp_path / "index.npz") is True
+    assert len(loaded) == 199
+    assert loaded.search(vectors[5], 1)[0].tolist() == [5]
+
+    # An index saved with different settings is not loaded
+    if index_cls is HnswIndex:
+        assert HnswIndex(m=8).load(tmp_path / "index.npz") is False
+    else:
+        assert IvfFlatIndex(lists=10, dynamic_lists=False).load(tmp_path / "index.npz") is False
+
+    index.compact()
+    assert len(index) == index.size == 199
+
+
+@pytest.mark.parametrize("vector_index", [HNSW(), Ivfflat()])
+def test_search_with_vector_index(tmp_path, sample_documents, vector_index):
+    db = LocalVectorDb(
+        collection=TEST_COLLECTION, path=str(tmp_path), embedder=KeywordEmbedder(), vector_index=vector_index
+    )
+    db.create()
+    db.insert(sample_documents)
+
+    assert db.search("spicy curry", limit=1)[0].content == sample_documents[2].content
+    results = db.search("coconut", limit=5, filters={"type": ["soup", "noodles"]})
+    assert {doc.meta_data["type"] for doc in results} == {"soup", "noodles"}
+
+    db.delete_by_metadata({"type": "curry"})
+    assert all(doc.meta_data["type"] != "curry" for doc in db.search("spicy curry", limit=5))
+
+    # Changes that were not saved to the index are replayed from the segments
+    db.upsert([Document(id="doc_1", content="chicken rice", meta_data={"type": "rice"})])
+    reopened = LocalVectorDb(
+        collection=TEST_COLLECTION, path=str(tmp_path), embedder=KeywordEmbedder(), vector_index=vector_index
+    )
+    reopened.create()
+    assert reopened.search("chicken rice", limit=1)[0].id == "doc_1"
+    assert len(reopened._load_index()) == 3
+
+    reopened.optimize()
+    assert reopened.index_file.exists()
+
+
+@pytest.mark.parametrize("quantization", [Quantization.half, Quantization.int8])
+@pytest.mark.parametrize("distance", [Distance.cosine, Distance.l2, Distance.max_inner_product])
+def test_quantized_search_recall(quantization, distance):
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(10, 64))
+    vectors = (centers[rng.integers(0, 10, 1000)] + 0.3 * rng.normal(size=(1000, 64))).astype(np.float32)
+    queries = vectors[:20] + 0.1 * rng.normal(size=(20, 64)).astype(np.float32)
+    norms = np.linalg.norm(vectors, axis=1)
+    codes, scales = quantize(vectors, quantization)
+
+    recall = []
+    for query in queries:
+        query_norm = float(np.linalg.norm(query))
+        expected = top_k(get_scores(vectors, norms, query, query_norm, distance), 10)
+        scores = get_quantized_scores(codes, scales, norms, query, query_norm, distance, quantization)
+        candidates = top_k(scores, 40)
+        results = candidates[top_k(get_scores(vectors[candidates], norms[candidates], query, query_norm, distance), 10)]
+        recall.append(len(set(results.tolist()) & set(expected.tolist())) / 10)
+    assert np.mean(recall) >= 0.95
+
+
+@pytest.mark.parametrize("quantization", [Quantization.half, Quantization.int8, Quantization.binary])
+def test_search_with_quantization(tmp_path, sample_documents, quantization):
+    db = LocalVectorDb(collection=TEST_COLLECTION, path=str(tmp_path), embedder=KeywordEmbedder())
+    db.create()
+    db.insert(sample_documents[:2])
+
+    # Segments written before quantization was enabled are quantized when they are loaded
+    quantized = LocalVectorDb(
+        collection=TEST_COLLECTION, path=str(tmp_path), embedder=KeywordEmbedder(), quantization=quantization
+    )
+    quantized.create()
+    quantized.insert(sample_documents[2:])
+    assert len(list(quantized.collection_path.glob(f"*_{quantization.value}.npy"))) == 2
+
+    assert quantized.search("spicy curry", limit=1)[0].content == sample_documents[2].content
+    results = quantized.search("coconut", limit=5, filters={"type": "soup"})
+    assert [doc.meta_data["type"] for doc in results] == ["soup"]
+
+    quantized.delete_by_metadata({"type": "curry"})
+    quantized.compact()
+    assert len(list(quantized.collection_path.glob(f"*_{quantization.value}.npy"))) == 1
+    assert all(doc.meta_data["type"] != "curry" for doc in quantized.search("spicy curry", limit=5))
+
+
+def test_quantization_cannot_be_combined_with_vector_index(tmp_path):
+    with pytest.raises(ValueError):
+        LocalVectorDb(
+            collection=TEST_COLLECTION,
+            path=str(tmp_path),
+            embedder=KeywordEmbedder(),
+            vector_index=HNSW(),
+            quantization=Quantization.int8,
+        )
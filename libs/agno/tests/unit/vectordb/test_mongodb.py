@@ -18,6 +18,8 @@ def mock_embedder() -> MagicMock:
     embedder = MagicMock()
     embedder.dimensions = 384
     embedder.get_embedding.return_value = [0.1] * 384
+    embedder.aget_embedding = AsyncMock(return_value=[0.1] * 384)
+    embedder.aget_embeddings_batch_and_usage = AsyncMock(side_effect=lambda texts: [([0.1] * 384, None) for _ in texts])
     embedder.embedding_dim = 384
     return embedder
 
@@ -419,7 +421,7 @@ async def test_async_insert(
 
     # Mock the prepare_doc method to avoid embedding issues during test
     original_prepare_doc = async_vector_db.prepare_doc
-    async_vector_db.prepare_doc = lambda doc, filters=None: {
+    async_vector_db.prepare_doc = lambda doc, filters=None, embed=True: {
         "_id": md5(doc.content.encode("utf-8")).hexdigest(),
         "name": doc.name,
         "content": doc.content,
@@ -2,11 +2,12 @@ import uuid
 from unittest.mock import MagicMock, patch
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.engine import URL, Engine
 from sqlalchemy.orm import Session
 
 from agno.document import Document
-from agno.vectordb.pgvector import PgVector
+from agno.vectordb.pgvector import HNSW, PgVector, Quantization
 from agno.vectordb.search import SearchType
 
 # Configuration for tests
@@ -209,19 +210,23 @@ def test_search(mock_pgvector):
     with patch.object(mock_pgvector, "vector_search") as mock_vector_search:
         mock_pgvector.search_type = SearchType.vector
         mock_pgvector.search("test query")
-        mock_vector_search.assert_called_with(query="test query", limit=5, filters=None)
+        mock_vector_search.assert_called_with(
+            query="test query", limit=5, filters=None, include_embeddings=False, query_embedding=None
+        )
 
     # Test keyword search
     with patch.object(mock_pgvector, "keyword_search") as mock_keyword_search:
         mock_pgvector.search_type = SearchType.keyword
         mock_pgvector.search("test query")
-        mock_keyword_search.assert_called_with(query="test query", limit=5, filters=None)
+        mock_keyword_search.assert_called_with(query="test query", limit=5, filters=None, include_embeddings=False)
 
     # Test hybrid search
     with patch.object(mock_pgvector, "hybrid_search") as mock_hybrid_search:
         mock_pgvector.search_type = SearchType.hybrid
         mock_pgvector.search("test query")
-        mock_hybrid_search.assert_called_with(query="test query", limit=5, filters=None)
+        mock_hybrid_search.assert_called_with(
+            query="test query", limit=5, filters=None, include_embeddings=False, query_embedding=None
+        )
 
 
 def test_vector_search(mock_pgvector, mock_embedder):
@@ -274,6 +279,177 @@ def test_delete(mock_pgvector):
         assert result is True
 
 
+def _capture_statements(db):
+    """Replace the session of a PgVector with a mock that records executed statements."""
+    statements = []
+    session = MagicMock()
+    session.execute.side_effect = lambda stmt, *args, **kwargs: statements.append(stmt) or MagicMock()
+    db.Session = MagicMock()
+    db.Session.return_value.__enter__.return_value = session
+    return statements
+
+
+@pytest.fixture
+def sql_pgvector():
+    """A PgVector with a real table definition, for inspecting the generated SQL."""
+    embedder = MagicMock()
+    embedder.dimensions = 3
+    embedder.get_embedding.return_value = [0.1, 0.2, 0.3]
+    with patch("agno.vectordb.pgvector.pgvector.scoped_session"):
+        db = PgVector(table_name=TEST_TABLE, schema=TEST_SCHEMA, db_engine=MagicMock(), embedder=embedder)
+    db._content_tsv_exists = True
+    return db
+
+
+def test_table_has_stored_tsvector_column(sql_pgvector):
+    """Test that schema version 2 adds a generated tsvector column with a GIN index."""
+    column = sql_pgvector.table.c.content_tsv
+    assert "to_tsvector('english'::regconfig" in str(column.computed.sqltext)
+    assert column.computed.persisted is True
+    gin_indexes = [index for index in sql_pgvector.table.indexes if index.dialect_options["postgresql"]["using"]]
+    assert [index.name for index in gin_indexes] == [f"idx_{TEST_TABLE}_content_tsv"]
+
+
+def test_hybrid_search_uses_reciprocal_rank_fusion(sql_pgvector):
+    """Test that hybrid search fuses vector and full-text candidates using the stored tsvector column."""
+    statements = _capture_statements(sql_pgvector)
+    sql_pgvector.hybrid_search("thai curry", limit=3, filters={"cuisine": "thai"})
+
+    sql = str(statements[-1].compile(dialect=postgresql.dialect()))
+    assert "UNION ALL" in sql
+    assert sql.count("row_number() OVER") == 2
+    assert "content_tsv @@ websearch_to_tsquery" in sql
+    assert "to_tsvector(" not in sql
+    assert sql.count("meta_data @>") == 2
+
+
+def test_keyword_search_without_tsvector_column(sql_pgvector):
+    """Test that tables without the tsvector column compute it with the expression of the GIN index."""
+    sql_pgvector._content_tsv_exists = False
+    statements = _capture_statements(sql_pgvector)
+    sql_pgvector.keyword_search("thai curry")
+
+    sql = str(statements[-1].compile(dialect=postgresql.dialect()))
+    assert "to_tsvector('english'::regconfig, " in sql
+    assert "@@ websearch_to_tsquery" in sql
+
+
+@pytest.mark.parametrize("search_type", [SearchType.vector, SearchType.keyword, SearchType.hybrid])
+def test_search_selects_embeddings_only_when_requested(sql_pgvector, search_type):
+    """Test that searches only select the embedding column when include_embeddings is set."""
+    sql_pgvector.search_type = search_type
+    statements = _capture_statements(sql_pgvector)
+
+    sql_pgvector.search("thai curry")
+    assert "embedding" not in [column.name for column in statements[-1].selected_columns]
+
+    sql_pgvector.search("thai curry", include_embeddings=True)
+    assert "embedding" in [column.name for column in statements[-1].selected_columns]
+
+
+def test_create_upgrades_schema(sql_pgvector):
+    """Test that create() adds the tsvector column to an existing table when auto_upgrade_schema is set."""
+    sql_pgvector._content_tsv_exists = False
+    sql_pgvector.auto_upgrade_schema = True
+    statements = _capture_statements(sql_pgvector)
+    with patch.object(sql_pgvector, "table_exists", return_value=True):
+        sql_pgvector.create()
+
+    assert "ADD COLUMN IF NOT EXISTS content_tsv tsvector GENERATED ALWAYS" in str(statements[0])
+    assert "USING GIN (content_tsv)" in str(statements[1])
+    assert sql_pgvector._has_content_tsv() is True
+
+
+@pytest.mark.parametrize(
+    "quantization, quantized_order, index_sql",
+    [
+        (Quantization.half, "embedding AS HALFVEC(3)) <=>", "(embedding::halfvec(3)) halfvec_cosine_ops"),
+        (
+            Quantization.binary,
+            "embedding) AS BIT(3)) <~> CAST(binary_quantize(",
+            "(binary_quantize(embedding)::bit(3)) bit_hamming_ops",
+        ),
+    ],
+)
+def test_quantized_vector_search(sql_pgvector, quantization, quantized_order, index_sql):
+    """Test that quantized searches take candidates from the quantized index and re-rank them exactly."""
+    sql_pgvector.quantization = quantization
+    sql_pgvector.vector_index = HNSW()
+    statements = _capture_statements(sql_pgvector)
+
+    sql_pgvector.vector_search("thai curry", limit=3, filters={"cuisine": "thai"})
+    sql = str(statements[-1].compile(dialect=postgresql.dialect()))
+    assert quantized_order in sql
+    assert "ORDER BY quantized_candidates.embedding <=>" in sql
+    assert statements[-1].compile().params["param_2"] == 3 * sql_pgvector.rescore_factor
+
+    with patch.object(sql_pgvector, "_index_exists", return_value=False):
+        sql_pgvector.optimize()
+    index_statements = [str(statement) for statement in statements if "USING hnsw" in str(statement)]
+    assert index_sql in index_statements[0]
+    assert f"_hnsw_{quantization.value}_index" in index_statements[0]
+
+
+def test_pgvector_has_no_int8_quantization(mock_embedder):
+    with pytest.raises(ValueError):
+        PgVector(table_name=TEST_TABLE, db_engine=MagicMock(), embedder=mock_embedder, quantization=Quantization.int8)
+
+
+def test_filters_compile_to_sql(sql_pgvector):
+    """Test that equality filters use JSONB containment and ranges compare the value of the key."""
+    statements = _capture_statements(sql_pgvector)
+    sql_pgvector.vector_search(
+        "thai curry",
+        filters={
+            "cuisine": "thai",
+            "year": {"$gte": 2020},
+            "$or": [{"type": ["soup", "curry"]}, {"name": {"$lt": "m"}}],
+        },
+    )
+
+    sql = str(statements[-1].compile(dialect=postgresql.dialect()))
+    assert sql.count("meta_data @>") == 2
+    assert (
+        f"jsonb_typeof({TEST_SCHEMA}.{TEST_TABLE}.meta_data -> %(meta_data_2)s::VARCHAR) = %(jsonb_typeof_1)s::VARCHAR)"
+        in sql
+    )
+    assert f"THEN CAST(({TEST_SCHEMA}.{TEST_TABLE}.meta_data ->> %(meta_data_3)s::TEXT) AS FLOAT) END >=" in sql
+    assert f"CAST(({TEST_SCHEMA}.{TEST_TABLE}.meta_data ->> %(meta_data_5)s::TEXT) AS VARCHAR) <" in sql
+    assert " OR " in sql
+
+
+def test_list_filters_use_containment(sql_pgvector):
+    """Test that a list value matches documents whose metadata list contains it, like {"tags": ["a", "b"]}."""
+    statements = _capture_statements(sql_pgvector)
+    sql_pgvector.vector_search("thai curry", filters={"tags": ["a"]})
+
+    compiled = statements[-1].compile(dialect=postgresql.dialect())
+    assert str(compiled).count("meta_data @>") == 1
+    assert {"tags": ["a"]} in compiled.params.values()
+
+
+def test_filtered_keys_are_indexed(sql_pgvector):
+    """Test that searches only count filtered keys, and create_filter_indexes builds their indexes concurrently."""
+    sql_pgvector.filter_index_threshold = 2
+    statements = _capture_statements(sql_pgvector)
+    for _ in range(3):
+        sql_pgvector.vector_search("thai curry", filters={"cuisine": "thai", "year": {"$gte": 2020}})
+    assert not any("CREATE INDEX" in str(statement) for statement in statements)
+
+    connection = sql_pgvector.db_engine.connect.return_value.execution_options.return_value.__enter__.return_value
+    sql_pgvector.create_filter_indexes()
+    sql_pgvector.create_filter_indexes()
+
+    index_statements = [str(call.args[0]) for call in connection.execute.call_args_list]
+    assert len(index_statements) == 2
+    assert all("CREATE INDEX CONCURRENTLY" in statement for statement in index_statements)
+    assert (
+        "((CASE WHEN jsonb_typeof(meta_data -> 'year') = 'number' THEN (meta_data ->> 'year')::float END))"
+        in index_statements[0]
+    )
+    assert "USING GIN (meta_data jsonb_path_ops)" in index_statements[1]
+
+
 # Asynchronous Tests
 @pytest.mark.asyncio
 @pytest.mark.asyncio
@@ -317,49 +493,53 @@ async def test_async_name_exists(mock_pgvector):
 
 
 @pytest.mark.asyncio
-async def test_async_insert(mock_pgvector):
+async def test_async_insert(mock_pgvector, mock_embedder):
     """Test async_insert method."""
     docs = create_test_documents()
 
-    with patch.object(mock_pgvector, "insert"), patch("asyncio.to_thread") as mock_to_thread:
+    with patch.object(mock_pgvector, "_insert"), patch("asyncio.to_thread") as mock_to_thread:
         mock_to_thread.return_value = None
 
         await mock_pgvector.async_insert(docs)
 
-        # Check that insert was called via to_thread
-        mock_to_thread.assert_called_once_with(mock_pgvector.insert, docs, None)
+        # Check that the documents were embedded asynchronously, then inserted via to_thread
+        assert all(doc.embedding == mock_embedder.get_embedding.return_value for doc in docs)
+        mock_to_thread.assert_called_once_with(mock_pgvector._insert, docs, None, 100, False)
 
 
 @pytest.mark.asyncio
-async def test_async_upsert(mock_pgvector):
+async def test_async_upsert(mock_pgvector, mock_embedder):
     """Test async_upsert method."""
     docs = create_test_documents()
 
-    with patch.object(mock_pgvector, "upsert"), patch("asyncio.to_thread") as mock_to_thread:
+    with patch.object(mock_pgvector, "_upsert"), patch("asyncio.to_thread") as mock_to_thread:
         mock_to_thread.return_value = None
 
         await mock_pgvector.async_upsert(docs)
 
-        # Check that upsert was called via to_thread
-        mock_to_thread.assert_called_once_with(mock_pgvector.upsert, docs, None)
+        # Check that the documents were embedded asynchronously, then upserted via to_thread
+        assert all(doc.embedding == mock_embedder.get_embedding.return_value for doc in docs)
+        mock_to_thread.assert_called_once_with(mock_pgvector._upsert, docs, None, 100, False)
 
 
 @pytest.mark.asyncio
-async def test_async_search(mock_pgvector):
+async def test_async_search(mock_pgvector, mock_embedder):
     """Test async_search method."""
     expected_results = [Document(id="test", content="Test document")]
 
     with (
-        patch.object(mock_pgvector, "search", return_value=expected_results),
+        patch.object(mock_pgvector, "_search", return_value=expected_results),
         patch("asyncio.to_thread") as mock_to_thread,
     ):
         mock_to_thread.return_value = expected_results
 
         results = await mock_pgvector.async_search("test query")
 
-        # Check results and that search was called via to_thread
+        # Check results and that the query was embedded asynchronously before searching via to_thread
         assert results == expected_results
-        mock_to_thread.assert_called_once_with(mock_pgvector.search, "test query", 5, None)
+        mock_to_thread.assert_called_once_with(
+            mock_pgvector._search, "test query", 5, None, False, mock_embedder.get_embedding.return_value
+        )
 
 
 @pytest.mark.asyncio
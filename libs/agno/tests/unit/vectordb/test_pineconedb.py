@@ -255,7 +255,7 @@ def test_search(mock_pinecone_db, mock_embedder):
 
     # Check that index.query was called with the right arguments
     mock_pinecone_db.index.query.assert_called_with(
-        vector=[0.1] * 1024, top_k=2, namespace=TEST_NAMESPACE, filter=None, include_values=None, include_metadata=True
+        vector=[0.1] * 1024, top_k=2, namespace=TEST_NAMESPACE, filter=None, include_values=False, include_metadata=True
     )
 
     # Check the results
@@ -391,13 +391,13 @@ async def test_async_insert_not_supported(mock_pinecone_db):
 
 
 @pytest.mark.asyncio
-async def test_async_search(mock_pinecone_db):
+async def test_async_search(mock_pinecone_db, mock_embedder):
     """Test async_search method."""
     query = "test query"
     expected_results = [Document(id="test", content="Test document")]
 
     with (
-        patch.object(mock_pinecone_db, "search", return_value=expected_results),
+        patch.object(mock_pinecone_db, "_search", return_value=expected_results),
         patch("asyncio.to_thread") as mock_to_thread,
     ):
         mock_to_thread.return_value = expected_results
@@ -405,7 +405,10 @@ async def test_async_search(mock_pinecone_db):
         results = await mock_pinecone_db.async_search(query)
 
         assert results == expected_results
-        mock_to_thread.assert_called_once_with(mock_pinecone_db.search, query, 5, None, None, None)
+        mock_embedder.aget_embedding.assert_called_with(query)
+        mock_to_thread.assert_called_once_with(
+            mock_pinecone_db._search, query, mock_embedder.aget_embedding.return_value, 5, None, False, None, None
+        )
 
 
 @pytest.mark.asyncio
@@ -2,6 +2,7 @@ from typing import List
 from unittest.mock import Mock, patch
 
 import pytest
+from qdrant_client.http import models
 
 from agno.document import Document
 from agno.vectordb.qdrant import Qdrant
@@ -204,6 +205,42 @@ def test_search(qdrant_db, mock_qdrant_client):
         assert kwargs["limit"] == 2
 
 
+def test_format_filters(qdrant_db):
+    """Test that filters compile to Qdrant conditions"""
+    query_filter = qdrant_db._format_filters(
+        {"cuisine": "Thai", "year": {"$gte": 2020}, "$or": [{"type": ["soup", "curry"]}, {"spicy": True}]}
+    )
+    cuisine, year, alternatives = query_filter.must
+    assert cuisine == models.FieldCondition(key="meta_data.cuisine", match=models.MatchValue(value="Thai"))
+    assert year == models.FieldCondition(key="meta_data.year", range=models.Range(gte=2020))
+    assert alternatives.should == [
+        models.FieldCondition(key="meta_data.type", match=models.MatchAny(any=["soup", "curry"])),
+        models.FieldCondition(key="meta_data.spicy", match=models.MatchValue(value=True)),
+    ]
+    assert qdrant_db._format_filters({}) is None
+
+
+def test_filtered_keys_get_payload_index(qdrant_db, mock_qdrant_client):
+    """Test that keys filtered on filter_index_threshold times get a payload index once, outside of searches"""
+    qdrant_db.filter_index_threshold = 2
+    mock_qdrant_client.query_points.return_value = Mock(points=[])
+    with patch.object(qdrant_db.embedder, "get_embedding", return_value=[0.1] * 768):
+        for _ in range(3):
+            qdrant_db.search("Thai food", filters={"year": {"$gte": 2020}})
+    mock_qdrant_client.create_payload_index.assert_not_called()
+
+    # A failed index is not recorded as created, and is tried again
+    mock_qdrant_client.create_payload_index.side_effect = [Exception("forbidden"), None]
+    qdrant_db.create_filter_indexes()
+    qdrant_db.create_filter_indexes()
+    qdrant_db.create_filter_indexes()
+
+    assert mock_qdrant_client.create_payload_index.call_count == 2
+    mock_qdrant_client.create_payload_index.assert_called_with(
+        collection_name="test_collection", field_name="meta_data.year", field_schema=models.PayloadSchemaType.INTEGER
+    )
+
+
 def test_get_count(qdrant_db, mock_qdrant_client):
     """Test getting count of documents"""
     count_result = Mock()
@@ -19,6 +19,8 @@ def mock_embedder() -> MagicMock:
     embedder.dimensions = 384
     embedder.get_embedding.return_value = [0.1] * 384
     embedder.get_embedding_and_usage.return_value = [0.1] * 384, {}
+    embedder.aget_embedding = AsyncMock(return_value=[0.1] * 384)
+    embedder.aget_embeddings_batch_and_usage = AsyncMock(side_effect=lambda texts: [([0.1] * 384, {}) for _ in texts])
     embedder.embedding_dim = 384
     return embedder
 